@@ -45,34 +45,73 @@ except ImportError:
 ##############################################################################
 
 class Hasher(object):
+    """Computes the signatures used by the cache.
+
+    Signatures of parameters, functions and modules are memoized on the
+    objects that provide a ``_signature_memo`` attribute (the core
+    vistrail classes do). The memo of a function or module is keyed on
+    its identity and version, not on its children, and is dropped when
+    an operation changes it (see Pipeline.perform_operation()).
+
+    A parameter drops its memo when one of the attributes it is hashed
+    from is set in place. Since it doesn't know its function, it then
+    calls param_edited(), which invalidates every memoized function and
+    module.
+
+    """
+
+    # Number of in-place parameter edits, part of the memo keys
+    param_edits = 0
+
+    @staticmethod
+    def param_edited():
+        Hasher.param_edits += 1
 
     @staticmethod
     def parameter_signature(p, constant_hasher_map={}):
         k = (p.identifier, p.type, p.namespace)
         custom_hasher = constant_hasher_map.get(k, None)
         if custom_hasher:
+            # Custom hashers may depend on external state (e.g. file
+            # modification times) so their result is never memoized
             return custom_hasher(p)
-        else:
-            hasher = sha_hash()
-            u = hasher.update
-            u(p.type)
-            u(p.identifier)
-            u(p.namespace or "")
-            u(p.strValue)
-            u(p.name)
-            u(p.evaluatedStrValue)
-            return hasher.digest()
+        sig = getattr(p, '_signature_memo', None)
+        if sig is not None:
+            return sig
+        hasher = sha_hash()
+        u = hasher.update
+        u(p.type)
+        u(p.identifier)
+        u(p.namespace or "")
+        u(p.strValue)
+        u(p.name)
+        u(p.evaluatedStrValue)
+        sig = hasher.digest()
+        if hasattr(p, '_signature_memo'):
+            p._signature_memo = sig
+        return sig
 
     @staticmethod
     def function_signature(function, constant_hasher_map={}):
+        params = function.params
+        key = (function.name, function.returnType, len(params),
+               Hasher.param_edits)
+        memo = getattr(function, '_signature_memo', None)
+        if memo is not None and memo[0] == key:
+            return memo[1]
         hasher = sha_hash()
         u = hasher.update
         u(function.name)
         u(function.returnType)
-        u(hash_list(function.params,
-                    Hasher.parameter_signature,
-                    constant_hasher_map))
-        return hasher.digest()
+        u(hash_list(params, Hasher.parameter_signature, constant_hasher_map))
+        sig = hasher.digest()
+        if hasattr(function, '_signature_memo'):
+            if any((p.identifier, p.type, p.namespace) in constant_hasher_map
+                   for p in params):
+                function._signature_memo = None
+            else:
+                function._signature_memo = (key, sig)
+        return sig
 
     @staticmethod
     def control_param_signature(control_param, constant_hasher_map={}):
@@ -105,18 +144,36 @@ class Hasher(object):
 
     @staticmethod
     def module_signature(obj, constant_hasher_map={}):
+        descriptor = obj.module_descriptor
+        functions = obj.functions
+        key = (obj.id, descriptor, descriptor.package_version,
+               descriptor.version, len(functions),
+               tuple((cp.name, cp.value) for cp in obj.control_parameters),
+               Hasher.param_edits)
+        memo = getattr(obj, '_signature_memo', None)
+        if memo is not None and memo[0] == key:
+            return memo[1]
         hasher = sha_hash()
         u = hasher.update
-        u(obj.module_descriptor.name)
-        u(obj.module_descriptor.package)
-        u(obj.module_descriptor.namespace or '')
-        u(obj.module_descriptor.package_version or '')
-        u(obj.module_descriptor.version or '')
-        u(hash_list(obj.functions, Hasher.function_signature,
+        u(descriptor.name)
+        u(descriptor.package)
+        u(descriptor.namespace or '')
+        u(descriptor.package_version or '')
+        u(descriptor.version or '')
+        u(hash_list(functions, Hasher.function_signature,
                     constant_hasher_map))
         u(hash_list(obj.control_parameters, Hasher.control_param_signature,
                     constant_hasher_map))
-        return hasher.digest()
+        sig = hasher.digest()
+        if hasattr(obj, '_signature_memo'):
+            # functions with custom-hashed parameters are never memoized,
+            # and neither are their modules
+            if all(getattr(f, '_signature_memo', None) is not None
+                   for f in functions):
+                obj._signature_memo = (key, sig)
+            else:
+                obj._signature_memo = None
+        return sig
 
     @staticmethod
     def subpipeline_signature(module_sig, upstream_sigs):
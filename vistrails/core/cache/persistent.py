@@ -0,0 +1,410 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""On-disk store for module results, shared across sessions.
+
+Entries are keyed by the subpipeline signature computed by the cached
+interpreter and hold the values of the output ports of a module. Each
+entry is a directory that is published with an atomic rename, so that
+several VisTrails processes on the same host may share one store.
+
+"""
+
+from __future__ import division
+
+import contextlib
+import cPickle as pickle
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+from vistrails.core import debug
+
+try:
+    import fcntl
+except ImportError: # pragma: no cover
+    fcntl = None
+
+##############################################################################
+
+class PersistentCacheEntry(object):
+    def __init__(self, signature, abs_name, time, size):
+        self.signature = signature
+        self.abs_name = abs_name
+        self.time = time
+        self.size = size
+
+
+class UncacheableValue(Exception):
+    """Raised while pickling outputs that cannot be stored on disk.
+    """
+
+
+class PersistentResultCache(object):
+    """PersistentResultCache stores the output ports of cacheable modules on
+    disk, keyed by subpipeline signature, and evicts least-recently-used
+    entries once the store grows over `max_size` bytes.
+
+    Files that modules created through the interpreter's FilePool are
+    copied along with the entry and recreated in the current file pool when
+    the entry is loaded. Other non-picklable values make the module
+    uncacheable on disk; it then simply gets recomputed.
+
+    """
+
+    OUTPUTS_FILE = 'outputs.pkl'
+    FILES_DIR = 'files'
+    TMP_DIR = 'tmp'
+    LOCK_FILE = 'lock'
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+        if not os.path.isdir(os.path.join(directory, self.TMP_DIR)):
+            os.makedirs(os.path.join(directory, self.TMP_DIR))
+        self._size = None
+
+    def _entry_dir(self, signature):
+        # Signatures are binary SHA-1 digests; they may contain null bytes
+        # or path separators, so they are hex-encoded for the file system
+        name = signature.encode('hex')
+        return os.path.join(self.directory, name[:2], name)
+
+    @contextlib.contextmanager
+    def _lock(self):
+        """Holds an exclusive lock on the store while evicting entries.
+
+        Readers and writers don't need it as entries are published and
+        retired with renames.
+
+        """
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.directory, self.LOCK_FILE), 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _mkdtemp(self):
+        return tempfile.mkdtemp(prefix='vt_result_',
+                                dir=os.path.join(self.directory,
+                                                 self.TMP_DIR))
+
+    def _remove_dir(self, abs_name):
+        """Retires an entry: renames it away first so that readers never see
+        a partially deleted entry.
+
+        """
+        trash = os.path.join(self.directory, self.TMP_DIR,
+                             'del_%s' % uuid.uuid1().hex)
+        try:
+            os.rename(abs_name, trash)
+        except OSError:
+            # Already removed by another process
+            return
+        shutil.rmtree(trash, ignore_errors=True)
+
+    @staticmethod
+    def _dir_size(abs_name):
+        size = 0
+        for root, dirs, files in os.walk(abs_name):
+            for f in files:
+                try:
+                    size += os.path.getsize(os.path.join(root, f))
+                except OSError:
+                    pass
+        return size
+
+    def entries(self):
+        """entries() -> list of PersistentCacheEntry
+
+        Scans the store. The access time of an entry is the modification
+        time of its outputs file, which is touched on every hit.
+
+        """
+        elements = []
+        for prefix in os.listdir(self.directory):
+            prefix_dir = os.path.join(self.directory, prefix)
+            if prefix == self.TMP_DIR or not os.path.isdir(prefix_dir):
+                continue
+            for signature in os.listdir(prefix_dir):
+                abs_name = os.path.join(prefix_dir, signature)
+                try:
+                    mtime = os.path.getmtime(os.path.join(abs_name,
+                                                          self.OUTPUTS_FILE))
+                except OSError:
+                    continue
+                elements.append(PersistentCacheEntry(
+                        signature, abs_name, mtime, self._dir_size(abs_name)))
+        return elements
+
+    def size(self):
+        if self._size is None:
+            self._size = sum(e.size for e in self.entries())
+        return self._size
+
+    def has_entry(self, signature):
+        return os.path.isfile(os.path.join(self._entry_dir(signature),
+                                           self.OUTPUTS_FILE))
+
+    def store(self, signature, outputs, file_pool=None):
+        """store(signature: str, outputs: dict, file_pool: FilePool) -> bool
+
+        Writes the output values of a module. Returns False if some value
+        could not be stored, in which case nothing is written.
+
+        """
+        if self.has_entry(signature):
+            return True
+        tmp_dir = self._mkdtemp()
+        files_dir = os.path.join(tmp_dir, self.FILES_DIR)
+        pool_dir = None
+        if file_pool is not None:
+            pool_dir = os.path.join(os.path.realpath(file_pool.directory), '')
+
+        from vistrails.core.modules.basic_modules import PathObject
+        from vistrails.core.modules.vistrails_module import Module
+        def persistent_id(obj):
+            if isinstance(obj, PathObject):
+                if pool_dir is None or \
+                        not os.path.realpath(obj.name).startswith(pool_dir):
+                    # Files outside of the file pool are referenced by name
+                    return None
+                if not os.path.isdir(files_dir):
+                    os.mkdir(files_dir)
+                name = '%d%s' % (len(os.listdir(files_dir)),
+                                 os.path.splitext(obj.name)[1])
+                dst = os.path.join(files_dir, name)
+                if os.path.isdir(obj.name):
+                    shutil.copytree(obj.name, dst)
+                    return 'dir:%s' % name
+                shutil.copyfile(obj.name, dst)
+                return 'file:%s' % name
+            elif isinstance(obj, Module):
+                raise UncacheableValue("module instance")
+            return None
+
+        try:
+            with open(os.path.join(tmp_dir, self.OUTPUTS_FILE), 'wb') as f:
+                pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+                pickler.persistent_id = persistent_id
+                pickler.dump(outputs)
+        except Exception, e:
+            debug.debug("Not storing result %s on disk: %s" % (
+                        signature.encode('hex'), debug.format_exception(e)))
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return False
+
+        entry_dir = self._entry_dir(signature)
+        if not os.path.isdir(os.path.dirname(entry_dir)):
+            try:
+                os.mkdir(os.path.dirname(entry_dir))
+            except OSError:
+                # Created concurrently
+                pass
+        size = self._dir_size(tmp_dir)
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # Another process published the same entry first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return True
+        if self._size is not None:
+            self._size += size
+        if self.size() > self.max_size:
+            self.remove_lru()
+        return True
+
+    def load(self, signature, file_pool=None):
+        """load(signature: str, file_pool: FilePool) -> dict or None
+
+        Returns the output values stored for the given signature, or None
+        if there is no usable entry.
+
+        """
+        entry_dir = self._entry_dir(signature)
+        outputs_file = os.path.join(entry_dir, self.OUTPUTS_FILE)
+
+        from vistrails.core.modules.basic_modules import PathObject
+        def persistent_load(pid):
+            kind, name = pid.split(':', 1)
+            src = os.path.join(entry_dir, self.FILES_DIR, name)
+            if file_pool is None:
+                raise UncacheableValue("no file pool to restore %s" % name)
+            if kind == 'dir':
+                result = file_pool.create_directory()
+                os.rmdir(result.name)
+                shutil.copytree(src, result.name)
+                return result
+            result = file_pool.create_file(suffix=os.path.splitext(name)[1])
+            shutil.copyfile(src, result.name)
+            return result
+
+        try:
+            with open(outputs_file, 'rb') as f:
+                unpickler = pickle.Unpickler(f)
+                unpickler.persistent_load = persistent_load
+                outputs = unpickler.load()
+        except IOError:
+            return None
+        except Exception, e:
+            # Stale or corrupted entry, e.g. a class changed in a package
+            debug.debug("Discarding result %s from disk cache: %s" % (
+                        signature.encode('hex'), debug.format_exception(e)))
+            self.remove(signature)
+            return None
+        try:
+            os.utime(outputs_file, None)
+        except OSError:
+            pass
+        return outputs
+
+    def remove(self, signature):
+        self._remove_dir(self._entry_dir(signature))
+        self._size = None
+
+    def remove_lru(self):
+        """remove_lru() -> None
+
+        Evicts least-recently-used entries until the store is below 90% of
+        its size limit. The store is rescanned so that entries added by
+        other processes are accounted for.
+
+        """
+        with self._lock():
+            elements = self.entries()
+            elements.sort(key=lambda e: e.time)
+            size = sum(e.size for e in elements)
+            target = self.max_size * 0.9
+            nb_removed = 0
+            for elem in elements:
+                if size <= target:
+                    break
+                self._remove_dir(elem.abs_name)
+                size -= elem.size
+                nb_removed += 1
+            debug.debug("Removed %d entries from result cache, %d bytes "
+                        "left" % (nb_removed, size))
+            self._size = size
+
+    def clear(self):
+        with self._lock():
+            for elem in self.entries():
+                self._remove_dir(elem.abs_name)
+            self._size = 0
+
+##############################################################################
+
+import unittest
+
+
+class TestPersistentResultCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='vt_test_results_')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_store_load(self):
+        cache = PersistentResultCache(self.directory, 1 << 20)
+        self.assertIsNone(cache.load('abcdef'))
+        self.assertTrue(cache.store('abcdef', {'value': [1, 2.5, 'a']}))
+        self.assertTrue(cache.has_entry('abcdef'))
+        # a second store (another process) reads the same entry
+        other = PersistentResultCache(self.directory, 1 << 20)
+        self.assertEqual(other.load('abcdef'), {'value': [1, 2.5, 'a']})
+
+    def test_digest_signatures(self):
+        from vistrails.core.cache.hasher import sha_hash
+        cache = PersistentResultCache(self.directory, 1 << 20)
+        signatures = [sha_hash(str(i)).digest() for i in xrange(500)]
+        # digests with null bytes and path separators are the tricky ones
+        self.assertTrue(any('\0' in s for s in signatures))
+        self.assertTrue(any('/' in s for s in signatures))
+        for i, sig in enumerate(signatures):
+            self.assertTrue(cache.store(sig, {'value': i}))
+        other = PersistentResultCache(self.directory, 1 << 20)
+        for i, sig in enumerate(signatures):
+            self.assertTrue(other.has_entry(sig))
+            self.assertEqual(other.load(sig), {'value': i})
+        self.assertEqual(len(other.entries()), len(signatures))
+
+    def test_unpicklable(self):
+        cache = PersistentResultCache(self.directory, 1 << 20)
+        self.assertFalse(cache.store('abcdef', {'value': lambda: 1}))
+        self.assertFalse(cache.has_entry('abcdef'))
+        self.assertEqual(os.listdir(os.path.join(self.directory,
+                                                 cache.TMP_DIR)), [])
+
+    def test_lru(self):
+        cache = PersistentResultCache(self.directory, 1 << 20)
+        data = 'x' * 300000
+        for i, sig in enumerate(['aa01', 'aa02', 'aa03']):
+            cache.store(sig, {'value': data})
+            os.utime(os.path.join(cache._entry_dir(sig), cache.OUTPUTS_FILE),
+                     (1000 + i, 1000 + i))
+        # touch the oldest one
+        self.assertIsNotNone(cache.load('aa01'))
+        cache.store('aa04', {'value': data})
+        self.assertTrue(cache.size() <= cache.max_size)
+        self.assertTrue(cache.has_entry('aa01'))
+        self.assertFalse(cache.has_entry('aa02'))
+        self.assertTrue(cache.has_entry('aa04'))
+
+    def test_files(self):
+        from vistrails.core.modules.module_utils import FilePool
+        pool = FilePool()
+        try:
+            f = pool.create_file(suffix='.txt')
+            with open(f.name, 'w') as fp:
+                fp.write('some result')
+            cache = PersistentResultCache(self.directory, 1 << 20)
+            self.assertTrue(cache.store('abcdef', {'value': f}, pool))
+            os.unlink(f.name)
+            outputs = cache.load('abcdef', pool)
+            self.assertNotEqual(outputs['value'].name, f.name)
+            self.assertTrue(outputs['value'].name.endswith('.txt'))
+            with open(outputs['value'].name) as fp:
+                self.assertEqual(fp.read(), 'some result')
+        finally:
+            pool.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
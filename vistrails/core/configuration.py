@@ -60,6 +60,8 @@ autoConnect: Automatically connect dragged in modules
 autoSave: Automatically save backup vistrails every two minutes
 batch: Run in batch mode instead of interactive mode
 cache: Cache previous results so they may be used in future computations
+checkpoints.interval: Number of actions between workflow checkpoints
+checkpoints.save: Save workflow checkpoints in .vt files
 dataDir: Default data directory
 db: The name for the database to load the vistrail from
 dbDefault: Save vistrails in a database by default
@@ -71,17 +73,23 @@ enablePackagesSilently: Automatically enable packages when needed
 errorLog: Write errors to a log file
 execute: Execute any specified workflows
 executionLog: Track execution provenance when running workflows
+executionThreads: Number of threads used to run independent modules concurrently
 fileDir: Default vistrail directory
 fixedSpreadsheetCells: Draw spreadsheet cells at a fixed size
 handlerDontAsk: Do not ask about extension handling at startup
 host: The hostname for the database to load the vistrail from
+indexedLog: Store execution logs in the indexed append-only format
 installBundles: Install missing Python dependencies
 installBundlesWithPip: Use pip to install missing Python dependencies
 isInServerMode: Indicates whether VisTrails is being run as a server
 jobAutorun: Run jobs automatically when they finish
 jobCheckInterval: How often to check for jobs (in seconds)
+jobCheckThreads: Maximum number of jobs checked at the same time
 jobList: List running workflows
 jobInfo: List jobs in running workflow
+lazyBundles: Extract the contents of .vt files only when they are needed
+lazyDB.cacheSize: Number of actions of a database vistrail that keep their operations
+lazyDB.enabled: Read the operations of database vistrails only when they are needed
 logDir: Log files directory
 maxRecentVistrails: Number of recent vistrails
 maximizeWindows: VisTrails windows should be maximized
@@ -94,6 +102,9 @@ parameters: List of parameters to use when running workflow
 port: The port for the database to load the vistrail from
 repositoryHTTPURL: Remote package repository URL
 repositoryLocalPath: Local package repository directory
+resultCache.cacheDir: Directory for results cached across sessions
+resultCache.cacheSize: Size of the result cache on disk (MB)
+resultCache.enabled: Store module results on disk for use in later sessions
 rootDirectory: Directory that contains the VisTrails source code
 rpcConfig: Config file for server connection options
 rpcInstances: Number of other instances that vistrails should start
@@ -115,6 +126,7 @@ spreadsheetDumpCells: Defines the location for generated cells
 spreadsheetDumpPDF: Whether the spreadsheet should dump images in PDF format
 staticRegistry: XML registry file
 stopOnError: Stop all workflow execution immediately after first error
+streamChunkSize: Number of values passed at once between streaming modules
 subworkflowsDir: Local subworkflows directory
 temporaryDir: Temporary files directory
 thumbs.autoSave: Save thumbnails of visual results
@@ -122,6 +134,8 @@ thumbs.cacheDir: Thumbnail cache directory
 thumbs.cacheSize: Thumbnail cache size (MB)
 thumbs.mouseHover: Show thumbnails when mouse is hovering above a version
 thumbs.tagsOnly: Store thumbnails only for tagged versions
+translationCache.cacheDir: Directory for vistrails translated from older versions
+translationCache.enabled: Only translate vistrails saved by older versions once
 upgradeDelay: Persist upgrade only after other changes
 upgradeModuleFailPrompt: Alert when a subworkflow upgrade fails
 upgrades: Attempt to automatically upgrade old workflows
@@ -153,6 +167,23 @@ cache: Boolean
 
     Cache previous results so they may be used in future computations.
 
+checkpoints: ConfigurationObject
+
+    Settings for the checkpoints used to materialize workflows from the
+    version tree without replaying every action from the root.
+
+checkpoints.interval: Integer
+
+    The number of actions between two checkpoints along the version
+    tree. Tagged versions are always checkpointed. Set to 0 to disable
+    checkpoints.
+
+checkpoints.save: Boolean
+
+    Whether to save workflow checkpoints in .vt files so they can be
+    used when the file is opened again. Files with checkpoints cannot
+    be opened by older versions of VisTrails.
+
 dataDir: Path
 
     The location that VisTrails uses as a default directory for data.
@@ -201,6 +232,13 @@ executionLog: Boolean
 
     Track execution provenance when running workflows.
 
+executionThreads: Integer
+
+    Number of worker threads used to run independent branches of a
+    workflow concurrently. Only modules declared thread-safe run on
+    these threads. Defaults to 0, which updates modules one at a time
+    from the sinks.
+
 fileDir: Path
 
     The location that VisTrails uses as a default directory for
@@ -218,6 +256,14 @@ host: URL
 
     The hostname for the database to load the vistrail from.
 
+indexedLog: Boolean
+
+    Store new execution logs in an append-only binary format indexed by
+    execution, vistrail version and time, so single executions can be
+    read without loading the whole log. Existing logs keep their
+    format. Files saved this way cannot be read by older versions of
+    VisTrails.
+
 installBundles: Boolean
 
     Automatically try to install missing Python dependencies.
@@ -239,6 +285,12 @@ jobCheckInterval: Integer:
 
     How often to check for jobs (in seconds, default=600).
 
+jobCheckThreads: Integer
+
+    Maximum number of job handles checked concurrently when polling the
+    running jobs (default=4). Only handles that declare themselves thread
+    safe are checked concurrently.
+
 jobList: Boolean
 
     List running workflows.
@@ -247,6 +299,29 @@ jobInfo: Boolean
 
     List jobs in running workflow
 
+lazyBundles: Boolean
+
+    Only read the vistrail when opening a .vt file. Thumbnails,
+    abstractions, mashups and the execution log are extracted from the
+    file the first time they are used.
+
+lazyDB: ConfigurationObject
+
+    Settings for opening vistrails from a database without reading all
+    of their contents.
+
+lazyDB.cacheSize: Integer
+
+    The number of actions of a vistrail opened lazily whose operations
+    are kept in memory. The operations of the least recently used
+    actions are read again from the database when needed.
+
+lazyDB.enabled: Boolean
+
+    Only read the version tree when opening a vistrail from a
+    database. The operations of each action are read when a workflow
+    that needs them is materialized.
+
 logDir: Path
 
     The path that indicates where log files should be stored.
@@ -337,6 +412,25 @@ reviewMode: Boolean
 
     *Deprecated* Used to interactively export a pipeline.
 
+resultCache: ConfigurationObject
+
+    Settings for storing module results on disk, so they can be
+    reused across sessions and shared by processes on the same host.
+
+resultCache.cacheDir: Path
+
+    The directory where module results are stored.
+
+resultCache.cacheSize: Integer
+
+    The size (in MB) of the result cache on disk. Least recently used
+    results are removed when it grows past this size.
+
+resultCache.enabled: Boolean
+
+    Whether to store the results of cacheable modules on disk and
+    reuse them in later sessions.
+
 rootDirectory: Path
 
     Directory that contains the VisTrails source code.
@@ -436,6 +530,14 @@ stopOnError: Boolean
     Whether or not VisTrails stops executing the rest of the workflow
     if it encounters an error in one module.
 
+streamChunkSize: Integer
+
+    The number of values a streaming output passes to the downstream
+    modules at each step. Values larger than 1 pass lists of values
+    (chunks), which bounds the memory used by the stream while reducing
+    the per-value overhead. Custom streaming modules have to read their
+    inputs with Generator.next_chunk() to support this.
+
 subworkflowsDir: Path
 
     The location where a user's local subworkflows are stored.
@@ -470,6 +572,22 @@ thumbs.tagsOnly: Boolean
     If True, only stores thumbnails for tagged versions. Otherwise,
     stores thumbnails for all versions.
 
+translationCache: ConfigurationObject
+
+    Settings for keeping the vistrails that were translated from an
+    older file format.
+
+translationCache.cacheDir: Path
+
+    The directory where translated vistrails are stored, named after
+    the hash of the original files.
+
+translationCache.enabled: Boolean
+
+    Whether to store vistrails saved by an older version of VisTrails
+    once they have been translated to the current format, so that
+    opening an unchanged file again skips the translation.
+
 upgradeDelay: Boolean
 
     Persist upgrade only after other changes.
@@ -636,9 +754,27 @@ base_config = {
     "General":
     [ConfigField('autoSave', True, bool, ConfigType.ON_OFF),
      ConfigField('dbDefault', False, bool, ConfigType.ON_OFF),
+     ConfigField('lazyBundles', False, bool, ConfigType.ON_OFF),
+     ConfigFieldParent('lazyDB',
+        [ConfigField('enabled', False, bool, ConfigType.ON_OFF),
+         ConfigField('cacheSize', 1000, int)]),
+     ConfigField('indexedLog', False, bool, ConfigType.ON_OFF),
      ConfigField('cache', True, bool, ConfigType.ON_OFF),
+     ConfigFieldParent('checkpoints',
+        [ConfigField('interval', 100, int),
+         ConfigField('save', False, bool, ConfigType.ON_OFF)]),
+     ConfigFieldParent('resultCache',
+        [ConfigField('enabled', False, bool, ConfigType.ON_OFF,
+                     depends_on="cache"),
+         ConfigField('cacheDir', "results", ConfigPath),
+         ConfigField('cacheSize', 1024, int)]),
+     ConfigFieldParent('translationCache',
+        [ConfigField('enabled', False, bool, ConfigType.ON_OFF),
+         ConfigField('cacheDir', "translations", ConfigPath)]),
      ConfigField('stopOnError', True, bool, ConfigType.ON_OFF),
+     ConfigField('streamChunkSize', 1, int),
      ConfigField('executionLog', True, bool, ConfigType.ON_OFF),
+     ConfigField('executionThreads', 0, int),
      ConfigField('errorLog', True, bool, ConfigType.ON_OFF),
      ConfigField('defaultFileType', system.vistrails_default_file_type(), str,
                  widget_type="combo",
@@ -729,6 +865,7 @@ base_config = {
      ConfigField('developerDebugger', False, bool, ConfigType.INTERNAL)],
     "Jobs":
     [ConfigField('jobCheckInterval', 600, int),
+     ConfigField('jobCheckThreads', 4, int),
      ConfigField('jobAutorun', False, bool),
      ConfigField('jobList', False, bool, ConfigType.COMMAND_LINE_FLAG),
      ConfigField('jobInfo', False, bool, ConfigType.COMMAND_LINE_FLAG)],
@@ -1285,6 +1422,9 @@ class ConfigurationObject(DBConfiguration):
     def __setattr__(self, name, value):
         if name == '_subscribers' or name == '_unset_keys' or name == '_in_init' or name == 'is_dirty' or name == 'vistrails' or self._in_init:
             object.__setattr__(self, name, value)
+        elif name.startswith('_db_'):
+            # indices and deleted lists are created lazily
+            object.__setattr__(self, name, value)
         else:
             if name in self.db_config_keys_name_index:
                 config_key = self.db_config_keys_name_index[name]
@@ -120,6 +120,7 @@ def run_and_get_results(w_list, parameters='', output_dir=None,
         
         jobMonitor = controller.jobMonitor
         current_workflow = jobMonitor.currentWorkflow()
+        sinks = None
         if not current_workflow:
             for job in jobMonitor.workflows.itervalues():
                 try:
@@ -129,6 +130,9 @@ def run_and_get_results(w_list, parameters='', output_dir=None,
                 if version == job_version:
                     current_workflow = job
                     jobMonitor.startWorkflow(job)
+                    # resuming: only run what depends on the jobs
+                    sinks = jobMonitor.resume_sinks(
+                            job, controller.current_pipeline)
             if not current_workflow:
                 current_workflow = JobWorkflow(version)
                 jobMonitor.startWorkflow(current_workflow)
@@ -138,7 +142,8 @@ def run_and_get_results(w_list, parameters='', output_dir=None,
             controller.execute_current_workflow(custom_aliases=aliases,
                                                 custom_params=params,
                                                 extra_info=extra_info,
-                                                reason=reason)
+                                                reason=reason,
+                                                sinks=sinks)
         finally:
             jobMonitor.finishWorkflow()
         new_version = controller.current_version
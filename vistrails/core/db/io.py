@@ -111,6 +111,21 @@ def open_log(fname, was_appended=False):
     return log
 
 
+def open_workflow_exec(fname, exec_id):
+    from vistrails.core.log.workflow_exec import WorkflowExec
+    workflow_exec = vistrails.db.services.io.open_workflow_exec_from_log(
+        fname, exec_id)
+    WorkflowExec.convert(workflow_exec)
+    return workflow_exec
+
+def find_workflow_execs(fname, parent_version=None, start=None, end=None):
+    from vistrails.core.log.workflow_exec import WorkflowExec
+    workflow_execs = vistrails.db.services.io.find_workflow_execs_in_log(
+        fname, parent_version, start, end)
+    for workflow_exec in workflow_execs:
+        WorkflowExec.convert(workflow_exec)
+    return workflow_execs
+
 def merge_logs(new_log, log_fname):
     log = vistrails.db.services.io.merge_logs(new_log, log_fname)
     Log.convert(log)
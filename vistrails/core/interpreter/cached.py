@@ -38,11 +38,14 @@ import copy
 import gc
 import cPickle as pickle
 
+from vistrails.core.cache.persistent import PersistentResultCache
 from vistrails.core.common import InstanceObject, VistrailsInternalError
+from vistrails.core.configuration import get_vistrails_configuration
 from vistrails.core.data_structures.bijectivedict import Bidict
 from vistrails.core import debug
 import vistrails.core.interpreter.base
 from vistrails.core.interpreter.base import AbortExecution
+from vistrails.core.interpreter.scheduler import ParallelScheduler
 import vistrails.core.interpreter.utils
 from vistrails.core.log.controller import DummyLogController
 from vistrails.core.modules.basic_modules import identifier as basic_pkg, \
@@ -210,6 +213,7 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         self._objects = {}
         self.filePool = self._file_pool
         self._streams = []
+        self._result_cache = None
 
     def clear(self):
         self._file_pool.cleanup()
@@ -258,6 +262,95 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                    if mod.module_descriptor.identifier == identifier]
         self.clean_modules(modules)
 
+    def get_result_cache(self):
+        """get_result_cache() -> PersistentResultCache or None
+
+        Returns the on-disk store shared across sessions, or None if it is
+        not enabled in the configuration.
+
+        """
+        conf = get_vistrails_configuration()
+        if (conf is None or not conf.check('cache') or
+                not conf.has_deep_value('resultCache.enabled') or
+                not conf.get_deep_value('resultCache.enabled')):
+            return None
+        directory = vistrails.core.system.get_vistrails_directory(
+                'resultCache.cacheDir')
+        if directory is None:
+            return None
+        size = conf.get_deep_value('resultCache.cacheSize') * 1024 * 1024
+        if (self._result_cache is None or
+                self._result_cache.directory != directory):
+            try:
+                self._result_cache = PersistentResultCache(directory, size)
+            except OSError, e:
+                debug.warning("Can't use result cache in %s" % directory, e)
+                return None
+        self._result_cache.max_size = size
+        return self._result_cache
+
+    def get_execution_threads(self):
+        """get_execution_threads() -> int
+
+        Returns the number of worker threads to use for thread-safe
+        modules, 0 if modules should be updated from the sinks as usual.
+
+        """
+        conf = get_vistrails_configuration()
+        if conf is None or not conf.check('executionThreads'):
+            return 0
+        return max(conf.executionThreads, 0)
+
+    def restore_results(self, result_cache, persistent_id, obj):
+        """restore_results(result_cache, persistent_id, obj) -> bool
+
+        Sets the outputs of a newly created module from the on-disk store.
+        Only succeeds if all the output ports used by downstream modules are
+        available.
+
+        """
+        if not obj.is_cacheable():
+            return False
+        outputs = result_cache.load(obj.signature, self._file_pool)
+        if outputs is None:
+            return False
+        p = self._persistent_pipeline
+        for _, conn_id in p.graph.edges_from(persistent_id):
+            port = p.connections[conn_id].source.name
+            if port != 'self' and port not in outputs:
+                return False
+        for port, value in outputs.iteritems():
+            obj.set_output(port, value)
+        obj.upToDate = True
+        return True
+
+    def store_results(self, result_cache, objs):
+        """store_results(result_cache, objs) -> None
+
+        Writes the outputs of the computed modules in objs to the on-disk
+        store, skipping modules that depend on non-cacheable ones.
+
+        """
+        cacheable = {}
+        def is_cacheable(obj):
+            if obj not in cacheable:
+                cacheable[obj] = False # guards against cycles
+                cacheable[obj] = obj.is_cacheable() and all(
+                        is_cacheable(connector.obj)
+                        for connectors in obj.inputPorts.itervalues()
+                        for connector in connectors)
+            return cacheable[obj]
+
+        for obj in objs:
+            if obj.signature is None or not obj.upToDate or \
+                    result_cache.has_entry(obj.signature) or \
+                    not is_cacheable(obj):
+                continue
+            outputs = dict((port, value)
+                           for port, value in obj.outputPorts.iteritems()
+                           if port != 'self')
+            result_cache.store(obj.signature, outputs, self._file_pool)
+
     def make_connection(self, conn, src, dst):
         """make_connection(self, conn, src, dst)
         Builds a execution-time connection between modules.
@@ -351,6 +444,9 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
          module_added_set,
          conn_added_set) = self.add_to_persistent_pipeline(pipeline)
 
+        result_cache = self.get_result_cache()
+        restored = set()
+
         # Create the new objects
         for i in module_added_set:
             persistent_id = tmp_to_persistent_module_map[i]
@@ -359,6 +455,13 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
             obj.interpreter = self
             obj.id = persistent_id
             obj.signature = module._signature
+
+            # Results stored on disk by a previous session don't need their
+            # inputs, so upstream modules only run if something else uses them
+            if result_cache is not None and \
+                    self.restore_results(result_cache, persistent_id, obj):
+                restored.add(persistent_id)
+                continue
             
             # Checking if output should be stored
             if module.has_annotation_with_key('annotate_output'):
@@ -417,6 +520,8 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         for i in conn_added_set:
             persistent_id = conn_map[i]
             conn = self._persistent_pipeline.connections[persistent_id]
+            if conn.destinationId in restored:
+                continue
             src = self._objects[conn.sourceId]
             dst = self._objects[conn.destinationId]
             self.make_connection(conn, src, dst)
@@ -434,6 +539,24 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
 
     def execute_pipeline(self, pipeline, tmp_id_to_module_map, 
                          persistent_to_tmp_id_map, **kwargs):
+        execution = self.prepare_execution(pipeline, tmp_id_to_module_map,
+                                           persistent_to_tmp_id_map,
+                                           **kwargs)
+        self.run_executions([execution])
+        return self.collect_execution(execution)
+
+    def prepare_execution(self, pipeline, tmp_id_to_module_map,
+                          persistent_to_tmp_id_map, claimed=None, **kwargs):
+        """prepare_execution(pipeline, tmp_id_to_module_map,
+                             persistent_to_tmp_id_map, claimed, **kwargs)
+              -> InstanceObject
+
+        Attaches the logging and pipeline information of an execution to
+        the module instances. If claimed is a set, instances already in it
+        belong to another execution of the same batch and are left alone;
+        the others are added to it.
+
+        """
         def fetch(name, default):
             return kwargs.pop(name, default)
         controller = fetch('controller', None)
@@ -478,7 +601,13 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
             return lambda *args: change_parameter(obj, *args)
 
         # Update **all** modules in the current pipeline
+        owned = []
         for i, obj in tmp_id_to_module_map.iteritems():
+            if claimed is not None:
+                if obj in claimed:
+                    continue
+                claimed.add(obj)
+            owned.append(obj)
             obj.in_pipeline = True # set flag to indicate in pipeline
             obj.logging = logging_obj
             obj.change_parameter = make_change_parameter(obj)
@@ -507,79 +636,179 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
             persistent_sinks = [tmp_id_to_module_map[sink]
                                 for sink in pipeline.graph.sinks()]
 
+        return InstanceObject(tmp_id_to_module_map=tmp_id_to_module_map,
+                              logging_obj=logging_obj,
+                              logging_proxy=logging_obj,
+                              owned=owned,
+                              sinks=persistent_sinks,
+                              parameter_changes=parameter_changes,
+                              clean_pipeline=clean_pipeline,
+                              stop_on_error=stop_on_error)
+
+    def run_executions(self, executions):
+        """run_executions(executions: list of InstanceObject) -> None
+
+        Updates the sinks of executions set up by prepare_execution(). The
+        executions of a batch run together, so modules they share run only
+        once and independent modules can run concurrently.
+
+        """
+        # Keyed on persistent ids, which the copies made for iterations and
+        # streams keep
+        owners = {}
+        for execution in executions:
+            for obj in execution.owned:
+                owners[obj.id] = execution
+        def get_owner(obj):
+            return owners.get(obj.id, executions[0])
+        persistent_sinks = []
+        for execution in executions:
+            execution.stopped = False
+            persistent_sinks.extend(execution.sinks)
+
         self._streams.append(Generator.generators)
         Generator.generators = []
 
-        # Update new sinks
-        for obj in persistent_sinks:
+        def update(obj):
+            """update(obj) -> bool
+            Updates a module and reports its errors. Returns True if the
+            execution should stop. Once an error stopped the execution
+            owning a module, it is skipped.
+
+            """
+            owner = get_owner(obj)
+            if owner.stopped:
+                return False
+            logging_proxy = owner.logging_proxy
             abort = False
             try:
                 obj.update()
-                continue
+                return False
             except ModuleWasSuspended:
-                continue
+                return False
             except ModuleHadError:
                 pass
             except AbortExecution:
-                break
+                return True
             except ModuleSuspended, ms:
                 ms.module.logging.end_update(ms.module, ms,
                                              was_suspended=True)
-                continue
+                return False
             except ModuleErrors, mes:
                 for me in mes.module_errors:
                     me.module.logging.end_update(me.module, me)
-                    logging_obj.signalError(me.module, me)
+                    logging_proxy.signalError(me.module, me)
                     abort = abort or me.abort
             except ModuleError, me:
                 me.module.logging.end_update(me.module, me, me.errorTrace)
-                logging_obj.signalError(me.module, me)
+                logging_proxy.signalError(me.module, me)
                 abort = me.abort
             except ModuleBreakpoint, mb:
                 mb.module.logging.end_update(mb.module)
-                logging_obj.signalError(mb.module, mb)
+                logging_proxy.signalError(mb.module, mb)
                 abort = True
-            if stop_on_error or abort:
-                break
+            if abort:
+                return True
+            if owner.stop_on_error:
+                owner.stopped = True
+            return all(e.stopped for e in executions)
+
+        nb_threads = self.get_execution_threads()
+        if nb_threads:
+            # Independent branches run concurrently; logging and view
+            # updates still happen on this thread
+            reg = get_module_registry()
+            def is_thread_safe(obj):
+                try:
+                    return reg.get_descriptor(obj.__class__).is_thread_safe
+                except Exception:
+                    return False
+            scheduler = ParallelScheduler(nb_threads, is_thread_safe)
+            for execution in executions:
+                execution.logging_proxy = scheduler.wrap(
+                        execution.logging_obj,
+                        wrap_results=('begin_loop_execution',))
+                for obj in execution.owned:
+                    obj.logging = execution.logging_proxy
+            scheduler.run(persistent_sinks, set(self._objects.itervalues()),
+                          update)
+            for execution in executions:
+                execution.logging_proxy = execution.logging_obj
+        else:
+            # Update new sinks
+            for obj in persistent_sinks:
+                if update(obj):
+                    break
 
         # execute all generators until inputs are exhausted
         # this makes sure branching and multiple sinks are executed correctly
-        if not logging_obj.errors and not logging_obj.suspended and \
-                                                          Generator.generators:
-            result = True
+        # Streams only run for executions without errors or suspensions, and
+        # an error only stops the streams of the execution it happened in
+        def is_running(execution):
+            return not (execution.stopped or execution.logging_obj.errors or
+                        execution.logging_obj.suspended)
+        generators = [m for m in Generator.generators
+                      if is_running(get_owner(m))]
+        result = True
+        while generators and result is not None:
             abort = False
-            while result is not None:
-                try:
-                    for m in Generator.generators:
-                        result = m.generator.next()
-                    continue
-                except AbortExecution:
-                    break
-                except ModuleErrors, mes:
-                    for me in mes.module_errors:
-                        me.module.logging.end_update(me.module, me)
-                        logging_obj.signalError(me.module, me)
-                        abort = abort or me.abort
-                except ModuleError, me:
-                    me.module.logging.end_update(me.module, me, me.errorTrace)
-                    logging_obj.signalError(me.module, me)
-                    abort = me.abort
-                except ModuleBreakpoint, mb:
-                    mb.module.logging.end_update(mb.module)
-                    logging_obj.signalError(mb.module, mb)
-                    abort = True
-                except Exception, e:
-                    import traceback
-                    traceback.print_exc()
-                    abort = True
-                if stop_on_error or abort:
-                    break
+            try:
+                for m in generators:
+                    result = m.generator.next()
+                continue
+            except AbortExecution:
+                break
+            except ModuleErrors, mes:
+                for me in mes.module_errors:
+                    me.module.logging.end_update(me.module, me)
+                    get_owner(me.module).logging_obj.signalError(
+                            me.module, me)
+                    abort = abort or me.abort
+                failed = get_owner(mes.module_errors[0].module)
+            except ModuleError, me:
+                me.module.logging.end_update(me.module, me, me.errorTrace)
+                get_owner(me.module).logging_obj.signalError(me.module, me)
+                abort = me.abort
+                failed = get_owner(me.module)
+            except ModuleBreakpoint, mb:
+                mb.module.logging.end_update(mb.module)
+                get_owner(mb.module).logging_obj.signalError(mb.module, mb)
+                abort = True
+            except Exception, e:
+                import traceback
+                traceback.print_exc()
+                abort = True
+            if abort:
+                break
+            if failed.stop_on_error:
+                failed.stopped = True
+                generators = [m for m in generators
+                              if not get_owner(m).stopped]
 
         Generator.generators = self._streams.pop()
 
+        result_cache = self.get_result_cache()
+        if result_cache is not None:
+            self.store_results(result_cache,
+                               [obj
+                                for execution in executions
+                                for obj in execution.owned
+                                if obj.id in execution.logging_obj.executed])
+
         if self.done_update_hook:
             self.done_update_hook(self._persistent_pipeline, self._objects)
-                
+
+    def collect_execution(self, execution):
+        """collect_execution(execution: InstanceObject) -> tuple
+
+        Returns what execute_pipeline() returns, for an execution that was
+        run by run_executions().
+
+        """
+        logging_obj = execution.logging_obj
+        clean_pipeline = execution.clean_pipeline
+        owned = set(execution.owned)
+
         # objs, errs, and execs are mappings that use the local ids as keys,
         # as opposed to the persistent ids.
         # They are thus ideal to external consumption.
@@ -592,7 +821,11 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         caches = {}
 
         to_delete = []
-        for (tmp_id, obj) in tmp_id_to_module_map.iteritems():
+        for (tmp_id, obj) in execution.tmp_id_to_module_map.iteritems():
+            if obj not in owned and obj.upToDate and \
+                    obj.id not in logging_obj.cached:
+                # computed for another execution of the batch
+                logging_obj.update_cached(obj)
             if clean_pipeline:
                 to_delete.append(obj.id)
             objs[tmp_id] = obj
@@ -616,7 +849,8 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
                 # these modules didn't execute
                 execs[tmp_id] = False
 
-        return (to_delete, objs, errs, execs, suspends, caches, parameter_changes)
+        return (to_delete, objs, errs, execs, suspends, caches,
+                execution.parameter_changes)
 
     def finalize_pipeline(self, pipeline, to_delete, objs, errs, execs,
                           suspended, cached, **kwargs):
@@ -676,8 +910,103 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         If modules have no error associated with but were not executed, it
         means they were cached."""
 
+        self.clean_non_cacheable_modules()
+        run = self.begin_run(pipeline, kwargs)
+        if run.execution is not None:
+            self.run_executions([run.execution])
+        return self.end_run(run)
+
+    def execute_many(self, pipelines, **kwargs):
+        """execute_many(pipelines: list of Pipeline, **kwargs) -> list
+
+        Executes several pipelines together and returns the result of
+        each, as execute() would. kwargs are those of execute();
+        'point_kwargs' can give a dictionary for each pipeline that
+        overrides them (e.g. 'reason', 'actions' or 'extra_info').
+
+        All the pipelines are matched with the persistent pipeline before
+        anything runs, so modules they share only run once, and their
+        sinks are updated together: with executionThreads set, modules
+        from different pipelines run concurrently. Each pipeline still
+        gets its own workflow execution in the log. As with execute(),
+        'stop_on_error' defaults to True; an error then stops the pipeline
+        it happened in, but the other pipelines keep running. Pass
+        stop_on_error=False to also continue after errors within each
+        pipeline.
+
+        """
+        point_kwargs = kwargs.pop('point_kwargs', None)
+        if point_kwargs is None:
+            point_kwargs = [{}] * len(pipelines)
+        elif len(point_kwargs) != len(pipelines):
+            raise VistrailsInternalError('point_kwargs should have one '
+                                         'item per pipeline')
+        self.clean_non_cacheable_modules()
+        claimed = set()
+        runs = []
+        for pipeline, extra_kwargs in zip(pipelines, point_kwargs):
+            run_kwargs = dict(kwargs)
+            run_kwargs.update(extra_kwargs)
+            runs.append(self.begin_run(pipeline, run_kwargs, claimed))
+        self.run_executions([run.execution for run in runs
+                             if run.execution is not None])
+        # collect everything before finalize_pipeline() cleans modules
+        for run in runs:
+            if run.execution is not None:
+                run.res = self.collect_execution(run.execution)
+                run.execution = None
+        return [self.end_run(run) for run in runs]
+
+    def execute_batch(self, pipeline, deltas, **kwargs):
+        """execute_batch(pipeline: Pipeline, deltas: list, **kwargs) -> list
+
+        Executes a variant of pipeline for each item of deltas, a list of
+        actions performed on a copy of pipeline, as built by
+        ActionBasedParameterExploration.explore(). Returns the result of
+        each variant, as execute() would.
+
+        The signatures of pipeline are computed once; each variant only
+        rehashes the modules downstream of what its actions changed. The
+        variants are then run by execute_many(), which takes the same
+        kwargs. 'actions' defaults to the delta of each variant.
+
+        """
+        controller = kwargs.get('controller', None)
+        if controller is not None:
+            controller.validate(pipeline)
+        else:
+            pipeline.validate()
+        pipeline.refresh_signatures()
+
+        point_kwargs = kwargs.pop('point_kwargs', None)
+        if point_kwargs is None:
+            point_kwargs = [{}] * len(deltas)
+        elif len(point_kwargs) != len(deltas):
+            raise VistrailsInternalError('point_kwargs should have one '
+                                         'item per delta')
+        pipelines = []
+        new_point_kwargs = []
+        for delta, extra_kwargs in zip(deltas, point_kwargs):
+            variant = copy.copy(pipeline)
+            for action in delta:
+                variant.perform_action(action)
+            pipelines.append(variant)
+            new_point_kwargs.append(dict({'actions': delta}, **extra_kwargs))
+        return self.execute_many(pipelines, point_kwargs=new_point_kwargs,
+                                 **kwargs)
+
+    def begin_run(self, pipeline, kwargs, claimed=None):
+        """begin_run(pipeline: Pipeline, kwargs: dict, claimed: set)
+              -> InstanceObject
+
+        Starts logging the execution of a pipeline and sets it up, see
+        execute(). The modules are run by run_executions() and the result
+        is obtained from end_run().
+
+        """
         # Setup named arguments. We don't use named parameters so
         # that positional parameter calls fail earlier
+        kwargs = dict(kwargs)
         new_kwargs = {}
         def fetch(name, default):
             new_kwargs[name] = r = kwargs.pop(name, default)
@@ -702,8 +1031,6 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         if len(kwargs) > 0:
             raise VistrailsInternalError('Wrong parameters passed '
                                          'to execute: %s' % kwargs)
-        self.clean_non_cacheable_modules()
-
 
 #         if controller is not None:
 #             vistrail = controller.vistrail
@@ -725,27 +1052,48 @@ class CachedInterpreter(vistrails.core.interpreter.base.BaseInterpreter):
         self.annotate_workflow_execution(logger, reason, aliases, params)
 
         res = self.setup_pipeline(pipeline, **new_kwargs)
-        modules_added = res[2]
-        conns_added = res[3]
+        run = InstanceObject(pipeline=pipeline,
+                             kwargs=new_kwargs,
+                             logger=logger,
+                             modules_added=res[2],
+                             conns_added=res[3],
+                             execution=None,
+                             res=None)
         to_delete = res[4]
         errors = res[5]
         if len(errors) == 0:
-            res = self.execute_pipeline(pipeline, *(res[:2]), **new_kwargs)
+            run.execution = self.prepare_execution(pipeline, *(res[:2]),
+                                                   claimed=claimed,
+                                                   **new_kwargs)
         else:
-            res = (to_delete, res[0], errors, {}, {}, {}, [])
+            run.res = (to_delete, res[0], errors, {}, {}, {}, [])
             for (i, error) in errors.iteritems():
                 view.set_module_error(i, error)
-        self.finalize_pipeline(pipeline, *(res[:-1]), **new_kwargs)
+        return run
+
+    def end_run(self, run):
+        """end_run(run: InstanceObject) -> InstanceObject
+
+        Finishes an execution started by begin_run() and returns its
+        result, see execute().
+
+        """
+        if run.execution is not None:
+            res = self.collect_execution(run.execution)
+        else:
+            res = run.res
+        self.finalize_pipeline(run.pipeline, *(res[:-1]), **run.kwargs)
 
         result = InstanceObject(objects=res[1],
                               errors=res[2],
                               executed=res[3],
                               suspended=res[4],
                               parameter_changes=res[6],
-                              modules_added=modules_added,
-                              conns_added=conns_added)
+                              modules_added=run.modules_added,
+                              conns_added=run.conns_added)
 
-        logger.finish_workflow_execution(result.errors, suspended=result.suspended)
+        run.logger.finish_workflow_execution(result.errors,
+                                             suspended=result.suspended)
 
         return result
 
@@ -928,6 +1276,265 @@ class TestCachedInterpreter(unittest.TestCase):
         finally:
             StandardOutput.compute = old_compute
 
+    def test_parallel_execution(self):
+        """Test if the scheduler runs the pipeline like the sinks do."""
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.db.io import load_vistrail
+        from vistrails.core.modules.basic_modules import StandardOutput
+        from vistrails.core.vistrail.controller import VistrailController
+
+        conf = get_vistrails_configuration()
+        old_compute = StandardOutput.compute
+        StandardOutput.compute = lambda s: None
+        old_threads = conf.executionThreads
+        conf.executionThreads = 2
+        try:
+            locator = XMLFileLocator(
+                    vistrails.core.system.vistrails_root_directory() +
+                    '/tests/resources/dummy.xml')
+            (v, abstractions, thumbnails, mashups) = load_vistrail(locator)
+            controller = VistrailController(v, locator, abstractions,
+                                            thumbnails, mashups)
+            n = v.get_version_number('int chain')
+            controller.change_selected_version(n)
+            controller.flush_delayed_actions()
+            p = controller.current_pipeline
+
+            CachedInterpreter.flush()
+            interpreter = CachedInterpreter.get()
+            result = interpreter.execute(p, locator=v, current_version=n,
+                                         view=DummyView())
+            self.assertFalse(result.errors)
+            self.assertTrue(all(result.executed.itervalues()))
+        finally:
+            StandardOutput.compute = old_compute
+            conf.executionThreads = old_threads
+            CachedInterpreter.flush()
+
+    def test_batch_execution(self):
+        """Test if variants of a pipeline run together share modules."""
+        from vistrails.core.db.action import create_action
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.db.io import load_vistrail
+        from vistrails.core.modules.basic_modules import StandardOutput
+        from vistrails.core.vistrail.controller import VistrailController
+
+        conf = get_vistrails_configuration()
+        old_compute = StandardOutput.compute
+        StandardOutput.compute = lambda s: None
+        old_threads = conf.executionThreads
+        try:
+            locator = XMLFileLocator(
+                    vistrails.core.system.vistrails_root_directory() +
+                    '/tests/resources/dummy.xml')
+            (v, abstractions, thumbnails, mashups) = load_vistrail(locator)
+            controller = VistrailController(v, locator, abstractions,
+                                            thumbnails, mashups)
+            n = v.get_version_number('int chain')
+            controller.change_selected_version(n)
+            controller.flush_delayed_actions()
+            p = controller.current_pipeline
+            module = [m for m in p.module_list if m.functions][0]
+            def set_value(value):
+                return [create_action(controller.update_function_ops(
+                            module, 'value', [value]))]
+            deltas = [[], set_value('3'), set_value('3'), set_value('4')]
+
+            for threads in (0, 2):
+                conf.executionThreads = threads
+                CachedInterpreter.flush()
+                interpreter = CachedInterpreter.get()
+                results = interpreter.execute_batch(p, deltas, locator=v,
+                                                    current_version=n,
+                                                    view=DummyView())
+                self.assertEqual(len(results), 4)
+                for result in results:
+                    self.assertFalse(result.errors)
+                    self.assertEqual(len(result.objects), len(p.modules))
+                self.assertTrue(all(results[0].executed.itervalues()))
+                self.assertTrue(all(results[1].executed.itervalues()))
+                # same pipeline as the previous variant
+                self.assertFalse(any(results[2].executed.itervalues()))
+                self.assertEqual(results[1].objects, results[2].objects)
+                self.assertNotEqual(results[0].objects[module.id],
+                                    results[3].objects[module.id])
+                # the base pipeline is left untouched
+                self.assertEqual(
+                    p.modules[module.id].functions[0].params[0].strValue, '2')
+        finally:
+            StandardOutput.compute = old_compute
+            conf.executionThreads = old_threads
+            CachedInterpreter.flush()
+
+    def test_batch_errors(self):
+        """Test if an error only stops the variant it happened in."""
+        from vistrails.core.db.action import create_action
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.db.io import load_vistrail
+        from vistrails.core.modules.basic_modules import StandardOutput
+        from vistrails.core.modules.vistrails_module import ModuleError
+        from vistrails.core.vistrail.controller import VistrailController
+
+        def compute(module):
+            if module.get_input('value') == 4:
+                raise ModuleError(module, "Four")
+        old_compute = StandardOutput.compute
+        StandardOutput.compute = compute
+        try:
+            locator = XMLFileLocator(
+                    vistrails.core.system.vistrails_root_directory() +
+                    '/tests/resources/dummy.xml')
+            (v, abstractions, thumbnails, mashups) = load_vistrail(locator)
+            controller = VistrailController(v, locator, abstractions,
+                                            thumbnails, mashups)
+            n = v.get_version_number('int chain')
+            controller.change_selected_version(n)
+            controller.flush_delayed_actions()
+            p = controller.current_pipeline
+            module = [m for m in p.module_list if m.functions][0]
+            def set_value(value):
+                return [create_action(controller.update_function_ops(
+                            module, 'value', [value]))]
+            deltas = [set_value('4'), set_value('5')]
+
+            CachedInterpreter.flush()
+            interpreter = CachedInterpreter.get()
+            results = interpreter.execute_batch(p, deltas, locator=v,
+                                                current_version=n,
+                                                view=DummyView())
+            self.assertTrue(results[0].errors)
+            self.assertFalse(results[1].errors)
+            self.assertTrue(all(results[1].executed.itervalues()))
+        finally:
+            StandardOutput.compute = old_compute
+            CachedInterpreter.flush()
+
+    def test_batch_stream_errors(self):
+        """Test if a failing stream doesn't stop the other variants."""
+        import urllib
+        from vistrails.core.modules.basic_modules import Round, \
+            version as basic_version
+        from vistrails.core.vistrail.connection import Connection
+        from vistrails.core.vistrail.module import Module
+        from vistrails.core.vistrail.module_function import ModuleFunction
+        from vistrails.core.vistrail.module_param import ModuleParam
+        from vistrails.core.vistrail.pipeline import Pipeline
+        from vistrails.core.vistrail.port import Port
+        from vistrails.core.vistrail.port_spec import PortSpec
+
+        def make_pipeline(id_scope, source):
+            pipeline = Pipeline()
+            source_module = Module(
+                    id=id_scope.getNewId('module'), name='PythonSource',
+                    package=basic_pkg, version=basic_version,
+                    functions=[ModuleFunction(name='source', parameters=[
+                            ModuleParam(pos=0, type='String',
+                                        val=urllib.quote(source))])])
+            source_module.add_port_spec(PortSpec(
+                    id=id_scope.getNewId('port_spec'), name='values',
+                    type='output',
+                    sigstring='(%s:List)' % basic_pkg))
+            output_module = Module(id=id_scope.getNewId('module'),
+                                   name='Round', package=basic_pkg,
+                                   version=basic_version)
+            pipeline.add_module(source_module)
+            pipeline.add_module(output_module)
+            pipeline.add_connection(Connection(
+                    id=id_scope.getNewId('connection'),
+                    ports=[Port(id=id_scope.getNewId('port'),
+                                type='source', moduleId=source_module.id,
+                                name='values',
+                                signature='(%s:List)' % basic_pkg),
+                           Port(id=id_scope.getNewId('port'),
+                                type='destination',
+                                moduleId=output_module.id, name='in_value',
+                                signature='(%s:Float)' % basic_pkg)]))
+            return pipeline
+
+        from vistrails.core.vistrail.vistrail import Vistrail
+        id_scope = Vistrail().idScope
+        pipelines = [
+            make_pipeline(id_scope,
+                          "self.set_streaming_output('values', "
+                          "iter([1, 2, 3]), 3, chunk_size=1)\n"),
+            make_pipeline(id_scope,
+                          "self.set_streaming_output('values', "
+                          "iter([6, 7, 8]), 3, chunk_size=1)\n"),
+        ]
+        computed = []
+        def compute(module):
+            value = module.get_input('in_value')
+            if value == 2:
+                raise ModuleError(module, "Two")
+            computed.append(value)
+        old_compute = Round.compute
+        Round.compute = compute
+        try:
+            CachedInterpreter.flush()
+            interpreter = CachedInterpreter.get()
+            results = interpreter.execute_many(pipelines, locator=None,
+                                               current_version=0,
+                                               view=DummyView())
+            self.assertTrue(results[0].errors)
+            self.assertFalse(results[1].errors)
+            self.assertEqual(sorted(computed), [1, 6, 7, 8])
+        finally:
+            Round.compute = old_compute
+            CachedInterpreter.flush()
+
+    def test_result_cache(self):
+        """Test if results are reused from disk after a flush."""
+        import shutil
+        import tempfile
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.db.io import load_vistrail
+        from vistrails.core.modules.basic_modules import StandardOutput
+        from vistrails.core.vistrail.controller import VistrailController
+
+        conf = get_vistrails_configuration()
+        cache_dir = tempfile.mkdtemp(prefix='vt_test_results_')
+        old_compute = StandardOutput.compute
+        StandardOutput.compute = lambda s: None
+        old_enabled = conf.resultCache.enabled
+        old_dir = conf.resultCache.cacheDir
+        conf.resultCache.enabled = True
+        conf.resultCache.cacheDir = cache_dir
+        try:
+            locator = XMLFileLocator(
+                    vistrails.core.system.vistrails_root_directory() +
+                    '/tests/resources/dummy.xml')
+            (v, abstractions, thumbnails, mashups) = load_vistrail(locator)
+            controller = VistrailController(v, locator, abstractions,
+                                            thumbnails, mashups)
+            n = v.get_version_number('int chain')
+            controller.change_selected_version(n)
+            controller.flush_delayed_actions()
+            p = controller.current_pipeline
+
+            CachedInterpreter.flush()
+            interpreter = CachedInterpreter.get()
+            result = interpreter.execute(p, locator=v, current_version=n,
+                                         view=DummyView())
+            self.assertFalse(result.errors)
+            cacheable = [i for i, m in p.modules.iteritems()
+                         if m.name != 'StandardOutput']
+            self.assertTrue(cacheable)
+            self.assertTrue(all(result.executed[i] for i in cacheable))
+
+            # a fresh interpreter (e.g. a new process) reuses the results
+            CachedInterpreter.flush()
+            interpreter = CachedInterpreter.get()
+            result = interpreter.execute(p, locator=v, current_version=n,
+                                         view=DummyView())
+            self.assertFalse(result.errors)
+            self.assertFalse(any(result.executed.get(i) for i in cacheable))
+        finally:
+            StandardOutput.compute = old_compute
+            conf.resultCache.enabled = old_enabled
+            conf.resultCache.cacheDir = old_dir
+            CachedInterpreter.flush()
+            shutil.rmtree(cache_dir)
+
 
 if __name__ == '__main__':
     unittest.main()
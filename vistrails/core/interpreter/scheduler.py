@@ -0,0 +1,328 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""Parallel scheduling of the modules of a pipeline.
+
+The default execution model pulls data from the sinks: Module.update()
+recursively updates upstream modules on a single thread. ParallelScheduler
+instead walks the graph of module instances in topological order and
+starts each module as soon as all the modules it depends on are done, so
+that independent branches can run concurrently.
+
+Only modules declared with ``ModuleSettings(thread_safe=True)`` run on
+worker threads. Other modules, and every call to the logging and view
+objects, happen on the thread that started the execution.
+
+"""
+
+import Queue
+import sys
+import threading
+
+##############################################################################
+
+class MainThreadProxy(object):
+    """Forwards method calls to an object, running them on the scheduler's
+    main thread.
+
+    Results of the methods named in `wrap_results` are wrapped in turn (e.g.
+    the loop objects returned by the logging controller).
+
+    """
+    def __init__(self, obj, scheduler, wrap_results=()):
+        self._obj = obj
+        self._scheduler = scheduler
+        self._wrap_results = wrap_results
+
+    def __getattr__(self, name):
+        attr = getattr(self._obj, name)
+        if not callable(attr):
+            return attr
+        def call(*args, **kwargs):
+            result = self._scheduler.call_in_main_thread(attr, *args, **kwargs)
+            if name in self._wrap_results:
+                result = MainThreadProxy(result, self._scheduler,
+                                         self._wrap_results)
+            return result
+        return call
+
+
+class ParallelScheduler(object):
+    """Runs the modules upstream of a list of sinks, concurrently when
+    possible.
+
+    `run_update` is called with each module instance, in topological order;
+    it should update the module, report its errors, and return True if the
+    execution should stop. Modules that are already running are allowed to
+    finish, but no other module is started after that.
+
+    """
+
+    def __init__(self, nb_threads, is_thread_safe):
+        self.nb_threads = nb_threads
+        self.is_thread_safe = is_thread_safe
+        self._main_thread = None
+        self._messages = None
+
+    def wrap(self, obj, wrap_results=()):
+        return MainThreadProxy(obj, self, wrap_results)
+
+    def call_in_main_thread(self, func, *args, **kwargs):
+        if self._messages is None or \
+                threading.current_thread() is self._main_thread:
+            return func(*args, **kwargs)
+        done = threading.Event()
+        result = [None, None]
+        self._messages.put(('call', (func, args, kwargs, done, result)))
+        done.wait()
+        if result[1] is not None:
+            raise result[1][0], result[1][1], result[1][2]
+        return result[0]
+
+    @staticmethod
+    def upstream_graph(sinks, objects):
+        """upstream_graph(sinks, objects) -> (list, dict)
+
+        Returns the modules in `objects` that the sinks depend on, in
+        topological order, and a dict mapping each of them to the set of
+        modules it directly depends on. Modules not in `objects` (e.g. the
+        constants that hold parameter values) are updated by the module
+        that uses them.
+
+        """
+        order = []
+        upstream = {}
+        stack = [(sink, False) for sink in reversed(sinks)]
+        while stack:
+            obj, expanded = stack.pop()
+            if expanded:
+                order.append(obj)
+                continue
+            if obj in upstream:
+                continue
+            deps = set()
+            pending = list(getattr(obj, 'inputPorts', {}).itervalues())
+            while pending:
+                for connector in pending.pop():
+                    src = connector.obj
+                    if src in objects:
+                        deps.add(src)
+                    else:
+                        pending.append([c for cl in getattr(
+                                            src, 'inputPorts', {}).itervalues()
+                                        for c in cl])
+            upstream[obj] = deps
+            stack.append((obj, True))
+            stack.extend((dep, False) for dep in deps if dep not in upstream)
+        return order, upstream
+
+    def _worker(self, tasks, run_update):
+        while True:
+            obj = tasks.get()
+            if obj is None:
+                return
+            try:
+                stop = run_update(obj)
+            except Exception:
+                self._messages.put(('error', (obj, sys.exc_info())))
+            else:
+                self._messages.put(('done', (obj, stop)))
+
+    def run(self, sinks, objects, run_update):
+        order, upstream = self.upstream_graph(sinks, objects)
+        downstream = dict((obj, []) for obj in order)
+        nb_deps = {}
+        for obj in order:
+            nb_deps[obj] = len(upstream[obj])
+            for dep in upstream[obj]:
+                downstream[dep].append(obj)
+        ready = [obj for obj in order if not nb_deps[obj]]
+        ready.reverse()
+
+        self._main_thread = threading.current_thread()
+        self._messages = Queue.Queue()
+        tasks = Queue.Queue()
+        threads = []
+        for i in xrange(min(self.nb_threads, len(order))):
+            t = threading.Thread(target=self._worker,
+                                 args=(tasks, run_update),
+                                 name='vistrails-module-%d' % i)
+            t.daemon = True
+            t.start()
+            threads.append(t)
+
+        running = 0
+        stop = False
+        error = None
+        try:
+            while ready or running:
+                inline = None
+                while ready and not stop:
+                    obj = ready.pop()
+                    if threads and self.is_thread_safe(obj):
+                        tasks.put(obj)
+                        running += 1
+                    else:
+                        inline = obj
+                        break
+                if inline is not None:
+                    obj, stop_now = inline, run_update(inline)
+                elif running:
+                    kind, data = self._messages.get()
+                    if kind == 'call':
+                        func, args, kwargs, done, result = data
+                        try:
+                            result[0] = func(*args, **kwargs)
+                        except Exception:
+                            result[1] = sys.exc_info()
+                        done.set()
+                        continue
+                    running -= 1
+                    if kind == 'error':
+                        obj, exc_info = data
+                        error = error or exc_info
+                        stop_now = True
+                    else:
+                        obj, stop_now = data
+                else:
+                    # stopped with modules still waiting
+                    break
+                stop = stop or stop_now
+                for succ in downstream[obj]:
+                    nb_deps[succ] -= 1
+                    if not nb_deps[succ]:
+                        ready.append(succ)
+        finally:
+            for t in threads:
+                tasks.put(None)
+            for t in threads:
+                t.join()
+            self._messages = None
+        if error is not None:
+            raise error[0], error[1], error[2]
+
+##############################################################################
+
+import unittest
+
+
+class TestParallelScheduler(unittest.TestCase):
+    class FakeModule(object):
+        def __init__(self, name, *upstream):
+            self.name = name
+            self.inputPorts = {}
+            for i, obj in enumerate(upstream):
+                connector = lambda: None
+                connector.obj = obj
+                self.inputPorts['in%d' % i] = [connector]
+
+    def make_diamond(self):
+        M = self.FakeModule
+        a = M('a')
+        b = M('b', a)
+        c = M('c', a)
+        d = M('d', b, c)
+        return a, b, c, d
+
+    def test_upstream_graph(self):
+        a, b, c, d = self.make_diamond()
+        constant = self.FakeModule('const')
+        e = self.FakeModule('e', constant, d)
+        order, upstream = ParallelScheduler.upstream_graph(
+                [e], set([a, b, c, d, e]))
+        self.assertEqual(len(order), 5)
+        pos = dict((obj, i) for i, obj in enumerate(order))
+        for obj, deps in upstream.iteritems():
+            for dep in deps:
+                self.assertLess(pos[dep], pos[obj])
+        self.assertEqual(upstream[e], set([d]))
+
+    def test_concurrent_branches(self):
+        a, b, c, d = self.make_diamond()
+        # b and c each wait for the other: only works if they run at the
+        # same time
+        started = dict((obj, threading.Event()) for obj in (b, c))
+        other = {b: c, c: b}
+        done = []
+        def run_update(obj):
+            if obj in other:
+                started[obj].set()
+                if not started[other[obj]].wait(5):
+                    raise RuntimeError("branches didn't run concurrently")
+            done.append(obj)
+            return False
+        scheduler = ParallelScheduler(2, lambda obj: obj in other)
+        scheduler.run([d], set([a, b, c, d]), run_update)
+        self.assertEqual(done[0], a)
+        self.assertEqual(done[-1], d)
+        self.assertEqual(set(done), set([a, b, c, d]))
+
+    def test_stop(self):
+        a, b, c, d = self.make_diamond()
+        done = []
+        def run_update(obj):
+            done.append(obj)
+            return obj is a
+        scheduler = ParallelScheduler(2, lambda obj: True)
+        scheduler.run([d], set([a, b, c, d]), run_update)
+        self.assertEqual(done, [a])
+
+    def test_main_thread_calls(self):
+        a, b, c, d = self.make_diamond()
+        main = threading.current_thread()
+        threads = []
+        class Logger(object):
+            def log(self, obj):
+                threads.append(threading.current_thread())
+        scheduler = ParallelScheduler(4, lambda obj: True)
+        logger = scheduler.wrap(Logger())
+        def run_update(obj):
+            logger.log(obj)
+            return False
+        scheduler.run([d], set([a, b, c, d]), run_update)
+        self.assertEqual(threads, [main] * 4)
+
+    def test_error(self):
+        a, b, c, d = self.make_diamond()
+        def run_update(obj):
+            if obj is b:
+                raise ValueError("module failed")
+            return False
+        scheduler = ParallelScheduler(2, lambda obj: True)
+        with self.assertRaises(ValueError):
+            scheduler.run([d], set([a, b, c, d]), run_update)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -45,7 +45,9 @@ from vistrails.core.modules.sub_module import Group, Abstraction
 from vistrails.core.vistrail.annotation import Annotation
 from vistrails.core.vistrail.pipeline import Pipeline
 from vistrails.core.vistrail.vistrail import Vistrail
+import vistrails.core.db.io
 import vistrails.core.system
+from vistrails.db import VistrailsDBException
 
 
 @apply
@@ -72,7 +74,8 @@ class DummyLogController(object):
 class LogController(object):
     """The top-level log controller.
 
-    This holds a log.
+    This holds a log, and optionally the name of the file the previous
+    executions were saved to.
     """
     local_machine = Machine(
             id=-1,
@@ -82,8 +85,9 @@ class LogController(object):
             processor=vistrails.core.system.current_processor(),
             ram=vistrails.core.system.guess_total_memory())
 
-    def __init__(self, log, machine=None):
+    def __init__(self, log, machine=None, log_filename=None):
         self.log = log
+        self.log_filename = log_filename
         self.module_execs = {}      # vistrails_module -> *Exec
         self.parent_execs = {}      # vistrails_module -> *Exec
         self.children_execs = {}    # vistrails_module -> [*Exec]
@@ -135,6 +139,23 @@ class LogController(object):
         return LogWorkflowExecController(self.log, self.machine, parent_exec,
                                          vistrail, pipeline, currentVersion)
 
+    def get_workflow_exec(self, exec_id):
+        """get_workflow_exec(exec_id: int) -> WorkflowExec
+        Returns a single workflow execution, from the log if it ran in this
+        session, else from the log file. If the file is indexed, only that
+        execution is read. Returns None if it can't be found.
+
+        """
+        if self.log.db_has_workflow_exec_with_id(exec_id):
+            return self.log.db_get_workflow_exec_by_id(exec_id)
+        if self.log_filename is None:
+            return None
+        try:
+            return vistrails.core.db.io.open_workflow_exec(self.log_filename,
+                                                           exec_id)
+        except VistrailsDBException:
+            return None
+
 
 class LogLoopController(object):
     def __init__(self, controller, loop_exec, loop_module):
@@ -384,3 +405,53 @@ class LogWorkflowExecController(LogWorkflowController):
             self.workflow_exec.completed = -1
         else:
             self.workflow_exec.completed = 1
+
+
+import unittest
+
+
+class TestLogController(unittest.TestCase):
+    def test_get_workflow_exec(self):
+        """Test reading single executions from an indexed log."""
+        import os
+        import shutil
+        import tempfile
+        from vistrails.core.log.log import Log
+        import vistrails.db.services.io as db_io
+
+        filename = os.path.join(
+                vistrails.core.system.vistrails_root_directory(),
+                'tests/resources/spx_loop.vt')
+        bundle, save_dir = db_io.open_vistrail_bundle_from_zip_xml(
+                filename, lazy=False)
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        try:
+            log = db_io.open_log_from_xml(bundle.vistrail.db_log_filename,
+                                          True)
+            log_fname = os.path.join(testdir, 'log')
+            db_io.convert_log_to_indexed(log, log_fname)
+            wf_exec = log.db_workflow_execs[-1]
+
+            controller = LogController(Log(), log_filename=log_fname)
+            # the rest of the log is not parsed
+            old_open_log = db_io.open_log_from_xml
+            def open_log_from_xml(*args, **kwargs):
+                self.fail("Whole log was read")
+            db_io.open_log_from_xml = open_log_from_xml
+            try:
+                found = controller.get_workflow_exec(wf_exec.db_id)
+                self.assertIsInstance(found, WorkflowExec)
+                self.assertEqual(found.id, wf_exec.db_id)
+                self.assertEqual(found.parent_version,
+                                 wf_exec.db_parent_version)
+                self.assertIsNone(controller.get_workflow_exec(1000))
+            finally:
+                db_io.open_log_from_xml = old_open_log
+
+            # executions from this session come from the log
+            workflow_exec = WorkflowExec(id=1000)
+            controller.log.add_workflow_exec(workflow_exec)
+            self.assertIs(controller.get_workflow_exec(1000), workflow_exec)
+        finally:
+            shutil.rmtree(testdir)
+            shutil.rmtree(save_dir)
@@ -838,6 +838,9 @@ class Not(Module):
         value = self.get_input('input')
         self.set_output('value', not value)
 
+    def compute_batch(self, inputs):
+        self.set_output('value', [not value for value in inputs['input']])
+
 ##############################################################################
 
 # List
@@ -1119,6 +1122,16 @@ class Round(Converter):
             integ = int(fl + 0.5)   # nearest
         self.set_output('out_value', integ)
 
+    def compute_batch(self, inputs):
+        values = inputs['in_value']
+        if 'floor' in inputs:
+            floors = inputs['floor']
+        else:
+            floors = [self.get_input('floor')] * len(values)
+        self.set_output('out_value',
+                        [int(fl) if floor else int(fl + 0.5)
+                         for fl, floor in izip(values, floors)])
+
 
 class TupleToList(Converter):
     """Turns a Tuple into a List.
@@ -1156,17 +1169,21 @@ class Generator(object):
     """
     Used to keep track of list iteration, it will execute a module once for
     each input in the list/generator.
+
+    A chunked generator passes a list of values at each step instead of a
+    single value; use next_chunk() to read either kind.
     """
     _settings = ModuleSettings(abstract=True)
 
     generators = []
     def __init__(self, size=None, module=None, generator=None, port=None,
-                 accumulated=False):
+                 accumulated=False, chunked=False):
         self.module = module
         self.generator = generator
         self.port = port
         self.size = size
         self.accumulated = accumulated
+        self.chunked = chunked
         if generator and module not in Generator.generators:
             # add to global list of generators
             # they will be topologically ordered
@@ -1179,16 +1196,26 @@ class Generator(object):
         if isinstance(value, Generator):
             value = value.all()
         return value
-    
+
+    def next_chunk(self):
+        """ return the list of values for the current step, or None when
+        the stream is exhausted
+
+        """
+        value = self.next()
+        if value is None or self.chunked:
+            return value
+        return [value]
+
     def all(self):
         """ exhausts next() for Streams
         
         """
         items = []
-        item = self.next()
-        while item is not None:
-            items.append(item)
-            item = self.next()
+        chunk = self.next_chunk()
+        while chunk is not None:
+            items.extend(chunk)
+            chunk = self.next_chunk()
         return items
 
     @staticmethod
@@ -1503,6 +1530,21 @@ class TestNot(unittest.TestCase):
         errors, results = self.run_pipeline([])
         self.assertTrue(errors)
 
+    def test_list(self):
+        """Not computes a whole list at once"""
+        from vistrails.tests.utils import execute, intercept_result
+        with intercept_result(Not, 'value') as results:
+            errors = execute([
+                    ('List', 'org.vistrails.vistrails.basic', [
+                        ('value', [('List', '[True, False, True]')])]),
+                    ('Not', 'org.vistrails.vistrails.basic', []),
+                ],
+                [
+                    (0, 'value', 1, 'input'),
+                ])
+        self.assertFalse(errors)
+        self.assertEqual(results, [[False, True, False]])
+
 
 class TestList(unittest.TestCase):
     @staticmethod
@@ -1645,6 +1687,24 @@ class TestNumericConversions(unittest.TestCase):
                 ]))
         self.assertEqual(results, [7])
 
+    def test_batch(self):
+        """Ports that are not iterated read single values in compute_batch"""
+        from vistrails.tests.utils import execute, intercept_result
+        for floor, expected in [('False', [2, 2, 4]), ('True', [1, 2, 3])]:
+            with intercept_result(Round, 'out_value') as results:
+                self.assertFalse(execute([
+                        ('List', 'org.vistrails.vistrails.basic', [
+                            ('value', [('List', '[1.6, 2.2, 3.5]')])
+                        ]),
+                        ('Round', 'org.vistrails.vistrails.basic', [
+                            ('floor', [('Boolean', floor)]),
+                        ]),
+                    ],
+                    [
+                        (0, 'value', 1, 'in_value'),
+                    ]))
+            self.assertEqual(results, [expected])
+
 
 class TestUnzip(unittest.TestCase):
     def test_unzip_file(self):
@@ -300,6 +300,13 @@ _documentation = \
       specified namespace instead of the 'namespace' attribute of the
       descriptor.
 
+   ModuleSettings.thread_safe: Boolean
+
+      If True, the module's compute() may run on a worker thread,
+      concurrently with other modules, when parallel execution is
+      enabled. Modules that don't set it always run on the thread
+      that started the execution.
+
    Port.name: String
 
       The name of the of the port
@@ -474,7 +481,8 @@ ModuleSettings = namedtuple('ModuleSettings',
                            (('is_root', False),),
                            (('ghost_package', None),),
                            (('ghost_package_version', None),),
-                           (('ghost_namespace', None),),])
+                           (('ghost_namespace', None),),
+                           (('thread_safe', False),),])
 
 Port = namedtuple('Port', 
                      [("name",),
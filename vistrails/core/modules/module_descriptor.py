@@ -139,6 +139,7 @@ class ModuleDescriptor(DBModuleDescriptor):
             self._widget_item = None
             self._is_hidden = False
             self._namespace_hidden = False
+            self._is_thread_safe = False
             self._widget_classes = {}
             self.children = []
             # The ghost attributes represent the original values
@@ -167,6 +168,7 @@ class ModuleDescriptor(DBModuleDescriptor):
             self._widget_classes = dict((k,copy.copy(v)) for k, v in \
                                          other._widget_classes.iteritems())
             self._namespace_hidden = other._namespace_hidden
+            self._is_thread_safe = other._is_thread_safe
             self.ghost_identifier = other.ghost_identifier
             self.ghost_package_version = other.ghost_package_version
             self.ghost_namespace = other.ghost_namespace
@@ -333,6 +335,12 @@ class ModuleDescriptor(DBModuleDescriptor):
         self._namespace_hidden = hidden
     namespace_hidden = property(_get_namespace_hidden, _set_namespace_hidden)
 
+    def _get_is_thread_safe(self):
+        return self._is_thread_safe
+    def _set_is_thread_safe(self, thread_safe):
+        self._is_thread_safe = thread_safe
+    is_thread_safe = property(_get_is_thread_safe, _set_is_thread_safe)
+
     ##########################################################################
     # Operators
 
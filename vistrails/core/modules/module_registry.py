@@ -1209,6 +1209,7 @@ class ModuleRegistry(DBRegistry):
         # descriptor.set_configuration_widget(configureWidget)
         descriptor.is_hidden = settings.hide_descriptor
         descriptor.namespace_hidden = settings.hide_namespace
+        descriptor.is_thread_safe = settings.thread_safe
 
         if settings.signature:
             descriptor.set_hasher_callable(settings.signature)
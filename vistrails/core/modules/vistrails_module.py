@@ -274,11 +274,29 @@ class Module(Serializable):
     will make temporary files work correctly with caching, and will
     make sure the temporaries are correctly removed.
 
+    *Lists*
+
+    When a list is connected to a port that expects single values, the
+    module is executed once per element (see compute_all()). Modules that
+    can process all the elements at once may define a method
+    compute_batch(inputs), which is then called a single time instead;
+    inputs maps the names of the iterated ports to lists of values, one
+    per iteration, and the method should set each output port to a list
+    with one value per iteration. The other ports are read as they would be
+    in a single iteration. Subclasses that override compute() without also
+    overriding compute_batch() are executed per element.
+
     """
 
     _settings = ModuleSettings(is_root=True, abstract=True)
     _output_ports = [OPort("self", "Module", optional=True)]
 
+    # Optional batched compute, see "Lists" above
+    compute_batch = None
+    # Optional incremental reduction of streamed inputs, see
+    # compute_accumulate()
+    reduce_stream = None
+
     def __init__(self):
         self.inputPorts = {}
         self.outputPorts = {}
@@ -683,6 +701,11 @@ class Module(Serializable):
 
         elements, port_names = self.do_combine(combine_type, inputs, port_names)
         num_inputs = len(elements)
+        if (self.has_compute_batch() and self.list_depth == 1 and
+                not self.upToDate and
+                ModuleControlParam.WHILE_COND_KEY not in self.control_params and
+                ModuleControlParam.WHILE_MAX_KEY not in self.control_params):
+            return self.compute_all_batch(port_names, elements)
         loop = self.logging.begin_loop_execution(self, num_inputs)
         ## Update everything for each value inside the list
         outputs = {}
@@ -735,6 +758,42 @@ class Module(Serializable):
             self.set_output(nameOutput, outputs[nameOutput])
         loop.end_loop_execution()
 
+    @classmethod
+    def has_compute_batch(cls):
+        """has_compute_batch() -> bool
+
+        Whether compute_batch() can be used in place of compute(), i.e. it
+        is defined by the same class as compute() or by a subclass of it.
+
+        """
+        for klass in cls.__mro__:
+            if 'compute_batch' in klass.__dict__:
+                return klass.__dict__['compute_batch'] is not None
+            if 'compute' in klass.__dict__:
+                return False
+        return False
+
+    def compute_all_batch(self, port_names, elements):
+        """compute_all_batch(port_names: list, elements: list) -> None
+        Executes the module once for all the elements, with
+        compute_batch(). The loop is logged as a whole, without an entry
+        per iteration.
+
+        """
+        self.typeChecking(self, port_names, elements)
+        num_inputs = len(elements)
+        loop = self.logging.begin_loop_execution(self, num_inputs)
+        self.logging.update_progress(self, 0.0)
+        inputs = dict((port_name, [element[i] for element in elements])
+                      for i, port_name in enumerate(port_names))
+        # Other ports are read as they would be by a single iteration
+        self.list_depth -= 1
+        try:
+            self.compute_batch(inputs)
+        finally:
+            self.list_depth += 1
+        loop.end_loop_execution()
+
     def build_stream(self):
         """Determines and builds correct generator type.
 
@@ -761,6 +820,10 @@ class Module(Serializable):
         """This method creates a generator object and sets the outputs as
         generators.
 
+        If the input streams are chunked, each step computes the module
+        for all the values of the chunks (at once if it defines
+        compute_batch()) and the outputs are chunked as well.
+
         """
         from vistrails.core.modules.basic_modules import Generator
         type = self.control_params.get(ModuleControlParam.LOOP_KEY, 'pairwise')
@@ -773,6 +836,9 @@ class Module(Serializable):
         ports = [port for port, depth, value in self.iterated_ports
                  if depth == self.list_depth]
         num_inputs = self.iterated_ports[0][2].size
+        chunked = any(value.chunked for port, depth, value
+                      in self.iterated_ports if port in ports)
+        output_names = self.outputPorts.keys()
         # the generator will read next from each iterated input port and
         # compute the module again
         module = copy.copy(self)
@@ -787,8 +853,8 @@ class Module(Serializable):
                                   for port, depth, value in
                                   self.iterated_ports])
 
-                elements = [iter_dict[port][1].next() for port in ports]
-                if None in elements:
+                chunks = [iter_dict[port][1].next_chunk() for port in ports]
+                if None in chunks:
                     for name_output in module.outputPorts:
                         module.set_output(name_output, None)
                     if suspended:
@@ -802,37 +868,59 @@ class Module(Serializable):
                     self.logging.end_update(module)
                     yield None
                 if num_inputs:
-                    if i in milestones:
+                    if chunked or i in milestones:
                         self.logging.update_progress(module,float(i)/num_inputs)
                 else:
                     self.logging.update_progress(module, 0.5)
-                module.had_error = False
+                rows = zip(*chunks)
                 ## Type checking
                 if i == 0:
-                    self.typeChecking(module, ports, [elements])
+                    self.typeChecking(module, ports, rows[:1])
 
-                module.upToDate = False
-                module.computed = False
+                if chunked and module.has_compute_batch():
+                    module.had_error = False
+                    module.upToDate = False
+                    module.computed = False
+                    try:
+                        module.compute_batch(dict(izip(ports, chunks)))
+                    except Exception, e:
+                        raise ModuleError(module, str(e))
+                    i += len(rows)
+                    yield True
+                    continue
 
-                self.setInputValues(module, ports, elements, i)
+                outputs = dict((name, []) for name in output_names)
+                for elements in rows:
+                    module.had_error = False
+                    module.upToDate = False
+                    module.computed = False
 
-                try:
-                    module.compute()
-                except ModuleSuspended, e:
-                    e.loop_iteration = i
-                    suspended.append(e)
-                except Exception, e:
-                    raise ModuleError(module, str(e))
-                i += 1
+                    self.setInputValues(module, ports, elements, i)
+
+                    try:
+                        module.compute()
+                    except ModuleSuspended, e:
+                        e.loop_iteration = i
+                        suspended.append(e)
+                    except Exception, e:
+                        raise ModuleError(module, str(e))
+                    if chunked:
+                        for name, values in outputs.iteritems():
+                            values.append(module.outputPorts.get(name))
+                    i += 1
+                if chunked:
+                    for name, values in outputs.iteritems():
+                        module.set_output(name, values)
                 yield True
 
         _generator = generator(self)
         # set streaming outputs
-        for name_output in self.outputPorts:
+        for name_output in output_names:
             iterator = Generator(size=num_inputs,
                                  module=module,
                                  generator=_generator,
-                                 port=name_output)
+                                 port=name_output,
+                                 chunked=chunked)
             self.set_output(name_output, iterator)
 
     def compute_accumulate(self):
@@ -840,6 +928,13 @@ class Module(Serializable):
         streaming inputs to list inputs for modules that does not explicitly
         support streaming.
 
+        Modules that define reduce_stream(accumulator, inputs) are instead
+        given each step of the stream as it arrives, so that the values do
+        not have to be kept in memory; inputs maps the streamed ports to
+        lists of values and the returned accumulator (initially None) is
+        passed to the next call. finish_stream(accumulator) is then called
+        once the stream is exhausted, and should set the outputs.
+
         """
         from vistrails.core.modules.basic_modules import Generator
         suspended = []
@@ -853,21 +948,28 @@ class Module(Serializable):
         module.upToDate = False
         module.computed = False
 
+        reduce_stream = module.reduce_stream
         inputs = dict([(port, []) for port in ports])
         def generator(self):
             self.logging.begin_update(module)
             i = 0
+            accumulator = None
             while 1:
-                elements = [self.streamed_ports[port].next() for port in ports]
-                if None in elements:
+                chunks = [self.streamed_ports[port].next_chunk()
+                          for port in ports]
+                if None in chunks:
                     self.logging.begin_compute(module)
-                    # assembled all inputs so do the actual computation
-                    elements = [inputs[port] for port in ports]
-                    ## Type checking
-                    self.typeChecking(module, ports, zip(*elements))
-                    self.setInputValues(module, ports, elements, i)
                     try:
-                        module.compute()
+                        if reduce_stream is not None:
+                            module.finish_stream(accumulator)
+                        else:
+                            # assembled all inputs so do the actual
+                            # computation
+                            elements = [inputs[port] for port in ports]
+                            ## Type checking
+                            self.typeChecking(module, ports, zip(*elements))
+                            self.setInputValues(module, ports, elements, i)
+                            module.compute()
                     except Exception, e:
                         raise ModuleError(module, str(e))
                     if suspended:
@@ -880,8 +982,16 @@ class Module(Serializable):
                     self.logging.end_update(module)
                     yield None
 
-                for port, value in zip(ports, elements):
-                    inputs[port].append(value)
+                if reduce_stream is not None:
+                    self.typeChecking(module, ports, zip(*chunks))
+                    try:
+                        accumulator = reduce_stream(accumulator,
+                                                    dict(izip(ports, chunks)))
+                    except Exception, e:
+                        raise ModuleError(module, str(e))
+                else:
+                    for port, chunk in izip(ports, chunks):
+                        inputs[port].extend(chunk)
                 for name_output in module.outputPorts:
                     module.set_output(name_output, None)
                 i += 1
@@ -1464,6 +1574,8 @@ class Module(Serializable):
         ports = self.streamed_ports.keys()
         specs = []
         num_inputs = self.streamed_ports[ports[0]].size
+        chunked = any(self.streamed_ports[port].chunked for port in ports)
+        output_names = self.outputPorts.keys()
         module = copy.copy(self)
         module.list_depth = self.list_depth - 1
         module.had_error = False
@@ -1480,43 +1592,53 @@ class Module(Serializable):
             #intsum = 0
             userGenerator = UserGenerator(module)
             while 1:
-                elements = [self.streamed_ports[port].next() for port in ports]
-                if None in elements:
+                chunks = [self.streamed_ports[port].next_chunk()
+                          for port in ports]
+                if None in chunks:
                     self.logging.update_progress(self, 1.0)
                     self.logging.end_update(module)
                     for name_output in module.outputPorts:
                         module.set_output(name_output, None)
                     yield None
-                ## Type checking
-                self.typeChecking(module, ports, [elements])
-                self.setInputValues(module, ports, elements, i)
-
-                userGenerator.next()
-                # <compute here>
-                #intsum += dict(zip(ports, elements))['integerStream']
-                #print "Sum so far:", intsum
+                outputs = dict((name, []) for name in output_names)
+                for elements in zip(*chunks):
+                    ## Type checking
+                    self.typeChecking(module, ports, [elements])
+                    self.setInputValues(module, ports, elements, i)
 
-                # <set output here if any>
-                #module.set_output(name_output, intsum)
-                if num_inputs:
-                    if i in milestones:
-                        self.logging.update_progress(self,float(i)/num_inputs)
-                else:
-                    self.logging.update_progress(self, 0.5)
-                i += 1
+                    userGenerator.next()
+                    # <compute here>
+                    #intsum += dict(zip(ports, elements))['integerStream']
+                    #print "Sum so far:", intsum
+
+                    # <set output here if any>
+                    #module.set_output(name_output, intsum)
+                    if chunked:
+                        for name, values in outputs.iteritems():
+                            values.append(module.outputPorts.get(name))
+                    if num_inputs:
+                        if i in milestones:
+                            self.logging.update_progress(self,float(i)/num_inputs)
+                    else:
+                        self.logging.update_progress(self, 0.5)
+                    i += 1
+                if chunked:
+                    for name, values in outputs.iteritems():
+                        module.set_output(name, values)
                 yield True
 
         generator = _Generator(self)
         # sets streaming outputs for downstream modules
-        for name_output in self.outputPorts:
+        for name_output in output_names:
             iterator = Generator(size=num_inputs,
                                  module=module,
                                  generator=generator,
-                                 port=name_output)
+                                 port=name_output,
+                                 chunked=chunked)
 
             self.set_output(name_output, iterator)
 
-    def set_streaming_output(self, port, generator, size=0):
+    def set_streaming_output(self, port, generator, size=0, chunk_size=None):
         """This method is used to set a streaming output port.
 
         :param port: the name of the output port to be set
@@ -1524,42 +1646,70 @@ class Module(Serializable):
         :param generator: An iterator object supporting .next()
         :param size: The number of values if known (default=0)
         :type size: int
+        :param chunk_size: The number of values passed downstream at each
+          step, defaults to the streamChunkSize configuration option
+        :type chunk_size: int
         """
         from vistrails.core.modules.basic_modules import Generator
         module = copy.copy(self)
 
+        if chunk_size is None:
+            conf = get_vistrails_configuration()
+            chunk_size = 1
+            if conf is not None and conf.check('streamChunkSize'):
+                chunk_size = conf.streamChunkSize
+        chunked = chunk_size > 1
+
         if size:
             milestones = [i*size/10 for i in xrange(1,11)]
         def _Generator():
             i = 0
+            exhausted = False
             while 1:
-                try:
-                    value = generator.next()
-                except StopIteration:
-                    module.set_output(port, None)
-                    self.logging.update_progress(self, 1.0)
-                    yield None
-                except Exception, e:
-                    me = ModuleError(self, "Error generating value: %s"% str(e),
-                                      errorTrace=str(e))
-                    raise me
+                value = None
+                if not exhausted:
+                    try:
+                        if chunked:
+                            value = []
+                            while len(value) < chunk_size:
+                                item = generator.next()
+                                if item is None:
+                                    exhausted = True
+                                    break
+                                value.append(item)
+                        else:
+                            value = generator.next()
+                    except StopIteration:
+                        exhausted = True
+                    except Exception, e:
+                        me = ModuleError(self, "Error generating value: %s"% str(e),
+                                          errorTrace=str(e))
+                        raise me
+                    if chunked and not value:
+                        value = None
                 if value is None:
                     module.set_output(port, None)
                     self.logging.update_progress(self, 1.0)
                     yield None
                 module.set_output(port, value)
                 if size:
-                    if i in milestones:
-                        self.logging.update_progress(self,float(i)/size)
+                    if chunked:
+                        i += len(value)
+                        self.logging.update_progress(self, float(i)/size)
+                    else:
+                        if i in milestones:
+                            self.logging.update_progress(self,float(i)/size)
+                        i += 1
                 else:
                     self.logging.update_progress(self, 0.5)
-                i += 1
+                    i += 1
                 yield True
         _generator = _Generator()
         self.set_output(port, Generator(size=size,
                                         module=module,
                                         generator=_generator,
-                                        port=port))
+                                        port=port,
+                                        chunked=chunked))
 
     def job_monitor(self):
         """ job_monitor() -> JobMonitor
@@ -1876,3 +2026,56 @@ class TestImplicitLooping(unittest.TestCase):
 
     def test_list_custom(self):
         self.run_vt("test-list-custom.vt")
+
+    def test_has_compute_batch(self):
+        """Overriding compute() hides an inherited compute_batch()"""
+        class Batched(Module):
+            def compute(self):
+                pass
+            def compute_batch(self, inputs):
+                pass
+        class Renamed(Batched):
+            pass
+        class Overridden(Batched):
+            def compute(self):
+                pass
+        class Both(Overridden):
+            def compute_batch(self, inputs):
+                pass
+        self.assertFalse(Module.has_compute_batch())
+        self.assertTrue(Batched.has_compute_batch())
+        self.assertTrue(Renamed.has_compute_batch())
+        self.assertFalse(Overridden.has_compute_batch())
+        self.assertTrue(Both.has_compute_batch())
+
+    def test_streaming_chunks(self):
+        """Chunked streams give the same results as unchunked ones"""
+        import urllib
+        from vistrails.tests.utils import execute, capture_stdout
+        for chunk_size in (1, 2, 4):
+            source = urllib.quote(
+                    "self.set_streaming_output('values', "
+                    "iter([1.2, 2.7, 3.5, 4.1, 5.9]), 5, "
+                    "chunk_size=%d)" % chunk_size)
+            with capture_stdout() as output:
+                errors = execute([
+                        ('PythonSource', 'org.vistrails.vistrails.basic', [
+                            ('source', [('String', source)]),
+                        ]),
+                        ('Round', 'org.vistrails.vistrails.basic', []),
+                        ('StandardOutput', 'org.vistrails.vistrails.basic', []),
+                        ('StandardOutput', 'org.vistrails.vistrails.basic', []),
+                    ],
+                    [
+                        (0, 'values', 1, 'in_value'),
+                        (1, 'out_value', 2, 'value'),
+                        (0, 'values', 3, 'value'),
+                    ],
+                    add_port_specs=[
+                        (0, 'output', 'values',
+                         '(org.vistrails.vistrails.basic:List)'),
+                    ])
+            self.assertFalse(errors)
+            self.assertEqual(sorted(output),
+                             ['1', '2', '3', '4', '5',
+                              '[1.2, 2.7, 3.5, 4.1, 5.9]'])
@@ -440,12 +440,22 @@ class NameSearchStmt(RegexEnabledSearchStmt):
         return bool(m)
 
 class ModuleSearchStmt(RegexEnabledSearchStmt):
+    def __init__(self, content, use_regex):
+        RegexEnabledSearchStmt.__init__(self, content, use_regex)
+        self._index = None
+        self._index_size = None
+        self._versions = None
+
     def match(self, vistrail, action):
-        pipeline = vistrail.getPipeline(action.timestep)
-        for module in pipeline.modules.itervalues():
-            if self._content_matches(module.name):
-                return True
-        return False
+        # Look the version up in the index of the vistrail instead of
+        # materializing its pipeline
+        index = vistrail.get_version_index()
+        if index is not self._index or len(index) != self._index_size:
+            self._index = index
+            self._index_size = len(index)
+            self._versions = index.find_versions('module',
+                                                 self._content_matches)
+        return action.timestep in self._versions
 
 class AndSearchStmt(SearchStmt):
     def __init__(self, lst):
@@ -699,6 +709,17 @@ class TestSearch(unittest.TestCase):
         # Test compiling these searches
         SearchCompiler('before')
         SearchCompiler('after')
+    def test25(self):
+        from vistrails.core.db.locator import XMLFileLocator
+        import vistrails.core.system
+        v = XMLFileLocator(vistrails.core.system.vistrails_root_directory() +
+                           '/tests/resources/dummy.xml').load()
+        search = SearchCompiler('module:StandardOutput').searchStmt
+        for action in v.actions:
+            pipeline = v.getPipeline(action.timestep)
+            self.assertEqual(search.match(v, action),
+                             any(m.name == 'StandardOutput'
+                                 for m in pipeline.modules.itervalues()))
 
 if __name__ == '__main__':
     unittest.main()
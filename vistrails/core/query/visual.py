@@ -87,7 +87,17 @@ class VisualQuery(query.Query):
     def run(self, vistrail, name):
         result = []
         self.tupleLength = 2
-        for version in self.versions_to_check:
+        # A version can only match if it contains all the modules of the
+        # query, use the index of the vistrail to skip the others without
+        # materializing their pipelines
+        index = vistrail.get_version_index()
+        query_names = set(module.name
+                          for module in self.queryPipeline.modules.itervalues())
+        versions_to_check = [version for version in self.versions_to_check
+                             if version not in index or
+                             all(index.contains(version, 'module', name)
+                                 for name in query_names)]
+        for version in versions_to_check:
             p = vistrail.getPipeline(version)
             matches = set()
             queryModuleNameIndex = {}
@@ -37,7 +37,7 @@ from datetime import datetime
 from itertools import izip
 import unittest
 
-from vistrails.db.domain import DBAction
+from vistrails.db.domain import DBAction, DBLazyOperationList
 from vistrails.core.system import strftime, time_strptime
 from vistrails.core.vistrail.annotation import Annotation
 from vistrails.core.vistrail.operation import AddOp, ChangeOp, DeleteOp
@@ -134,16 +134,26 @@ class Action(DBAction):
         _action.__class__ = Action
         for _annotation in _action.annotations:
             Annotation.convert(_annotation)
-        for _operation in _action.operations:
-            if _operation.vtType == 'add':
-                AddOp.convert(_operation)
-            elif _operation.vtType == 'change':
-                ChangeOp.convert(_operation)
-            elif _operation.vtType == 'delete':
-                DeleteOp.convert(_operation)
-            else:
-                raise TypeError("Unknown operation type '%s'" %
-                                _operation.vtType)
+        operations = _action.db_operations
+        if isinstance(operations, DBLazyOperationList) and \
+                operations.is_pending():
+            # convert them when they are read from the database
+            operations.convert = Action.convert_operation
+        else:
+            for _operation in operations:
+                Action.convert_operation(_operation)
+
+    @staticmethod
+    def convert_operation(_operation):
+        if _operation.vtType == 'add':
+            AddOp.convert(_operation)
+        elif _operation.vtType == 'change':
+            ChangeOp.convert(_operation)
+        elif _operation.vtType == 'delete':
+            DeleteOp.convert(_operation)
+        else:
+            raise TypeError("Unknown operation type '%s'" %
+                            _operation.vtType)
             
     ##########################################################################
     # Operators
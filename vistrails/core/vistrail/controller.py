@@ -47,7 +47,7 @@ import vistrails.core.db.locator
 from vistrails.core import debug
 from vistrails.core.data_structures.graph import Graph
 from vistrails.core.interpreter.default import get_default_interpreter
-from vistrails.core.vistrail.job import JobMonitor
+from vistrails.core.vistrail.job import JobMonitor, get_job_journal
 from vistrails.core.layout.workflow_layout import WorkflowLayout, \
     Pipeline as LayoutPipeline, Defaults as LayoutDefaults
 from vistrails.core.log.controller import LogController, DummyLogController
@@ -215,7 +215,8 @@ class VistrailController(object):
             
     def get_logger(self):
         if self.logging_on():
-            return LogController(self.log)
+            return LogController(self.log, log_filename=getattr(
+                    self.vistrail, 'db_log_filename', None))
         else:
             return DummyLogController
         
@@ -243,7 +244,8 @@ class VistrailController(object):
             if mashups is not None:
                 self._mashups = mashups
             job_annotation = vistrail.get_annotation('__jobs__')
-            self.jobMonitor = JobMonitor(job_annotation and job_annotation.value)
+            self.jobMonitor = JobMonitor(job_annotation and job_annotation.value,
+                                         get_job_journal(locator))
 
         self.current_version = -1
         self.current_pipeline = Pipeline()
@@ -3370,14 +3372,7 @@ class VistrailController(object):
         # stateless.
 
         def get_cost(descendant, ancestor):
-            cost = 0
-            am = self.vistrail.actionMap
-            if descendant == -1:
-                descendant = 0
-            while descendant != ancestor:
-                descendant = am[descendant].parent
-                cost += 1
-            return cost
+            return self.vistrail.ancestry.distance(descendant, ancestor)
         
         def switch_version(version, allow_fail=False):
             if self.current_version != -1 and not self.current_pipeline:
@@ -3411,7 +3406,7 @@ class VistrailController(object):
                     return result
             # Fast check: if target is cached, copy it and we're done.
             elif version in self._pipelines:
-                result = copy.copy(self._pipelines[version])
+                result = self._pipelines[version].snapshot()
             else:
                 # Find the closest upstream pipeline to the current one
                 cv = self._current_full_graph.inverse_immutable().closest_vertex
@@ -3433,7 +3428,7 @@ class VistrailController(object):
                     if closest == 0:
                         result = self.vistrail.getPipeline(version)
                     else:
-                        result = copy.copy(self._pipelines[closest])
+                        result = self._pipelines[closest].snapshot()
                         action = self.vistrail.general_action_chain(closest, 
                                                                     version)
                         result.perform_action(action)
@@ -3444,7 +3439,7 @@ class VistrailController(object):
                     if self.current_version == -1 or self.current_version == 0:
                         result = Pipeline()
                     else:
-                        result = copy.copy(self.current_pipeline)
+                        result = self.current_pipeline.snapshot()
                     result.perform_action(action)
                 if self._cache_pipelines and \
                         self.vistrail.has_tag(long(version)):
@@ -3456,9 +3451,9 @@ class VistrailController(object):
                             if not allow_fail:
                                 raise
                         else:
-                            self._pipelines[version] = copy.copy(result)
+                            self._pipelines[version] = result.snapshot()
                     else:
-                        self._pipelines[version] = copy.copy(result)
+                        self._pipelines[version] = result.snapshot()
             if do_validate:
                 try:
                     self.validate(result)
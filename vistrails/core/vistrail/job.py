@@ -40,12 +40,19 @@ from vistrails.core.configuration import get_vistrails_configuration
 from vistrails.core import debug
 from vistrails.core.modules.vistrails_module import NotCacheable, \
     ModuleError, ModuleSuspended
+from vistrails.core.system import current_dot_vistrails
 
 from uuid import uuid1
 
 import datetime
 import getpass
+import hashlib
+import heapq
+import itertools
 import json
+import os
+import Queue
+import threading
 import time
 import unittest
 import weakref
@@ -97,6 +104,14 @@ class JobMixin(NotCacheable):
             params = job.parameters
         jm.addJob(self.signature, params, self.job_name())
 
+        scheduler = jm.scheduler
+        if (job is not None and scheduler.has_job(self.signature) and
+                not scheduler.check(self.signature, force=True)):
+            # Still running: suspend without getting a new handle
+            debug.log("Job is still running according to the scheduler")
+            raise ModuleSuspended(self, 'Job is running',
+                                  handle=scheduler.get_handle(self.signature))
+
         # Might raise ModuleSuspended
         debug.log("Calling checkJob()")
         try:
@@ -104,6 +119,8 @@ class JobMixin(NotCacheable):
         except ModuleSuspended, e:
             debug.log("checkJob() raised ModuleSuspended, job handle is %r" %
                       e.handle)
+            if e.handle is not None:
+                scheduler.schedule(self.signature, e.handle)
             raise
 
         # Didn't raise: job is finished
@@ -219,14 +236,15 @@ class Workflow(object):
         # parent modules are stored as temporary exceptions
         self.parents = {}
 
-    def to_dict(self):
+    def to_dict(self, *extra_jobs):
         wf = dict()
         wf['version'] = self.version
         wf['id'] = self.id
         wf['name'] = self.name
         wf['user'] = self.user
         wf['start'] = self.start
-        wf['jobs'] = self.jobs.keys()
+        wf['jobs'] = self.jobs.keys() + [j for j in extra_jobs
+                                         if j not in self.jobs]
         return wf
 
     @staticmethod
@@ -326,6 +344,284 @@ class Job(object):
         return True
 
 
+def handle_is_done(handle):
+    """ handle_is_done(handle: JobHandle) -> bool
+
+        A job is done when it reaches finished or failed state
+        val() is used by stable batchq branch
+    """
+    finished = handle.finished()
+    if hasattr(finished, 'val'):
+        finished = finished.val()
+    if finished:
+        return True
+
+    # FIXME : deprecate this, remove from RemoteQ
+    # finished should just return True here too
+    if hasattr(handle, 'failed'):
+        failed = handle.failed()
+        if hasattr(failed, 'val'):
+            failed = failed.val()
+        if failed:
+            return True
+    return False
+
+
+class JobScheduler(object):
+    """ Decides when the handles of the running jobs are checked.
+
+    Jobs are kept in a priority queue ordered by the time of their next
+    check. A job is checked every `interval` seconds: the check_interval
+    attribute of its handle if it has one, jobCheckInterval otherwise. poll()
+    checks the jobs that are due. Handles with a true thread_safe attribute
+    are checked using at most jobCheckThreads threads, the others one after
+    the other from the calling thread, since they may share a connection.
+    """
+
+    # checks due within this many seconds are done now, so that a timer
+    # with the same period doesn't miss them
+    SLACK = 1.0
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.lock = threading.RLock()
+        # heap of (next check, sequence number, id)
+        self.queue = []
+        # id -> {'handle', 'interval', 'next_check', 'finished'}
+        self.jobs = {}
+        self.counter = itertools.count()
+
+    def schedule(self, id, handle, interval=None, due=False):
+        """ schedule(id: str, handle: JobHandle, interval: float,
+                     due: bool) -> None
+            Adds or replaces a job. Unless due is True, the handle is
+            assumed to have just been checked.
+
+        """
+        if interval is None:
+            interval = getattr(handle, 'check_interval', None)
+        if interval is None:
+            interval = get_vistrails_configuration().jobCheckInterval or 0
+        with self.lock:
+            next_check = 0 if due else self.clock() + interval
+            self.jobs[id] = {'handle': handle,
+                             'interval': interval,
+                             'next_check': next_check,
+                             'finished': False}
+            heapq.heappush(self.queue, (next_check, next(self.counter), id))
+
+    def unschedule(self, id):
+        with self.lock:
+            # stale queue items are skipped by _pop_due()
+            self.jobs.pop(id, None)
+
+    def has_job(self, id):
+        return id in self.jobs
+
+    def get_handle(self, id):
+        job = self.jobs.get(id)
+        return job['handle'] if job is not None else None
+
+    def is_finished(self, id):
+        job = self.jobs.get(id)
+        return job is not None and job['finished']
+
+    def next_check(self):
+        """ next_check() -> float
+            Returns the time of the next check, or None
+
+        """
+        with self.lock:
+            while self.queue:
+                next_check, _, id = self.queue[0]
+                job = self.jobs.get(id)
+                if (job is not None and not job['finished'] and
+                        job['next_check'] == next_check):
+                    return next_check
+                heapq.heappop(self.queue)
+            return None
+
+    def _pop_due(self, now, force):
+        due = []
+        while self.queue and (force or self.queue[0][0] <= now + self.SLACK):
+            next_check, _, id = heapq.heappop(self.queue)
+            job = self.jobs.get(id)
+            if (job is not None and not job['finished'] and
+                    job['next_check'] == next_check):
+                due.append(id)
+        return due
+
+    def _update(self, id, handle, finished, now):
+        job = self.jobs.get(id)
+        if job is None or job['handle'] is not handle:
+            # unscheduled or replaced while it was being checked
+            return
+        if finished:
+            job['finished'] = True
+        else:
+            job['next_check'] = now + job['interval']
+            heapq.heappush(self.queue,
+                           (job['next_check'], next(self.counter), id))
+
+    def check(self, id, force=False):
+        """ check(id: str, force: bool) -> bool
+            Returns whether a job is finished, checking its handle if the
+            job is due or if force is True.
+
+        """
+        with self.lock:
+            job = self.jobs[id]
+            if job['finished']:
+                return True
+            now = self.clock()
+            if not force and job['next_check'] > now + self.SLACK:
+                return False
+            handle = job['handle']
+        finished = handle_is_done(handle)
+        with self.lock:
+            self._update(id, handle, finished, now)
+        return finished
+
+    def poll(self, force=False):
+        """ poll(force: bool) -> list
+            Checks the jobs that are due, or all of them if force is True,
+            and returns the ids of those that finished.
+
+        """
+        now = self.clock()
+        with self.lock:
+            due = [(id, self.jobs[id]['handle'])
+                   for id in self._pop_due(now, force)]
+        if not due:
+            return []
+
+        results = {}
+        def check_all(tasks):
+            while True:
+                try:
+                    id, handle = tasks.get_nowait()
+                except Queue.Empty:
+                    return
+                try:
+                    results[id] = handle_is_done(handle)
+                except Exception, e:
+                    debug.critical("Error checking job %s" % id, e)
+                    results[id] = False
+        safe = Queue.Queue()
+        unsafe = Queue.Queue()
+        for id, handle in due:
+            if getattr(handle, 'thread_safe', False):
+                safe.put((id, handle))
+            else:
+                unsafe.put((id, handle))
+        threads = get_vistrails_configuration().jobCheckThreads
+        threads = min(max(threads or 1, 1), safe.qsize())
+        workers = []
+        if threads > 1:
+            workers = [threading.Thread(target=check_all, args=(safe,))
+                       for i in xrange(threads)]
+            for thread in workers:
+                thread.start()
+        check_all(unsafe)
+        check_all(safe)
+        for thread in workers:
+            thread.join()
+
+        finished = []
+        with self.lock:
+            for id, handle in due:
+                self._update(id, handle, results[id], now)
+                if results[id]:
+                    finished.append(id)
+        return finished
+
+
+class JobJournal(object):
+    """ Append-only journal of the changes made to a JobMonitor.
+
+    Each line is a JSON record adding or replacing a job or a workflow,
+    deleting one, or resetting the monitor (which starts a snapshot). It is
+    replayed over the jobs saved with the vistrail when it is opened, so
+    that jobs submitted since the last save are not lost. Once it holds many
+    more records than there are jobs and workflows, it is rewritten as a
+    snapshot.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.records = 0
+
+    def append(self, records):
+        """ append(records: list) -> None
+
+        """
+        dirname = os.path.dirname(self.filename)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        with open(self.filename, 'ab') as fp:
+            for record in records:
+                fp.write(json.dumps(record) + '\n')
+        self.records += len(records)
+
+    def replay(self, monitor):
+        """ replay(monitor: JobMonitor) -> None
+            Applies the recorded changes to the monitor
+
+        """
+        try:
+            fp = open(self.filename, 'rb')
+        except IOError:
+            return
+        with fp:
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # last record was partially written
+                    debug.warning("Ignoring truncated record in job "
+                                  "journal %s" % self.filename)
+                    continue
+                monitor.apply_record(record)
+                self.records += 1
+
+    def compact(self, monitor):
+        """ compact(monitor: JobMonitor) -> None
+            Replaces the journal with a snapshot of the monitor
+
+        """
+        records = [{'op': 'reset'}]
+        records.extend({'op': 'job', 'job': job.to_dict()}
+                       for job in monitor.jobs.itervalues())
+        records.extend({'op': 'workflow', 'workflow': workflow.to_dict()}
+                       for workflow in monitor.workflows.itervalues())
+        temp = self.filename + '.tmp'
+        with open(temp, 'wb') as fp:
+            for record in records:
+                fp.write(json.dumps(record) + '\n')
+        if os.path.exists(self.filename):
+            # rename() doesn't overwrite on Windows
+            os.remove(self.filename)
+        os.rename(temp, self.filename)
+        self.records = len(records)
+
+
+def get_job_journal(locator):
+    """ get_job_journal(locator: BaseLocator) -> JobJournal
+
+        Returns the journal for the jobs of a saved vistrail, or None
+
+    """
+    from vistrails.db.services.locator import UntitledLocator
+    if locator is None or isinstance(locator, UntitledLocator):
+        return None
+    name = locator.name
+    if not name:
+        return None
+    if isinstance(name, unicode):
+        name = name.encode('utf-8')
+    return JobJournal(os.path.join(current_dot_vistrails(), 'jobs',
+                                   hashlib.sha1(name).hexdigest() + '.log'))
+
+
 class JobMonitor(object):
     """ Keeps a list of running jobs and the current job for a vistrail.
 
@@ -333,13 +629,17 @@ class JobMonitor(object):
     A callback mechanism is used to interact with the associated GUI component.
     """
 
-    def __init__(self, json_string=None):
+    def __init__(self, json_string=None, journal=None):
         self._current_workflow = None
         self.workflows = {}
         self.jobs = {}
         self.callback = None
-        if json_string is not None:
+        self.scheduler = JobScheduler()
+        if json_string:
             self.unserialize(json_string)
+        self.journal = journal
+        if journal is not None:
+            journal.replay(self)
 
     def setCallback(self, callback=None):
         """ setCallback(callback: class) -> None
@@ -393,6 +693,53 @@ class JobMonitor(object):
             self.workflows[id] = wf
         return self.workflows
 
+    def record(self, *records):
+        """ record(*records: dict) -> None
+            Writes changes to the journal, if any
+
+        """
+        if self.journal is None:
+            return
+        try:
+            live = len(self.jobs) + len(self.workflows)
+            if self.journal.records + len(records) > 2 * live + 64:
+                self.journal.compact(self)
+            else:
+                self.journal.append(records)
+        except (IOError, OSError), e:
+            debug.warning("Couldn't write job journal", e)
+
+    def apply_record(self, record):
+        """ apply_record(record: dict) -> None
+            Applies a change read from the journal
+
+        """
+        op = record['op']
+        if op == 'reset':
+            self.jobs = {}
+            self.workflows = {}
+        elif op == 'job':
+            new = Job.from_dict(record['job'])
+            job = self.jobs.get(new.id)
+            if job is None:
+                self.jobs[new.id] = new
+            else:
+                # workflows reference this object
+                job.__dict__.update(new.__dict__)
+        elif op == 'delete_job':
+            self.jobs.pop(record['id'], None)
+            for workflow in self.workflows.itervalues():
+                workflow.jobs.pop(record['id'], None)
+        elif op == 'workflow':
+            workflow = dict(record['workflow'])
+            workflow['jobs'] = dict((i, self.jobs[i])
+                                    for i in workflow['jobs']
+                                    if i in self.jobs)
+            workflow = Workflow.from_dict(workflow)
+            self.workflows[workflow.id] = workflow
+        elif op == 'delete_workflow':
+            self.workflows.pop(record['id'], None)
+
     def addWorkflow(self, workflow):
         """ addWorkflow(workflow: Workflow) -> None
 
@@ -400,6 +747,9 @@ class JobMonitor(object):
         self.workflows[workflow.id] = workflow
         for id, job in workflow.jobs.iteritems():
             self.jobs[id] = job
+        self.record(*([{'op': 'job', 'job': job.to_dict()}
+                       for job in workflow.jobs.itervalues()] +
+                      [{'op': 'workflow', 'workflow': workflow.to_dict()}]))
 
     def getWorkflow(self, id):
         """ getWorkflow(id: str) -> Workflow
@@ -416,6 +766,7 @@ class JobMonitor(object):
         """
         workflow = self.workflows[id]
         del self.workflows[id]
+        records = [{'op': 'delete_workflow', 'id': id}]
         # delete jobs that only occur in this workflow
         for job_id in workflow.jobs:
             delete = True
@@ -424,6 +775,9 @@ class JobMonitor(object):
                     delete = False
             if delete:
                 del self.jobs[job_id]
+                self._forget_handle(job_id)
+                records.append({'op': 'delete_job', 'id': job_id})
+        self.record(*records)
         if self.callback:
             self.callback.deleteWorkflow(id)
 
@@ -435,9 +789,22 @@ class JobMonitor(object):
         for wf in self.workflows.itervalues():
             if id in wf.jobs:
                 del wf.jobs[id]
+        self._forget_handle(id)
+        self.record({'op': 'delete_job', 'id': id})
         if self.callback:
             self.callback.deleteJob(id)
 
+    def _forget_handle(self, id):
+        """ _forget_handle(id: str) -> None
+            Stops checking a deleted job. Handles may define forget(), e.g.
+            to stop polling a server for the job.
+
+        """
+        handle = self.scheduler.get_handle(id)
+        self.scheduler.unschedule(id)
+        if handle is not None and hasattr(handle, 'forget'):
+            handle.forget()
+
     ###########################################################################
     # _current_workflow methods
 
@@ -459,6 +826,36 @@ class JobMonitor(object):
         if self.callback:
             self.callback.startWorkflow(workflow)
 
+    def resume_sinks(self, workflow, pipeline):
+        """ resume_sinks(workflow: Workflow, pipeline: Pipeline) -> list
+
+            Returns the ids of the sinks of pipeline that depend on the
+            finished jobs of workflow, so that resuming it only executes
+            again the modules downstream of those jobs. If none of them is
+            finished, the sinks that depend on any of its jobs are returned.
+            Returns None, i.e. all sinks, if the jobs are not modules of
+            pipeline, e.g. old-style jobs inside of groups.
+
+        """
+        pipeline.refresh_signatures()
+        finished = set()
+        running = set()
+        for module_id in pipeline.modules:
+            job = workflow.jobs.get(pipeline.subpipeline_signature(module_id))
+            if job is None:
+                continue
+            if job.finished or self.scheduler.is_finished(job.id):
+                finished.add(module_id)
+            else:
+                running.add(module_id)
+        job_modules = finished or running
+        if not job_modules:
+            return None
+        downstream = set(job_modules)
+        for module_id in job_modules:
+            downstream.update(pipeline.graph.bfs(module_id))
+        return [sink for sink in pipeline.graph.sinks() if sink in downstream]
+
     def addJobRec(self, obj, parent_id=None):
         workflow = self.currentWorkflow()
         id = obj.module.signature
@@ -478,6 +875,9 @@ class JobMonitor(object):
             return
         # this is a new old-style job that we need to add
         self.addJob(id, {'__message__': obj.msg}, obj.name)
+        handle = getattr(obj, 'handle', None)
+        if handle is not None:
+            self.scheduler.schedule(id, handle)
 
     def finishWorkflow(self):
         """ finish_job() -> None
@@ -499,9 +899,14 @@ class JobMonitor(object):
             self.addJobRec(parent)
 
         # Assume all unfinished jobs that were not updated are now finished
+        records = []
         for job in workflow.jobs.values():
             if not job.finished and not job.updated:
                 job.finish()
+                self.scheduler.unschedule(job.id)
+                records.append({'op': 'job', 'job': job.to_dict()})
+        if records:
+            self.record(*records)
         if self.callback:
             self.callback.finishWorkflow(workflow)
         self._current_workflow = None
@@ -514,6 +919,7 @@ class JobMonitor(object):
         """
 
         params = params if params is not None else {}
+        records = []
 
         if self.hasJob(id):
             # update job attributes
@@ -526,12 +932,20 @@ class JobMonitor(object):
         else:
             job = Job(id, params, name, finished=finished)
             self.jobs[id] = job
+        if finished:
+            self.scheduler.unschedule(id)
+        records.append({'op': 'job', 'job': job.to_dict()})
 
         workflow = self.currentWorkflow()
         if workflow:
+            if (id not in workflow.jobs or
+                    self.workflows.get(workflow.id) is not workflow):
+                records.append({'op': 'workflow',
+                                'workflow': workflow.to_dict(id)})
             workflow.jobs[id] = job
             # we add workflows permanently if they have at least one job
             self.workflows[workflow.id] = workflow
+        self.record(*records)
         if self.callback:
             self.callback.addJob(self.getJob(id))
 
@@ -558,6 +972,9 @@ class JobMonitor(object):
                 finished method for checking if the job has completed
 
         """
+        if self.scheduler.is_finished(id):
+            # the scheduler just found it finished
+            return
         if not self.currentWorkflow():
             if not handle or not self.isDone(handle):
                 raise ModuleSuspended(module, 'Job is running',
@@ -617,21 +1034,7 @@ class JobMonitor(object):
             A job is done when it reaches finished or failed state
             val() is used by stable batchq branch
         """
-        finished = handle.finished()
-        if hasattr(finished, 'val'):
-            finished = finished.val()
-        if finished:
-            return True
-
-        # FIXME : deprecate this, remove from RemoteQ
-        # finished should just return True here too
-        if hasattr(handle, 'failed'):
-            failed = handle.failed()
-            if hasattr(failed, 'val'):
-                failed = failed.val()
-            if failed:
-                return True
-        return False
+        return handle_is_done(handle)
 
 
 ###############################################################################
@@ -674,3 +1077,233 @@ class TestJob(unittest.TestCase):
         self.assertIn(workflow2.id, jm.workflows)
         self.assertEqual(workflow1, jm.workflows[workflow1.id])
         self.assertEqual(workflow2, jm.workflows[workflow2.id])
+
+    def test_resume_sinks(self):
+        from vistrails.core.modules.basic_modules import identifier, version
+        from vistrails.core.vistrail.connection import Connection
+        from vistrails.core.vistrail.module import Module
+        from vistrails.core.vistrail.pipeline import Pipeline
+        from vistrails.core.vistrail.port import Port
+
+        # two branches 0 -> 1 and 2 -> 3, and a lone module 4
+        pipeline = Pipeline()
+        for i, name in enumerate(['String', 'StandardOutput',
+                                  'Integer', 'StandardOutput',
+                                  'StandardOutput']):
+            pipeline.add_module(Module(id=i, name=name, package=identifier,
+                                       version=version))
+        for i, (src, dst) in enumerate([(0, 1), (2, 3)]):
+            pipeline.add_connection(Connection(id=i, ports=[
+                    Port(id=i * 2, type='source', moduleId=src,
+                         name='value'),
+                    Port(id=i * 2 + 1, type='destination', moduleId=dst,
+                         name='value')]))
+        pipeline.refresh_signatures()
+
+        jm = JobMonitor()
+        workflow = Workflow(1)
+        self.assertIsNone(jm.resume_sinks(workflow, pipeline))
+        for i in (0, 2):
+            job = Job(pipeline.subpipeline_signature(i), {})
+            workflow.jobs[job.id] = job
+        # nothing finished: every branch with a job
+        self.assertEqual(sorted(jm.resume_sinks(workflow, pipeline)), [1, 3])
+        workflow.jobs[pipeline.subpipeline_signature(0)].finish()
+        self.assertEqual(jm.resume_sinks(workflow, pipeline), [1])
+
+    def test_journal(self):
+        import shutil
+        import tempfile
+        directory = tempfile.mkdtemp(prefix='vt_jobs_')
+        try:
+            filename = os.path.join(directory, 'jobs', 'test.log')
+            jm = JobMonitor(journal=JobJournal(filename))
+            workflow = Workflow(12, 'wf', 'wf_id')
+            jm.startWorkflow(workflow)
+            jm.addJob('job1', {'a': 1}, 'first')
+            jm.addJob('job2', {'a': 2}, 'second')
+            jm.finishWorkflow()
+            jm.addJob('job1', {'a': 3}, 'first', True)
+            jm.deleteJob('job2')
+
+            # replaying over the saved annotation gives the same monitor
+            jm2 = JobMonitor(journal=JobJournal(filename))
+            self.assertEqual(jm2.serialize(), jm.serialize())
+            self.assertEqual(jm2.getJob('job1').parameters, {'a': 3})
+            self.assertTrue(jm2.getJob('job1').finished)
+            self.assertIs(jm2.workflows['wf_id'].jobs['job1'],
+                          jm2.getJob('job1'))
+            self.assertNotIn('job2', jm2.workflows['wf_id'].jobs)
+            jm3 = JobMonitor(jm.serialize(), JobJournal(filename))
+            self.assertEqual(jm3.serialize(), jm.serialize())
+
+            # a partially written record is ignored
+            with open(filename, 'ab') as fp:
+                fp.write('{"op": "delete_wor')
+            jm2 = JobMonitor(journal=JobJournal(filename))
+            self.assertEqual(jm2.serialize(), jm.serialize())
+            os.remove(filename)
+
+            # the journal doesn't grow without bound
+            jm = JobMonitor(journal=JobJournal(filename))
+            jm.startWorkflow(workflow)
+            for i in xrange(200):
+                jm.addJob('job1', {'i': i})
+            jm.finishWorkflow()
+            with open(filename, 'rb') as fp:
+                self.assertLess(len(fp.readlines()), 100)
+            jm2 = JobMonitor(journal=JobJournal(filename))
+            self.assertEqual(jm2.serialize(), jm.serialize())
+            self.assertEqual(jm2.getJob('job1').parameters, {'i': 199})
+        finally:
+            shutil.rmtree(directory)
+
+    def test_journal_locator(self):
+        from vistrails.db.services.locator import UntitledLocator, \
+            XMLFileLocator
+        self.assertIsNone(get_job_journal(None))
+        self.assertIsNone(get_job_journal(UntitledLocator()))
+        journal1 = get_job_journal(XMLFileLocator('/tmp/a.xml'))
+        journal2 = get_job_journal(XMLFileLocator('/tmp/b.xml'))
+        self.assertNotEqual(journal1.filename, journal2.filename)
+        self.assertEqual(journal1.filename,
+                         get_job_journal(XMLFileLocator('/tmp/a.xml')).filename)
+
+    def test_scheduler(self):
+        class Handle(object):
+            def __init__(self, check_interval=None):
+                self.done = False
+                self.checks = 0
+                if check_interval is not None:
+                    self.check_interval = check_interval
+            def finished(self):
+                self.checks += 1
+                return self.done
+        now = [1000.0]
+        scheduler = JobScheduler(lambda: now[0])
+        fast = Handle(10)
+        slow = Handle(100)
+        scheduler.schedule('fast', fast)
+        scheduler.schedule('slow', slow)
+        self.assertEqual(scheduler.next_check(), 1010.0)
+
+        # nothing is due
+        self.assertEqual(scheduler.poll(), [])
+        self.assertFalse(scheduler.check('fast'))
+        self.assertEqual(fast.checks, 0)
+
+        now[0] = 1010.0
+        self.assertEqual(scheduler.poll(), [])
+        self.assertEqual((fast.checks, slow.checks), (1, 0))
+        self.assertEqual(scheduler.next_check(), 1020.0)
+
+        fast.done = True
+        now[0] = 1020.0
+        self.assertEqual(scheduler.poll(), ['fast'])
+        self.assertTrue(scheduler.is_finished('fast'))
+        self.assertTrue(scheduler.check('fast'))
+        self.assertEqual(fast.checks, 2)
+        self.assertEqual(scheduler.next_check(), 1100.0)
+
+        # forced poll checks everything that is not finished
+        self.assertEqual(scheduler.poll(force=True), [])
+        self.assertEqual((fast.checks, slow.checks), (2, 1))
+        self.assertEqual(scheduler.next_check(), 1120.0)
+
+        # rescheduling replaces the previous entry
+        scheduler.schedule('slow', slow, 5)
+        self.assertEqual(scheduler.next_check(), 1025.0)
+        scheduler.unschedule('slow')
+        self.assertIsNone(scheduler.next_check())
+        self.assertEqual(scheduler.poll(force=True), [])
+        self.assertEqual(slow.checks, 1)
+
+    def test_scheduler_concurrent(self):
+        class Handle(object):
+            check_interval = 0
+            thread_safe = True
+            def finished(self):
+                time.sleep(0.2)
+                return True
+        scheduler = JobScheduler()
+        for i in xrange(8):
+            scheduler.schedule(str(i), Handle(), due=True)
+        old_threads = get_vistrails_configuration().jobCheckThreads
+        get_vistrails_configuration().jobCheckThreads = 8
+        try:
+            start = time.time()
+            finished = scheduler.poll()
+            elapsed = time.time() - start
+        finally:
+            get_vistrails_configuration().jobCheckThreads = old_threads
+        self.assertEqual(sorted(finished), [str(i) for i in xrange(8)])
+        self.assertLess(elapsed, 1.0)
+
+    def test_scheduler_unsafe_handles(self):
+        class Handle(object):
+            running = [0]
+            overlap = [False]
+            def finished(self):
+                self.running[0] += 1
+                if self.running[0] > 1:
+                    self.overlap[0] = True
+                time.sleep(0.05)
+                self.running[0] -= 1
+                return True
+        scheduler = JobScheduler()
+        for i in xrange(4):
+            scheduler.schedule(str(i), Handle(), due=True)
+        old_threads = get_vistrails_configuration().jobCheckThreads
+        get_vistrails_configuration().jobCheckThreads = 4
+        try:
+            self.assertEqual(len(scheduler.poll()), 4)
+        finally:
+            get_vistrails_configuration().jobCheckThreads = old_threads
+        self.assertFalse(Handle.overlap[0])
+
+    def test_mixin_finished_before_check(self):
+        """ Re-executing checks the handle even if no check is due.
+        """
+        from vistrails.core.modules.vistrails_module import Module
+        class Handle(object):
+            done = False
+            def finished(self):
+                return self.done
+        handle = Handle()
+        class Controller(object):
+            jobMonitor = JobMonitor()
+        class MyJob(JobMixin, Module):
+            def job_read_inputs(self):
+                return {}
+            def job_start(self, params):
+                return params
+            def job_get_handle(self, params):
+                return handle
+            def job_finish(self, params):
+                params['result'] = 42
+                return params
+            def job_set_results(self, params):
+                self.result = params['result']
+        def run():
+            module = MyJob()
+            module.signature = 'job_signature'
+            module.moduleInfo['controller'] = Controller
+            module.compute()
+            return module
+        jm = Controller.jobMonitor
+        old_autorun = get_vistrails_configuration().jobAutorun
+        get_vistrails_configuration().jobAutorun = True
+        try:
+            jm.startWorkflow(Workflow(1))
+            self.assertRaises(ModuleSuspended, run)
+            jm.finishWorkflow()
+            self.assertTrue(jm.scheduler.has_job('job_signature'))
+            self.assertGreater(jm.scheduler.next_check(), time.time() + 1)
+
+            handle.done = True
+            jm.startWorkflow(Workflow(1))
+            self.assertEqual(run().result, 42)
+            jm.finishWorkflow()
+        finally:
+            get_vistrails_configuration().jobAutorun = old_autorun
+        self.assertFalse(jm.scheduler.has_job('job_signature'))
@@ -92,6 +92,7 @@ class Module(DBModule):
             self._module_descriptor = None
             self.list_depth = 0
             self.iterated_ports = []
+            self._signature_memo = None
         else:
             self.portVisible = copy.copy(other.portVisible)
             self.visible_input_ports = copy.copy(other.visible_input_ports)
@@ -106,6 +107,7 @@ class Module(DBModule):
             self.list_depth = other.list_depth
             self.iterated_ports = other.iterated_ports
             self._module_descriptor = other._module_descriptor
+            self._signature_memo = other._signature_memo
         if not self.namespace:
             self.namespace = None
         self.function_idx = self.db_functions_id_index
@@ -179,6 +181,7 @@ class Module(DBModule):
     functions = property(_get_functions, _set_functions)
     def add_function(self, function):
         self.db_add_function(function)
+        self._signature_memo = None
     def has_function_with_real_id(self, f_id):
         return self.db_has_function_with_id(f_id)
     def get_function_by_real_id(self, f_id):
@@ -194,8 +197,10 @@ class Module(DBModule):
         return self.db_get_annotation_by_key(key)        
     def add_control_parameter(self, controlParameter):
         self.db_add_controlParameter(controlParameter)
+        self._signature_memo = None
     def delete_control_parameter(self, controlParameter):
         self.db_delete_controlParameter(controlParameter)
+        self._signature_memo = None
     def has_control_parameter_with_name(self, name):
         return self.db_has_controlParameter_with_name(name)
     def get_control_parameter_by_name(self, name):
@@ -73,9 +73,11 @@ class ModuleFunction(DBFunction):
         if other is None:
             self.returnType = "void"
             self.is_valid = False
+            self._signature_memo = None
         else:
             self.returnType = other.returnType
             self.is_valid = other.is_valid
+            self._signature_memo = other._signature_memo
         self.parameter_idx = self.db_parameters_id_index
 
     def __copy__(self):
@@ -122,11 +124,13 @@ class ModuleFunction(DBFunction):
 
     def add_parameter(self, param):
         self.db_add_parameter(param)
+        self._signature_memo = None
     addParameter = add_parameter
 
     def add_parameters(self, params):
         for p in params:
             self.db_add_parameter(p)
+        self._signature_memo = None
 
     ##########################################################################
 
@@ -252,6 +256,26 @@ class TestModuleFunction(unittest.TestCase):
         self.assertEquals(f1, f3)
         self.assertNotEquals(f1.real_id, f3.real_id)
 
+    def test_compact(self):
+        """Makes sure the compact domain classes keep their db_ API."""
+        id_scope = IdScope()
+        f = ModuleFunction(id=id_scope.getNewId(ModuleFunction.vtType),
+                           name=''.join(['val', 'ue']))
+        self.assertIs(f.name, intern('value'))
+        self.assertNotIn('_db_name', getattr(f, '__dict__', {}))
+        self.assertFalse(f.db_has_parameter_with_id(0))
+        self.assertEquals(f.db_deleted_children(), [])
+        self.assertIsNone(f._db_deleted_parameters)
+
+        f.addParameter(self.create_function(id_scope).params[0])
+        param_id = f.params[0].real_id
+        self.assertTrue(f.db_has_parameter_with_id(param_id))
+        f.params[0].is_new = False
+        f.db_delete_parameter(f.params[0])
+        self.assertEquals(len(f.db_deleted_children(True)), 1)
+        self.assertEquals(f.db_deleted_children(), [])
+        self.assertIsNone(f._db_deleted_parameters)
+
     def test_serialization(self):
         import vistrails.core.db.io
         f1 = self.create_function()
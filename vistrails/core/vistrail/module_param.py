@@ -36,6 +36,7 @@
     * ModuleParam
 
  """
+from vistrails.core.cache.hasher import Hasher
 from vistrails.db.domain import DBParameter
 from vistrails.core.modules.utils import parse_port_spec_item_string, \
     create_port_spec_item_string
@@ -66,6 +67,7 @@ class ModuleParam(DBParameter):
             del kwargs['namespace']
         else:
             namespace = None
+        self._signature_memo = None
         DBParameter.__init__(self, *args, **kwargs)
         if self.real_id is None:
             self.real_id = -1
@@ -103,9 +105,10 @@ class ModuleParam(DBParameter):
     def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
         cp = DBParameter.do_copy(self, new_ids, id_scope, id_remap)
         cp.__class__ = ModuleParam
+        cp._signature_memo = self._signature_memo
         cp.minValue = self.minValue
         cp.maxValue = self.maxValue
-        cp.evaluatedStrValue = self.evaluatedStrValue
+        cp._evaluatedStrValue = self._evaluatedStrValue
         cp.queryMethod = self.queryMethod
         cp._port_spec_item = self._port_spec_item
 
@@ -121,6 +124,7 @@ class ModuleParam(DBParameter):
         if _parameter.__class__ == ModuleParam:
             return
         _parameter.__class__ = ModuleParam
+        _parameter._signature_memo = None
         _parameter.queryMethod = None
         _parameter.minValue = ""
         _parameter.maxValue = ""
@@ -138,11 +142,45 @@ class ModuleParam(DBParameter):
     id = DBParameter.db_pos
     pos = DBParameter.db_pos
     real_id = DBParameter.db_id
-    name = DBParameter.db_name
-    typeStr = DBParameter.db_type
-    strValue = DBParameter.db_val
     alias = DBParameter.db_alias
 
+    # Setting any of the attributes the signature is computed from drops
+    # the signature memoized by the cache Hasher
+
+    def drop_signature(self):
+        if self._signature_memo is not None:
+            self._signature_memo = None
+            Hasher.param_edited()
+
+    def _get_name(self):
+        return self.db_name
+    def _set_name(self, name):
+        self.db_name = name
+        self.drop_signature()
+    name = property(_get_name, _set_name)
+
+    def _get_typeStr(self):
+        return self.db_type
+    def _set_typeStr(self, typeStr):
+        self.db_type = typeStr
+        self.drop_signature()
+    typeStr = property(_get_typeStr, _set_typeStr)
+
+    def _get_strValue(self):
+        return self.db_val
+    def _set_strValue(self, strValue):
+        self.db_val = strValue
+        self.drop_signature()
+    strValue = property(_get_strValue, _set_strValue)
+
+    def _get_evaluatedStrValue(self):
+        return self._evaluatedStrValue
+    def _set_evaluatedStrValue(self, evaluatedStrValue):
+        self._evaluatedStrValue = evaluatedStrValue
+        self.drop_signature()
+    evaluatedStrValue = property(_get_evaluatedStrValue,
+                                 _set_evaluatedStrValue)
+
     def parse_db_type(self):
         if self.db_type:
             (self._identifier, self._type, self._namespace) = \
@@ -154,6 +192,7 @@ class ModuleParam(DBParameter):
             self._namespace = None
 
     def update_db_type(self):
+        self.drop_signature()
         if not self._type:
             self.db_type = None
         else:
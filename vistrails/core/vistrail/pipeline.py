@@ -200,6 +200,148 @@ class Pipeline(DBWorkflow):
         cp.set_defaults(self)
         return cp
 
+    # Keys of the modules and connections this pipeline may modify in
+    # place; None means it owns all of them (it is not a snapshot)
+    _owned = None
+    # (type, id) -> module id for functions and port specs, shared
+    # between snapshots and checked before each use
+    _parent_modules = None
+
+    _snapshot_shared = frozenset(['_owned', '_parent_modules'])
+
+    def snapshot(self):
+        """snapshot() -> Pipeline
+        Returns a copy of the pipeline that shares its modules and
+        connections with this one. Containers and indices are copied;
+        a module or connection is only cloned the first time either
+        pipeline modifies it, so switching versions costs time
+        proportional to the changes rather than to the pipeline size.
+
+        """
+        cp = Pipeline.__new__(Pipeline)
+        for k, v in self.__dict__.iteritems():
+            if k not in self._snapshot_shared and \
+                    isinstance(v, (list, dict, Graph, IdScope)):
+                v = copy.copy(v)
+            cp.__dict__[k] = v
+        if self._parent_modules is None:
+            self._parent_modules = {}
+        cp._parent_modules = self._parent_modules
+        self._owned = set()
+        cp._owned = set()
+        return cp
+
+    def _own(self, what, obj_id):
+        """_own(what: str, obj_id: long) -> DBObject
+        Returns the module or connection with the given id, cloning it
+        first if it is still shared with another snapshot.
+
+        """
+        obj = getattr(self, 'db_get_%s_by_id' % what)(obj_id)
+        if self._owned is None or (what, obj_id) in self._owned:
+            return obj
+        obj = copy.copy(obj)
+        is_dirty = self.is_dirty
+        getattr(self, 'db_change_%s' % what)(obj)
+        self.is_dirty = is_dirty
+        g = self._vtTypeMap.get
+        for (child, _, _) in obj.db_children():
+            self.objects[(g(child.vtType, child.vtType), child._db_id)] = \
+                child
+        self._owned.add((what, obj_id))
+        return obj
+
+    def _own_parent(self, parent_type, parent_id):
+        """_own_parent(parent_type: str, parent_id: long) -> None
+        Makes sure the module or connection containing the given
+        parent object is owned by this pipeline before it is modified.
+
+        """
+        if self._owned is None or parent_type is None or parent_id is None:
+            return
+        if parent_type in (Module.vtType, Abstraction.vtType, Group.vtType):
+            self._own(Module.vtType, parent_id)
+        elif parent_type == Connection.vtType:
+            self._own(Connection.vtType, parent_id)
+        elif parent_type in (ModuleFunction.vtType, PortSpec.vtType):
+            self._own(Module.vtType,
+                      self._parent_module_id(parent_type, parent_id))
+
+    def _parent_module_id(self, obj_type, obj_id):
+        """_parent_module_id(obj_type: str, obj_id: long) -> long
+        Returns the id of the module containing the function or port
+        spec with the given id.
+
+        """
+        key = (obj_type, obj_id)
+        get_child = 'db_has_%s_with_id' % obj_type
+        m_id = self._parent_modules.get(key)
+        if m_id in self.modules and \
+                getattr(self.modules[m_id], get_child)(obj_id):
+            return m_id
+        for module in self.module_list:
+            for function in module.db_functions:
+                self._parent_modules[(ModuleFunction.vtType,
+                                      function.db_id)] = module.id
+            for port_spec in module.db_portSpecs:
+                self._parent_modules[(PortSpec.vtType,
+                                      port_spec.db_id)] = module.id
+        try:
+            return self._parent_modules[key]
+        except KeyError:
+            msg = "Cannot find object of type '%s' with id '%s'" % key
+            raise Exception(msg)
+
+    def get_module_for_update(self, module_id):
+        """get_module_for_update(module_id: long) -> Module
+        Returns the module with the given id so that it can be modified
+        in place without affecting snapshots sharing it.
+
+        """
+        if self._owned is None:
+            return self.modules[module_id]
+        return self._own(Module.vtType, module_id)
+
+    def _own_added(self, object):
+        """_own_added(object: DBObject) -> None
+        Records that a module or connection just added at the top
+        level is a fresh copy owned by this pipeline.
+
+        """
+        if self._owned is None:
+            return
+        if object.vtType in (Module.vtType, Abstraction.vtType, Group.vtType):
+            self._owned.add((Module.vtType, object.db_id))
+        elif object.vtType == Connection.vtType:
+            self._owned.add((Connection.vtType, object.db_id))
+
+    def db_add_object(self, object, parent_obj_type=None,
+                      parent_obj_id=None, parent_obj=None):
+        if parent_obj is None:
+            self._own_parent(parent_obj_type, parent_obj_id)
+        DBWorkflow.db_add_object(self, object, parent_obj_type,
+                                 parent_obj_id, parent_obj)
+        if parent_obj is None and \
+                (parent_obj_type is None or parent_obj_id is None):
+            self._own_added(object)
+
+    def db_change_object(self, old_id, object, parent_obj_type=None,
+                         parent_obj_id=None, parent_obj=None):
+        if parent_obj is None:
+            self._own_parent(parent_obj_type, parent_obj_id)
+        DBWorkflow.db_change_object(self, old_id, object, parent_obj_type,
+                                    parent_obj_id, parent_obj)
+        if parent_obj is None and \
+                (parent_obj_type is None or parent_obj_id is None):
+            self._own_added(object)
+
+    def db_delete_object(self, obj_id, obj_type, parent_obj_type=None,
+                         parent_obj_id=None, parent_obj=None):
+        if parent_obj is None:
+            self._own_parent(parent_obj_type, parent_obj_id)
+        DBWorkflow.db_delete_object(self, obj_id, obj_type, parent_obj_type,
+                                    parent_obj_id, parent_obj)
+
     @staticmethod
     def convert(_workflow):
         if _workflow.__class__ == Pipeline:
@@ -364,6 +506,30 @@ class Pipeline(DBWorkflow):
         elif op.vtType == 'change':
             f(op.oldObjId, op.data, op.parentObjType, op.parentObjId)
 
+        # Drop the signatures of the module whose functions, parameters,
+        # etc. were changed
+        module_id = None
+        if op.parentObjType in (Module.vtType, Abstraction.vtType,
+                                Group.vtType):
+            module_id = op.parentObjId
+        elif op.parentObjType == ModuleFunction.vtType:
+            function = self.db_get_object(ModuleFunction.vtType,
+                                          op.parentObjId)
+            function._signature_memo = None
+            for module in self.module_list:
+                if (module.has_function_with_real_id(op.parentObjId) and
+                        module.get_function_by_real_id(
+                                op.parentObjId) is function):
+                    module_id = module.id
+                    break
+        elif (op.parentObjType == Connection.vtType and
+                self.has_connection_with_id(op.parentObjId)):
+            connection = self.connections[op.parentObjId]
+            if connection.destination is not None:
+                module_id = connection.destinationId
+        if module_id is not None and self.has_module_with_id(module_id):
+            self.invalidate_module_signature(module_id)
+
     def add_module(self, m, *args):
         """add_module(m: Module) -> None 
         Add new module to pipeline
@@ -383,6 +549,10 @@ class Pipeline(DBWorkflow):
         self.db_change_object(old_id, m)
         self.graph.delete_vertex(old_id)
         self.graph.add_vertex(m.id)
+        if old_id in self._module_signatures:
+            del self._module_signatures[old_id]
+        if old_id in self._subpipeline_signatures:
+            del self._subpipeline_signatures[old_id]
 
     def delete_module(self, id, *args):
         """delete_module(id:int) -> None 
@@ -418,16 +588,20 @@ class Pipeline(DBWorkflow):
         if c.source is not None and c.destination is not None:
             assert(c.sourceId != c.destinationId)        
             self.graph.add_edge(c.sourceId, c.destinationId, c.id)
+            if c.destinationId in self._subpipeline_signatures:
+                del self._subpipeline_signatures[c.destinationId]
             self.ensure_connection_specs([c.id])
 
             source_name = c.source.name
-            output_ports = self.modules[c.sourceId].connected_output_ports
+            source_module = self.get_module_for_update(c.sourceId)
+            output_ports = source_module.connected_output_ports
             if source_name not in output_ports:
                 output_ports[source_name] = 0
             output_ports[source_name] += 1
                 
             dest_name = c.destination.name
-            input_ports = self.modules[c.destinationId].connected_input_ports
+            dest_module = self.get_module_for_update(c.destinationId)
+            input_ports = dest_module.connected_input_ports
             if dest_name not in input_ports:
                 input_ports[dest_name] = 0
             input_ports[dest_name] += 1
@@ -454,10 +628,14 @@ class Pipeline(DBWorkflow):
 
         if old_id in self._connection_signatures:
             del self._connection_signatures[old_id]
+        if old_conn.destinationId in self._subpipeline_signatures:
+            del self._subpipeline_signatures[old_conn.destinationId]
         self.db_change_object(old_id, c)        
         if c.source is not None and c.destination is not None:
             assert(c.sourceId != c.destinationId)
             self.graph.add_edge(c.sourceId, c.destinationId, c.id)
+            if c.destinationId in self._subpipeline_signatures:
+                del self._subpipeline_signatures[c.destinationId]
             self.ensure_connection_specs([c.id])
             self.modules[c.sourceId].connected_output_ports.add(c.source.name)
             self.modules[c.destinationId].connected_input_ports.add(
@@ -481,12 +659,16 @@ class Pipeline(DBWorkflow):
 
             c = conn
             source_name = c.source.name
-            output_ports = self.modules[c.sourceId].connected_output_ports
+            source_module = self.get_module_for_update(c.sourceId)
+            output_ports = source_module.connected_output_ports
             output_ports[source_name] -= 1
                 
             dest_name = c.destination.name
-            input_ports = self.modules[c.destinationId].connected_input_ports
+            dest_module = self.get_module_for_update(c.destinationId)
+            input_ports = dest_module.connected_input_ports
             input_ports[dest_name] -= 1
+            if c.destinationId in self._subpipeline_signatures:
+                del self._subpipeline_signatures[c.destinationId]
 
         if id in self._connection_signatures:
             del self._connection_signatures[id]
@@ -530,13 +712,15 @@ class Pipeline(DBWorkflow):
                                 connection.id)
             c = connection
             source_name = c.source.name
-            output_ports = self.modules[c.sourceId].connected_output_ports
+            source_module = self.get_module_for_update(c.sourceId)
+            output_ports = source_module.connected_output_ports
             if source_name not in output_ports:
                 output_ports[source_name] = 0
             output_ports[source_name] += 1
                 
             dest_name = c.destination.name
-            input_ports = self.modules[c.destinationId].connected_input_ports
+            dest_module = self.get_module_for_update(c.destinationId)
+            input_ports = dest_module.connected_input_ports
             if dest_name not in input_ports:
                 input_ports[dest_name] = 0
             input_ports[dest_name] += 1
@@ -549,11 +733,13 @@ class Pipeline(DBWorkflow):
                                    conn.id)
             c = conn
             source_name = c.source.name
-            output_ports = self.modules[c.sourceId].connected_output_ports
+            source_module = self.get_module_for_update(c.sourceId)
+            output_ports = source_module.connected_output_ports
             output_ports[source_name] -= 1
                 
             dest_name = c.destination.name
-            input_ports = self.modules[c.destinationId].connected_input_ports
+            dest_module = self.get_module_for_update(c.destinationId)
+            input_ports = dest_module.connected_input_ports
             input_ports[dest_name] -= 1
             
         self.db_delete_object(port_id, Port.vtType, parent_type, parent_id)
@@ -575,7 +761,7 @@ class Pipeline(DBWorkflow):
             dest_list.append((connection.sourceId, connection.id))
 
     def add_port_to_registry(self, portSpec, moduleId):
-        m = self.get_module_by_id(moduleId)
+        m = self.get_module_for_update(moduleId)
         m.add_port_spec(portSpec)
 
     def add_portSpec(self, port_spec, parent_type, parent_id):
@@ -583,7 +769,7 @@ class Pipeline(DBWorkflow):
         self.add_port_to_registry(port_spec, parent_id)
         
     def delete_port_from_registry(self, id, moduleId):
-        m = self.get_module_by_id(moduleId)
+        m = self.get_module_for_update(moduleId)
         portSpec = m.port_specs[id]
         m.delete_port_spec(portSpec)
 
@@ -769,6 +955,22 @@ class Pipeline(DBWorkflow):
             self._module_signatures[module_id] = sig
             return sig
     
+    def invalidate_module_signature(self, module_id):
+        """invalidate_module_signature(module_id: int) -> None
+        Drops the signature of a module that was changed, and the
+        subpipeline and connection signatures downstream of it.
+
+        """
+        self.modules[module_id]._signature_memo = None
+        if module_id in self._module_signatures:
+            del self._module_signatures[module_id]
+        for m_id in [module_id] + self.graph.bfs(module_id).keys():
+            if m_id in self._subpipeline_signatures:
+                del self._subpipeline_signatures[m_id]
+            for _, c_id in self.graph.edges_to(m_id):
+                if c_id in self._connection_signatures:
+                    del self._connection_signatures[c_id]
+
     def module_id_from_signature(self, signature):
         """module_id_from_signature(sig): int
         Returns the module_id that corresponds to the given signature.
@@ -835,10 +1037,55 @@ class Pipeline(DBWorkflow):
         return signature in self._connection_signatures.inverse
 
     def refresh_signatures(self):
-        self._connection_signatures = {}
-        self._subpipeline_signatures = {}
+        """refresh_signatures() -> None
+        Brings all signatures up to date with the current contents of the
+        pipeline.
+
+        Module signatures are memoized on the modules, functions and
+        parameters themselves, so recomputing them is cheap for modules
+        that did not change. Subpipeline signatures are only rehashed for
+        the modules whose signature or upstream changed, i.e. the
+        downstream cone of the edited modules.
+
+        """
+        old_module_sigs = self._module_signatures
+        old_subpipeline_sigs = self._subpipeline_signatures
+        old_connection_sigs = self._connection_signatures
         self._module_signatures = {}
-        self.compute_signatures()
+        self._subpipeline_signatures = {}
+        self._connection_signatures = {}
+        try:
+            verts = self.graph.vertices_topological_sort()
+        except Graph.GraphContainsCycles:
+            raise CycleInPipeline()
+        registry = get_module_registry()
+        changed = set()
+        for module_id in verts:
+            module_sig = registry.module_signature(self,
+                                                   self.modules[module_id])
+            self._module_signatures[module_id] = module_sig
+            edges = self.graph.edges_to(module_id)
+            old_sig = old_subpipeline_sigs.get(module_id)
+            if (old_sig is not None and
+                    old_module_sigs.get(module_id) == module_sig and
+                    not any(m in changed for m, _ in edges)):
+                self._subpipeline_signatures[module_id] = old_sig
+                continue
+            upstream_sigs = [(self._subpipeline_signatures[m] +
+                              Hasher.connection_signature(
+                                      self.connections[edge_id]))
+                             for (m, edge_id) in edges]
+            sig = Hasher.subpipeline_signature(module_sig, upstream_sigs)
+            self._subpipeline_signatures[module_id] = sig
+            if sig != old_sig:
+                changed.add(module_id)
+        for c in self.connections.itervalues():
+            old_sig = old_connection_sigs.get(c.id)
+            if (old_sig is not None and c.sourceId not in changed and
+                    c.destinationId not in changed):
+                self._connection_signatures[c.id] = old_sig
+            else:
+                self.connection_signature(c.id)
 
     def compute_signatures(self):
         """compute_signatures(): compute all module and subpipeline signatures
@@ -1461,6 +1708,79 @@ class TestPipeline(unittest.TestCase):
         self.assertNotEquals(c_sig_size_before, c_sig_size_after)
         self.assertNotEquals(p_sig_size_before, p_sig_size_after)
 
+    def test_refresh_signatures(self):
+        """Makes sure refreshing only rehashes what changed and agrees with
+        signatures computed from scratch."""
+        p = self.create_default_pipeline()
+        p.refresh_signatures()
+        before = dict(p._subpipeline_signatures)
+        p.modules[0].functions[0].params[0].strValue = '3.0'
+        p.refresh_signatures()
+        after = dict(p._subpipeline_signatures)
+        self.assertNotEqual(before[0], after[0])
+        self.assertEqual(before[1], after[1])
+        self.assertNotEqual(before[2], after[2])
+
+        p2 = copy.copy(p)
+        for m in p2.modules.itervalues():
+            m._signature_memo = None
+            for f in m.functions:
+                f._signature_memo = None
+                for param in f.params:
+                    param._signature_memo = None
+        p2._module_signatures = {}
+        p2._subpipeline_signatures = {}
+        p2._connection_signatures = {}
+        p2.compute_signatures()
+        self.assertEqual(after, p2._subpipeline_signatures)
+        self.assertEqual(p._connection_signatures,
+                         p2._connection_signatures)
+
+    def test_signatures_after_operations(self):
+        """Makes sure performing an action drops the signatures of the
+        module it changes and of its downstream, and only those."""
+        import vistrails.core.db.action
+        # copy to index the functions
+        p = copy.copy(self.create_default_pipeline())
+        p.compute_signatures()
+        sibling = copy.copy(p)
+        module_sigs = dict(p._module_signatures)
+        subpipeline_sigs = dict(p._subpipeline_signatures)
+
+        func = p.modules[0].functions[0]
+        old_param = func.params[0]
+        new_param = ModuleParam(id=-1,
+                                pos=old_param.pos,
+                                name=old_param.name,
+                                val='-',
+                                type=old_param.type)
+        action = vistrails.core.db.action.create_action([
+                ('change', old_param, new_param, func.vtType, func.real_id)])
+        p.perform_action(action)
+        self.assertNotIn(0, p._module_signatures)
+        self.assertNotIn(2, p._subpipeline_signatures)
+        self.assertEqual(p._subpipeline_signatures[1], subpipeline_sigs[1])
+
+        p.refresh_signatures()
+        self.assertNotEqual(p.module_signature(0), module_sigs[0])
+        self.assertEqual(p.module_signature(1), module_sigs[1])
+        self.assertNotEqual(p.subpipeline_signature(2), subpipeline_sigs[2])
+
+        # module signatures are memoized on the modules
+        function_signature = Hasher.__dict__['function_signature']
+        def fail(*args, **kwargs):
+            self.fail("Unchanged module was rehashed")
+        Hasher.function_signature = staticmethod(fail)
+        try:
+            p._module_signatures = Bidict()
+            p.refresh_signatures()
+        finally:
+            Hasher.function_signature = function_signature
+
+        # the other version of the pipeline is left untouched
+        sibling.refresh_signatures()
+        self.assertEqual(sibling._subpipeline_signatures, subpipeline_sigs)
+
     def test_delete_connections(self):
         p = self.create_default_pipeline()
         p.delete_connection(0)
@@ -1496,6 +1816,65 @@ class TestPipeline(unittest.TestCase):
         self.assertNotEquals(p1, p3)
         self.assertNotEquals(p1.id, p3.id)
 
+    def test_snapshot(self):
+        """Makes sure changes to a snapshot do not leak into the pipeline
+        it was taken from, and that untouched modules stay shared."""
+        id_scope = IdScope()
+        p1 = self.create_default_pipeline(id_scope)
+        p0 = copy.copy(p1)
+        p2 = p1.snapshot()
+        self.assertEquals(p1, p2)
+        m_id = p1.connections[0].destinationId
+
+        f = ModuleFunction()
+        f.real_id = id_scope.getNewId(ModuleFunction.vtType)
+        f.name = 'value2'
+        p2.db_add_object(f, Module.vtType, m_id)
+        param = ModuleParam()
+        param.real_id = id_scope.getNewId(ModuleParam.vtType)
+        param.type = 'Float'
+        param.strValue = '1.0'
+        p2.add_parameter(param, ModuleFunction.vtType, f.real_id)
+        param = copy.copy(param)
+        param.strValue = '3.0'
+        p2.change_parameter(param.real_id, param,
+                            ModuleFunction.vtType, f.real_id)
+        p2.delete_connection(0)
+
+        self.assertEquals(p1, p0)
+        self.assertEquals(len(p1.modules[m_id].functions), 1)
+        self.assertEquals(
+            p1.modules[m_id].connected_input_ports['value1'], 1)
+        self.assertEquals(
+            p2.modules[m_id].connected_input_ports['value1'], 0)
+        function = p2.modules[m_id].function_idx[f.real_id]
+        self.assertEquals(function.params[0].strValue, '3.0')
+        self.assertIs(p2.db_get_object(ModuleFunction.vtType, f.real_id),
+                      function)
+        untouched = p1.connections[1].sourceId
+        self.assertIs(p1.modules[untouched], p2.modules[untouched])
+
+        # changes to the original are not seen by the snapshot either
+        p1.delete_connection(1)
+        self.assertEquals(
+            p2.modules[m_id].connected_input_ports['value2'], 1)
+
+    def test_snapshot_visible_ports(self):
+        """Makes sure showing a port on one version of a pipeline does not
+        show it on another version sharing the module."""
+        p1 = self.create_default_pipeline()
+        p2 = p1.snapshot()
+        m_id = p1.connections[0].destinationId
+        self.assertIs(p1.modules[m_id], p2.modules[m_id])
+
+        p2.get_module_for_update(m_id).visible_input_ports.add('value1')
+        self.assertIn('value1', p2.modules[m_id].visible_input_ports)
+        self.assertNotIn('value1', p1.modules[m_id].visible_input_ports)
+
+        p1.get_module_for_update(m_id).visible_output_ports.add('value')
+        self.assertIn('value', p1.modules[m_id].visible_output_ports)
+        self.assertNotIn('value', p2.modules[m_id].visible_output_ports)
+
     def test_serialization(self):
         import vistrails.core.db.io
         p1 = self.create_default_pipeline()
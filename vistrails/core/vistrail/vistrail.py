@@ -38,12 +38,17 @@ import copy
 import datetime
 import getpass
 
+from vistrails.db import VistrailsDBException
 from vistrails.db.domain import DBVistrail
+from vistrails.db.services.checkpoints import WorkflowCheckpoints
+from vistrails.db.services.version_ancestry import VersionAncestry
+from vistrails.db.services.version_index import VersionIndex
 from vistrails.db.services.io import open_vt_log_from_db, open_log_from_xml
 from vistrails.core.db.locator import DBLocator
 from vistrails.core.log.log import Log
 from vistrails.core.data_structures.graph import Graph
 from vistrails.core.data_structures.bijectivedict import Bidict
+from vistrails.core.configuration import get_vistrails_configuration
 from vistrails.core import debug
 import vistrails.core.db.io
 from vistrails.core.utils import VistrailsInternalError, \
@@ -122,6 +127,26 @@ class Vistrail(DBVistrail):
         # add all versions to the trees
         for action in sorted(self.actions, key=lambda a: a.id):
             self.tree.addVersion(action.id, action.prevId)
+        # depths and jump pointers for common ancestor queries
+        self.ancestry = VersionAncestry(self)
+
+        # index of the contents of the versions, built on first use
+        self.version_index = None
+
+        # checkpoints used to materialize workflows
+        interval = 100
+        persistent = False
+        conf = get_vistrails_configuration()
+        if conf is not None:
+            if conf.has_deep_value('checkpoints.interval'):
+                interval = conf.get_deep_value('checkpoints.interval')
+            if conf.has_deep_value('checkpoints.save'):
+                persistent = conf.get_deep_value('checkpoints.save')
+        if getattr(self, 'db_checkpoints', None) is None:
+            self.db_checkpoints = WorkflowCheckpoints(interval, persistent)
+        else:
+            self.db_checkpoints.interval = interval
+            self.db_checkpoints.persistent = persistent
 
     @staticmethod
     def convert(_vistrail):
@@ -307,6 +332,16 @@ class Vistrail(DBVistrail):
         except Exception, e:
             raise InvalidPipeline([e])
     
+    def get_version_index(self):
+        """get_version_index() -> VersionIndex
+        Returns the index of the modules, packages, parameter values and
+        annotation keys used by each version.
+
+        """
+        if self.version_index is None:
+            self.version_index = VersionIndex(self)
+        return self.version_index
+
     def getPipelineVersionName(self, version):
         """getPipelineVersionName(version:str) -> Pipeline
         Returns a pipeline given a version name. If version name doesn't exist
@@ -406,38 +441,15 @@ class Vistrail(DBVistrail):
         """
         if (v1<=0 or v2<=0):
             return 0
-        
-        t1 = set()
-        t1.add(v1)
-        t = self.actionMap[v1].parent
-        while  t != 0:
-            t1.add(t)
-            t = self.actionMap[t].parent
-        
-        t = v2
-        while t != 0:
-            if t in t1:
-                return t
-            t = self.actionMap[t].parent
-        return 0
+        return self.ancestry.common_ancestor(v1, v2)
     
     def getLastCommonVersion(self, v):
         """getLastCommonVersion(v: Vistrail) -> int
         Returns the last version that is common to this vistrail and v
         
         """
-        # TODO:  There HAS to be a better way to do this...
-        common = []
-        for action in self.actionMap:
-            if(v.hasVersion(action.timestep)):
-                common.append(action.timestep)
-                
-        timestep = 0
-        for time in common:
-            if time > timestep:
-                timestep = time
-
-        return timestep
+        return max([version for version in self.actionMap
+                    if v.hasVersion(version)] or [0])
 
     def general_action_chain(self, v1, v2):
         """general_action_chain(v1, v2): Returns an action that turns
@@ -543,6 +555,9 @@ class Vistrail(DBVistrail):
 
         # signal to update explicit tree
         self.tree.addVersion(action.id, action.prevId)
+        self.ancestry.add_version(action.id, action.prevId)
+        if self.version_index is not None:
+            self.version_index.add_version(action)
 
     def hasTag(self, tag):
         """ hasTag(tag) -> boolean 
@@ -1037,6 +1052,26 @@ class Vistrail(DBVistrail):
             log = open_vt_log_from_db(connection, self.db_id)
         Log.convert(log)
         return log
+
+    def get_persisted_workflow_exec(self, exec_id):
+        """get_persisted_workflow_exec(exec_id: int) -> WorkflowExec
+        Returns a single execution from the log of this vistrail, without
+        reading the other ones if the log is indexed. Returns None if it
+        is not available.
+
+        """
+        if isinstance(self.locator, vistrails.core.db.locator.ZIPFileLocator):
+            if self.db_log_filename is not None:
+                try:
+                    return vistrails.core.db.io.open_workflow_exec(
+                        self.db_log_filename, exec_id)
+                except VistrailsDBException:
+                    return None
+            return None
+        log = self.get_persisted_log()
+        if log.db_has_workflow_exec_with_id(exec_id):
+            return log.db_get_workflow_exec_by_id(exec_id)
+        return None
     
     def get_used_packages(self):
         package_list = {}
@@ -1297,5 +1332,21 @@ class TestVistrail(unittest.TestCase):
         do_test('/tests/resources/dummy.xml', XMLFileLocator)
         do_test('/tests/resources/terminator.vt', FileLocator)
 
+    def test_checkpoints(self):
+        """Test that workflows materialized from checkpoints are the same
+        as the ones obtained by replaying all actions."""
+        from vistrails.core.db.locator import FileLocator
+        import vistrails.core.system
+
+        v = FileLocator(vistrails.core.system.vistrails_root_directory() +
+                        '/tests/resources/terminator.vt').load().vistrail
+        v.db_checkpoints.interval = 5
+        version_ids = sorted(v.actionMap.keys(), reverse=True)[::10]
+        pipelines = [v.getPipeline(version) for version in version_ids]
+        self.assertTrue(len(v.db_checkpoints) > 0)
+        v.db_checkpoints = None
+        for version, p in zip(version_ids, pipelines):
+            self.assertEqual(p, v.getPipeline(version))
+
 if __name__ == '__main__':
     unittest.main()
@@ -33,6 +33,8 @@
 ##
 ###############################################################################
 
+import re
+
 def capitalizeOne(str):
     result = ''
     strs = str.split('_')
@@ -208,6 +210,9 @@ class Field(object):
     def shouldExpand(self):
         return self.params.get('expand','true') == 'true'
 
+    def shouldIntern(self):
+        return False
+
     def shouldExpandAction(self):
         return self.params.get('expandAction', 'true') == 'true'
 
@@ -294,6 +299,15 @@ class Property(Field):
     def isChoice(self):
         return False
 
+    def shouldIntern(self):
+        # short string columns (names, identifiers, port names) repeat
+        # a lot across a vistrail so compact classes intern them
+        if self.isReference() or self.getPythonType() != 'str':
+            return False
+        sql_type = self.specs.get('sql', {}).get('type', '')
+        match = re.match(r'(var)?char\((\d+)\)$', sql_type.lower())
+        return match is not None and int(match.group(2)) <= 511
+
 class Object(object):
     def __init__(self, params, properties, layouts, choices):
         self.params = params
@@ -342,6 +356,9 @@ class Object(object):
             pass
         return 'DB%s' % capitalizeOne(Object.getName(self))
 
+    def useSlots(self):
+        return self.params.get('slots', 'true') == 'true'
+
     def getChildren(self):
         return 'db_children'
 
@@ -148,7 +148,7 @@ def indent_python(fname):
                      stdout=subprocess.PIPE).communicate()
 
 def run_template(template_fname, objects, version, version_string, output_file,
-                 indent=False):
+                 indent=False, compact=False):
     [prefix, suffix] = os.path.basename(template_fname).split('.', 1)
     (fd, p_fname) = tempfile.mkstemp(prefix=prefix, suffix=suffix)
     os.close(fd)
@@ -159,7 +159,8 @@ def run_template(template_fname, objects, version, version_string, output_file,
         f = open(output_file, 'w')
         f.write(template.render(objs=objects,
                                 version=version,
-                                version_string=version_string))
+                                version_string=version_string,
+                                compact=compact))
         f.close()
         if indent:
             indent_python(output_file)
@@ -225,6 +226,7 @@ def main(argv=None):
     optionsUsage = {'a': ('generate all database information (-p -s -x)', 
                           False),
                     'b:': ('base directory', False, 'dir'),
+                    'c': ('generate compact python domain classes', False),
                     'd:': ('versions directory', False, 'dir'),
                     'p': ('generate python domain classes', False),
                     's': ('generate sql schema and persistence classes', False),
@@ -305,7 +307,7 @@ def main(argv=None):
             objects = parser.parse(versionDirs['specs'])
         run_template('templates/domain.py.mako', objects, version, versionName,
                      os.path.join(versionDirs['domain'], 'auto_gen.py'),
-                     True)
+                     True, options['c'])
 
         if not options['n']:
             domainFile = os.path.join(baseDirs['domain'], '__init__.py')
@@ -25,6 +25,31 @@ def shouldIgnoreIndexDelete(index):
     if type(index) == type([]):
         return index[0][0] == '!'
     return index[0] == '!'
+
+def getSlotNames(obj):
+    names = []
+    for field in obj.getPythonFields():
+        if field.isReference():
+            names.append('_db_deleted_' + field.getRegularName())
+        for index in field.getAllIndices():
+            names.append('_db_%s_%s_index' % (field.getRegularName(),
+                                              getIndexName(index)))
+        names.append(field.getPrivateName())
+    names.extend(['is_dirty', 'is_new', '__dict__', '__weakref__'])
+    return names
+
+def formatSlots(obj):
+    indent = ' ' * len('    __slots__ = (')
+    lines = []
+    line = ''
+    for name in getSlotNames(obj):
+        item = "'%s', " % name
+        if line and len(indent + line + item.rstrip()) > 79:
+            lines.append(line.rstrip())
+            line = ''
+        line += item
+    lines.append(line.rstrip().rstrip(','))
+    return ('\n' + indent).join(lines)
 %> \\
 <%text>###############################################################################
 ##
@@ -64,21 +89,40 @@ def shouldIgnoreIndexDelete(index):
 """generated automatically by auto_dao.py"""
 
 import copy
+% if compact:
+
+def _intern(value):
+    if type(value) is str:
+        return intern(value)
+    return value
+% endif
 
 % for obj in objs:
 class ${obj.getClassName()}(object):
 
     vtType = '${obj.getRegularName()}'
+    % if compact and obj.useSlots():
+
+    __slots__ = (${formatSlots(obj)})
+    % endif
 
     def __init__(self, ${', '.join(['%s=None' % n \
                                     for n in obj.getConstructorNames()])}):
         % for field in obj.getPythonFields():
         % if field.isReference() and not field.isInverse():
+        % if compact:
+        self._db_deleted_${field.getRegularName()} = None
+        % else:
         self.db_deleted_${field.getRegularName()} = []
         % endif
+        % endif
         % if field.isPlural():
         % for index in field.getAllIndices():
+        % if compact:
+        self._db_${field.getRegularName()}_${getIndexName(index)}_index = None
+        % else:
         self.db_${field.getRegularName()}_${getIndexName(index)}_index = {}
+        % endif
         % endfor
         if ${field.getRegularName()} is None:
             % if field.getPythonType() == 'hash':
@@ -99,6 +143,8 @@ class ${obj.getClassName()}(object):
                     index[${getIndexKey('v', index)}] = v
                 % endfor
             % endif
+        % elif compact and field.shouldIntern():
+        self.${field.getPrivateName()} = _intern(${field.getRegularName()})
         % else:
         self.${field.getPrivateName()} = ${field.getRegularName()}
         % endif
@@ -186,12 +232,21 @@ class ${obj.getClassName()}(object):
         # recreate indices and set flags
         % for field in obj.getPythonFields():
         % if len(field.getAllIndices()) > 0:
+        % if compact:
+        if cp.${field.getPrivateName()}:
+            % for index in field.getAllIndices():
+            cp._db_${field.getRegularName()}_${getIndexName(index)}_index = \
+                dict((${getIndexKey('v', index)}, v) \
+                         for v in cp.${field.getPrivateIterator()})
+            % endfor
+        % else:
         % for index in field.getAllIndices():
         cp.db_${field.getRegularName()}_${getIndexName(index)}_index = \
             dict((${getIndexKey('v', index)}, v) \
                      for v in cp.${field.getPrivateIterator()})
         % endfor
         % endif
+        % endif
         % endfor
         if not new_ids:
             cp.is_dirty = self.is_dirty
@@ -340,11 +395,20 @@ class ${obj.getClassName()}(object):
         children = []
         % if len(obj.getNonInverseReferences()) > 0:
         % for ref in obj.getNonInverseReferences():
+        % if compact:
+        if self._db_deleted_${ref.getRegularName()} is not None:
+            children.extend(self._db_deleted_${ref.getRegularName()})
+        % else:
         children.extend(self.db_deleted_${ref.getRegularName()})
+        % endif
         % endfor
         if remove:
             % for ref in obj.getNonInverseReferences():
+            % if compact:
+            self._db_deleted_${ref.getRegularName()} = None
+            % else:
             self.db_deleted_${ref.getRegularName()} = []
+            % endif
             % endfor
         % endif
         return children
@@ -369,15 +433,26 @@ class ${obj.getClassName()}(object):
     def ${field.getDefineAccessor()}(self):
         return self.${field.getPrivateName()}
     def ${field.getDefineMutator()}(self, ${field.getRegularName()}):
+        % if compact and field.shouldIntern():
+        self.${field.getPrivateName()} = _intern(${field.getRegularName()})
+        % else:
         self.${field.getPrivateName()} = ${field.getRegularName()}
+        % endif
         self.is_dirty = True
     ${field.getFieldName()} = property(${field.getDefineAccessor()}, \
                                             ${field.getDefineMutator()})
     % if not field.isPlural():
+    % if compact and field.shouldIntern():
+    def ${field.getAppender()}(self, ${field.getName()}):
+        self.${field.getPrivateName()} = _intern(${field.getName()})
+    def ${field.getModifier()}(self, ${field.getName()}):
+        self.${field.getPrivateName()} = _intern(${field.getName()})
+    % else:
     def ${field.getAppender()}(self, ${field.getName()}):
         self.${field.getPrivateName()} = ${field.getName()}
     def ${field.getModifier()}(self, ${field.getName()}):
         self.${field.getPrivateName()} = ${field.getName()}
+    % endif
     def ${field.getRemover()}(self, ${field.getName()}):
         % if field.isReference() and not field.isInverse():
         if not self.is_new:
@@ -486,13 +561,45 @@ class ${obj.getClassName()}(object):
         return None
         % endif
     % endif
+    % if compact:
+    % if field.isReference():
+    ## deleted lists and indices are only created when first needed
+    def __get_db_deleted_${field.getRegularName()}(self):
+        if self._db_deleted_${field.getRegularName()} is None:
+            self._db_deleted_${field.getRegularName()} = []
+        return self._db_deleted_${field.getRegularName()}
+    def __set_db_deleted_${field.getRegularName()}(self, deleted):
+        self._db_deleted_${field.getRegularName()} = deleted
+    db_deleted_${field.getRegularName()} = \
+        property(__get_db_deleted_${field.getRegularName()}, \
+                 __set_db_deleted_${field.getRegularName()})
+    % endif
+    % for index in field.getAllIndices():
+    <% index_name = 'db_%s_%s_index' % (field.getRegularName(), \
+                                        getIndexName(index)) %> \\
+    def __get_${index_name}(self):
+        if self._${index_name} is None:
+            self._${index_name} = {}
+        return self._${index_name}
+    def __set_${index_name}(self, index):
+        self._${index_name} = index
+    ${index_name} = property(__get_${index_name}, __set_${index_name})
+    % endfor
+    % endif
     % for index in field.getAllIndices():
     def db_get_${field.getSingleName()}_by_${getIndexName(index)}(self, key):
         return self.db_${field.getRegularName()}_ \!
             ${getIndexName(index)}_index[key]
     def db_has_${field.getSingleName()}_with_${getIndexName(index)}(self, key):
+        % if compact:
+        return self._db_${field.getRegularName()}_ \!
+            ${getIndexName(index)}_index is not None and \
+            key in self._db_${field.getRegularName()}_ \!
+            ${getIndexName(index)}_index
+        % else:
         return key in self.db_${field.getRegularName()}_ \!
             ${getIndexName(index)}_index
+        % endif
     % endfor
     
     % endfor
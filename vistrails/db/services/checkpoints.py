@@ -0,0 +1,296 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""Checkpoints of materialized workflows.
+
+Materializing a version of a vistrail means replaying every action from
+the root of the version tree. :class:`WorkflowCheckpoints` keeps the
+current operations (the operations whose data make up the workflow) at
+some versions so that materialization can start from the closest
+checkpointed ancestor and only replay the remaining actions.
+
+"""
+
+from vistrails.db.services.action_chain import getCurrentOperationDict
+
+import os
+import unittest
+
+TAG_ANNOTATION = '__tag__'
+
+class WorkflowCheckpoints(object):
+    """WorkflowCheckpoints(interval: int, persistent: bool)
+
+    Keeps the current operations of a vistrail at tagged versions and
+    every `interval` actions along the chains that get materialized. An
+    interval of 0 disables checkpointing. `persistent` tells whether the
+    checkpoints should be written to the .vt bundle when it is saved.
+
+    """
+
+    def __init__(self, interval=100, persistent=False):
+        self.interval = interval
+        self.persistent = persistent
+        # version -> {(what, object id): operation}
+        self._operations = {}
+        # version -> [operation id], read from a bundle and not yet
+        # matched with the operations of the vistrail
+        self._unresolved = {}
+
+    def __len__(self):
+        return len(self._operations) + len(self._unresolved)
+
+    def versions(self):
+        return set(self._operations) | set(self._unresolved)
+
+    def clear(self):
+        self._operations = {}
+        self._unresolved = {}
+
+    def is_checkpoint(self, vistrail, action, count):
+        """is_checkpoint(vistrail, action, count: int) -> bool
+        Tells whether a checkpoint should be kept for an action that is
+        count actions away from the previous checkpoint.
+
+        """
+        if count % self.interval == 0:
+            return True
+        return vistrail.db_has_actionAnnotation_with_action_id(
+            (action.db_id, TAG_ANNOTATION))
+
+    def get_operations(self, vistrail, version):
+        """get_operations(vistrail: DBVistrail, version: int) -> [operation]
+        Returns the current operations of the given version, sorted by id,
+        recording new checkpoints along the way.
+
+        """
+        if self._unresolved:
+            self.resolve(vistrail)
+        chain = []
+        current_id = version
+        while current_id > 0 and current_id not in self._operations:
+            action = vistrail.db_get_action_by_id(current_id)
+            chain.append(action)
+            current_id = action.db_prevId
+        chain.reverse()
+        if current_id > 0:
+            current_ops = dict(self._operations[current_id])
+        else:
+            current_ops = {}
+        for count, action in enumerate(chain):
+            getCurrentOperationDict([action], current_ops)
+            if self.interval > 0 and \
+                    self.is_checkpoint(vistrail, action, count + 1):
+                self._operations[action.db_id] = dict(current_ops)
+        operations = current_ops.values()
+        operations.sort(key=lambda x: x.db_id)
+        return operations
+
+    def resolve(self, vistrail):
+        """resolve(vistrail: DBVistrail) -> None
+        Matches the checkpoints read from a bundle with the operations of
+        the vistrail, dropping the ones that do not fit it.
+
+        """
+        operations = {}
+        for action in vistrail.db_actions:
+            for operation in action.db_operations:
+                operations[operation.db_id] = operation
+        for version, op_ids in self._unresolved.iteritems():
+            if not vistrail.db_has_action_with_id(version):
+                continue
+            current_ops = {}
+            for op_id in op_ids:
+                operation = operations.get(op_id)
+                if operation is None or operation.vtType == 'delete':
+                    break
+                if operation.vtType == 'change':
+                    obj_id = operation.db_newObjId
+                else:
+                    obj_id = operation.db_objectId
+                current_ops[(operation.db_what, obj_id)] = operation
+            else:
+                self._operations[version] = current_ops
+        self._unresolved = {}
+
+    def save(self, filename):
+        """save(filename: str) -> None
+        Writes the checkpoints to a file, one line per version listing the
+        ids of its current operations.
+
+        """
+        f = open(filename, 'w')
+        try:
+            for version, current_ops in sorted(self._operations.iteritems()):
+                op_ids = sorted(op.db_id for op in current_ops.itervalues())
+                f.write('%d %s\n' % (version, ' '.join(str(i)
+                                                        for i in op_ids)))
+            for version, op_ids in sorted(self._unresolved.iteritems()):
+                if version not in self._operations:
+                    f.write('%d %s\n' % (version, ' '.join(str(i)
+                                                            for i in op_ids)))
+        finally:
+            f.close()
+
+    def load(self, filename):
+        """load(filename: str) -> None
+        Reads checkpoints written by save(). They are matched with the
+        operations of the vistrail the first time they are used.
+
+        """
+        f = open(filename, 'r')
+        try:
+            for line in f:
+                fields = line.split()
+                if not fields:
+                    continue
+                self._unresolved[int(fields[0])] = [int(i)
+                                                    for i in fields[1:]]
+        finally:
+            f.close()
+
+##############################################################################
+
+class TestWorkflowCheckpoints(unittest.TestCase):
+    @staticmethod
+    def create_vistrail(nb_versions):
+        from vistrails.db.domain import DBVistrail, DBAction, DBAdd, \
+            DBChange, DBModule, DBFunction, DBParameter
+        vistrail = DBVistrail()
+        id_scope = vistrail.idScope
+        module = DBModule(id=id_scope.getNewId(DBModule.vtType),
+                          name='Float', package='pkg')
+        ops = [DBAdd(id=id_scope.getNewId('operation'),
+                     what=DBModule.vtType,
+                     objectId=module.db_id,
+                     data=module)]
+        action = DBAction(id=id_scope.getNewId(DBAction.vtType),
+                          prevId=0, operations=ops)
+        vistrail.db_add_action(action)
+        function = DBFunction(id=id_scope.getNewId(DBFunction.vtType),
+                              pos=0, name='value')
+        action = DBAction(id=id_scope.getNewId(DBAction.vtType),
+                          prevId=action.db_id,
+                          operations=[DBAdd(id=id_scope.getNewId('operation'),
+                                            what=DBFunction.vtType,
+                                            objectId=function.db_id,
+                                            parentObjId=module.db_id,
+                                            parentObjType=DBModule.vtType,
+                                            data=function)])
+        vistrail.db_add_action(action)
+        param_id = None
+        for i in xrange(nb_versions):
+            param = DBParameter(id=id_scope.getNewId(DBParameter.vtType),
+                                pos=0, type='Float', val=str(i))
+            if param_id is None:
+                op = DBAdd(id=id_scope.getNewId('operation'),
+                           what=DBParameter.vtType,
+                           objectId=param.db_id,
+                           parentObjId=function.db_id,
+                           parentObjType=DBFunction.vtType,
+                           data=param)
+            else:
+                op = DBChange(id=id_scope.getNewId('operation'),
+                              what=DBParameter.vtType,
+                              oldObjId=param_id,
+                              newObjId=param.db_id,
+                              parentObjId=function.db_id,
+                              parentObjType=DBFunction.vtType,
+                              data=param)
+            param_id = param.db_id
+            action = DBAction(id=id_scope.getNewId(DBAction.vtType),
+                              prevId=action.db_id, operations=[op])
+            vistrail.db_add_action(action)
+        return vistrail
+
+    @staticmethod
+    def operation_ids(operations):
+        return [op.db_id for op in operations]
+
+    def test_checkpoints(self):
+        from vistrails.db.services.action_chain import getActionChain, \
+            getCurrentOperations
+        vistrail = self.create_vistrail(30)
+        checkpoints = WorkflowCheckpoints(interval=10)
+        for version in (32, 25, 7, 32):
+            expected = getCurrentOperations(getActionChain(vistrail, version))
+            self.assertEqual(
+                    self.operation_ids(
+                            checkpoints.get_operations(vistrail, version)),
+                    self.operation_ids(expected))
+        self.assertEqual(checkpoints.versions(), set([10, 20, 30]))
+
+    def test_tags(self):
+        from vistrails.db.domain import DBActionAnnotation
+        vistrail = self.create_vistrail(10)
+        vistrail.db_add_actionAnnotation(
+                DBActionAnnotation(id=vistrail.idScope.getNewId(
+                                           DBActionAnnotation.vtType),
+                                   key=TAG_ANNOTATION, value='tagged',
+                                   action_id=5))
+        checkpoints = WorkflowCheckpoints(interval=100)
+        checkpoints.get_operations(vistrail, 12)
+        self.assertEqual(checkpoints.versions(), set([5]))
+
+    def test_disabled(self):
+        vistrail = self.create_vistrail(10)
+        checkpoints = WorkflowCheckpoints(interval=0)
+        checkpoints.get_operations(vistrail, 12)
+        self.assertEqual(len(checkpoints), 0)
+
+    def test_save_load(self):
+        import tempfile
+        vistrail = self.create_vistrail(30)
+        checkpoints = WorkflowCheckpoints(interval=10)
+        expected = self.operation_ids(checkpoints.get_operations(vistrail,
+                                                                 25))
+        (fd, fname) = tempfile.mkstemp(prefix='vt_checkpoints')
+        os.close(fd)
+        try:
+            checkpoints.save(fname)
+            loaded = WorkflowCheckpoints(interval=10)
+            loaded.load(fname)
+        finally:
+            os.unlink(fname)
+        self.assertEqual(loaded.versions(), set([10, 20]))
+        self.assertEqual(
+                self.operation_ids(loaded.get_operations(vistrail, 25)),
+                expected)
+        self.assertEqual(loaded.versions(), set([10, 20]))
+
+        # checkpoints that don't match the vistrail are dropped
+        loaded._unresolved = {20: [-1], 40: []}
+        loaded._operations = {}
+        loaded.resolve(vistrail)
+        self.assertEqual(len(loaded), 0)
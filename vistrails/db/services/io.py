@@ -36,6 +36,7 @@ from __future__ import with_statement
 
 from datetime import datetime
 from vistrails.core import debug
+from vistrails.core.configuration import get_vistrails_configuration
 from vistrails.core.bundles import py_import
 from vistrails.core.system import get_elementtree_library, strftime
 from vistrails.core.utils import Chdir
@@ -46,15 +47,18 @@ from vistrails.core.modules.sub_module import get_cur_abs_namespace,\
 import vistrails.core.requirements
 
 import os.path
+import posixpath
 import shutil
 import tempfile
+import threading
 import copy
+import itertools
 import zipfile
 
 from vistrails.db import VistrailsDBException
 from vistrails.db.domain import DBVistrail, DBWorkflow, DBLog, DBAbstraction, DBGroup, \
     DBRegistry, DBWorkflowExec, DBOpmGraph, DBProvDocument, DBAnnotation, \
-    DBMashuptrail, DBStartup
+    DBMashuptrail, DBStartup, DBLazyOperationList
 import vistrails.db.services.abstraction
 import vistrails.db.services.log
 import vistrails.db.services.opm
@@ -62,6 +66,10 @@ import vistrails.db.services.prov
 import vistrails.db.services.registry
 import vistrails.db.services.workflow
 import vistrails.db.services.vistrail
+from vistrails.db.services.checkpoints import WorkflowCheckpoints
+from vistrails.db.services.log_store import get_indexed_log, is_indexed_log, \
+    release_indexed_logs
+from vistrails.db.services.translation_cache import get_translation_cache
 from vistrails.db.versions import getVersionDAO, currentVersion, getVersionSchemaDir, \
     translate_vistrail, translate_workflow, translate_log, translate_registry, translate_startup
 
@@ -71,6 +79,7 @@ import vistrails.core.system
 ElementTree = get_elementtree_library()
 
 CONNECT_TIMEOUT = 15
+CONNECTION_POOL_SIZE = 4
 
 _db_lib = None
 def get_db_lib():
@@ -232,6 +241,93 @@ def ping_db_connection(db_connection):
     except get_db_lib().OperationalError:
         return False
     return True
+
+class DBConnectionPool(object):
+    """DBConnectionPool(max_idle: int)
+
+    Keeps up to max_idle connections per database configuration once they
+    are released, so that later requests don't have to connect again.
+    Idle connections are pinged before being handed out again.
+
+    """
+
+    def __init__(self, max_idle=CONNECTION_POOL_SIZE):
+        self.max_idle = max_idle
+        # config key -> [idle connection]
+        self._idle = {}
+        # id(connection) -> config key
+        self._in_use = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(config):
+        return tuple(sorted((k, v) for k, v in config.iteritems()
+                            if k != 'connect_timeout'))
+
+    def acquire(self, config):
+        """acquire(config: dict) -> connection
+        Returns an idle connection for config, or opens a new one.
+
+        """
+        key = self.get_key(config)
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                db_connection = idle.pop() if idle else None
+            if db_connection is None:
+                db_connection = open_db_connection(config)
+                break
+            if ping_db_connection(db_connection):
+                break
+            close_db_connection(db_connection)
+        with self._lock:
+            self._in_use[id(db_connection)] = key
+        return db_connection
+
+    def release(self, db_connection):
+        """release(db_connection) -> None
+        Hands a connection back to the pool, ending its transaction. It
+        is closed if enough connections are idle already.
+
+        """
+        with self._lock:
+            key = self._in_use.pop(id(db_connection), None)
+        if key is not None:
+            try:
+                db_connection.rollback()
+            except get_db_lib().Error:
+                key = None
+        if key is not None:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_idle:
+                    idle.append(db_connection)
+                    return
+        close_db_connection(db_connection)
+
+    def clear(self):
+        """clear() -> None
+        Closes all idle connections.
+
+        """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.itervalues():
+            for db_connection in connections:
+                close_db_connection(db_connection)
+
+_db_connection_pool = DBConnectionPool()
+
+def get_db_connection(config):
+    """get_db_connection(config: dict) -> connection
+    Gets a connection from the pool; give it back with
+    release_db_connection() instead of closing it.
+
+    """
+    return _db_connection_pool.acquire(config)
+
+def release_db_connection(db_connection):
+    _db_connection_pool.release(db_connection)
     
 def translate_to_tbl_name(obj_type):
     map = {DBVistrail.vtType: 'vistrail',
@@ -250,7 +346,7 @@ def date_to_str(date):
 def get_db_object_list(config, obj_type):
     
     result = []    
-    db = open_db_connection(config)
+    db = get_db_connection(config)
 
     #FIXME Create a DBGetVistrailListSQLDAOBase for this
     # and maybe there's another way to build this query
@@ -285,12 +381,13 @@ def get_db_object_list(config, obj_type):
         rows = c.fetchall()
         result = rows
         c.close()
-        close_db_connection(db)
         
     except get_db_lib().Error, e:
         msg = "Couldn't get list of vistrails objects from db (%d : %s)" % \
             (e.args[0], e.args[1])
         raise VistrailsDBException(msg)
+    finally:
+        release_db_connection(db)
     return result
 
 def get_db_object_modification_time(db_connection, obj_id, obj_type):
@@ -313,6 +410,36 @@ def get_db_object_modification_time(db_connection, obj_id, obj_type):
         raise VistrailsDBException(msg)
     return time
 
+def get_db_object_state(db_connection, obj_id, obj_type):
+    """get_db_object_state(db_connection, obj_id: int, obj_type: str) -> tuple
+    Returns the number of rows stored for the entity in each table that
+    can change while it is edited, along with a checksum of their contents.
+    Unlike last_modified, this changes with every save.
+
+    """
+    tables = [('action', "a.id"),
+              ('action_annotation', "a.id, a.akey, a.value, a.action_id"),
+              ('annotation', "a.id, a.akey, a.value, a.parent_id"),
+              ('tag', "a.id, a.name")]
+    command = """
+    SELECT COUNT(*), BIT_XOR(CRC32(CONCAT_WS(',', %s)))
+    FROM %s a
+    WHERE a.entity_id = %s AND a.entity_type = '%s'
+    """
+
+    state = []
+    try:
+        c = db_connection.cursor()
+        for table, columns in tables:
+            c.execute(command % (columns, table, int(obj_id), obj_type))
+            state.extend(c.fetchall()[0])
+        c.close()
+    except get_db_lib().Error, e:
+        msg = "Couldn't get object state from db (%d : %s)" % \
+            (e.args[0], e.args[1])
+        raise VistrailsDBException(msg)
+    return tuple(state)
+
 def get_db_object_version(db_connection, obj_id, obj_type):
     command = """
     SELECT o.version
@@ -653,6 +780,10 @@ def close_zip_xml(temp_dir):
     """
     if temp_dir is None:
         return
+    reader = _lazy_bundles.pop(temp_dir, None)
+    if reader is not None:
+        reader.closed = True
+    release_indexed_logs(temp_dir)
     if not os.path.isdir(temp_dir):
         if os.path.isfile(temp_dir):
             os.remove(temp_dir)
@@ -677,14 +808,245 @@ def unserialize(str, obj_type):
     daoList = getVersionDAO(currentVersion)
     return daoList.unserialize(str, obj_type)
  
+##############################################################################
+# Lazy bundles
+
+# save directory -> ZipBundleReader of the .vt files opened lazily
+_lazy_bundles = {}
+
+class ZipBundleReader(object):
+    """ZipBundleReader(filename: str, vt_save_dir: str)
+
+    Extracts the members of a .vt file into its save directory when they
+    are first needed instead of extracting the whole archive up front.
+
+    """
+
+    def __init__(self, filename, vt_save_dir):
+        self.filename = filename
+        self.vt_save_dir = vt_save_dir
+        self.closed = False
+        z = zipfile.ZipFile(filename)
+        try:
+            self.names = [name for name in z.namelist()
+                          if not name.endswith('/')]
+        finally:
+            z.close()
+        self.pending = set(self.names)
+
+    def get_path(self, name):
+        return os.path.join(self.vt_save_dir, *name.split('/'))
+
+    def open(self, name):
+        """open(name: str) -> file
+        Returns a file object reading the member directly from the archive.
+
+        """
+        z = zipfile.ZipFile(self.filename)
+        try:
+            return z.open(name)
+        finally:
+            z.close()
+
+    def extract(self, names):
+        """extract(names: list of str) -> list of str
+        Extracts the given members if they weren't already and returns
+        their paths.
+
+        """
+        todo = [name for name in names if name in self.pending]
+        if todo and not self.closed:
+            z = zipfile.ZipFile(self.filename)
+            try:
+                for name in todo:
+                    z.extract(name, self.vt_save_dir)
+                    self.pending.discard(name)
+            finally:
+                z.close()
+        return [self.get_path(name) for name in names]
+
+    def extract_all(self):
+        self.extract(list(self.pending))
+
+class LazyBundleList(list):
+    """LazyBundleList(reader: ZipBundleReader, names: list of str,
+                      load: callable)
+
+    List of entries of a lazily opened .vt file. The members are only
+    extracted (and passed through load, if given) when the list is first
+    accessed; until then it is empty.
+
+    """
+
+    def __init__(self, reader, names, load=None):
+        list.__init__(self)
+        self._reader = reader
+        self._names = names
+        self._load = load
+
+    def _materialize(self):
+        if self._reader is None:
+            return
+        reader = self._reader
+        self._reader = None
+        paths = reader.extract(self._names)
+        if self._load is not None:
+            paths = [self._load(path) for path in paths]
+        list.extend(self, paths)
+
+def _materializing(name):
+    method = getattr(list, name)
+    def wrapper(self, *args, **kwargs):
+        self._materialize()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = name
+    return wrapper
+
+for _name in ['__add__', '__contains__', '__delitem__', '__delslice__',
+              '__eq__', '__ge__', '__getitem__', '__getslice__', '__gt__',
+              '__iadd__', '__imul__', '__iter__', '__le__', '__len__',
+              '__lt__', '__mul__', '__ne__', '__repr__', '__reversed__',
+              '__rmul__', '__setitem__', '__setslice__', 'append', 'count',
+              'extend', 'index', 'insert', 'pop', 'remove', 'reverse',
+              'sort']:
+    setattr(LazyBundleList, _name, _materializing(_name))
+del _name
+
+def extract_bundle_member(filename):
+    """extract_bundle_member(filename: str) -> None
+    Makes sure that a file belonging to a lazily opened .vt file has been
+    extracted.
+
+    """
+    if filename is None or os.path.exists(filename):
+        return
+    for vt_save_dir, reader in _lazy_bundles.items():
+        if os.path.dirname(filename) == vt_save_dir:
+            name = os.path.basename(filename)
+            if name in reader.pending:
+                reader.extract([name])
+
+class StreamedElement(object):
+    """StreamedElement(events: iterator, root: Element)
+
+    Stands for the root element of a document that is still being parsed.
+    Its children are parsed as they are iterated on. Each one is cleared
+    and removed from the root once the next one is requested, so that only
+    the objects built from them are kept in memory. As a consequence, the
+    children can only be iterated on once.
+
+    """
+    def __init__(self, events, root):
+        self._events = events
+        self._root = root
+        self.tag = root.tag
+        self.attrib = root.attrib
+        self.text = None
+
+    def get(self, key, default=None):
+        return self._root.get(key, default)
+
+    def keys(self):
+        return self._root.keys()
+
+    def items(self):
+        return self._root.items()
+
+    def getchildren(self):
+        return iter(self)
+
+    def __iter__(self):
+        depth = 0
+        for event, elem in self._events:
+            if event == 'start':
+                depth += 1
+            elif depth == 0:
+                # end of the root element
+                return
+            else:
+                depth -= 1
+                if depth == 0:
+                    yield elem
+                    elem.clear()
+                    self._root.remove(elem)
+
+def parse_xml_stream(f):
+    """parse_xml_stream(f: file) -> ElementTree
+    Parses f incrementally, so that members of a .vt file can be read
+    without extracting them first. The root of the tree is a
+    StreamedElement; f must stay open until its children have been read.
+
+    """
+    events = ElementTree.iterparse(f, events=('start', 'end'))
+    for event, root in events:
+        return ElementTree.ElementTree(StreamedElement(iter(events), root))
+    raise VistrailsDBException("Empty XML document")
+
 ##############################################################################
 # Vistrail I/O
 
-def open_vistrail_from_xml(filename):
-    """open_vistrail_from_xml(filename) -> Vistrail"""
-    tree = ElementTree.parse(filename)
-    version = get_version_for_xml(tree.getroot())
+def read_xml_version(f):
+    """read_xml_version(f: file) -> str
+    Returns the version of an XML document, only parsing its root element.
+
+    """
+    for _, elem in ElementTree.iterparse(f, events=('start',)):
+        return get_version_for_xml(elem)
+    raise VistrailsDBException("Cannot find version information")
+
+def open_vistrail_from_xml(filename, tree=None, open_file=None):
+    """open_vistrail_from_xml(filename, tree=None, open_file=None) -> Vistrail
+    open_file, if given, is called to read the document when it hasn't
+    been extracted to filename (see open_vistrail_bundle_from_zip_xml).
+
+    When the translation cache is enabled, vistrails written with an older
+    schema are translated only once and read from the cache afterwards.
+
+    """
+    if open_file is None:
+        open_file = lambda: open(filename, 'rb')
+    cache = get_translation_cache()
+    if cache is not None:
+        f = open_file()
+        try:
+            version = read_xml_version(f)
+        finally:
+            f.close()
+        if version != currentVersion:
+            f = open_file()
+            try:
+                key = cache.get_key(f, currentVersion)
+            finally:
+                f.close()
+            cached_fname = cache.lookup(key, DBVistrail.vtType)
+            if cached_fname is not None:
+                try:
+                    return read_vistrail_from_xml(cached_fname)
+                except Exception, e:
+                    debug.warning("Couldn't read translated vistrail from "
+                                  "the cache", e)
+                    cache.discard(key, DBVistrail.vtType)
+            vistrail = read_vistrail_from_xml(filename, tree, open_file)
+            cache.store(key, DBVistrail.vtType,
+                        lambda fname: save_vistrail_to_xml(vistrail, fname))
+            return vistrail
+    return read_vistrail_from_xml(filename, tree, open_file)
+
+def read_vistrail_from_xml(filename, tree=None, open_file=None):
+    """read_vistrail_from_xml(filename, tree=None, open_file=None) -> Vistrail
+    Reads and translates a vistrail, bypassing the translation cache.
+
+    """
+    f = None
+    if tree is None:
+        if open_file is None:
+            tree = ElementTree.parse(filename)
+        else:
+            # the document is parsed as the vistrail is read
+            f = open_file()
+            tree = parse_xml_stream(f)
     try:
+        version = get_version_for_xml(tree.getroot())
         daoList = getVersionDAO(version)
         vistrail = daoList.open_from_xml(filename, DBVistrail.vtType, tree)
         if vistrail is None:
@@ -697,67 +1059,97 @@ def open_vistrail_from_xml(filename):
                 "This vistrail was created by a newer version of VisTrails "
                 "and cannot be opened.")
         raise e
+    finally:
+        if f is not None:
+            f.close()
 
     return vistrail
 
-def open_vistrail_bundle_from_zip_xml(filename):
-    """open_vistrail_bundle_from_zip_xml(filename) -> SaveBundle
+def open_vistrail_bundle_from_zip_xml(filename, lazy=None):
+    """open_vistrail_bundle_from_zip_xml(filename, lazy=None) -> SaveBundle
     Open a vistrail from a zip compressed format.
     It expects that the vistrail file inside archive has name 'vistrail',
     the log inside archive has name 'log',
     abstractions inside archive have prefix 'abstraction_',
-    and thumbnails inside archive are '.png' files in 'thumbs' dir
+    thumbnails inside archive are '.png' files in 'thumbs' dir,
+    and workflow checkpoints, if saved, have name 'checkpoints'
+
+    If lazy is True (defaults to the 'lazyBundles' setting), only the
+    vistrail is read up front, directly from the archive. Abstractions,
+    thumbnails, mashups and the log are extracted when first accessed.
 
     """
+    if lazy is None:
+        conf = get_vistrails_configuration()
+        lazy = conf is not None and conf.check('lazyBundles')
     vt_save_dir = tempfile.mkdtemp(prefix='vt_save')
 
-    z = zipfile.ZipFile(filename)
-    try:
-        z.extractall(vt_save_dir)
-    finally:
-        z.close()
+    if lazy:
+        reader = ZipBundleReader(filename, vt_save_dir)
+        names = reader.names
+    else:
+        reader = None
+        z = zipfile.ZipFile(filename)
+        try:
+            z.extractall(vt_save_dir)
+            names = [name for name in z.namelist() if not name.endswith('/')]
+        finally:
+            z.close()
+
+    def get_path(name):
+        return os.path.join(vt_save_dir, *name.split('/'))
 
     vistrail = None
     log = None
     log_fname = None
-    abstraction_files = []
+    abstraction_names = []
     unknown_files = []
-    thumbnail_files = []
-    mashups = []
+    thumbnail_names = []
+    mashup_names = []
+    checkpoints_fname = None
     try:
-        for root, dirs, files in os.walk(vt_save_dir):
-            for fname in files:
-                if fname == 'vistrail' and root == vt_save_dir:
-                    vistrail = open_vistrail_from_xml(os.path.join(root, fname))
-                elif fname == 'log' and root == vt_save_dir:
-                    # FIXME read log to get execution info
-                    # right now, just ignore the file
-                    log = None 
-                    log_fname = os.path.join(root, fname)
-                    # log = open_log_from_xml(os.path.join(root, fname))
-                    # objs.append(DBLog.vtType, log)
-                elif fname.startswith('abstraction_'):
-                    abstraction_file = os.path.join(root, fname)
-                    abstraction_files.append(abstraction_file)
-                elif (fname.endswith('.png') and
-                      root == os.path.join(vt_save_dir,'thumbs')):
-                    thumbnail_file = os.path.join(root, fname)
-                    thumbnail_files.append(thumbnail_file)
-                elif root == os.path.join(vt_save_dir,'mashups'):
-                    mashup_file = os.path.join(root, fname)
-                    mashup = open_mashuptrail_from_xml(mashup_file)
-                    mashups.append(mashup)
+        for name in names:
+            root, fname = posixpath.split(name)
+            if fname == 'vistrail' and not root:
+                if reader is not None:
+                    # the vistrail file is written again when saving
+                    reader.pending.discard(name)
+                    vistrail = open_vistrail_from_xml(
+                            get_path(name),
+                            open_file=lambda: reader.open(name))
                 else:
-                    handled = False
-                    from vistrails.core.packagemanager import get_package_manager
-                    pm = get_package_manager()
-                    for package in pm.enabled_package_list():
-                        if package.can_handle_vt_file(fname):
-                            handled = True
-                            continue
-                    if not handled:
-                        unknown_files.append(os.path.join(root, fname))
-    except OSError, e:
+                    vistrail = open_vistrail_from_xml(get_path(name))
+            elif fname == 'log' and not root:
+                # FIXME read log to get execution info
+                # right now, just ignore the file
+                log = None 
+                log_fname = get_path(name)
+                # log = open_log_from_xml(os.path.join(root, fname))
+                # objs.append(DBLog.vtType, log)
+            elif fname == 'checkpoints' and not root:
+                if reader is not None:
+                    reader.extract([name])
+                checkpoints_fname = get_path(name)
+            elif fname.startswith('abstraction_'):
+                abstraction_names.append(name)
+            elif fname.endswith('.png') and root == 'thumbs':
+                thumbnail_names.append(name)
+            elif root == 'mashups':
+                mashup_names.append(name)
+            else:
+                # files handled by packages are extracted for their hooks
+                if reader is not None:
+                    reader.extract([name])
+                handled = False
+                from vistrails.core.packagemanager import get_package_manager
+                pm = get_package_manager()
+                for package in pm.enabled_package_list():
+                    if package.can_handle_vt_file(fname):
+                        handled = True
+                        continue
+                if not handled:
+                    unknown_files.append(get_path(name))
+    except (OSError, zipfile.BadZipfile), e:
         raise VistrailsDBException("Error when reading vt file")
     if len(unknown_files) > 0:
         raise VistrailsDBException("Unknown files in vt file: %s" % \
@@ -765,6 +1157,26 @@ def open_vistrail_bundle_from_zip_xml(filename):
     if vistrail is None:
         raise VistrailsDBException("vt file does not contain vistrail")
     vistrail.db_log_filename = log_fname
+    if checkpoints_fname is not None:
+        checkpoints = WorkflowCheckpoints(persistent=True)
+        try:
+            checkpoints.load(checkpoints_fname)
+        except (IOError, ValueError), e:
+            debug.warning("Could not read workflow checkpoints", e)
+        else:
+            vistrail.db_checkpoints = checkpoints
+
+    if reader is not None:
+        abstraction_files = LazyBundleList(reader, abstraction_names)
+        thumbnail_files = LazyBundleList(reader, thumbnail_names)
+        mashups = LazyBundleList(reader, mashup_names,
+                                 open_mashuptrail_from_xml)
+        _lazy_bundles[vt_save_dir] = reader
+    else:
+        abstraction_files = [get_path(name) for name in abstraction_names]
+        thumbnail_files = [get_path(name) for name in thumbnail_names]
+        mashups = [open_mashuptrail_from_xml(get_path(name))
+                   for name in mashup_names]
 
     # call package hooks
     from vistrails.core.packagemanager import get_package_manager
@@ -814,18 +1226,174 @@ def open_vistrail_bundle_from_db(db_connection, vistrail_id, tmp_dir=None):
                       abstractions=abstractions, thumbnails=thumbnails,
                       mashups=mashuptrails)
 
-def open_vistrail_from_db(db_connection, id, lock=False, version=None):
+class DBActionLoader(object):
+    """DBActionLoader(db_connection, vistrail: DBVistrail, max_actions: int)
+
+    Reads the operations of the actions of a vistrail opened lazily from
+    the database (see open_vistrail_from_db). At most max_actions actions
+    keep their operations in memory; the operations of the least
+    recently used ones are dropped and read again when needed.
+
+    Reading relies on a connection that stays open while the vistrail is
+    in use. If get_connection is set (DBLocator sets it to its own
+    get_connection(), which reconnects if needed), it is called before
+    each read; otherwise db_connection is checked first, so that a closed
+    connection is reported clearly.
+
+    """
+
+    def __init__(self, db_connection, vistrail, max_actions):
+        self.db_connection = db_connection
+        self.get_connection = None
+        self.entity_id = vistrail.db_id
+        self.entity_type = vistrail.vtType
+        self.dao_list = getVersionDAO(currentVersion)
+        self.max_actions = max_actions
+        # actions holding operations read by this loader:
+        # id(action) -> [last use, action]
+        self.loaded = {}
+        self.uses = itertools.count()
+
+    def set_pending(self, action):
+        """set_pending(action: DBAction) -> None
+        Makes the operations of action be read on first use.
+
+        """
+        operations = DBLazyOperationList(action, self)
+        if isinstance(action.db_operations, DBLazyOperationList):
+            operations.convert = action.db_operations.convert
+        action._db_operations = operations
+        action._db_operations_id_index = None
+
+    def connection(self):
+        """connection() -> connection
+        Returns an open connection to read operations from.
+
+        """
+        if self.get_connection is not None:
+            self.db_connection = self.get_connection()
+        elif (self.db_connection is None or
+                not ping_db_connection(self.db_connection)):
+            raise VistrailsDBException("The database connection the "
+                                       "vistrail was opened with is closed")
+        return self.db_connection
+
+    def load(self, action):
+        self.prefetch([action])
+
+    def read_operations(self, actions):
+        """read_operations(actions: list of DBAction) -> dict
+        Reads the operations of the given actions that are still pending
+        with a single set of queries, without storing them in the actions
+        or evicting others. Returns a dict mapping the ids of these
+        actions to their sorted operations.
+
+        This is for walking many actions once (e.g. VersionIndex), which
+        would otherwise push the whole vistrail through the cache.
+
+        """
+        action_ids = list(set(action.db_id for action in actions
+                              if action.db_operations_pending() and
+                                  action.db_operations.loader is self))
+        if not action_ids:
+            return {}
+        operations = self.dao_list.open_operations_from_db(
+            self.connection(), self.entity_id, self.entity_type, action_ids)
+        return dict((action_id,
+                     sorted(operations.get(action_id, []),
+                            key=lambda x: x.db_id))
+                    for action_id in action_ids)
+
+    def prefetch(self, actions):
+        """prefetch(actions: list of DBAction) -> None
+        Reads the operations of all the given actions that are still
+        pending with a single set of queries.
+
+        """
+        pending = [action for action in actions
+                   if action.db_operations_pending() and
+                       action.db_operations.loader is self]
+        if pending:
+            action_ids = list(set(action.db_id for action in pending))
+            operations = self.dao_list.open_operations_from_db(
+                self.connection(), self.entity_id, self.entity_type,
+                action_ids)
+            seen = set()
+            for action in pending:
+                action_ops = operations[action.db_id]
+                if action.db_id in seen:
+                    # copies of the same action get their own operations
+                    action_ops = [op.do_copy() for op in action_ops]
+                seen.add(action.db_id)
+                action.db_operations.fill(action_ops)
+                self.loaded[id(action)] = [None, action]
+        used = set()
+        for action in actions:
+            key = id(action)
+            if key in self.loaded:
+                self.loaded[key][0] = next(self.uses)
+                used.add(key)
+        self.evict(used)
+
+    def evict(self, keep=()):
+        """evict(keep: set) -> None
+        Drops the operations of the least recently used actions, but not
+        of the actions in keep, until at most max_actions are left.
+
+        """
+        if len(self.loaded) <= self.max_actions:
+            return
+        for key in sorted(self.loaded, key=lambda k: self.loaded[k][0]):
+            if len(self.loaded) <= self.max_actions:
+                break
+            if key in keep:
+                continue
+            action = self.loaded.pop(key)[1]
+            # actions do not change once they are in the version tree, so
+            # their operations can always be read again
+            self.set_pending(action)
+
+def open_vistrail_from_db(db_connection, id, lock=False, version=None,
+                          lazy=None):
     """open_vistrail_from_db(db_connection, id : long, lock: bool, 
-                             version: str) 
+                             version: str, lazy: bool) 
          -> DBVistrail 
 
+    If lazy is True (defaults to the 'lazyDB.enabled' setting), only the
+    version tree (actions, tags and annotations) is read up front. The
+    operations of an action are read when a workflow that needs them is
+    materialized, so db_connection has to stay open while the vistrail
+    is in use (DBLocator keeps its connections open and reconnects; see
+    DBActionLoader). Vistrails that are locked or stored with an older
+    schema are always read completely.
+
     """
     if db_connection is None:
         msg = "Need to call open_db_connection() before reading"
         raise VistrailsDBException(msg)
     if version is None:
         version = get_db_object_version(db_connection, id, DBVistrail.vtType)
+    conf = get_vistrails_configuration()
+    if lazy is None:
+        lazy = (conf is not None and
+                conf.has_deep_value('lazyDB.enabled') and
+                conf.get_deep_value('lazyDB.enabled'))
     dao_list = getVersionDAO(version)
+    if lazy and not lock and version == currentVersion:
+        vistrail, max_ids = \
+            dao_list.open_skeleton_from_db(db_connection, DBVistrail.vtType,
+                                           id)
+        max_actions = 1000
+        if conf is not None and conf.has_deep_value('lazyDB.cacheSize'):
+            max_actions = conf.get_deep_value('lazyDB.cacheSize')
+        loader = DBActionLoader(db_connection, vistrail, max_actions)
+        for db_action in vistrail.db_get_actions():
+            loader.set_pending(db_action)
+        vistrail.db_action_loader = loader
+        for vtType, max_id in max_ids.iteritems():
+            vistrail.idScope.updateBeginId(vtType, max_id + 1)
+        vistrails.db.services.vistrail.update_id_scope(vistrail)
+        return vistrail
     vistrail = \
         dao_list.open_from_db(db_connection, DBVistrail.vtType, id, lock)
     vistrail = translate_vistrail(vistrail, version)
@@ -834,6 +1402,16 @@ def open_vistrail_from_db(db_connection, id, lock=False, version=None):
     vistrails.db.services.vistrail.update_id_scope(vistrail)
     return vistrail
 
+def fetch_vistrail_operations(vistrail):
+    """fetch_vistrail_operations(vistrail: DBVistrail) -> None
+    Reads all the operations of a vistrail opened lazily from the
+    database, before they are all used.
+
+    """
+    loader = getattr(vistrail, 'db_action_loader', None)
+    if loader is not None:
+        loader.prefetch(vistrail.db_get_actions())
+
 def save_vistrail_to_xml(vistrail, filename, version=None):
     tags = {'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance',
             'xsi:schemaLocation': 'http://www.vistrails.org/vistrail.xsd'
@@ -849,6 +1427,7 @@ def save_vistrail_to_xml(vistrail, filename, version=None):
     if hasattr(vistrail, 'db_currentVersion'):
         current_action = vistrail.db_currentVersion
 
+    fetch_vistrail_operations(vistrail)
     vistrail = translate_vistrail(vistrail, vistrail.db_version, version)
 
     daoList = getVersionDAO(version)        
@@ -876,6 +1455,9 @@ def save_vistrail_bundle_to_zip_xml(save_bundle, filename, vt_save_dir=None, ver
                                    'bundle does not contain a vistrail')
     if not vt_save_dir:
         vt_save_dir = tempfile.mkdtemp(prefix='vt_save')
+    elif vt_save_dir in _lazy_bundles:
+        # the archive is about to be overwritten, get everything out of it
+        _lazy_bundles[vt_save_dir].extract_all()
     # abstractions are saved in the root of the zip file
     # abstraction_dir = os.path.join(vt_save_dir, 'abstractions')
     #thumbnails and mashups have their own folder
@@ -890,6 +1472,7 @@ def save_vistrail_bundle_to_zip_xml(save_bundle, filename, vt_save_dir=None, ver
     if save_bundle.vistrail.db_log_filename is not None:
         xml_fname = os.path.join(vt_save_dir, 'log')
         if save_bundle.vistrail.db_log_filename != xml_fname:
+            extract_bundle_member(save_bundle.vistrail.db_log_filename)
             shutil.copyfile(save_bundle.vistrail.db_log_filename, xml_fname)
             save_bundle.vistrail.db_log_filename = xml_fname
 
@@ -898,6 +1481,15 @@ def save_vistrail_bundle_to_zip_xml(save_bundle, filename, vt_save_dir=None, ver
         save_log_to_xml(save_bundle.log, xml_fname, version, True)
         save_bundle.vistrail.db_log_filename = xml_fname
 
+    # Save Checkpoints
+    checkpoints = getattr(save_bundle.vistrail, 'db_checkpoints', None)
+    checkpoints_fname = os.path.join(vt_save_dir, 'checkpoints')
+    if checkpoints is not None and checkpoints.persistent and \
+            len(checkpoints) > 0:
+        checkpoints.save(checkpoints_fname)
+    elif os.path.exists(checkpoints_fname):
+        os.unlink(checkpoints_fname)
+
     # Save Abstractions
     saved_abstractions = []
     for obj in save_bundle.abstractions:
@@ -1057,6 +1649,9 @@ def save_vistrail_to_db(vistrail, db_connection, do_copy=False, version=None):
             vistrail = old_vistrail
     vistrail.db_last_modified = get_current_time(db_connection)
 
+    if do_copy or version != vistrail.db_version:
+        # copies and translations need every operation
+        fetch_vistrail_operations(vistrail)
     vistrail = translate_vistrail(vistrail, vistrail.db_version, version)
     # get saved workflows from db
     workflowIds = get_saved_workflows(vistrail, db_connection)
@@ -1185,8 +1780,30 @@ def get_saved_workflows(vistrail, db_connection):
 ##############################################################################
 # Logging I/O
 
+def read_workflow_exec_from_xml(node):
+    """read_workflow_exec_from_xml(node: Element) -> DBWorkflowExec
+    Reads an appended workflow_exec element, translating it to the
+    current version.
+
+    """
+    version = get_version_for_xml(node)
+    daoList = getVersionDAO(version)
+    workflow_exec = daoList.read_xml_object(DBWorkflowExec.vtType, node)
+    if version != currentVersion:
+        # if version is wrong, dump this into a dummy log object, 
+        # then translate, then get workflow_exec back
+        log = DBLog()
+        translate_log(log, currentVersion, version)
+        log.db_add_workflow_exec(workflow_exec)
+        log = translate_log(log, version)
+        workflow_exec = log.db_workflow_execs[0]
+    return workflow_exec
+
 def open_log_from_xml(filename, was_appended=False):
     """open_log_from_xml(filename) -> DBLog"""
+    extract_bundle_member(filename)
+    if was_appended and is_indexed_log(filename):
+        return open_log_from_indexed(filename)
     if was_appended:
         parser = ElementTree.XMLTreeBuilder()
         parser.feed("<log>\n")
@@ -1196,19 +1813,7 @@ def open_log_from_xml(filename, was_appended=False):
         root = parser.close()
         workflow_execs = []
         for node in root:
-            version = get_version_for_xml(node)
-            daoList = getVersionDAO(version)
-            workflow_exec = \
-                daoList.read_xml_object(DBWorkflowExec.vtType, node)
-            if version != currentVersion:
-                # if version is wrong, dump this into a dummy log object, 
-                # then translate, then get workflow_exec back
-                log = DBLog()
-                translate_log(log, currentVersion, version)
-                log.db_add_workflow_exec(workflow_exec)
-                log = translate_log(log, version)
-                workflow_exec = log.db_workflow_execs[0]
-            workflow_execs.append(workflow_exec)
+            workflow_execs.append(read_workflow_exec_from_xml(node))
         log = DBLog(workflow_execs=workflow_execs)
         vistrails.db.services.log.update_ids(log)
     else:
@@ -1220,6 +1825,75 @@ def open_log_from_xml(filename, was_appended=False):
         vistrails.db.services.log.update_id_scope(log)
     return log
 
+def _read_indexed_workflow_exec(log_file, entry):
+    workflow_exec = read_workflow_exec_from_xml(
+        ElementTree.fromstring(log_file.read(entry)))
+    workflow_exec.db_id = entry.id
+    return workflow_exec
+
+def open_log_from_indexed(filename):
+    """open_log_from_indexed(filename: str) -> DBLog
+    Reads a whole log stored in the indexed format.
+
+    """
+    log_file = get_indexed_log(filename)
+    workflow_execs = [_read_indexed_workflow_exec(log_file, entry)
+                      for entry in log_file.entries()]
+    log = DBLog(workflow_execs=workflow_execs)
+    vistrails.db.services.log.update_ids(log)
+    return log
+
+def open_workflow_exec_from_log(filename, exec_id):
+    """open_workflow_exec_from_log(filename: str, exec_id: int)
+          -> DBWorkflowExec
+    Reads a single workflow execution from an appended log. Only that
+    execution is parsed if the log uses the indexed format.
+
+    """
+    extract_bundle_member(filename)
+    if is_indexed_log(filename):
+        log_file = get_indexed_log(filename)
+        try:
+            entry = log_file.get_entry(exec_id)
+        except KeyError:
+            raise VistrailsDBException("Log '%s' has no workflow execution "
+                                       "with id %s" % (filename, exec_id))
+        return _read_indexed_workflow_exec(log_file, entry)
+    log = open_log_from_xml(filename, True)
+    for workflow_exec in log.db_workflow_execs:
+        if workflow_exec.db_id == exec_id:
+            return workflow_exec
+    raise VistrailsDBException("Log '%s' has no workflow execution "
+                               "with id %s" % (filename, exec_id))
+
+def find_workflow_execs_in_log(filename, parent_version=None,
+                               start=None, end=None):
+    """find_workflow_execs_in_log(filename: str, parent_version: int,
+                                  start: datetime, end: datetime)
+          -> list of DBWorkflowExec
+    Returns the workflow executions of a vistrail version that overlap
+    the given time range. Criteria left to None are ignored.
+
+    """
+    extract_bundle_member(filename)
+    if is_indexed_log(filename):
+        log_file = get_indexed_log(filename)
+        return [_read_indexed_workflow_exec(log_file, entry)
+                for entry in log_file.find(parent_version, start, end)]
+    result = []
+    for workflow_exec in open_log_from_xml(filename, True).db_workflow_execs:
+        if parent_version is not None and \
+                workflow_exec.db_parent_version != parent_version:
+            continue
+        if start is not None and (workflow_exec.db_ts_end is None or
+                                  workflow_exec.db_ts_end < start):
+            continue
+        if end is not None and (workflow_exec.db_ts_start is None or
+                                workflow_exec.db_ts_start > end):
+            continue
+        result.append(workflow_exec)
+    return result
+
 def open_log_from_db(db_connection, id, lock=False, version=None):
     """open_log_from_db(db_connection, id : long: lock: bool, version: str) 
          -> DBLog 
@@ -1263,6 +1937,51 @@ def open_vt_log_from_db(db_connection, vt_id, version=None):
     log = translate_log(log, version)
     return log
 
+def use_indexed_log(filename):
+    """use_indexed_log(filename: str) -> bool
+    Tells whether workflow executions appended to filename are stored in
+    the indexed format: existing logs keep their format, new ones use
+    the 'indexedLog' configuration option.
+
+    """
+    if os.path.exists(filename) and os.path.getsize(filename) > 0:
+        return is_indexed_log(filename)
+    conf = get_vistrails_configuration()
+    return conf is not None and conf.check('indexedLog')
+
+def _append_log_to_indexed(log, filename, daoList, version):
+    records = []
+    for workflow_exec in log.db_workflow_execs:
+        # ids are positions in the file, see log_store
+        wf_exec_id = workflow_exec.db_id
+        workflow_exec.db_id = -1L
+        root = daoList.write_xml_object(workflow_exec)
+        root.set('version', version)
+        workflow_exec.db_id = wf_exec_id
+        records.append((workflow_exec.db_parent_version,
+                        workflow_exec.db_ts_start,
+                        workflow_exec.db_ts_end,
+                        ElementTree.tostring(root)))
+    get_indexed_log(filename).append(records)
+
+def convert_log_to_indexed(log, filename, version=None):
+    """convert_log_to_indexed(log: DBLog, filename: str, version: str)
+          -> DBLog
+    Writes all the workflow executions of log to a new indexed log file.
+    open_log_from_xml(filename, True) reads it back.
+
+    """
+    if version is None:
+        version = currentVersion
+    if not log.db_version:
+        log.db_version = currentVersion
+    log = translate_log(log, log.db_version, version)
+    if os.path.exists(filename):
+        os.unlink(filename)
+    _append_log_to_indexed(log, filename, getVersionDAO(version), version)
+    log = translate_log(log, version)
+    return log
+
 def save_log_to_xml(log, filename, version=None, do_append=False):
     if version is None:
         version = currentVersion
@@ -1271,7 +1990,9 @@ def save_log_to_xml(log, filename, version=None, do_append=False):
     log = translate_log(log, log.db_version, version)
 
     daoList = getVersionDAO(version)
-    if do_append:
+    if do_append and use_indexed_log(filename):
+        _append_log_to_indexed(log, filename, daoList, version)
+    elif do_append:
         log_file = open(filename, 'ab')
         for workflow_exec in log.db_workflow_execs:
             # cannot do correct numbering here...
@@ -1696,6 +2417,11 @@ def open_mashuptrail_from_xml(filename):
         mashuptrail = daoList.open_from_xml(filename, DBMashuptrail.vtType, tree)
         if old_version == "0.1.0":
             mashuptrail.db_version = version
+        if version != currentVersion:
+            # the mashup schema has not changed since 1.0.3, but the
+            # objects still have to be rebuilt with the current domain
+            # classes before they can be converted
+            mashuptrail = DBMashuptrail.update_version(mashuptrail, {})
         Mashuptrail.convert(mashuptrail)
         mashuptrail.currentVersion = mashuptrail.getLatestVersion()
         mashuptrail.updateIdScope()
@@ -1925,3 +2651,356 @@ class TestDBIO(unittest.TestCase):
                 self.fail(str(e))
         finally:
             os.rmdir(testdir)
+
+    def test_parse_xml_stream(self):
+        """test that parsed elements are released"""
+        from StringIO import StringIO
+
+        f = StringIO('<vistrail version="1.0.4" id="3">' +
+                     ''.join('<action id="%d"><add what="module"/></action>' %
+                             i for i in xrange(5)) +
+                     '</vistrail>')
+        root = parse_xml_stream(f).getroot()
+        self.assertEqual(get_version_for_xml(root), '1.0.4')
+        self.assertEqual(root.get('id'), '3')
+        previous = None
+        ids = []
+        for child in root.getchildren():
+            if previous is not None:
+                # the previous child was cleared and dropped
+                self.assertIsNone(previous.get('id'))
+                self.assertEqual(len(previous), 0)
+            # children read before this one are no longer in the tree
+            self.assertIs(root._root[0], child)
+            self.assertEqual(child.tag, 'action')
+            self.assertEqual(len(child), 1)
+            ids.append(child.get('id'))
+            previous = child
+        self.assertEqual(ids, ['0', '1', '2', '3', '4'])
+        self.assertEqual(len(root._root), 0)
+
+    def test_lazy_bundle(self):
+        """test opening a vt file lazily"""
+
+        filename = os.path.join(vistrails.core.system.vistrails_root_directory(),
+                                'tests/resources/spx_loop.vt')
+        (eager_bundle, eager_dir) = open_vistrail_bundle_from_zip_xml(
+            filename, lazy=False)
+        (lazy_bundle, lazy_dir) = open_vistrail_bundle_from_zip_xml(
+            filename, lazy=True)
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        try:
+            self.assertEqual(os.listdir(lazy_dir), [])
+            self.assertEqual(lazy_bundle.vistrail.db_actions_id_index.keys(),
+                             eager_bundle.vistrail.db_actions_id_index.keys())
+
+            # members are extracted on first access
+            self.assertEqual(
+                [os.path.basename(f) for f in lazy_bundle.thumbnails],
+                [os.path.basename(f) for f in eager_bundle.thumbnails])
+            for f in lazy_bundle.thumbnails:
+                self.assertTrue(os.path.isfile(f))
+            self.assertEqual([m.db_id for m in lazy_bundle.mashups],
+                             [m.db_id for m in eager_bundle.mashups])
+            log_fname = lazy_bundle.vistrail.db_log_filename
+            self.assertFalse(os.path.exists(log_fname))
+            log = open_log_from_xml(log_fname, True)
+            self.assertEqual(len(log.db_workflow_execs),
+                             len(open_log_from_xml(
+                        eager_bundle.vistrail.db_log_filename,
+                        True).db_workflow_execs))
+
+            # saving writes everything back
+            new_filename = os.path.join(testdir, 'spx_loop.vt')
+            shutil.copyfile(filename, new_filename)
+            close_zip_xml(lazy_dir)
+            (lazy_bundle, lazy_dir) = open_vistrail_bundle_from_zip_xml(
+                new_filename, lazy=True)
+            save_bundle_to_zip_xml(lazy_bundle, new_filename, lazy_dir)
+            z = zipfile.ZipFile(new_filename)
+            try:
+                self.assertEqual(
+                    set(n for n in z.namelist() if not n.endswith('/')),
+                    set(n for n in zipfile.ZipFile(filename).namelist()
+                        if not n.endswith('/')))
+            finally:
+                z.close()
+        finally:
+            close_zip_xml(eager_dir)
+            close_zip_xml(lazy_dir)
+            shutil.rmtree(testdir)
+
+    def test_indexed_log(self):
+        """test converting a log to the indexed format and back"""
+
+        filename = os.path.join(vistrails.core.system.vistrails_root_directory(),
+                                'tests/resources/spx_loop.vt')
+        (bundle, save_dir) = open_vistrail_bundle_from_zip_xml(filename,
+                                                               lazy=False)
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        try:
+            log = open_log_from_xml(bundle.vistrail.db_log_filename, True)
+            self.assertTrue(len(log.db_workflow_execs) > 0)
+            log_fname = os.path.join(testdir, 'log')
+            convert_log_to_indexed(log, log_fname)
+            self.assertTrue(is_indexed_log(log_fname))
+
+            # more executions are appended in the same format
+            save_log_to_xml(DBLog(workflow_execs=[
+                        copy.copy(log.db_workflow_execs[0])]),
+                            log_fname, do_append=True)
+            indexed_log = open_log_from_xml(log_fname, True)
+            self.assertEqual(len(indexed_log.db_workflow_execs),
+                             len(log.db_workflow_execs) + 1)
+            for wf_exec, indexed_wf_exec in zip(log.db_workflow_execs,
+                                                indexed_log.db_workflow_execs):
+                self.assertEqual(wf_exec.db_id, indexed_wf_exec.db_id)
+                self.assertEqual(wf_exec.db_ts_start,
+                                 indexed_wf_exec.db_ts_start)
+                self.assertEqual(len(wf_exec.db_item_execs),
+                                 len(indexed_wf_exec.db_item_execs))
+
+            # single executions are read directly
+            wf_exec = log.db_workflow_execs[-1]
+            indexed_wf_exec = open_workflow_exec_from_log(log_fname,
+                                                          wf_exec.db_id)
+            self.assertEqual(indexed_wf_exec.db_id, wf_exec.db_id)
+            self.assertEqual(indexed_wf_exec.db_parent_version,
+                             wf_exec.db_parent_version)
+            self.assertRaises(VistrailsDBException,
+                              open_workflow_exec_from_log, log_fname, 1000)
+            self.assertEqual(
+                [e.db_id for e in find_workflow_execs_in_log(
+                        log_fname, wf_exec.db_parent_version)],
+                [e.db_id for e in find_workflow_execs_in_log(
+                        bundle.vistrail.db_log_filename,
+                        wf_exec.db_parent_version)])
+            # the copy of the first execution is found too
+            wf_exec = log.db_workflow_execs[0]
+            self.assertEqual(
+                len(find_workflow_execs_in_log(log_fname,
+                                               start=wf_exec.db_ts_start,
+                                               end=wf_exec.db_ts_end)),
+                len(find_workflow_execs_in_log(bundle.vistrail.db_log_filename,
+                                               start=wf_exec.db_ts_start,
+                                               end=wf_exec.db_ts_end)) + 1)
+        finally:
+            close_zip_xml(save_dir)
+            shutil.rmtree(testdir)
+
+    def test_fused_translation(self):
+        """test skipping structural translations"""
+        from vistrails.db.versions import translate_object
+
+        filename = os.path.join(vistrails.core.system.vistrails_root_directory(),
+                                'tests/resources/triangle_count.vt')
+        z = zipfile.ZipFile(filename)
+        try:
+            xml = z.read('vistrail')
+        finally:
+            z.close()
+        testdir = tempfile.mkdtemp(prefix='vt_')
+        try:
+            results = []
+            for fuse in (False, True):
+                tree = ElementTree.ElementTree(ElementTree.fromstring(xml))
+                version = get_version_for_xml(tree.getroot())
+                vistrail = getVersionDAO(version).open_from_xml(
+                    None, DBVistrail.vtType, tree)
+                vistrail = translate_object(vistrail, 'translateVistrail',
+                                            version, fuse=fuse)
+                fname = os.path.join(testdir, 'vistrail_%s.xml' % fuse)
+                save_vistrail_to_xml(vistrail, fname)
+                with open(fname, 'rb') as f:
+                    results.append(f.read())
+            self.assertEqual(results[0], results[1])
+        finally:
+            shutil.rmtree(testdir)
+
+    def test_translation_cache(self):
+        """test reading translated vistrails from the cache"""
+
+        filename = os.path.join(vistrails.core.system.vistrails_root_directory(),
+                                'tests/resources/visvar-1.0.2.vt')
+        conf = get_vistrails_configuration()
+        cache_dir = tempfile.mkdtemp(prefix='vt_test_translations_')
+        old_enabled = conf.translationCache.enabled
+        old_dir = conf.translationCache.cacheDir
+        conf.translationCache.enabled = True
+        conf.translationCache.cacheDir = cache_dir
+        save_dirs = []
+        try:
+            bundles = []
+            for lazy in (False, True, False):
+                (bundle, save_dir) = open_vistrail_bundle_from_zip_xml(
+                    filename, lazy=lazy)
+                save_dirs.append(save_dir)
+                bundles.append(bundle)
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+            for bundle in bundles[1:]:
+                self.assertEqual(
+                    sorted(bundle.vistrail.db_actions_id_index),
+                    sorted(bundles[0].vistrail.db_actions_id_index))
+                self.assertEqual(
+                    sorted(v.db_name
+                           for v in bundle.vistrail.db_vistrailVariables),
+                    sorted(v.db_name
+                           for v in bundles[0].vistrail.db_vistrailVariables))
+
+            # current files don't go through the cache
+            (bundle, save_dir) = open_vistrail_bundle_from_zip_xml(
+                os.path.join(vistrails.core.system.vistrails_root_directory(),
+                             'tests/resources/test-streaming.vt'))
+            save_dirs.append(save_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+        finally:
+            conf.translationCache.enabled = old_enabled
+            conf.translationCache.cacheDir = old_dir
+            for save_dir in save_dirs:
+                close_zip_xml(save_dir)
+            shutil.rmtree(cache_dir)
+
+    def test_connection_pool(self):
+        """test reusing database connections"""
+
+        class FakeError(Exception):
+            pass
+        class Connection(object):
+            def __init__(self, config):
+                self.config = config
+                self.alive = True
+                self.rollbacks = 0
+            def ping(self):
+                if not self.alive:
+                    raise FakeLib.OperationalError()
+            def rollback(self):
+                self.rollbacks += 1
+            def close(self):
+                self.alive = False
+        class FakeLib(object):
+            Error = FakeError
+            class OperationalError(FakeError):
+                pass
+            opened = []
+            @classmethod
+            def connect(cls, **config):
+                cls.opened.append(Connection(config))
+                return cls.opened[-1]
+
+        old_lib = _db_lib
+        set_db_lib(FakeLib)
+        try:
+            pool = DBConnectionPool(2)
+            config = {'host': 'localhost', 'db': 'vistrails'}
+            conns = [pool.acquire(dict(config)) for i in xrange(3)]
+            self.assertEqual(len(FakeLib.opened), 3)
+            for conn in conns:
+                pool.release(conn)
+            # only two are kept
+            self.assertEqual([c.alive for c in conns], [True, True, False])
+            self.assertEqual(conns[0].rollbacks, 1)
+            self.assertIs(pool.acquire(dict(config)), conns[1])
+            # dead connections are replaced
+            conns[0].alive = False
+            conn = pool.acquire(dict(config))
+            self.assertEqual(len(FakeLib.opened), 4)
+            # connections are kept per configuration
+            other = pool.acquire({'host': 'localhost', 'db': 'other'})
+            self.assertEqual(other.config['db'], 'other')
+            for c in (conn, other, conns[1]):
+                pool.release(c)
+            pool.clear()
+            self.assertFalse(any(c.alive for c in FakeLib.opened))
+        finally:
+            set_db_lib(old_lib)
+
+    def test_lazy_actions(self):
+        """test reading the operations of actions on demand"""
+        from vistrails.db.domain import DBAction, DBAdd, DBModule
+        from vistrails.db.services.action_chain import getActionChain
+
+        class FakeError(Exception):
+            pass
+        class FakeLib(object):
+            Error = FakeError
+            class OperationalError(FakeError):
+                pass
+        class Connection(object):
+            alive = True
+            def ping(self):
+                if not self.alive:
+                    raise FakeLib.OperationalError()
+        class FakeDAOList(object):
+            def __init__(self):
+                self.calls = []
+                self.connections = []
+            def open_operations_from_db(self, db_connection, entity_id,
+                                        entity_type, action_ids):
+                self.calls.append(sorted(action_ids))
+                self.connections.append(db_connection)
+                return dict((i, [DBAdd(id=i*10, what='module', objectId=i,
+                                       data=DBModule(id=i, name='m%d' % i))])
+                            for i in action_ids)
+
+        vistrail = DBVistrail(id=1)
+        actions = [DBAction(id=i, prevId=i-1) for i in xrange(1, 4)]
+        for action in actions:
+            vistrail.db_add_action(action)
+        connection = Connection()
+        loader = DBActionLoader(connection, vistrail, 2)
+        loader.dao_list = FakeDAOList()
+        for action in actions:
+            loader.set_pending(action)
+        vistrail.db_action_loader = loader
+
+        # nothing is read until operations are used
+        vistrail.update_id_scope()
+        self.assertEqual(len(actions[0].db_children()), 1)
+        self.assertEqual(loader.dao_list.calls, [])
+        self.assertEqual(actions[0].db_operations[0].db_data.db_name, 'm1')
+        self.assertTrue(actions[0].db_has_operation_with_id(10))
+        self.assertEqual(loader.dao_list.calls, [[1]])
+
+        # a chain is read at once, and is kept even if it is too long
+        self.assertEqual(len(getActionChain(vistrail, 3)), 3)
+        self.assertEqual(loader.dao_list.calls, [[1], [2, 3]])
+        self.assertFalse(any(a.db_operations_pending() for a in actions))
+
+        # least recently materialized actions are dropped
+        getActionChain(vistrail, 1)
+        self.assertTrue(actions[1].db_operations_pending())
+        self.assertFalse(actions[2].db_operations_pending())
+
+        # copies read their own operations
+        cp = actions[1].do_copy()
+        self.assertTrue(cp.db_operations_pending())
+        self.assertEqual(cp.db_operations[0].db_id, 20)
+        self.assertTrue(actions[1].db_operations_pending())
+        self.assertEqual(loader.dao_list.calls[-1], [2])
+
+        # bulk reads don't go through the cache
+        loaded = dict(loader.loaded)
+        pending = [a.db_id for a in actions if a.db_operations_pending()]
+        self.assertIn(2, pending)
+        operations = loader.read_operations(actions)
+        self.assertEqual(loader.dao_list.calls[-1], pending)
+        self.assertEqual(sorted(operations), pending)
+        self.assertEqual([op.db_id for op in operations[2]], [20])
+        self.assertEqual([a.db_id for a in actions
+                          if a.db_operations_pending()], pending)
+        self.assertEqual(loader.loaded, loaded)
+
+        # a closed connection is reported before reading
+        old_lib = _db_lib
+        set_db_lib(FakeLib)
+        try:
+            connection.alive = False
+            self.assertRaises(VistrailsDBException,
+                              lambda: actions[1].db_operations[0])
+            # DBLocator gives the loader a way to reconnect
+            other = Connection()
+            loader.get_connection = lambda: other
+            self.assertEqual(actions[1].db_operations[0].db_id, 20)
+            self.assertIs(loader.dao_list.connections[-1], other)
+        finally:
+            set_db_lib(old_lib)
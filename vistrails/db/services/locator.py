@@ -863,6 +863,10 @@ class DBLocator(BaseLocator):
             return io.open_from_db(connection, type, self.obj_id)
         save_bundle = io.open_bundle_from_db(type, connection, self.obj_id, tmp_dir)
         primary_obj = save_bundle.get_primary_obj()
+        loader = getattr(primary_obj, 'db_action_loader', None)
+        if loader is not None:
+            # operations are read later, through a live connection
+            loader.get_connection = self.get_connection
         self._name = primary_obj.db_name
         #print "locator db name:", self._name
         for obj in save_bundle.get_db_objs():
@@ -901,6 +905,20 @@ class DBLocator(BaseLocator):
                                                 obj_type)
         ts = datetime(*time_strptime(str(ts).strip(), '%Y-%m-%d %H:%M:%S')[0:6])
         return ts
+
+    def get_db_state(self, obj_type=None):
+        """get_db_state(obj_type: str) -> tuple
+        Returns a summary of the rows stored for the object, that changes
+        whenever it is saved (see io.get_db_object_state).
+
+        """
+        if obj_type is None:
+            if self.obj_type is None:
+                obj_type = DBVistrail.vtType
+            else:
+                obj_type = self.obj_type
+        return io.get_db_object_state(self.get_connection(), self.obj_id,
+                                      obj_type)
         
     def serialize(self, dom, element):
         """serialize(dom, element) -> None
@@ -0,0 +1,358 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""Append-only storage for execution logs.
+
+The XML log of a vistrail is a list of appended workflow_exec fragments
+that has to be parsed completely to find anything in it.
+:class:`IndexedLogFile` stores each workflow execution as a separate
+compressed record preceded by a small fixed-size header holding the
+vistrail version and the start and end times of the execution. The
+index is built by reading the headers only, so single executions can be
+looked up by id, version or time without parsing the rest of the log.
+
+Workflow execution ids are the positions of the records in the file,
+starting at 1, which is also how ids are assigned when reading an
+appended XML log.
+
+"""
+
+import contextlib
+import datetime
+import os
+import struct
+import time
+import unittest
+import zlib
+
+try:
+    import fcntl
+except ImportError: # pragma: no cover
+    fcntl = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+MAGIC = 'VTLOGIDX1\n'
+
+class IndexedLogEntry(object):
+    """Index entry for a workflow execution stored in an IndexedLogFile"""
+
+    def __init__(self, id, parent_version, ts_start, ts_end, offset, length):
+        self.id = id
+        self.parent_version = parent_version
+        self.ts_start = ts_start
+        self.ts_end = ts_end
+        self.offset = offset
+        self.length = length
+
+def to_timestamp(dt):
+    """to_timestamp(dt: datetime) -> float
+    Converts a local datetime to seconds since the epoch, None to NaN.
+
+    """
+    if dt is None:
+        return float('nan')
+    return time.mktime(dt.timetuple()) + dt.microsecond / 1e6
+
+@contextlib.contextmanager
+def locked(f):
+    """Holds an exclusive lock on an open file, so that several processes
+    can append to the same log.
+
+    """
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None: # pragma: no cover
+        # locks the first byte, which is enough as all writers use it
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else: # pragma: no cover
+        yield
+
+def is_indexed_log(filename):
+    """is_indexed_log(filename: str) -> bool
+    Tells whether filename is a log stored by IndexedLogFile.
+
+    """
+    try:
+        f = open(filename, 'rb')
+    except IOError:
+        return False
+    try:
+        return f.read(len(MAGIC)) == MAGIC
+    finally:
+        f.close()
+
+class IndexedLogFile(object):
+    """IndexedLogFile(filename: str)
+
+    Append-only file of workflow executions, indexed by execution id,
+    vistrail version and time. Records are serialized by the caller (see
+    vistrails.db.services.io) and stored compressed.
+
+    """
+
+    # payload length, parent version, start time, end time
+    header = struct.Struct('<Iqdd')
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._entries = []
+        self._scanned = 0
+
+    def entries(self):
+        """entries() -> list of IndexedLogEntry
+        Returns the index of the file, reading the headers of the records
+        appended since the last call.
+
+        """
+        try:
+            size = os.path.getsize(self.filename)
+        except OSError:
+            size = 0
+        if size < self._scanned:
+            # the file was replaced
+            self._entries = []
+            self._scanned = 0
+        if size == self._scanned:
+            return self._entries
+        f = open(self.filename, 'rb')
+        try:
+            offset = self._scanned
+            if offset == 0:
+                if f.read(len(MAGIC)) != MAGIC:
+                    raise ValueError("%s is not an indexed log" %
+                                     self.filename)
+                offset = len(MAGIC)
+            f.seek(offset)
+            while True:
+                data = f.read(self.header.size)
+                if len(data) < self.header.size:
+                    break
+                length, version, ts_start, ts_end = self.header.unpack(data)
+                start = offset + self.header.size
+                if start + length > size:
+                    # incomplete record, being written or truncated
+                    break
+                self._entries.append(IndexedLogEntry(
+                        len(self._entries) + 1,
+                        version if version >= 0 else None,
+                        ts_start, ts_end, start, length))
+                offset = start + length
+                f.seek(offset)
+            self._scanned = offset
+        finally:
+            f.close()
+        return self._entries
+
+    def __len__(self):
+        return len(self.entries())
+
+    def append(self, records):
+        """append(records: list of (parent_version, ts_start, ts_end, str))
+              -> list of int
+        Appends serialized workflow executions to the file and returns
+        their ids. Times are datetime objects (or None).
+
+        """
+        # opening in append mode creates the file without truncating it
+        f = open(self.filename, 'ab')
+        try:
+            with locked(f):
+                if os.fstat(f.fileno()).st_size == 0:
+                    f.write(MAGIC)
+                    f.flush()
+                # records appended by other processes are indexed first
+                first_id = len(self.entries()) + 1
+                # drop a partial record left by an interrupted write
+                f.truncate(self._scanned)
+                for version, ts_start, ts_end, data in records:
+                    data = zlib.compress(data)
+                    if version is None:
+                        version = -1
+                    f.write(self.header.pack(len(data), version,
+                                             to_timestamp(ts_start),
+                                             to_timestamp(ts_end)))
+                    f.write(data)
+                f.flush()
+                self.entries()
+        finally:
+            f.close()
+        return range(first_id, first_id + len(records))
+
+    def read(self, entry):
+        """read(entry: IndexedLogEntry) -> str
+        Returns the serialized workflow execution for an index entry.
+
+        """
+        f = open(self.filename, 'rb')
+        try:
+            f.seek(entry.offset)
+            return zlib.decompress(f.read(entry.length))
+        finally:
+            f.close()
+
+    def get_entry(self, id):
+        entries = self.entries()
+        if id < 1 or id > len(entries):
+            raise KeyError(id)
+        return entries[id - 1]
+
+    def find(self, parent_version=None, start=None, end=None):
+        """find(parent_version: int, start: datetime, end: datetime)
+              -> list of IndexedLogEntry
+        Returns the executions of the given version that overlap the
+        given time range. Criteria left to None are ignored.
+
+        """
+        result = []
+        start = to_timestamp(start) if start is not None else None
+        end = to_timestamp(end) if end is not None else None
+        for entry in self.entries():
+            if parent_version is not None and \
+                    entry.parent_version != parent_version:
+                continue
+            if start is not None and not entry.ts_end >= start:
+                continue
+            if end is not None and not entry.ts_start <= end:
+                continue
+            result.append(entry)
+        return result
+
+# filename -> IndexedLogFile, so indexes are only read once
+_log_files = {}
+
+def get_indexed_log(filename):
+    """get_indexed_log(filename: str) -> IndexedLogFile
+    Returns the shared IndexedLogFile object for filename.
+
+    """
+    filename = os.path.abspath(filename)
+    try:
+        return _log_files[filename]
+    except KeyError:
+        log_file = _log_files[filename] = IndexedLogFile(filename)
+        return log_file
+
+def release_indexed_logs(directory):
+    """release_indexed_logs(directory: str) -> None
+    Forgets the IndexedLogFile objects for logs stored under directory,
+    e.g. when the temporary directory of a bundle is removed.
+
+    """
+    directory = os.path.join(os.path.abspath(directory), '')
+    for filename in _log_files.keys():
+        if filename.startswith(directory):
+            del _log_files[filename]
+
+##############################################################################
+
+class TestIndexedLogFile(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        self.dir = tempfile.mkdtemp(prefix='vt_log_')
+        self.filename = os.path.join(self.dir, 'log')
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.dir)
+
+    def test_append_find(self):
+        log_file = IndexedLogFile(self.filename)
+        t = datetime.datetime(2014, 1, 1, 12, 0, 0)
+        hour = datetime.timedelta(hours=1)
+        self.assertEqual(log_file.append([(3, t, t + hour, 'a'),
+                                          (4, t + hour, t + 2*hour, 'b')]),
+                         [1, 2])
+        self.assertEqual(log_file.append([(3, t + 2*hour, None, 'c')]), [3])
+        self.assertTrue(is_indexed_log(self.filename))
+
+        other = IndexedLogFile(self.filename)
+        self.assertEqual(len(other), 3)
+        self.assertEqual(other.read(other.get_entry(2)), 'b')
+        self.assertEqual([e.id for e in other.find(parent_version=3)],
+                         [1, 3])
+        self.assertEqual([e.id for e in other.find(start=t + hour + hour/2)],
+                         [2])
+        self.assertEqual([e.id for e in other.find(end=t + hour/2)], [1])
+        self.assertRaises(KeyError, other.get_entry, 4)
+
+    def test_partial_record(self):
+        log_file = IndexedLogFile(self.filename)
+        log_file.append([(1, None, None, 'a')])
+        f = open(self.filename, 'ab')
+        f.write(IndexedLogFile.header.pack(100, 2, 0.0, 0.0) + 'xx')
+        f.close()
+        log_file = IndexedLogFile(self.filename)
+        self.assertEqual(len(log_file), 1)
+        log_file.append([(2, None, None, 'b')])
+        self.assertEqual(len(IndexedLogFile(self.filename)), 2)
+        self.assertEqual(log_file.read(log_file.get_entry(2)), 'b')
+
+    def test_concurrent_append(self):
+        import multiprocessing
+        def append(n):
+            log_file = IndexedLogFile(self.filename)
+            for i in xrange(50):
+                log_file.append([(n, None, None, '%d-%d' % (n, i))])
+        processes = [multiprocessing.Process(target=append, args=(n,))
+                     for n in xrange(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        log_file = IndexedLogFile(self.filename)
+        self.assertEqual(len(log_file), 200)
+        records = set(log_file.read(entry) for entry in log_file.entries())
+        self.assertEqual(records, set('%d-%d' % (n, i)
+                                      for n in xrange(4)
+                                      for i in xrange(50)))
+
+    def test_not_indexed(self):
+        f = open(self.filename, 'wb')
+        f.write('<workflowExec/>')
+        f.close()
+        self.assertFalse(is_indexed_log(self.filename))
+        self.assertRaises(ValueError, IndexedLogFile(self.filename).entries)
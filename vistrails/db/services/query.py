@@ -33,14 +33,22 @@
 ##
 ###############################################################################
 from vistrails.db import VistrailsDBException
-from vistrails.db.services.io import open_db_connection, close_db_connection, get_db_lib
+from vistrails.db.services.io import get_db_connection, release_db_connection, get_db_lib
 
 def runWorkflowQuery(config, vistrail=None, version=None, fromTime=None,
         toTime=None, user=None, offset=0, limit=100, modules=[], thumbs=None):
     # returns list of workflows:
     #         (vistrail name, vistrail id, id, name, date, user, thumb)
+    db = get_db_connection(config)
+    try:
+        return _runWorkflowQuery(db, vistrail, version, fromTime, toTime,
+                                 user, offset, limit, modules, thumbs)
+    finally:
+        release_db_connection(db)
+
+def _runWorkflowQuery(db, vistrail, version, fromTime, toTime, user, offset,
+                      limit, modules, thumbs):
     result = []
-    db = open_db_connection(config)
     select_part = \
     """SELECT DISTINCT v.name, v.id, w.parent_id, a1.value,
               action.date, action.user"""
@@ -147,7 +155,6 @@ def runWorkflowQuery(config, vistrail=None, version=None, fromTime=None,
                 (e.args[0], e.args[1])
             raise VistrailsDBException(msg)
 
-    close_db_connection(db)
     return result
 
 def runLogQuery(config, vistrail=None, version=None, fromTime=None, toTime=None,
@@ -156,8 +163,16 @@ def runLogQuery(config, vistrail=None, version=None, fromTime=None, toTime=None,
     # returns list of workflow executions:
     #         (vistrail name, vistrail id, log id, workflow id, workflow name,
     #          execution id, start time, end time, user, completed, thumb)
+    db = get_db_connection(config)
+    try:
+        return _runLogQuery(db, vistrail, version, fromTime, toTime, user,
+                            completed, offset, limit, modules, thumbs)
+    finally:
+        release_db_connection(db)
+
+def _runLogQuery(db, vistrail, version, fromTime, toTime, user, completed,
+                 offset, limit, modules, thumbs):
     result = []
-    db = open_db_connection(config)
     select_part = \
     """SELECT DISTINCT v.name, v.id, w.entity_id,
               w.parent_version, a1.value, w.id,
@@ -258,5 +273,4 @@ def runLogQuery(config, vistrail=None, version=None, fromTime=None, toTime=None,
                 (e.args[0], e.args[1])
             raise VistrailsDBException(msg)
 
-    close_db_connection(db)
     return result
@@ -0,0 +1,211 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""On-disk cache of vistrails translated from older schema versions.
+
+Opening a file written with an older schema translates it through every
+schema version since. Once a file has been translated, the result is
+written in the current schema under the SHA-1 of the original document,
+so that opening the same unchanged file again only has to read it.
+The digest also covers the target schema and the VisTrails version, so
+that entries written by other translators are not reused.
+
+"""
+
+import hashlib
+import os
+import tempfile
+
+from vistrails.core import debug
+from vistrails.core.configuration import get_vistrails_configuration
+import vistrails.core.system
+
+import unittest
+
+##############################################################################
+
+class TranslationCache(object):
+    """TranslationCache(directory: str)
+
+    Stores translated documents in directory, one file per document named
+    after the digest of the original document and its vtType. Files are
+    published with an atomic rename, so that several processes may share
+    a directory.
+
+    """
+
+    BLOCK_SIZE = 1 << 16
+
+    def __init__(self, directory):
+        self.directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    @classmethod
+    def get_key(cls, f, target_version):
+        """get_key(f: file, target_version: str) -> str
+        Returns the digest of the contents of f, translated to the
+        target_version schema by this version of VisTrails.
+
+        """
+        digest = hashlib.sha1()
+        digest.update('%s\0%s\0' % (
+                target_version, vistrails.core.system.vistrails_version()))
+        block = f.read(cls.BLOCK_SIZE)
+        while block:
+            digest.update(block)
+            block = f.read(cls.BLOCK_SIZE)
+        return digest.hexdigest()
+
+    def get_filename(self, key, vtType):
+        return os.path.join(self.directory, '%s.%s.xml' % (key, vtType))
+
+    def lookup(self, key, vtType):
+        """lookup(key: str, vtType: str) -> str
+        Returns the filename of the translated document, or None if it
+        hasn't been stored.
+
+        """
+        filename = self.get_filename(key, vtType)
+        if os.path.isfile(filename):
+            return filename
+        return None
+
+    def store(self, key, vtType, write):
+        """store(key: str, vtType: str, write: callable) -> None
+        Calls write(filename) to save the translated document to a
+        temporary file and publishes it under key.
+
+        """
+        fd, tmp_name = tempfile.mkstemp(prefix='vt_translation_',
+                                        dir=self.directory)
+        os.close(fd)
+        try:
+            write(tmp_name)
+            os.rename(tmp_name, self.get_filename(key, vtType))
+        except Exception, e:
+            debug.warning("Couldn't store translated document in %s" %
+                          self.directory, e)
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+
+    def discard(self, key, vtType):
+        try:
+            os.remove(self.get_filename(key, vtType))
+        except OSError:
+            pass
+
+_translation_cache = None
+
+def get_translation_cache():
+    """get_translation_cache() -> TranslationCache
+    Returns the translation cache, or None if it is not enabled in the
+    configuration.
+
+    """
+    global _translation_cache
+    conf = get_vistrails_configuration()
+    if (conf is None or
+            not conf.has_deep_value('translationCache.enabled') or
+            not conf.get_deep_value('translationCache.enabled')):
+        return None
+    directory = vistrails.core.system.get_vistrails_directory(
+            'translationCache.cacheDir')
+    if directory is None:
+        return None
+    if (_translation_cache is None or
+            _translation_cache.directory != directory):
+        try:
+            _translation_cache = TranslationCache(directory)
+        except OSError, e:
+            debug.warning("Can't use translation cache in %s" % directory, e)
+            return None
+    return _translation_cache
+
+##############################################################################
+
+class TestTranslationCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='vt_test_translations_')
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_store(self):
+        from StringIO import StringIO
+        cache = TranslationCache(self.directory)
+        key = cache.get_key(StringIO('<vistrail version="1.0.2"/>'), '1.0.4')
+        self.assertNotEqual(key,
+                            cache.get_key(StringIO('<vistrail version="1.0.1"/>'),
+                                          '1.0.4'))
+        self.assertIsNone(cache.lookup(key, 'vistrail'))
+
+        def write(filename):
+            with open(filename, 'w') as f:
+                f.write('<vistrail version="1.0.4"/>')
+        cache.store(key, 'vistrail', write)
+        filename = cache.lookup(key, 'vistrail')
+        self.assertIsNotNone(filename)
+        with open(filename) as f:
+            self.assertEqual(f.read(), '<vistrail version="1.0.4"/>')
+        self.assertIsNone(cache.lookup(key, 'workflow'))
+
+        def fail(filename):
+            raise IOError("disk full")
+        cache.store(key, 'workflow', fail)
+        self.assertIsNone(cache.lookup(key, 'workflow'))
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+        cache.discard(key, 'vistrail')
+        self.assertIsNone(cache.lookup(key, 'vistrail'))
+
+    def test_key_versions(self):
+        """Keys change with the target schema and the translator."""
+        from StringIO import StringIO
+        document = '<vistrail version="1.0.2"/>'
+        key = TranslationCache.get_key(StringIO(document), '1.0.4')
+        self.assertEqual(key,
+                         TranslationCache.get_key(StringIO(document), '1.0.4'))
+        self.assertNotEqual(key,
+                            TranslationCache.get_key(StringIO(document),
+                                                     '1.0.3'))
+        old_version = vistrails.core.system.vistrails_version
+        vistrails.core.system.vistrails_version = lambda: '0.0.0'
+        try:
+            self.assertNotEqual(key,
+                                TranslationCache.get_key(StringIO(document),
+                                                         '1.0.4'))
+        finally:
+            vistrails.core.system.vistrails_version = old_version
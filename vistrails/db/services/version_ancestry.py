@@ -0,0 +1,239 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""Ancestry queries on the version tree of a vistrail.
+
+Finding the common ancestor of two versions by following the parents of
+the actions one at a time takes time proportional to the depth of the
+tree, which can be large. :class:`VersionAncestry` stores with each
+version its depth and a jump pointer to one of its ancestors, chosen so
+that any ancestor can be reached in a logarithmic number of jumps (the
+skew-binary scheme of Myers, "An applicative random-access stack").
+Unlike tables of ancestors at every power of two, this takes constant
+space and time per added version.
+
+"""
+
+import unittest
+
+class VersionAncestry(object):
+    """VersionAncestry(vistrail: DBVistrail)
+
+    Answers common ancestor, distance and is-ancestor queries on the
+    version tree of vistrail in O(log n) time. Versions added to the
+    vistrail afterwards have to be registered with add_version().
+    Version 0 is the root of the tree, and versions less than 0 are
+    treated as the root.
+
+    """
+
+    def __init__(self, vistrail=None):
+        self._parent = {0: 0}
+        self._depth = {0: 0}
+        self._jump = {0: 0}
+        if vistrail is not None:
+            children = {}
+            for action in vistrail.db_actions:
+                children.setdefault(action.db_prevId, []).append(action.db_id)
+            # parents have to be added before their children
+            queue = [0]
+            while queue:
+                version = queue.pop()
+                for child in children.get(version, []):
+                    self.add_version(child, version)
+                    queue.append(child)
+
+    def __contains__(self, version):
+        return version in self._depth
+
+    def __len__(self):
+        return len(self._depth)
+
+    def add_version(self, version, parent):
+        """add_version(version: int, parent: int) -> None
+        Adds a version as a child of parent, which has to be present.
+
+        """
+        depth = self._depth
+        jump = self._jump
+        parent_jump = jump[parent]
+        if depth[parent] - depth[parent_jump] == \
+                depth[parent_jump] - depth[jump[parent_jump]]:
+            jump[version] = jump[parent_jump]
+        else:
+            jump[version] = parent
+        self._parent[version] = parent
+        depth[version] = depth[parent] + 1
+
+    def depth(self, version):
+        """depth(version: int) -> int
+        Returns the number of actions between the root and version.
+
+        """
+        return self._depth[max(version, 0)]
+
+    def parent(self, version):
+        """parent(version: int) -> int
+        Returns the parent of version (the root is its own parent).
+
+        """
+        return self._parent[max(version, 0)]
+
+    def ancestor_at_depth(self, version, target_depth):
+        """ancestor_at_depth(version: int, target_depth: int) -> int
+        Returns the ancestor of version at the given depth.
+
+        """
+        version = max(version, 0)
+        depth = self._depth
+        jump = self._jump
+        parent = self._parent
+        if target_depth > depth[version] or target_depth < 0:
+            raise ValueError("Version %s has no ancestor at depth %s" %
+                             (version, target_depth))
+        while depth[version] > target_depth:
+            if depth[jump[version]] >= target_depth:
+                version = jump[version]
+            else:
+                version = parent[version]
+        return version
+
+    def is_ancestor(self, ancestor, version):
+        """is_ancestor(ancestor: int, version: int) -> bool
+        Tells whether ancestor is version or one of its ancestors.
+
+        """
+        ancestor = max(ancestor, 0)
+        target_depth = self._depth[ancestor]
+        if target_depth > self.depth(version):
+            return False
+        return self.ancestor_at_depth(version, target_depth) == ancestor
+
+    def common_ancestor(self, v1, v2):
+        """common_ancestor(v1: int, v2: int) -> int
+        Returns the deepest version that is an ancestor of both v1 and
+        v2 (each version being an ancestor of itself).
+
+        """
+        depth = self._depth
+        jump = self._jump
+        parent = self._parent
+        v1 = max(v1, 0)
+        v2 = max(v2, 0)
+        if depth[v1] > depth[v2]:
+            v1 = self.ancestor_at_depth(v1, depth[v2])
+        elif depth[v2] > depth[v1]:
+            v2 = self.ancestor_at_depth(v2, depth[v1])
+        # jump pointers only depend on the depth, so they stay in step
+        while v1 != v2:
+            if jump[v1] != jump[v2]:
+                v1 = jump[v1]
+                v2 = jump[v2]
+            else:
+                v1 = parent[v1]
+                v2 = parent[v2]
+        return v1
+
+    def shared_root(self, versions):
+        """shared_root(versions: list of int) -> int
+        Returns the common ancestor of all the versions.
+
+        """
+        versions = iter(versions)
+        root = max(versions.next(), 0)
+        for version in versions:
+            root = self.common_ancestor(root, version)
+        return root
+
+    def distance(self, v1, v2):
+        """distance(v1: int, v2: int) -> int
+        Returns the number of actions on the path from v1 to v2.
+
+        """
+        return self.depth(v1) + self.depth(v2) - \
+            2 * self._depth[self.common_ancestor(v1, v2)]
+
+################################################################################
+
+class TestVersionAncestry(unittest.TestCase):
+    def make_tree(self, n, seed):
+        import random
+        rng = random.Random(seed)
+        parents = {0: 0}
+        ancestry = VersionAncestry()
+        for version in xrange(1, n):
+            # mostly long chains, with some branching
+            if rng.random() < 0.8:
+                parent = version - 1
+            else:
+                parent = rng.randrange(version)
+            parents[version] = parent
+            ancestry.add_version(version, parent)
+        return parents, ancestry
+
+    def path(self, parents, version):
+        path = [version]
+        while version != 0:
+            version = parents[version]
+            path.append(version)
+        return path
+
+    def test_queries(self):
+        import random
+        parents, ancestry = self.make_tree(2000, 42)
+        rng = random.Random(1)
+        for i in xrange(300):
+            v1 = rng.randrange(2000)
+            v2 = rng.randrange(2000)
+            path1 = self.path(parents, v1)
+            path2 = self.path(parents, v2)
+            common = [v for v in path1 if v in set(path2)][0]
+            self.assertEqual(ancestry.common_ancestor(v1, v2), common)
+            self.assertEqual(ancestry.depth(v1), len(path1) - 1)
+            self.assertEqual(ancestry.distance(v1, v2),
+                             path1.index(common) + path2.index(common))
+            self.assertEqual(ancestry.is_ancestor(v1, v2), v1 in path2)
+            self.assertEqual(ancestry.is_ancestor(common, v1), True)
+        self.assertEqual(ancestry.shared_root([-1, 5]), 0)
+
+    def test_vistrail(self):
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.system import vistrails_root_directory
+        import os
+        v = XMLFileLocator(os.path.join(vistrails_root_directory(), 'tests',
+                                        'resources', 'dummy.xml')).load()
+        ancestry = VersionAncestry(v)
+        self.assertEqual(len(ancestry), len(v.actions) + 1)
+        for action in v.actions:
+            self.assertEqual(ancestry.parent(action.id), action.prevId)
@@ -0,0 +1,408 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+"""Inverted index of the contents of the versions of a vistrail.
+
+Answering a question such as "which versions use a PythonSource module"
+by materializing the workflow of every version is very slow on large
+vistrails. :class:`VersionIndex` walks the version tree once instead,
+replaying the operations of each action as it goes down and undoing them
+as it comes back up, and records for module names, packages, parameter
+values and module annotation keys the ranges of versions where they are
+present.
+
+"""
+
+from vistrails.db.services.action_chain import getActionChain, \
+    getCurrentOperationDict
+
+from bisect import bisect_right
+import unittest
+
+MODULE_TYPES = ('module', 'group', 'abstraction')
+
+def operation_keys(operation):
+    """operation_keys(operation: DBAdd or DBChange) -> list of tuples
+    Returns the (kind, value) index keys of the object added by operation.
+
+    """
+    what = operation.db_what
+    data = operation.db_data
+    if what in MODULE_TYPES:
+        return [('module', data.db_name), ('package', data.db_package)]
+    elif what == 'parameter':
+        return [('parameter', data.db_val)]
+    elif what == 'annotation' and operation.db_parentObjType in MODULE_TYPES:
+        return [('annotation', data.db_key)]
+    return []
+
+class VersionIndex(object):
+    """VersionIndex(vistrail: DBVistrail)
+
+    Maps (kind, value) keys, where kind is one of 'module', 'package',
+    'parameter' or 'annotation', to the versions whose workflow contains
+    them. The versions are numbered in the depth-first order of the
+    version tree and the versions of a key are stored as ranges of
+    positions, so that the index stays small.
+
+    Versions added to the vistrail after the index was built are indexed
+    by add_version().
+
+    """
+
+    def __init__(self, vistrail):
+        self.vistrail = vistrail
+        self._order = []       # positions -> versions
+        self._position = {}    # versions -> positions
+        self._ranges = {}      # kind -> value -> [[start, end], ...]
+        self._objects = {}     # (what, id) -> keys
+        self._counts = {}      # key -> number of objects with that key
+        self._state_version = None
+        self.build()
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, version):
+        return version in self._position
+
+    def build(self):
+        """build() -> None
+        Indexes all the versions of the vistrail.
+
+        """
+        children = {}
+        for action in self.vistrail.db_actions:
+            children.setdefault(action.db_prevId, []).append(action.db_id)
+        self._order = []
+        self._position = {}
+        self._ranges = {}
+        self._objects = {}
+        self._counts = {}
+        self._open = {}
+        operations = self._iter_operations(self._preorder(children)[1:])
+        stack = [(0, None)]
+        while stack:
+            version, undo = stack.pop()
+            pos = len(self._order)
+            if undo is not None:
+                # leaving the subtree of a version
+                for what_id, keys in reversed(undo):
+                    if keys is None:
+                        self._remove(what_id, pos)
+                    else:
+                        self._add(what_id, keys, pos)
+                continue
+            self._order.append(version)
+            self._position[version] = pos
+            undo = []
+            if version != 0:
+                self._perform(next(operations), pos, undo)
+            stack.append((version, undo))
+            stack.extend((child, None)
+                         for child in sorted(children.get(version, []),
+                                             reverse=True))
+        # close the ranges of the keys present in the last version
+        end = len(self._order)
+        for key, start in self._open.iteritems():
+            self._ranges.setdefault(key[0], {}).setdefault(
+                key[1], []).append([start, end])
+        self._open = None
+        self._state_version = self._order[-1]
+
+    def add_version(self, action):
+        """add_version(action: DBAction) -> None
+        Indexes a new version, whose parent has to be indexed already.
+
+        """
+        if action.db_id in self._position:
+            return
+        if action.db_prevId != self._state_version:
+            self._load_state(action.db_prevId)
+        pos = len(self._order)
+        self._order.append(action.db_id)
+        self._position[action.db_id] = pos
+        self._perform(action.db_operations, None, None)
+        self._state_version = action.db_id
+        for key, count in self._counts.iteritems():
+            if count:
+                ranges = self._ranges.setdefault(key[0], {}).setdefault(
+                    key[1], [])
+                if ranges and ranges[-1][1] == pos:
+                    ranges[-1][1] = pos + 1
+                else:
+                    ranges.append([pos, pos + 1])
+
+    def versions(self, kind, value):
+        """versions(kind: str, value: str) -> set of int
+        Returns the versions whose workflow contains the given key.
+
+        """
+        result = set()
+        for start, end in self._ranges.get(kind, {}).get(value, []):
+            result.update(self._order[start:end])
+        return result
+
+    def find_versions(self, kind, predicate):
+        """find_versions(kind: str, predicate: callable) -> set of int
+        Returns the versions whose workflow contains a key of the given
+        kind whose value satisfies predicate.
+
+        """
+        result = set()
+        for value, ranges in self._ranges.get(kind, {}).iteritems():
+            if predicate(value):
+                for start, end in ranges:
+                    result.update(self._order[start:end])
+        return result
+
+    def values(self, kind):
+        """values(kind: str) -> list of str
+        Returns the values of the given kind present in some version.
+
+        """
+        return self._ranges.get(kind, {}).keys()
+
+    def contains(self, version, kind, value):
+        """contains(version: int, kind: str, value: str) -> bool
+        Tells whether the workflow of version contains the given key.
+
+        """
+        pos = self._position[version]
+        ranges = self._ranges.get(kind, {}).get(value, [])
+        i = bisect_right(ranges, [pos, float('inf')]) - 1
+        return i >= 0 and ranges[i][0] <= pos < ranges[i][1]
+
+    @staticmethod
+    def _preorder(children):
+        """_preorder(children: dict) -> list of int
+        Returns the versions in the order build() visits them.
+
+        """
+        order = []
+        stack = [0]
+        while stack:
+            version = stack.pop()
+            order.append(version)
+            stack.extend(sorted(children.get(version, []), reverse=True))
+        return order
+
+    def _iter_operations(self, versions):
+        """_iter_operations(versions: list of int) -> iterator
+        Yields the operations of each of the versions, in order.
+
+        The operations of a vistrail read lazily from the database are
+        read in batches of the size of its action cache, but without
+        going through it, so that indexing doesn't evict the actions in
+        use and reads each action once.
+
+        """
+        loader = getattr(self.vistrail, 'db_action_loader', None)
+        if loader is None:
+            for version in versions:
+                yield self.vistrail.db_get_action_by_id(version).db_operations
+            return
+        batch_size = max(1, loader.max_actions)
+        for i in xrange(0, len(versions), batch_size):
+            actions = [self.vistrail.db_get_action_by_id(version)
+                       for version in versions[i:i + batch_size]]
+            fetched = loader.read_operations(actions)
+            for action in actions:
+                operations = fetched.get(action.db_id)
+                if operations is None:
+                    operations = action.db_operations
+                yield operations
+
+    def _perform(self, operations, pos, undo):
+        for op in operations:
+            if op.vtType == 'add':
+                what_id = (op.db_what, op.db_objectId)
+                self._add(what_id, operation_keys(op), pos)
+                if undo is not None:
+                    undo.append((what_id, None))
+            elif op.vtType == 'delete':
+                what_id = (op.db_what, op.db_objectId)
+                keys = self._remove(what_id, pos)
+                if undo is not None and keys is not None:
+                    undo.append((what_id, keys))
+            elif op.vtType == 'change':
+                what_id = (op.db_what, op.db_oldObjId)
+                keys = self._remove(what_id, pos)
+                if undo is not None and keys is not None:
+                    undo.append((what_id, keys))
+                what_id = (op.db_what, op.db_newObjId)
+                self._add(what_id, operation_keys(op), pos)
+                if undo is not None:
+                    undo.append((what_id, None))
+
+    def _add(self, what_id, keys, pos):
+        self._objects[what_id] = keys
+        for key in keys:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+            if count == 0 and pos is not None:
+                ranges = self._ranges.get(key[0], {}).get(key[1])
+                if ranges and ranges[-1][1] == pos:
+                    # present again right after the end of its last range
+                    self._open[key] = ranges.pop()[0]
+                else:
+                    self._open[key] = pos
+
+    def _remove(self, what_id, pos):
+        keys = self._objects.pop(what_id, None)
+        if keys is None:
+            return None
+        for key in keys:
+            count = self._counts[key] - 1
+            if count:
+                self._counts[key] = count
+            else:
+                del self._counts[key]
+                if pos is not None:
+                    start = self._open.pop(key)
+                    if start < pos:
+                        self._ranges.setdefault(key[0], {}).setdefault(
+                            key[1], []).append([start, pos])
+        return keys
+
+    def _load_state(self, version):
+        """_load_state(version: int) -> None
+        Sets the current objects to those of the workflow of version.
+
+        """
+        if version == 0:
+            operations = []
+        else:
+            checkpoints = getattr(self.vistrail, 'db_checkpoints', None)
+            if checkpoints is not None:
+                operations = checkpoints.get_operations(self.vistrail,
+                                                        version)
+            else:
+                operations = getCurrentOperationDict(
+                    getActionChain(self.vistrail, version)).values()
+        self._objects = {}
+        self._counts = {}
+        for op in operations:
+            self._add((op.db_what, op.db_newObjId if op.vtType == 'change'
+                                   else op.db_objectId),
+                      operation_keys(op), None)
+        self._state_version = version
+
+################################################################################
+
+class TestVersionIndex(unittest.TestCase):
+    def load(self):
+        from vistrails.core.db.locator import XMLFileLocator
+        from vistrails.core.system import vistrails_root_directory
+        import os
+        return XMLFileLocator(os.path.join(vistrails_root_directory(),
+                                           'tests', 'resources',
+                                           'dummy.xml')).load()
+
+    def test_index(self):
+        v = self.load()
+        index = VersionIndex(v)
+        self.assertEqual(len(index), len(v.actions) + 1)
+        for name in index.values('module'):
+            expected = set(version for version in v.actionMap
+                           if any(m.name == name for m in
+                                  v.getPipeline(version).modules.itervalues()))
+            self.assertEqual(index.versions('module', name) - set([0]),
+                             expected)
+            for version in v.actionMap:
+                self.assertEqual(index.contains(version, 'module', name),
+                                 version in expected)
+        self.assertEqual(index.versions('module', 'NoSuchModule'), set())
+
+    def test_add_version(self):
+        from vistrails.core.vistrail.vistrail import Vistrail
+        import copy
+        v = self.load()
+        incremental = Vistrail()
+        incremental.get_version_index()
+        for version in sorted(v.actionMap):
+            incremental.addVersion(copy.copy(v.actionMap[version]))
+        index = VersionIndex(v)
+        for kind in ('module', 'package', 'parameter', 'annotation'):
+            self.assertEqual(
+                sorted(incremental.get_version_index().values(kind)),
+                sorted(index.values(kind)))
+            for value in index.values(kind):
+                self.assertEqual(
+                    incremental.get_version_index().versions(kind, value),
+                    index.versions(kind, value))
+
+    def test_lazy_vistrail(self):
+        """Indexing a lazily read vistrail doesn't go through its cache."""
+        from vistrails.db.services.io import DBActionLoader
+        v = self.load()
+        expected = VersionIndex(v)
+
+        class Connection(object):
+            def ping(self):
+                pass
+        class FakeDAOList(object):
+            def __init__(self, operations):
+                self.operations = operations
+                self.calls = []
+            def open_operations_from_db(self, db_connection, entity_id,
+                                        entity_type, action_ids):
+                self.calls.append(sorted(action_ids))
+                return dict((i, self.operations[i]) for i in action_ids)
+
+        operations = dict((action.db_id, list(action.db_operations))
+                          for action in v.db_actions)
+        loader = DBActionLoader(Connection(), v, 3)
+        loader.dao_list = FakeDAOList(operations)
+        for action in v.db_actions:
+            loader.set_pending(action)
+        v.db_action_loader = loader
+        try:
+            index = VersionIndex(v)
+        finally:
+            v.db_action_loader = None
+        # each action was read once, a batch at a time
+        calls = loader.dao_list.calls
+        self.assertEqual(len(calls), -(-len(operations) // 3))
+        self.assertEqual(sorted(i for ids in calls for i in ids),
+                         sorted(operations))
+        self.assertTrue(all(action.db_operations_pending()
+                            for action in v.db_actions))
+        self.assertEqual(loader.loaded, {})
+        for kind in ('module', 'package', 'parameter', 'annotation'):
+            self.assertEqual(sorted(index.values(kind)),
+                             sorted(expected.values(kind)))
+            for value in expected.values(kind):
+                self.assertEqual(index.versions(kind, value),
+                                 expected.versions(kind, value))
@@ -73,8 +73,14 @@ def materializeWorkflow(vistrail, version):
         workflow = DBWorkflow()
         #for action in getActionChain(vistrail, version):
         #    oldPerformAction(action, workflow)
-        performActions(getActionChain(vistrail, version), 
-                            workflow)
+        checkpoints = getattr(vistrail, 'db_checkpoints', None)
+        if checkpoints is not None:
+            # start from the closest checkpointed ancestor
+            performAdds(checkpoints.get_operations(vistrail, version),
+                        workflow)
+        else:
+            performActions(getActionChain(vistrail, version), 
+                           workflow)
         workflow.db_id = version
         workflow.db_vistrailId = vistrail.db_id
         return workflow
@@ -711,6 +717,9 @@ def fixActions(vistrail, v, actions):
 # Diff methods
 
 def getSharedRoot(vistrail, versions):
+    ancestry = getattr(vistrail, 'ancestry', None)
+    if ancestry is not None:
+        return ancestry.shared_root(versions)
     # base case is 0
     current = copy.copy(versions)
     while 0 not in current:
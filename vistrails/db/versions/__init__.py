@@ -58,7 +58,21 @@ def getVersionDAO(version=None):
         raise VistrailsDBException(debug.format_exc())
     return persistence.DAOList()
 
-def translate_object(obj, method_name, version=None, target_version=None):
+def translate_object(obj, method_name, version=None, target_version=None,
+                     fuse=True):
+    """translate_object(obj, method_name: str, version: str,
+                        target_version: str, fuse: bool) -> obj
+    Translates obj from one schema version to another, one version at a
+    time.
+
+    When translating forward and fuse is True, versions whose translation
+    module lists method_name in `structural_translations` are skipped
+    unless they are the last step: these translations only copy the
+    objects into the new schema, so the next translation can read the
+    older objects directly and the intermediate object graph is never
+    built.
+
+    """
     if version is None:
         version = obj.version
     if target_version is None:
@@ -130,6 +144,12 @@ def translate_object(obj, method_name, version=None, target_version=None):
             raise VistrailsDBException("Cannot translate version: "
                                        "version %s missing method '%s'" % \
                                            (version, method_name))
+        if (fuse and map is version_map and next_version != target_version and
+                method_name in getattr(translate_module,
+                                       'structural_translations', ())):
+            version = next_version
+            count += 1
+            continue
         obj = getattr(translate_module, method_name)(obj)
         version = next_version
         count += 1
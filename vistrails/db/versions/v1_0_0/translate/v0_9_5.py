@@ -36,6 +36,11 @@ import copy
 from vistrails.db.versions.v1_0_0.domain import DBVistrail, DBWorkflow, DBLog, \
     DBRegistry, DBModuleExec, DBGroupExec, DBLoopExec, DBGroup
 
+# these only copy objects into the new schema (see translate_object)
+structural_translations = ['translateVistrail',
+                           'translateWorkflow',
+                           'translateRegistry']
+
 def translateVistrail(_vistrail):
     def update_workflow(old_obj, translate_dict):
         return DBWorkflow.update_version(old_obj.db_workflow, translate_dict)
@@ -36,6 +36,11 @@ import copy
 from vistrails.db.versions.v1_0_2.domain import DBVistrail, DBWorkflow, DBLog, \
     DBRegistry, DBGroup, DBActionAnnotation, DBAnnotation, DBAction, IdScope
 
+# these only copy objects into the new schema (see translate_object)
+structural_translations = ['translateWorkflow',
+                           'translateLog',
+                           'translateRegistry']
+
 def translateVistrail(_vistrail):
     tag_annotations = []
     notes_annotations = []
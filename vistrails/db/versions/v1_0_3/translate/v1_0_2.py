@@ -50,6 +50,9 @@ from ast import literal_eval
 import unittest
 from xml.dom.minidom import parseString
 
+# these only copy objects into the new schema (see translate_object)
+structural_translations = ['translateLog']
+
 id_scope = None
 
 def update_portSpec(old_obj, translate_dict):
@@ -59,8 +62,12 @@ def update_portSpec(old_obj, translate_dict):
     if sigstring and sigstring != '()':
         for sig in sigstring[1:-1].split(','):
             sigs.append(sig.split(':', 2))
+    # port specs from before 1.0.1 have no defaults or labels and can be
+    # read here directly (translate_object skips structural translations)
+    old_defaults = getattr(old_obj, 'db_defaults', None)
+    old_labels = getattr(old_obj, 'db_labels', None)
     # not great to use eval...
-    defaults = literal_eval(old_obj.db_defaults) if old_obj.db_defaults else []
+    defaults = literal_eval(old_defaults) if old_defaults else []
     if isinstance(defaults, basestring):
         defaults = (defaults,)
     else:
@@ -69,7 +76,7 @@ def update_portSpec(old_obj, translate_dict):
         except TypeError:
             defaults = (defaults,)
     # not great to use eval...
-    labels = literal_eval(old_obj.db_labels) if old_obj.db_labels else []
+    labels = literal_eval(old_labels) if old_labels else []
     if isinstance(labels, basestring):
         labels = (labels,)
     else:
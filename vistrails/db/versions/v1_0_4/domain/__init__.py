@@ -34,6 +34,7 @@
 ###############################################################################
 
 from auto_gen import *
+from action import DBAction, DBLazyOperationList
 from registry import DBRegistry
 from workflow import DBWorkflow
 from vistrail import DBVistrail
@@ -0,0 +1,144 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+from auto_gen import DBAction as _DBAction
+
+class DBLazyOperationList(list):
+    """DBLazyOperationList(action: DBAction, loader)
+
+    Operations of an action read from the database whose contents have
+    not been fetched yet. The first time the list is used, it calls
+    loader.load(action), which fills it through fill(); until then it is
+    empty. convert, if set, is applied to each operation as it arrives.
+
+    """
+
+    def __init__(self, action, loader):
+        list.__init__(self)
+        self.action = action
+        self.loader = loader
+        self.convert = None
+
+    def is_pending(self):
+        return self.loader is not None
+
+    def fill(self, operations):
+        """fill(operations: list) -> None
+        Stores the fetched operations of the action.
+
+        """
+        self.loader = None
+        operations = sorted(operations, key=lambda x: x.db_id)
+        if self.convert is not None:
+            for operation in operations:
+                self.convert(operation)
+        list.extend(self, operations)
+        self.action._db_operations_id_index = \
+            dict((op.db_id, op) for op in operations)
+
+    def _materialize(self):
+        if self.loader is not None:
+            self.loader.load(self.action)
+
+def _materializing(name):
+    method = getattr(list, name)
+    def wrapper(self, *args, **kwargs):
+        self._materialize()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = name
+    return wrapper
+
+for _name in ['__add__', '__contains__', '__delitem__', '__delslice__',
+              '__eq__', '__ge__', '__getitem__', '__getslice__', '__gt__',
+              '__iadd__', '__imul__', '__iter__', '__le__', '__len__',
+              '__lt__', '__mul__', '__ne__', '__repr__', '__reversed__',
+              '__rmul__', '__setitem__', '__setslice__', 'append', 'count',
+              'extend', 'index', 'insert', 'pop', 'remove', 'reverse',
+              'sort']:
+    setattr(DBLazyOperationList, _name, _materializing(_name))
+del _name
+
+class DBAction(_DBAction):
+    __slots__ = ()
+
+    def __copy__(self):
+        return DBAction.do_copy(self)
+
+    def do_copy(self, new_ids=False, id_scope=None, id_remap=None):
+        operations = self._db_operations
+        if new_ids or not self.db_operations_pending():
+            cp = _DBAction.do_copy(self, new_ids, id_scope, id_remap)
+        else:
+            # the copy fetches the same operations when it needs them
+            self._db_operations = []
+            try:
+                cp = _DBAction.do_copy(self, new_ids, id_scope, id_remap)
+            finally:
+                self._db_operations = operations
+            cp._db_operations = DBLazyOperationList(cp, operations.loader)
+            cp._db_operations.convert = operations.convert
+        cp.__class__ = DBAction
+        return cp
+
+    def db_operations_pending(self):
+        """db_operations_pending() -> bool
+        Returns True if the operations of the action are still in the
+        database.
+
+        """
+        operations = self._db_operations
+        return isinstance(operations, DBLazyOperationList) and \
+            operations.is_pending()
+
+    def db_children(self, parent=(None,None), orphan=False, for_action=False):
+        if orphan or not self.db_operations_pending():
+            return _DBAction.db_children(self, parent, orphan, for_action)
+        # operations that were not fetched are unchanged in the database
+        children = []
+        for child in self.db_annotations:
+            children.extend(child.db_children((self.vtType, self.db_id),
+                                              orphan, for_action))
+        children.append((self, parent[0], parent[1]))
+        return children
+
+    def has_changes(self):
+        if self.db_operations_pending():
+            # operations that were not fetched cannot have changed
+            if self.is_dirty:
+                return True
+            for child in self._db_annotations:
+                if child.has_changes():
+                    return True
+            return False
+        return _DBAction.has_changes(self)
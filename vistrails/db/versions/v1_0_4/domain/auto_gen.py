@@ -37,23 +37,34 @@
 
 import copy
 
+def _intern(value):
+    if type(value) is str:
+        return intern(value)
+    return value
+
 class DBOpmWasGeneratedBy(object):
 
     vtType = 'opm_was_generated_by'
 
+    __slots__ = ('_db_deleted_effect', '_db_effect', '_db_deleted_role',
+                 '_db_role', '_db_deleted_cause', '_db_cause',
+                 '_db_deleted_accounts', '_db_accounts',
+                 '_db_deleted_opm_times', '_db_opm_times', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
+        self._db_deleted_effect = None
         self._db_effect = effect
-        self.db_deleted_role = []
+        self._db_deleted_role = None
         self._db_role = role
-        self.db_deleted_cause = []
+        self._db_deleted_cause = None
         self._db_cause = cause
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
+        self._db_deleted_opm_times = None
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -191,17 +202,22 @@ class DBOpmWasGeneratedBy(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        if self._db_deleted_effect is not None:
+            children.extend(self._db_deleted_effect)
+        if self._db_deleted_role is not None:
+            children.extend(self._db_deleted_role)
+        if self._db_deleted_cause is not None:
+            children.extend(self._db_deleted_cause)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_opm_times is not None:
+            children.extend(self._db_deleted_opm_times)
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            self._db_deleted_effect = None
+            self._db_deleted_role = None
+            self._db_deleted_cause = None
+            self._db_deleted_accounts = None
+            self._db_deleted_opm_times = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -233,6 +249,13 @@ class DBOpmWasGeneratedBy(object):
         if not self.is_new:
             self.db_deleted_effect.append(self._db_effect)
         self._db_effect = None
+    def __get_db_deleted_effect(self):
+        if self._db_deleted_effect is None:
+            self._db_deleted_effect = []
+        return self._db_deleted_effect
+    def __set_db_deleted_effect(self, deleted):
+        self._db_deleted_effect = deleted
+    db_deleted_effect = property(__get_db_deleted_effect, __set_db_deleted_effect)
     
     def __get_db_role(self):
         return self._db_role
@@ -248,6 +271,13 @@ class DBOpmWasGeneratedBy(object):
         if not self.is_new:
             self.db_deleted_role.append(self._db_role)
         self._db_role = None
+    def __get_db_deleted_role(self):
+        if self._db_deleted_role is None:
+            self._db_deleted_role = []
+        return self._db_deleted_role
+    def __set_db_deleted_role(self, deleted):
+        self._db_deleted_role = deleted
+    db_deleted_role = property(__get_db_deleted_role, __set_db_deleted_role)
     
     def __get_db_cause(self):
         return self._db_cause
@@ -263,6 +293,13 @@ class DBOpmWasGeneratedBy(object):
         if not self.is_new:
             self.db_deleted_cause.append(self._db_cause)
         self._db_cause = None
+    def __get_db_deleted_cause(self):
+        if self._db_deleted_cause is None:
+            self._db_deleted_cause = []
+        return self._db_deleted_cause
+    def __set_db_deleted_cause(self, deleted):
+        self._db_deleted_cause = deleted
+    db_deleted_cause = property(__get_db_deleted_cause, __set_db_deleted_cause)
     
     def __get_db_accounts(self):
         return self._db_accounts
@@ -283,6 +320,13 @@ class DBOpmWasGeneratedBy(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_account(self, key):
         return None
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     
     def __get_db_opm_times(self):
         return self._db_opm_times
@@ -303,6 +347,13 @@ class DBOpmWasGeneratedBy(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_opm_time(self, key):
         return None
+    def __get_db_deleted_opm_times(self):
+        if self._db_deleted_opm_times is None:
+            self._db_deleted_opm_times = []
+        return self._db_deleted_opm_times
+    def __set_db_deleted_opm_times(self, deleted):
+        self._db_deleted_opm_times = deleted
+    db_deleted_opm_times = property(__get_db_deleted_opm_times, __set_db_deleted_opm_times)
     
 
 
@@ -310,8 +361,11 @@ class DBConfigKey(object):
 
     vtType = 'config_key'
 
+    __slots__ = ('_db_deleted_value', '_db_value', '_db_name', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, value=None, name=None):
-        self.db_deleted_value = []
+        self._db_deleted_value = None
         self._db_value = value
         self._db_name = name
         self.is_dirty = True
@@ -398,9 +452,10 @@ class DBConfigKey(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
+        if self._db_deleted_value is not None:
+            children.extend(self._db_deleted_value)
         if remove:
-            self.db_deleted_value = []
+            self._db_deleted_value = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -422,6 +477,13 @@ class DBConfigKey(object):
         if not self.is_new:
             self.db_deleted_value.append(self._db_value)
         self._db_value = None
+    def __get_db_deleted_value(self):
+        if self._db_deleted_value is None:
+            self._db_deleted_value = []
+        return self._db_deleted_value
+    def __set_db_deleted_value(self, deleted):
+        self._db_deleted_value = deleted
+    db_deleted_value = property(__get_db_deleted_value, __set_db_deleted_value)
     
     def __get_db_name(self):
         return self._db_name
@@ -443,10 +505,14 @@ class DBMashupAlias(object):
 
     vtType = 'mashup_alias'
 
+    __slots__ = ('_db_id', '_db_name', '_db_deleted_component',
+                 '_db_component', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, name=None, component=None):
         self._db_id = id
-        self._db_name = name
-        self.db_deleted_component = []
+        self._db_name = _intern(name)
+        self._db_deleted_component = None
         self._db_component = component
         self.is_dirty = True
         self.is_new = True
@@ -516,9 +582,10 @@ class DBMashupAlias(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_component)
+        if self._db_deleted_component is not None:
+            children.extend(self._db_deleted_component)
         if remove:
-            self.db_deleted_component = []
+            self._db_deleted_component = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -542,13 +609,13 @@ class DBMashupAlias(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -566,6 +633,13 @@ class DBMashupAlias(object):
         if not self.is_new:
             self.db_deleted_component.append(self._db_component)
         self._db_component = None
+    def __get_db_deleted_component(self):
+        if self._db_deleted_component is None:
+            self._db_deleted_component = []
+        return self._db_deleted_component
+    def __set_db_deleted_component(self, deleted):
+        self._db_deleted_component = deleted
+    db_deleted_component = property(__get_db_deleted_component, __set_db_deleted_component)
     
     def getPrimaryKey(self):
         return self._db_id
@@ -574,28 +648,39 @@ class DBGroup(object):
 
     vtType = 'group'
 
+    __slots__ = ('_db_id', '_db_deleted_workflow', '_db_workflow', '_db_cache',
+                 '_db_name', '_db_namespace', '_db_package', '_db_version',
+                 '_db_deleted_location', '_db_location',
+                 '_db_deleted_functions', '_db_functions_id_index',
+                 '_db_functions', '_db_deleted_annotations',
+                 '_db_annotations_id_index', '_db_annotations_key_index',
+                 '_db_annotations', '_db_deleted_controlParameters',
+                 '_db_controlParameters_id_index',
+                 '_db_controlParameters_name_index', '_db_controlParameters',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, workflow=None, cache=None, name=None, namespace=None, package=None, version=None, location=None, functions=None, annotations=None, controlParameters=None):
         self._db_id = id
-        self.db_deleted_workflow = []
+        self._db_deleted_workflow = None
         self._db_workflow = workflow
         self._db_cache = cache
-        self._db_name = name
-        self._db_namespace = namespace
-        self._db_package = package
-        self._db_version = version
-        self.db_deleted_location = []
+        self._db_name = _intern(name)
+        self._db_namespace = _intern(namespace)
+        self._db_package = _intern(package)
+        self._db_version = _intern(version)
+        self._db_deleted_location = None
         self._db_location = location
-        self.db_deleted_functions = []
-        self.db_functions_id_index = {}
+        self._db_deleted_functions = None
+        self._db_functions_id_index = None
         if functions is None:
             self._db_functions = []
         else:
             self._db_functions = functions
             for v in self._db_functions:
                 self.db_functions_id_index[v.db_id] = v
-        self.db_deleted_annotations = []
-        self.db_annotations_id_index = {}
-        self.db_annotations_key_index = {}
+        self._db_deleted_annotations = None
+        self._db_annotations_id_index = None
+        self._db_annotations_key_index = None
         if annotations is None:
             self._db_annotations = []
         else:
@@ -603,9 +688,9 @@ class DBGroup(object):
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
                 self.db_annotations_key_index[v.db_key] = v
-        self.db_deleted_controlParameters = []
-        self.db_controlParameters_id_index = {}
-        self.db_controlParameters_name_index = {}
+        self._db_deleted_controlParameters = None
+        self._db_controlParameters_id_index = None
+        self._db_controlParameters_name_index = None
         if controlParameters is None:
             self._db_controlParameters = []
         else:
@@ -653,11 +738,14 @@ class DBGroup(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_functions_id_index = dict((v.db_id, v) for v in cp._db_functions)
-        cp.db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
-        cp.db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
-        cp.db_controlParameters_id_index = dict((v.db_id, v) for v in cp._db_controlParameters)
-        cp.db_controlParameters_name_index = dict((v.db_name, v) for v in cp._db_controlParameters)
+        if cp._db_functions:
+            cp._db_functions_id_index = dict((v.db_id, v) for v in cp._db_functions)
+        if cp._db_annotations:
+            cp._db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
+            cp._db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
+        if cp._db_controlParameters:
+            cp._db_controlParameters_id_index = dict((v.db_id, v) for v in cp._db_controlParameters)
+            cp._db_controlParameters_name_index = dict((v.db_name, v) for v in cp._db_controlParameters)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -788,17 +876,22 @@ class DBGroup(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_workflow)
-        children.extend(self.db_deleted_location)
-        children.extend(self.db_deleted_functions)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_controlParameters)
+        if self._db_deleted_workflow is not None:
+            children.extend(self._db_deleted_workflow)
+        if self._db_deleted_location is not None:
+            children.extend(self._db_deleted_location)
+        if self._db_deleted_functions is not None:
+            children.extend(self._db_deleted_functions)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_controlParameters is not None:
+            children.extend(self._db_deleted_controlParameters)
         if remove:
-            self.db_deleted_workflow = []
-            self.db_deleted_location = []
-            self.db_deleted_functions = []
-            self.db_deleted_annotations = []
-            self.db_deleted_controlParameters = []
+            self._db_deleted_workflow = None
+            self._db_deleted_location = None
+            self._db_deleted_functions = None
+            self._db_deleted_annotations = None
+            self._db_deleted_controlParameters = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -844,6 +937,13 @@ class DBGroup(object):
         if not self.is_new:
             self.db_deleted_workflow.append(self._db_workflow)
         self._db_workflow = None
+    def __get_db_deleted_workflow(self):
+        if self._db_deleted_workflow is None:
+            self._db_deleted_workflow = []
+        return self._db_deleted_workflow
+    def __set_db_deleted_workflow(self, deleted):
+        self._db_deleted_workflow = deleted
+    db_deleted_workflow = property(__get_db_deleted_workflow, __set_db_deleted_workflow)
     
     def __get_db_cache(self):
         return self._db_cache
@@ -861,52 +961,52 @@ class DBGroup(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
     def __get_db_namespace(self):
         return self._db_namespace
     def __set_db_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
         self.is_dirty = True
     db_namespace = property(__get_db_namespace, __set_db_namespace)
     def db_add_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_change_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_delete_namespace(self, namespace):
         self._db_namespace = None
     
     def __get_db_package(self):
         return self._db_package
     def __set_db_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
         self.is_dirty = True
     db_package = property(__get_db_package, __set_db_package)
     def db_add_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_change_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_delete_package(self, package):
         self._db_package = None
     
     def __get_db_version(self):
         return self._db_version
     def __set_db_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
         self.is_dirty = True
     db_version = property(__get_db_version, __set_db_version)
     def db_add_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_change_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_delete_version(self, version):
         self._db_version = None
     
@@ -924,6 +1024,13 @@ class DBGroup(object):
         if not self.is_new:
             self.db_deleted_location.append(self._db_location)
         self._db_location = None
+    def __get_db_deleted_location(self):
+        if self._db_deleted_location is None:
+            self._db_deleted_location = []
+        return self._db_deleted_location
+    def __set_db_deleted_location(self, deleted):
+        self._db_deleted_location = deleted
+    db_deleted_location = property(__get_db_deleted_location, __set_db_deleted_location)
     
     def __get_db_functions(self):
         return self._db_functions
@@ -962,10 +1069,24 @@ class DBGroup(object):
             if self._db_functions[i].db_id == key:
                 return self._db_functions[i]
         return None
+    def __get_db_deleted_functions(self):
+        if self._db_deleted_functions is None:
+            self._db_deleted_functions = []
+        return self._db_deleted_functions
+    def __set_db_deleted_functions(self, deleted):
+        self._db_deleted_functions = deleted
+    db_deleted_functions = property(__get_db_deleted_functions, __set_db_deleted_functions)
+    def __get_db_functions_id_index(self):
+        if self._db_functions_id_index is None:
+            self._db_functions_id_index = {}
+        return self._db_functions_id_index
+    def __set_db_functions_id_index(self, index):
+        self._db_functions_id_index = index
+    db_functions_id_index = property(__get_db_functions_id_index, __set_db_functions_id_index)
     def db_get_function_by_id(self, key):
         return self.db_functions_id_index[key]
     def db_has_function_with_id(self, key):
-        return key in self.db_functions_id_index
+        return self._db_functions_id_index is not None and key in self._db_functions_id_index
     
     def __get_db_annotations(self):
         return self._db_annotations
@@ -1007,14 +1128,35 @@ class DBGroup(object):
             if self._db_annotations[i].db_id == key:
                 return self._db_annotations[i]
         return None
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
+    def __get_db_annotations_id_index(self):
+        if self._db_annotations_id_index is None:
+            self._db_annotations_id_index = {}
+        return self._db_annotations_id_index
+    def __set_db_annotations_id_index(self, index):
+        self._db_annotations_id_index = index
+    db_annotations_id_index = property(__get_db_annotations_id_index, __set_db_annotations_id_index)
+    def __get_db_annotations_key_index(self):
+        if self._db_annotations_key_index is None:
+            self._db_annotations_key_index = {}
+        return self._db_annotations_key_index
+    def __set_db_annotations_key_index(self, index):
+        self._db_annotations_key_index = index
+    db_annotations_key_index = property(__get_db_annotations_key_index, __set_db_annotations_key_index)
     def db_get_annotation_by_id(self, key):
         return self.db_annotations_id_index[key]
     def db_has_annotation_with_id(self, key):
-        return key in self.db_annotations_id_index
+        return self._db_annotations_id_index is not None and key in self._db_annotations_id_index
     def db_get_annotation_by_key(self, key):
         return self.db_annotations_key_index[key]
     def db_has_annotation_with_key(self, key):
-        return key in self.db_annotations_key_index
+        return self._db_annotations_key_index is not None and key in self._db_annotations_key_index
     
     def __get_db_controlParameters(self):
         return self._db_controlParameters
@@ -1056,14 +1198,35 @@ class DBGroup(object):
             if self._db_controlParameters[i].db_id == key:
                 return self._db_controlParameters[i]
         return None
+    def __get_db_deleted_controlParameters(self):
+        if self._db_deleted_controlParameters is None:
+            self._db_deleted_controlParameters = []
+        return self._db_deleted_controlParameters
+    def __set_db_deleted_controlParameters(self, deleted):
+        self._db_deleted_controlParameters = deleted
+    db_deleted_controlParameters = property(__get_db_deleted_controlParameters, __set_db_deleted_controlParameters)
+    def __get_db_controlParameters_id_index(self):
+        if self._db_controlParameters_id_index is None:
+            self._db_controlParameters_id_index = {}
+        return self._db_controlParameters_id_index
+    def __set_db_controlParameters_id_index(self, index):
+        self._db_controlParameters_id_index = index
+    db_controlParameters_id_index = property(__get_db_controlParameters_id_index, __set_db_controlParameters_id_index)
+    def __get_db_controlParameters_name_index(self):
+        if self._db_controlParameters_name_index is None:
+            self._db_controlParameters_name_index = {}
+        return self._db_controlParameters_name_index
+    def __set_db_controlParameters_name_index(self, index):
+        self._db_controlParameters_name_index = index
+    db_controlParameters_name_index = property(__get_db_controlParameters_name_index, __set_db_controlParameters_name_index)
     def db_get_controlParameter_by_id(self, key):
         return self.db_controlParameters_id_index[key]
     def db_has_controlParameter_with_id(self, key):
-        return key in self.db_controlParameters_id_index
+        return self._db_controlParameters_id_index is not None and key in self._db_controlParameters_id_index
     def db_get_controlParameter_by_name(self, key):
         return self.db_controlParameters_name_index[key]
     def db_has_controlParameter_with_name(self, key):
-        return key in self.db_controlParameters_name_index
+        return self._db_controlParameters_name_index is not None and key in self._db_controlParameters_name_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -1072,24 +1235,30 @@ class DBOpmWasControlledBy(object):
 
     vtType = 'opm_was_controlled_by'
 
+    __slots__ = ('_db_deleted_effect', '_db_effect', '_db_deleted_role',
+                 '_db_role', '_db_deleted_cause', '_db_cause',
+                 '_db_deleted_accounts', '_db_accounts', '_db_deleted_starts',
+                 '_db_starts', '_db_deleted_ends', '_db_ends', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, starts=None, ends=None):
-        self.db_deleted_effect = []
+        self._db_deleted_effect = None
         self._db_effect = effect
-        self.db_deleted_role = []
+        self._db_deleted_role = None
         self._db_role = role
-        self.db_deleted_cause = []
+        self._db_deleted_cause = None
         self._db_cause = cause
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_starts = []
+        self._db_deleted_starts = None
         if starts is None:
             self._db_starts = []
         else:
             self._db_starts = starts
-        self.db_deleted_ends = []
+        self._db_deleted_ends = None
         if ends is None:
             self._db_ends = []
         else:
@@ -1249,19 +1418,25 @@ class DBOpmWasControlledBy(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_starts)
-        children.extend(self.db_deleted_ends)
+        if self._db_deleted_effect is not None:
+            children.extend(self._db_deleted_effect)
+        if self._db_deleted_role is not None:
+            children.extend(self._db_deleted_role)
+        if self._db_deleted_cause is not None:
+            children.extend(self._db_deleted_cause)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_starts is not None:
+            children.extend(self._db_deleted_starts)
+        if self._db_deleted_ends is not None:
+            children.extend(self._db_deleted_ends)
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_starts = []
-            self.db_deleted_ends = []
+            self._db_deleted_effect = None
+            self._db_deleted_role = None
+            self._db_deleted_cause = None
+            self._db_deleted_accounts = None
+            self._db_deleted_starts = None
+            self._db_deleted_ends = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1296,6 +1471,13 @@ class DBOpmWasControlledBy(object):
         if not self.is_new:
             self.db_deleted_effect.append(self._db_effect)
         self._db_effect = None
+    def __get_db_deleted_effect(self):
+        if self._db_deleted_effect is None:
+            self._db_deleted_effect = []
+        return self._db_deleted_effect
+    def __set_db_deleted_effect(self, deleted):
+        self._db_deleted_effect = deleted
+    db_deleted_effect = property(__get_db_deleted_effect, __set_db_deleted_effect)
     
     def __get_db_role(self):
         return self._db_role
@@ -1311,6 +1493,13 @@ class DBOpmWasControlledBy(object):
         if not self.is_new:
             self.db_deleted_role.append(self._db_role)
         self._db_role = None
+    def __get_db_deleted_role(self):
+        if self._db_deleted_role is None:
+            self._db_deleted_role = []
+        return self._db_deleted_role
+    def __set_db_deleted_role(self, deleted):
+        self._db_deleted_role = deleted
+    db_deleted_role = property(__get_db_deleted_role, __set_db_deleted_role)
     
     def __get_db_cause(self):
         return self._db_cause
@@ -1326,6 +1515,13 @@ class DBOpmWasControlledBy(object):
         if not self.is_new:
             self.db_deleted_cause.append(self._db_cause)
         self._db_cause = None
+    def __get_db_deleted_cause(self):
+        if self._db_deleted_cause is None:
+            self._db_deleted_cause = []
+        return self._db_deleted_cause
+    def __set_db_deleted_cause(self, deleted):
+        self._db_deleted_cause = deleted
+    db_deleted_cause = property(__get_db_deleted_cause, __set_db_deleted_cause)
     
     def __get_db_accounts(self):
         return self._db_accounts
@@ -1346,6 +1542,13 @@ class DBOpmWasControlledBy(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_account(self, key):
         return None
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     
     def __get_db_starts(self):
         return self._db_starts
@@ -1366,6 +1569,13 @@ class DBOpmWasControlledBy(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_start(self, key):
         return None
+    def __get_db_deleted_starts(self):
+        if self._db_deleted_starts is None:
+            self._db_deleted_starts = []
+        return self._db_deleted_starts
+    def __set_db_deleted_starts(self, deleted):
+        self._db_deleted_starts = deleted
+    db_deleted_starts = property(__get_db_deleted_starts, __set_db_deleted_starts)
     
     def __get_db_ends(self):
         return self._db_ends
@@ -1386,6 +1596,13 @@ class DBOpmWasControlledBy(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_end(self, key):
         return None
+    def __get_db_deleted_ends(self):
+        if self._db_deleted_ends is None:
+            self._db_deleted_ends = []
+        return self._db_deleted_ends
+    def __set_db_deleted_ends(self, deleted):
+        self._db_deleted_ends = deleted
+    db_deleted_ends = property(__get_db_deleted_ends, __set_db_deleted_ends)
     
 
 
@@ -1393,14 +1610,18 @@ class DBAdd(object):
 
     vtType = 'add'
 
+    __slots__ = ('_db_deleted_data', '_db_data', '_db_id', '_db_what',
+                 '_db_objectId', '_db_parentObjId', '_db_parentObjType',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, data=None, id=None, what=None, objectId=None, parentObjId=None, parentObjType=None):
-        self.db_deleted_data = []
+        self._db_deleted_data = None
         self._db_data = data
         self._db_id = id
-        self._db_what = what
+        self._db_what = _intern(what)
         self._db_objectId = objectId
         self._db_parentObjId = parentObjId
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
         self.is_dirty = True
         self.is_new = True
     
@@ -1553,9 +1774,10 @@ class DBAdd(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_data)
+        if self._db_deleted_data is not None:
+            children.extend(self._db_deleted_data)
         if remove:
-            self.db_deleted_data = []
+            self._db_deleted_data = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1577,6 +1799,13 @@ class DBAdd(object):
         if not self.is_new:
             self.db_deleted_data.append(self._db_data)
         self._db_data = None
+    def __get_db_deleted_data(self):
+        if self._db_deleted_data is None:
+            self._db_deleted_data = []
+        return self._db_deleted_data
+    def __set_db_deleted_data(self, deleted):
+        self._db_deleted_data = deleted
+    db_deleted_data = property(__get_db_deleted_data, __set_db_deleted_data)
     
     def __get_db_id(self):
         return self._db_id
@@ -1594,13 +1823,13 @@ class DBAdd(object):
     def __get_db_what(self):
         return self._db_what
     def __set_db_what(self, what):
-        self._db_what = what
+        self._db_what = _intern(what)
         self.is_dirty = True
     db_what = property(__get_db_what, __set_db_what)
     def db_add_what(self, what):
-        self._db_what = what
+        self._db_what = _intern(what)
     def db_change_what(self, what):
-        self._db_what = what
+        self._db_what = _intern(what)
     def db_delete_what(self, what):
         self._db_what = None
     
@@ -1633,13 +1862,13 @@ class DBAdd(object):
     def __get_db_parentObjType(self):
         return self._db_parentObjType
     def __set_db_parentObjType(self, parentObjType):
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
         self.is_dirty = True
     db_parentObjType = property(__get_db_parentObjType, __set_db_parentObjType)
     def db_add_parentObjType(self, parentObjType):
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
     def db_change_parentObjType(self, parentObjType):
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
     def db_delete_parentObjType(self, parentObjType):
         self._db_parentObjType = None
     
@@ -1650,10 +1879,15 @@ class DBProvGeneration(object):
 
     vtType = 'prov_generation'
 
+    __slots__ = ('_db_deleted_prov_entity', '_db_prov_entity',
+                 '_db_deleted_prov_activity', '_db_prov_activity',
+                 '_db_prov_role', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, prov_entity=None, prov_activity=None, prov_role=None):
-        self.db_deleted_prov_entity = []
+        self._db_deleted_prov_entity = None
         self._db_prov_entity = prov_entity
-        self.db_deleted_prov_activity = []
+        self._db_deleted_prov_activity = None
         self._db_prov_activity = prov_activity
         self._db_prov_role = prov_role
         self.is_dirty = True
@@ -1734,11 +1968,13 @@ class DBProvGeneration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_entity)
-        children.extend(self.db_deleted_prov_activity)
+        if self._db_deleted_prov_entity is not None:
+            children.extend(self._db_deleted_prov_entity)
+        if self._db_deleted_prov_activity is not None:
+            children.extend(self._db_deleted_prov_activity)
         if remove:
-            self.db_deleted_prov_entity = []
-            self.db_deleted_prov_activity = []
+            self._db_deleted_prov_entity = None
+            self._db_deleted_prov_activity = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1762,6 +1998,13 @@ class DBProvGeneration(object):
         if not self.is_new:
             self.db_deleted_prov_entity.append(self._db_prov_entity)
         self._db_prov_entity = None
+    def __get_db_deleted_prov_entity(self):
+        if self._db_deleted_prov_entity is None:
+            self._db_deleted_prov_entity = []
+        return self._db_deleted_prov_entity
+    def __set_db_deleted_prov_entity(self, deleted):
+        self._db_deleted_prov_entity = deleted
+    db_deleted_prov_entity = property(__get_db_deleted_prov_entity, __set_db_deleted_prov_entity)
     
     def __get_db_prov_activity(self):
         return self._db_prov_activity
@@ -1777,6 +2020,13 @@ class DBProvGeneration(object):
         if not self.is_new:
             self.db_deleted_prov_activity.append(self._db_prov_activity)
         self._db_prov_activity = None
+    def __get_db_deleted_prov_activity(self):
+        if self._db_deleted_prov_activity is None:
+            self._db_deleted_prov_activity = []
+        return self._db_deleted_prov_activity
+    def __set_db_deleted_prov_activity(self, deleted):
+        self._db_deleted_prov_activity = deleted
+    db_deleted_prov_activity = property(__get_db_deleted_prov_activity, __set_db_deleted_prov_activity)
     
     def __get_db_prov_role(self):
         return self._db_prov_role
@@ -1797,19 +2047,25 @@ class DBOpmUsed(object):
 
     vtType = 'opm_used'
 
+    __slots__ = ('_db_deleted_effect', '_db_effect', '_db_deleted_role',
+                 '_db_role', '_db_deleted_cause', '_db_cause',
+                 '_db_deleted_accounts', '_db_accounts',
+                 '_db_deleted_opm_times', '_db_opm_times', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
+        self._db_deleted_effect = None
         self._db_effect = effect
-        self.db_deleted_role = []
+        self._db_deleted_role = None
         self._db_role = role
-        self.db_deleted_cause = []
+        self._db_deleted_cause = None
         self._db_cause = cause
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
+        self._db_deleted_opm_times = None
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -1947,17 +2203,22 @@ class DBOpmUsed(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        if self._db_deleted_effect is not None:
+            children.extend(self._db_deleted_effect)
+        if self._db_deleted_role is not None:
+            children.extend(self._db_deleted_role)
+        if self._db_deleted_cause is not None:
+            children.extend(self._db_deleted_cause)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_opm_times is not None:
+            children.extend(self._db_deleted_opm_times)
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            self._db_deleted_effect = None
+            self._db_deleted_role = None
+            self._db_deleted_cause = None
+            self._db_deleted_accounts = None
+            self._db_deleted_opm_times = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -1989,6 +2250,13 @@ class DBOpmUsed(object):
         if not self.is_new:
             self.db_deleted_effect.append(self._db_effect)
         self._db_effect = None
+    def __get_db_deleted_effect(self):
+        if self._db_deleted_effect is None:
+            self._db_deleted_effect = []
+        return self._db_deleted_effect
+    def __set_db_deleted_effect(self, deleted):
+        self._db_deleted_effect = deleted
+    db_deleted_effect = property(__get_db_deleted_effect, __set_db_deleted_effect)
     
     def __get_db_role(self):
         return self._db_role
@@ -2004,6 +2272,13 @@ class DBOpmUsed(object):
         if not self.is_new:
             self.db_deleted_role.append(self._db_role)
         self._db_role = None
+    def __get_db_deleted_role(self):
+        if self._db_deleted_role is None:
+            self._db_deleted_role = []
+        return self._db_deleted_role
+    def __set_db_deleted_role(self, deleted):
+        self._db_deleted_role = deleted
+    db_deleted_role = property(__get_db_deleted_role, __set_db_deleted_role)
     
     def __get_db_cause(self):
         return self._db_cause
@@ -2019,6 +2294,13 @@ class DBOpmUsed(object):
         if not self.is_new:
             self.db_deleted_cause.append(self._db_cause)
         self._db_cause = None
+    def __get_db_deleted_cause(self):
+        if self._db_deleted_cause is None:
+            self._db_deleted_cause = []
+        return self._db_deleted_cause
+    def __set_db_deleted_cause(self, deleted):
+        self._db_deleted_cause = deleted
+    db_deleted_cause = property(__get_db_deleted_cause, __set_db_deleted_cause)
     
     def __get_db_accounts(self):
         return self._db_accounts
@@ -2039,6 +2321,13 @@ class DBOpmUsed(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_account(self, key):
         return None
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     
     def __get_db_opm_times(self):
         return self._db_opm_times
@@ -2059,6 +2348,13 @@ class DBOpmUsed(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_opm_time(self, key):
         return None
+    def __get_db_deleted_opm_times(self):
+        if self._db_deleted_opm_times is None:
+            self._db_deleted_opm_times = []
+        return self._db_deleted_opm_times
+    def __set_db_deleted_opm_times(self, deleted):
+        self._db_deleted_opm_times = deleted
+    db_deleted_opm_times = property(__get_db_deleted_opm_times, __set_db_deleted_opm_times)
     
 
 
@@ -2066,6 +2362,8 @@ class DBOpmArtifactIdCause(object):
 
     vtType = 'opm_artifact_id_cause'
 
+    __slots__ = ('_db_id', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -2138,6 +2436,9 @@ class DBRefProvEntity(object):
 
     vtType = 'ref_prov_entity'
 
+    __slots__ = ('_db_prov_ref', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -2210,6 +2511,11 @@ class DBVtConnection(object):
 
     vtType = 'vt_connection'
 
+    __slots__ = ('_db_id', '_db_vt_source', '_db_vt_dest',
+                 '_db_vt_source_port', '_db_vt_dest_port',
+                 '_db_vt_source_signature', '_db_vt_dest_signature',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, vt_source=None, vt_dest=None, vt_source_port=None, vt_dest_port=None, vt_source_signature=None, vt_dest_signature=None):
         self._db_id = id
         self._db_vt_source = vt_source
@@ -2401,6 +2707,9 @@ class DBOpmAccount(object):
 
     vtType = 'opm_account'
 
+    __slots__ = ('_db_id', '_db_value', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, value=None):
         self._db_id = id
         self._db_value = value
@@ -2492,9 +2801,17 @@ class DBGroupExec(object):
 
     vtType = 'group_exec'
 
+    __slots__ = ('_db_deleted_item_execs', '_db_item_execs_id_index',
+                 '_db_item_execs', '_db_id', '_db_ts_start', '_db_ts_end',
+                 '_db_cached', '_db_module_id', '_db_group_name',
+                 '_db_group_type', '_db_completed', '_db_error',
+                 '_db_machine_id', '_db_deleted_annotations',
+                 '_db_annotations_id_index', '_db_annotations', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, item_execs=None, id=None, ts_start=None, ts_end=None, cached=None, module_id=None, group_name=None, group_type=None, completed=None, error=None, machine_id=None, annotations=None):
-        self.db_deleted_item_execs = []
-        self.db_item_execs_id_index = {}
+        self._db_deleted_item_execs = None
+        self._db_item_execs_id_index = None
         if item_execs is None:
             self._db_item_execs = []
         else:
@@ -2506,13 +2823,13 @@ class DBGroupExec(object):
         self._db_ts_end = ts_end
         self._db_cached = cached
         self._db_module_id = module_id
-        self._db_group_name = group_name
-        self._db_group_type = group_type
+        self._db_group_name = _intern(group_name)
+        self._db_group_type = _intern(group_type)
         self._db_completed = completed
         self._db_error = error
         self._db_machine_id = machine_id
-        self.db_deleted_annotations = []
-        self.db_annotations_id_index = {}
+        self._db_deleted_annotations = None
+        self._db_annotations_id_index = None
         if annotations is None:
             self._db_annotations = []
         else:
@@ -2559,8 +2876,10 @@ class DBGroupExec(object):
                 cp._db_machine_id = id_remap[('machine', self._db_machine_id)]
         
         # recreate indices and set flags
-        cp.db_item_execs_id_index = dict((v.db_id, v) for v in cp._db_item_execs)
-        cp.db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
+        if cp._db_item_execs:
+            cp._db_item_execs_id_index = dict((v.db_id, v) for v in cp._db_item_execs)
+        if cp._db_annotations:
+            cp._db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -2681,11 +3000,13 @@ class DBGroupExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_item_execs)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_item_execs is not None:
+            children.extend(self._db_deleted_item_execs)
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_item_execs = []
+            self._db_deleted_annotations = None
+            self._db_deleted_item_execs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -2734,10 +3055,24 @@ class DBGroupExec(object):
             if self._db_item_execs[i].db_id == key:
                 return self._db_item_execs[i]
         return None
+    def __get_db_deleted_item_execs(self):
+        if self._db_deleted_item_execs is None:
+            self._db_deleted_item_execs = []
+        return self._db_deleted_item_execs
+    def __set_db_deleted_item_execs(self, deleted):
+        self._db_deleted_item_execs = deleted
+    db_deleted_item_execs = property(__get_db_deleted_item_execs, __set_db_deleted_item_execs)
+    def __get_db_item_execs_id_index(self):
+        if self._db_item_execs_id_index is None:
+            self._db_item_execs_id_index = {}
+        return self._db_item_execs_id_index
+    def __set_db_item_execs_id_index(self, index):
+        self._db_item_execs_id_index = index
+    db_item_execs_id_index = property(__get_db_item_execs_id_index, __set_db_item_execs_id_index)
     def db_get_item_exec_by_id(self, key):
         return self.db_item_execs_id_index[key]
     def db_has_item_exec_with_id(self, key):
-        return key in self.db_item_execs_id_index
+        return self._db_item_execs_id_index is not None and key in self._db_item_execs_id_index
     
     def __get_db_id(self):
         return self._db_id
@@ -2807,26 +3142,26 @@ class DBGroupExec(object):
     def __get_db_group_name(self):
         return self._db_group_name
     def __set_db_group_name(self, group_name):
-        self._db_group_name = group_name
+        self._db_group_name = _intern(group_name)
         self.is_dirty = True
     db_group_name = property(__get_db_group_name, __set_db_group_name)
     def db_add_group_name(self, group_name):
-        self._db_group_name = group_name
+        self._db_group_name = _intern(group_name)
     def db_change_group_name(self, group_name):
-        self._db_group_name = group_name
+        self._db_group_name = _intern(group_name)
     def db_delete_group_name(self, group_name):
         self._db_group_name = None
     
     def __get_db_group_type(self):
         return self._db_group_type
     def __set_db_group_type(self, group_type):
-        self._db_group_type = group_type
+        self._db_group_type = _intern(group_type)
         self.is_dirty = True
     db_group_type = property(__get_db_group_type, __set_db_group_type)
     def db_add_group_type(self, group_type):
-        self._db_group_type = group_type
+        self._db_group_type = _intern(group_type)
     def db_change_group_type(self, group_type):
-        self._db_group_type = group_type
+        self._db_group_type = _intern(group_type)
     def db_delete_group_type(self, group_type):
         self._db_group_type = None
     
@@ -2906,10 +3241,24 @@ class DBGroupExec(object):
             if self._db_annotations[i].db_id == key:
                 return self._db_annotations[i]
         return None
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
+    def __get_db_annotations_id_index(self):
+        if self._db_annotations_id_index is None:
+            self._db_annotations_id_index = {}
+        return self._db_annotations_id_index
+    def __set_db_annotations_id_index(self, index):
+        self._db_annotations_id_index = index
+    db_annotations_id_index = property(__get_db_annotations_id_index, __set_db_annotations_id_index)
     def db_get_annotation_by_id(self, key):
         return self.db_annotations_id_index[key]
     def db_has_annotation_with_id(self, key):
-        return key in self.db_annotations_id_index
+        return self._db_annotations_id_index is not None and key in self._db_annotations_id_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -2918,6 +3267,8 @@ class DBOpmAgentId(object):
 
     vtType = 'opm_agent_id'
 
+    __slots__ = ('_db_id', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -2990,13 +3341,16 @@ class DBParameter(object):
 
     vtType = 'parameter'
 
+    __slots__ = ('_db_id', '_db_pos', '_db_name', '_db_type', '_db_val',
+                 '_db_alias', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, pos=None, name=None, type=None, val=None, alias=None):
         self._db_id = id
         self._db_pos = pos
-        self._db_name = name
-        self._db_type = type
+        self._db_name = _intern(name)
+        self._db_type = _intern(type)
         self._db_val = val
-        self._db_alias = alias
+        self._db_alias = _intern(alias)
         self.is_dirty = True
         self.is_new = True
     
@@ -3105,26 +3459,26 @@ class DBParameter(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
     def __get_db_type(self):
         return self._db_type
     def __set_db_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
         self.is_dirty = True
     db_type = property(__get_db_type, __set_db_type)
     def db_add_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
     def db_change_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
     def db_delete_type(self, type):
         self._db_type = None
     
@@ -3144,13 +3498,13 @@ class DBParameter(object):
     def __get_db_alias(self):
         return self._db_alias
     def __set_db_alias(self, alias):
-        self._db_alias = alias
+        self._db_alias = _intern(alias)
         self.is_dirty = True
     db_alias = property(__get_db_alias, __set_db_alias)
     def db_add_alias(self, alias):
-        self._db_alias = alias
+        self._db_alias = _intern(alias)
     def db_change_alias(self, alias):
-        self._db_alias = alias
+        self._db_alias = _intern(alias)
     def db_delete_alias(self, alias):
         self._db_alias = None
     
@@ -3161,23 +3515,43 @@ class DBVistrail(object):
 
     vtType = 'vistrail'
 
+    __slots__ = ('_db_id', '_db_entity_type', '_db_version', '_db_name',
+                 '_db_last_modified', '_db_deleted_actions',
+                 '_db_actions_id_index', '_db_actions', '_db_deleted_tags',
+                 '_db_tags_id_index', '_db_tags_name_index', '_db_tags',
+                 '_db_deleted_annotations', '_db_annotations_id_index',
+                 '_db_annotations_key_index', '_db_annotations',
+                 '_db_deleted_controlParameters',
+                 '_db_controlParameters_id_index',
+                 '_db_controlParameters_name_index', '_db_controlParameters',
+                 '_db_deleted_vistrailVariables',
+                 '_db_vistrailVariables_name_index',
+                 '_db_vistrailVariables_uuid_index', '_db_vistrailVariables',
+                 '_db_deleted_parameter_explorations',
+                 '_db_parameter_explorations_id_index',
+                 '_db_parameter_explorations', '_db_deleted_actionAnnotations',
+                 '_db_actionAnnotations_id_index',
+                 '_db_actionAnnotations_action_id_index',
+                 '_db_actionAnnotations_key_index', '_db_actionAnnotations',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, entity_type=None, version=None, name=None, last_modified=None, actions=None, tags=None, annotations=None, controlParameters=None, vistrailVariables=None, parameter_explorations=None, actionAnnotations=None):
         self._db_id = id
-        self._db_entity_type = entity_type
-        self._db_version = version
-        self._db_name = name
+        self._db_entity_type = _intern(entity_type)
+        self._db_version = _intern(version)
+        self._db_name = _intern(name)
         self._db_last_modified = last_modified
-        self.db_deleted_actions = []
-        self.db_actions_id_index = {}
+        self._db_deleted_actions = None
+        self._db_actions_id_index = None
         if actions is None:
             self._db_actions = []
         else:
             self._db_actions = actions
             for v in self._db_actions:
                 self.db_actions_id_index[v.db_id] = v
-        self.db_deleted_tags = []
-        self.db_tags_id_index = {}
-        self.db_tags_name_index = {}
+        self._db_deleted_tags = None
+        self._db_tags_id_index = None
+        self._db_tags_name_index = None
         if tags is None:
             self._db_tags = []
         else:
@@ -3185,9 +3559,9 @@ class DBVistrail(object):
             for v in self._db_tags:
                 self.db_tags_id_index[v.db_id] = v
                 self.db_tags_name_index[v.db_name] = v
-        self.db_deleted_annotations = []
-        self.db_annotations_id_index = {}
-        self.db_annotations_key_index = {}
+        self._db_deleted_annotations = None
+        self._db_annotations_id_index = None
+        self._db_annotations_key_index = None
         if annotations is None:
             self._db_annotations = []
         else:
@@ -3195,9 +3569,9 @@ class DBVistrail(object):
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
                 self.db_annotations_key_index[v.db_key] = v
-        self.db_deleted_controlParameters = []
-        self.db_controlParameters_id_index = {}
-        self.db_controlParameters_name_index = {}
+        self._db_deleted_controlParameters = None
+        self._db_controlParameters_id_index = None
+        self._db_controlParameters_name_index = None
         if controlParameters is None:
             self._db_controlParameters = []
         else:
@@ -3205,9 +3579,9 @@ class DBVistrail(object):
             for v in self._db_controlParameters:
                 self.db_controlParameters_id_index[v.db_id] = v
                 self.db_controlParameters_name_index[v.db_name] = v
-        self.db_deleted_vistrailVariables = []
-        self.db_vistrailVariables_name_index = {}
-        self.db_vistrailVariables_uuid_index = {}
+        self._db_deleted_vistrailVariables = None
+        self._db_vistrailVariables_name_index = None
+        self._db_vistrailVariables_uuid_index = None
         if vistrailVariables is None:
             self._db_vistrailVariables = []
         else:
@@ -3215,18 +3589,18 @@ class DBVistrail(object):
             for v in self._db_vistrailVariables:
                 self.db_vistrailVariables_name_index[v.db_name] = v
                 self.db_vistrailVariables_uuid_index[v.db_uuid] = v
-        self.db_deleted_parameter_explorations = []
-        self.db_parameter_explorations_id_index = {}
+        self._db_deleted_parameter_explorations = None
+        self._db_parameter_explorations_id_index = None
         if parameter_explorations is None:
             self._db_parameter_explorations = []
         else:
             self._db_parameter_explorations = parameter_explorations
             for v in self._db_parameter_explorations:
                 self.db_parameter_explorations_id_index[v.db_id] = v
-        self.db_deleted_actionAnnotations = []
-        self.db_actionAnnotations_id_index = {}
-        self.db_actionAnnotations_action_id_index = {}
-        self.db_actionAnnotations_key_index = {}
+        self._db_deleted_actionAnnotations = None
+        self._db_actionAnnotations_id_index = None
+        self._db_actionAnnotations_action_id_index = None
+        self._db_actionAnnotations_key_index = None
         if actionAnnotations is None:
             self._db_actionAnnotations = []
         else:
@@ -3286,19 +3660,26 @@ class DBVistrail(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_actions_id_index = dict((v.db_id, v) for v in cp._db_actions)
-        cp.db_tags_id_index = dict((v.db_id, v) for v in cp._db_tags)
-        cp.db_tags_name_index = dict((v.db_name, v) for v in cp._db_tags)
-        cp.db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
-        cp.db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
-        cp.db_controlParameters_id_index = dict((v.db_id, v) for v in cp._db_controlParameters)
-        cp.db_controlParameters_name_index = dict((v.db_name, v) for v in cp._db_controlParameters)
-        cp.db_vistrailVariables_name_index = dict((v.db_name, v) for v in cp._db_vistrailVariables)
-        cp.db_vistrailVariables_uuid_index = dict((v.db_uuid, v) for v in cp._db_vistrailVariables)
-        cp.db_parameter_explorations_id_index = dict((v.db_id, v) for v in cp._db_parameter_explorations)
-        cp.db_actionAnnotations_id_index = dict((v.db_id, v) for v in cp._db_actionAnnotations)
-        cp.db_actionAnnotations_action_id_index = dict(((v.db_action_id,v.db_key), v) for v in cp._db_actionAnnotations)
-        cp.db_actionAnnotations_key_index = dict(((v.db_key,v.db_value), v) for v in cp._db_actionAnnotations)
+        if cp._db_actions:
+            cp._db_actions_id_index = dict((v.db_id, v) for v in cp._db_actions)
+        if cp._db_tags:
+            cp._db_tags_id_index = dict((v.db_id, v) for v in cp._db_tags)
+            cp._db_tags_name_index = dict((v.db_name, v) for v in cp._db_tags)
+        if cp._db_annotations:
+            cp._db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
+            cp._db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
+        if cp._db_controlParameters:
+            cp._db_controlParameters_id_index = dict((v.db_id, v) for v in cp._db_controlParameters)
+            cp._db_controlParameters_name_index = dict((v.db_name, v) for v in cp._db_controlParameters)
+        if cp._db_vistrailVariables:
+            cp._db_vistrailVariables_name_index = dict((v.db_name, v) for v in cp._db_vistrailVariables)
+            cp._db_vistrailVariables_uuid_index = dict((v.db_uuid, v) for v in cp._db_vistrailVariables)
+        if cp._db_parameter_explorations:
+            cp._db_parameter_explorations_id_index = dict((v.db_id, v) for v in cp._db_parameter_explorations)
+        if cp._db_actionAnnotations:
+            cp._db_actionAnnotations_id_index = dict((v.db_id, v) for v in cp._db_actionAnnotations)
+            cp._db_actionAnnotations_action_id_index = dict(((v.db_action_id,v.db_key), v) for v in cp._db_actionAnnotations)
+            cp._db_actionAnnotations_key_index = dict(((v.db_key,v.db_value), v) for v in cp._db_actionAnnotations)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -3472,21 +3853,28 @@ class DBVistrail(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_actions)
-        children.extend(self.db_deleted_tags)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_controlParameters)
-        children.extend(self.db_deleted_vistrailVariables)
-        children.extend(self.db_deleted_parameter_explorations)
-        children.extend(self.db_deleted_actionAnnotations)
+        if self._db_deleted_actions is not None:
+            children.extend(self._db_deleted_actions)
+        if self._db_deleted_tags is not None:
+            children.extend(self._db_deleted_tags)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_controlParameters is not None:
+            children.extend(self._db_deleted_controlParameters)
+        if self._db_deleted_vistrailVariables is not None:
+            children.extend(self._db_deleted_vistrailVariables)
+        if self._db_deleted_parameter_explorations is not None:
+            children.extend(self._db_deleted_parameter_explorations)
+        if self._db_deleted_actionAnnotations is not None:
+            children.extend(self._db_deleted_actionAnnotations)
         if remove:
-            self.db_deleted_actions = []
-            self.db_deleted_tags = []
-            self.db_deleted_annotations = []
-            self.db_deleted_controlParameters = []
-            self.db_deleted_vistrailVariables = []
-            self.db_deleted_parameter_explorations = []
-            self.db_deleted_actionAnnotations = []
+            self._db_deleted_actions = None
+            self._db_deleted_tags = None
+            self._db_deleted_annotations = None
+            self._db_deleted_controlParameters = None
+            self._db_deleted_vistrailVariables = None
+            self._db_deleted_parameter_explorations = None
+            self._db_deleted_actionAnnotations = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -3529,39 +3917,39 @@ class DBVistrail(object):
     def __get_db_entity_type(self):
         return self._db_entity_type
     def __set_db_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
         self.is_dirty = True
     db_entity_type = property(__get_db_entity_type, __set_db_entity_type)
     def db_add_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
     def db_change_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
     def db_delete_entity_type(self, entity_type):
         self._db_entity_type = None
     
     def __get_db_version(self):
         return self._db_version
     def __set_db_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
         self.is_dirty = True
     db_version = property(__get_db_version, __set_db_version)
     def db_add_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_change_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_delete_version(self, version):
         self._db_version = None
     
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -3615,10 +4003,24 @@ class DBVistrail(object):
             if self._db_actions[i].db_id == key:
                 return self._db_actions[i]
         return None
+    def __get_db_deleted_actions(self):
+        if self._db_deleted_actions is None:
+            self._db_deleted_actions = []
+        return self._db_deleted_actions
+    def __set_db_deleted_actions(self, deleted):
+        self._db_deleted_actions = deleted
+    db_deleted_actions = property(__get_db_deleted_actions, __set_db_deleted_actions)
+    def __get_db_actions_id_index(self):
+        if self._db_actions_id_index is None:
+            self._db_actions_id_index = {}
+        return self._db_actions_id_index
+    def __set_db_actions_id_index(self, index):
+        self._db_actions_id_index = index
+    db_actions_id_index = property(__get_db_actions_id_index, __set_db_actions_id_index)
     def db_get_action_by_id(self, key):
         return self.db_actions_id_index[key]
     def db_has_action_with_id(self, key):
-        return key in self.db_actions_id_index
+        return self._db_actions_id_index is not None and key in self._db_actions_id_index
     
     def __get_db_tags(self):
         return self._db_tags
@@ -3660,14 +4062,35 @@ class DBVistrail(object):
             if self._db_tags[i].db_id == key:
                 return self._db_tags[i]
         return None
+    def __get_db_deleted_tags(self):
+        if self._db_deleted_tags is None:
+            self._db_deleted_tags = []
+        return self._db_deleted_tags
+    def __set_db_deleted_tags(self, deleted):
+        self._db_deleted_tags = deleted
+    db_deleted_tags = property(__get_db_deleted_tags, __set_db_deleted_tags)
+    def __get_db_tags_id_index(self):
+        if self._db_tags_id_index is None:
+            self._db_tags_id_index = {}
+        return self._db_tags_id_index
+    def __set_db_tags_id_index(self, index):
+        self._db_tags_id_index = index
+    db_tags_id_index = property(__get_db_tags_id_index, __set_db_tags_id_index)
+    def __get_db_tags_name_index(self):
+        if self._db_tags_name_index is None:
+            self._db_tags_name_index = {}
+        return self._db_tags_name_index
+    def __set_db_tags_name_index(self, index):
+        self._db_tags_name_index = index
+    db_tags_name_index = property(__get_db_tags_name_index, __set_db_tags_name_index)
     def db_get_tag_by_id(self, key):
         return self.db_tags_id_index[key]
     def db_has_tag_with_id(self, key):
-        return key in self.db_tags_id_index
+        return self._db_tags_id_index is not None and key in self._db_tags_id_index
     def db_get_tag_by_name(self, key):
         return self.db_tags_name_index[key]
     def db_has_tag_with_name(self, key):
-        return key in self.db_tags_name_index
+        return self._db_tags_name_index is not None and key in self._db_tags_name_index
     
     def __get_db_annotations(self):
         return self._db_annotations
@@ -3709,14 +4132,35 @@ class DBVistrail(object):
             if self._db_annotations[i].db_id == key:
                 return self._db_annotations[i]
         return None
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
+    def __get_db_annotations_id_index(self):
+        if self._db_annotations_id_index is None:
+            self._db_annotations_id_index = {}
+        return self._db_annotations_id_index
+    def __set_db_annotations_id_index(self, index):
+        self._db_annotations_id_index = index
+    db_annotations_id_index = property(__get_db_annotations_id_index, __set_db_annotations_id_index)
+    def __get_db_annotations_key_index(self):
+        if self._db_annotations_key_index is None:
+            self._db_annotations_key_index = {}
+        return self._db_annotations_key_index
+    def __set_db_annotations_key_index(self, index):
+        self._db_annotations_key_index = index
+    db_annotations_key_index = property(__get_db_annotations_key_index, __set_db_annotations_key_index)
     def db_get_annotation_by_id(self, key):
         return self.db_annotations_id_index[key]
     def db_has_annotation_with_id(self, key):
-        return key in self.db_annotations_id_index
+        return self._db_annotations_id_index is not None and key in self._db_annotations_id_index
     def db_get_annotation_by_key(self, key):
         return self.db_annotations_key_index[key]
     def db_has_annotation_with_key(self, key):
-        return key in self.db_annotations_key_index
+        return self._db_annotations_key_index is not None and key in self._db_annotations_key_index
     
     def __get_db_controlParameters(self):
         return self._db_controlParameters
@@ -3758,14 +4202,35 @@ class DBVistrail(object):
             if self._db_controlParameters[i].db_id == key:
                 return self._db_controlParameters[i]
         return None
+    def __get_db_deleted_controlParameters(self):
+        if self._db_deleted_controlParameters is None:
+            self._db_deleted_controlParameters = []
+        return self._db_deleted_controlParameters
+    def __set_db_deleted_controlParameters(self, deleted):
+        self._db_deleted_controlParameters = deleted
+    db_deleted_controlParameters = property(__get_db_deleted_controlParameters, __set_db_deleted_controlParameters)
+    def __get_db_controlParameters_id_index(self):
+        if self._db_controlParameters_id_index is None:
+            self._db_controlParameters_id_index = {}
+        return self._db_controlParameters_id_index
+    def __set_db_controlParameters_id_index(self, index):
+        self._db_controlParameters_id_index = index
+    db_controlParameters_id_index = property(__get_db_controlParameters_id_index, __set_db_controlParameters_id_index)
+    def __get_db_controlParameters_name_index(self):
+        if self._db_controlParameters_name_index is None:
+            self._db_controlParameters_name_index = {}
+        return self._db_controlParameters_name_index
+    def __set_db_controlParameters_name_index(self, index):
+        self._db_controlParameters_name_index = index
+    db_controlParameters_name_index = property(__get_db_controlParameters_name_index, __set_db_controlParameters_name_index)
     def db_get_controlParameter_by_id(self, key):
         return self.db_controlParameters_id_index[key]
     def db_has_controlParameter_with_id(self, key):
-        return key in self.db_controlParameters_id_index
+        return self._db_controlParameters_id_index is not None and key in self._db_controlParameters_id_index
     def db_get_controlParameter_by_name(self, key):
         return self.db_controlParameters_name_index[key]
     def db_has_controlParameter_with_name(self, key):
-        return key in self.db_controlParameters_name_index
+        return self._db_controlParameters_name_index is not None and key in self._db_controlParameters_name_index
     
     def __get_db_vistrailVariables(self):
         return self._db_vistrailVariables
@@ -3807,14 +4272,35 @@ class DBVistrail(object):
             if self._db_vistrailVariables[i].db_name == key:
                 return self._db_vistrailVariables[i]
         return None
+    def __get_db_deleted_vistrailVariables(self):
+        if self._db_deleted_vistrailVariables is None:
+            self._db_deleted_vistrailVariables = []
+        return self._db_deleted_vistrailVariables
+    def __set_db_deleted_vistrailVariables(self, deleted):
+        self._db_deleted_vistrailVariables = deleted
+    db_deleted_vistrailVariables = property(__get_db_deleted_vistrailVariables, __set_db_deleted_vistrailVariables)
+    def __get_db_vistrailVariables_name_index(self):
+        if self._db_vistrailVariables_name_index is None:
+            self._db_vistrailVariables_name_index = {}
+        return self._db_vistrailVariables_name_index
+    def __set_db_vistrailVariables_name_index(self, index):
+        self._db_vistrailVariables_name_index = index
+    db_vistrailVariables_name_index = property(__get_db_vistrailVariables_name_index, __set_db_vistrailVariables_name_index)
+    def __get_db_vistrailVariables_uuid_index(self):
+        if self._db_vistrailVariables_uuid_index is None:
+            self._db_vistrailVariables_uuid_index = {}
+        return self._db_vistrailVariables_uuid_index
+    def __set_db_vistrailVariables_uuid_index(self, index):
+        self._db_vistrailVariables_uuid_index = index
+    db_vistrailVariables_uuid_index = property(__get_db_vistrailVariables_uuid_index, __set_db_vistrailVariables_uuid_index)
     def db_get_vistrailVariable_by_name(self, key):
         return self.db_vistrailVariables_name_index[key]
     def db_has_vistrailVariable_with_name(self, key):
-        return key in self.db_vistrailVariables_name_index
+        return self._db_vistrailVariables_name_index is not None and key in self._db_vistrailVariables_name_index
     def db_get_vistrailVariable_by_uuid(self, key):
         return self.db_vistrailVariables_uuid_index[key]
     def db_has_vistrailVariable_with_uuid(self, key):
-        return key in self.db_vistrailVariables_uuid_index
+        return self._db_vistrailVariables_uuid_index is not None and key in self._db_vistrailVariables_uuid_index
     
     def __get_db_parameter_explorations(self):
         return self._db_parameter_explorations
@@ -3853,10 +4339,24 @@ class DBVistrail(object):
             if self._db_parameter_explorations[i].db_id == key:
                 return self._db_parameter_explorations[i]
         return None
+    def __get_db_deleted_parameter_explorations(self):
+        if self._db_deleted_parameter_explorations is None:
+            self._db_deleted_parameter_explorations = []
+        return self._db_deleted_parameter_explorations
+    def __set_db_deleted_parameter_explorations(self, deleted):
+        self._db_deleted_parameter_explorations = deleted
+    db_deleted_parameter_explorations = property(__get_db_deleted_parameter_explorations, __set_db_deleted_parameter_explorations)
+    def __get_db_parameter_explorations_id_index(self):
+        if self._db_parameter_explorations_id_index is None:
+            self._db_parameter_explorations_id_index = {}
+        return self._db_parameter_explorations_id_index
+    def __set_db_parameter_explorations_id_index(self, index):
+        self._db_parameter_explorations_id_index = index
+    db_parameter_explorations_id_index = property(__get_db_parameter_explorations_id_index, __set_db_parameter_explorations_id_index)
     def db_get_parameter_exploration_by_id(self, key):
         return self.db_parameter_explorations_id_index[key]
     def db_has_parameter_exploration_with_id(self, key):
-        return key in self.db_parameter_explorations_id_index
+        return self._db_parameter_explorations_id_index is not None and key in self._db_parameter_explorations_id_index
     
     def __get_db_actionAnnotations(self):
         return self._db_actionAnnotations
@@ -3904,18 +4404,46 @@ class DBVistrail(object):
             if self._db_actionAnnotations[i].db_id == key:
                 return self._db_actionAnnotations[i]
         return None
+    def __get_db_deleted_actionAnnotations(self):
+        if self._db_deleted_actionAnnotations is None:
+            self._db_deleted_actionAnnotations = []
+        return self._db_deleted_actionAnnotations
+    def __set_db_deleted_actionAnnotations(self, deleted):
+        self._db_deleted_actionAnnotations = deleted
+    db_deleted_actionAnnotations = property(__get_db_deleted_actionAnnotations, __set_db_deleted_actionAnnotations)
+    def __get_db_actionAnnotations_id_index(self):
+        if self._db_actionAnnotations_id_index is None:
+            self._db_actionAnnotations_id_index = {}
+        return self._db_actionAnnotations_id_index
+    def __set_db_actionAnnotations_id_index(self, index):
+        self._db_actionAnnotations_id_index = index
+    db_actionAnnotations_id_index = property(__get_db_actionAnnotations_id_index, __set_db_actionAnnotations_id_index)
+    def __get_db_actionAnnotations_action_id_index(self):
+        if self._db_actionAnnotations_action_id_index is None:
+            self._db_actionAnnotations_action_id_index = {}
+        return self._db_actionAnnotations_action_id_index
+    def __set_db_actionAnnotations_action_id_index(self, index):
+        self._db_actionAnnotations_action_id_index = index
+    db_actionAnnotations_action_id_index = property(__get_db_actionAnnotations_action_id_index, __set_db_actionAnnotations_action_id_index)
+    def __get_db_actionAnnotations_key_index(self):
+        if self._db_actionAnnotations_key_index is None:
+            self._db_actionAnnotations_key_index = {}
+        return self._db_actionAnnotations_key_index
+    def __set_db_actionAnnotations_key_index(self, index):
+        self._db_actionAnnotations_key_index = index
+    db_actionAnnotations_key_index = property(__get_db_actionAnnotations_key_index, __set_db_actionAnnotations_key_index)
     def db_get_actionAnnotation_by_id(self, key):
         return self.db_actionAnnotations_id_index[key]
     def db_has_actionAnnotation_with_id(self, key):
-        return key in self.db_actionAnnotations_id_index
+        return self._db_actionAnnotations_id_index is not None and key in self._db_actionAnnotations_id_index
     def db_get_actionAnnotation_by_action_id(self, key):
         return self.db_actionAnnotations_action_id_index[key]
     def db_has_actionAnnotation_with_action_id(self, key):
-        return key in self.db_actionAnnotations_action_id_index
+        return self._db_actionAnnotations_action_id_index is not None and key in self._db_actionAnnotations_action_id_index
     def db_get_actionAnnotation_by_key(self, key):
         return self.db_actionAnnotations_key_index[key]
     def db_has_actionAnnotation_with_key(self, key):
-        return key in self.db_actionAnnotations_key_index
+        return self._db_actionAnnotations_key_index is not None and key in self._db_actionAnnotations_key_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -3924,8 +4452,11 @@ class DBOpmArtifactValue(object):
 
     vtType = 'opm_artifact_value'
 
+    __slots__ = ('_db_deleted_value', '_db_value', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, value=None):
-        self.db_deleted_value = []
+        self._db_deleted_value = None
         self._db_value = value
         self.is_dirty = True
         self.is_new = True
@@ -3991,9 +4522,10 @@ class DBOpmArtifactValue(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
+        if self._db_deleted_value is not None:
+            children.extend(self._db_deleted_value)
         if remove:
-            self.db_deleted_value = []
+            self._db_deleted_value = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -4015,6 +4547,13 @@ class DBOpmArtifactValue(object):
         if not self.is_new:
             self.db_deleted_value.append(self._db_value)
         self._db_value = None
+    def __get_db_deleted_value(self):
+        if self._db_deleted_value is None:
+            self._db_deleted_value = []
+        return self._db_deleted_value
+    def __set_db_deleted_value(self, deleted):
+        self._db_deleted_value = deleted
+    db_deleted_value = property(__get_db_deleted_value, __set_db_deleted_value)
     
 
 
@@ -4022,6 +4561,8 @@ class DBConfigStr(object):
 
     vtType = 'config_str'
 
+    __slots__ = ('_db_value', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -4092,13 +4633,19 @@ class DBStartup(object):
 
     vtType = 'startup'
 
+    __slots__ = ('_db_version', '_db_deleted_configuration',
+                 '_db_configuration', '_db_deleted_enabled_packages',
+                 '_db_enabled_packages', '_db_deleted_disabled_packages',
+                 '_db_disabled_packages', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, version=None, configuration=None, enabled_packages=None, disabled_packages=None):
         self._db_version = version
-        self.db_deleted_configuration = []
+        self._db_deleted_configuration = None
         self._db_configuration = configuration
-        self.db_deleted_enabled_packages = []
+        self._db_deleted_enabled_packages = None
         self._db_enabled_packages = enabled_packages
-        self.db_deleted_disabled_packages = []
+        self._db_deleted_disabled_packages = None
         self._db_disabled_packages = disabled_packages
         self.is_dirty = True
         self.is_new = True
@@ -4194,13 +4741,16 @@ class DBStartup(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_configuration)
-        children.extend(self.db_deleted_enabled_packages)
-        children.extend(self.db_deleted_disabled_packages)
+        if self._db_deleted_configuration is not None:
+            children.extend(self._db_deleted_configuration)
+        if self._db_deleted_enabled_packages is not None:
+            children.extend(self._db_deleted_enabled_packages)
+        if self._db_deleted_disabled_packages is not None:
+            children.extend(self._db_deleted_disabled_packages)
         if remove:
-            self.db_deleted_configuration = []
-            self.db_deleted_enabled_packages = []
-            self.db_deleted_disabled_packages = []
+            self._db_deleted_configuration = None
+            self._db_deleted_enabled_packages = None
+            self._db_deleted_disabled_packages = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -4239,6 +4789,13 @@ class DBStartup(object):
         if not self.is_new:
             self.db_deleted_configuration.append(self._db_configuration)
         self._db_configuration = None
+    def __get_db_deleted_configuration(self):
+        if self._db_deleted_configuration is None:
+            self._db_deleted_configuration = []
+        return self._db_deleted_configuration
+    def __set_db_deleted_configuration(self, deleted):
+        self._db_deleted_configuration = deleted
+    db_deleted_configuration = property(__get_db_deleted_configuration, __set_db_deleted_configuration)
     
     def __get_db_enabled_packages(self):
         return self._db_enabled_packages
@@ -4254,6 +4811,13 @@ class DBStartup(object):
         if not self.is_new:
             self.db_deleted_enabled_packages.append(self._db_enabled_packages)
         self._db_enabled_packages = None
+    def __get_db_deleted_enabled_packages(self):
+        if self._db_deleted_enabled_packages is None:
+            self._db_deleted_enabled_packages = []
+        return self._db_deleted_enabled_packages
+    def __set_db_deleted_enabled_packages(self, deleted):
+        self._db_deleted_enabled_packages = deleted
+    db_deleted_enabled_packages = property(__get_db_deleted_enabled_packages, __set_db_deleted_enabled_packages)
     
     def __get_db_disabled_packages(self):
         return self._db_disabled_packages
@@ -4269,6 +4833,13 @@ class DBStartup(object):
         if not self.is_new:
             self.db_deleted_disabled_packages.append(self._db_disabled_packages)
         self._db_disabled_packages = None
+    def __get_db_deleted_disabled_packages(self):
+        if self._db_deleted_disabled_packages is None:
+            self._db_deleted_disabled_packages = []
+        return self._db_deleted_disabled_packages
+    def __set_db_deleted_disabled_packages(self, deleted):
+        self._db_deleted_disabled_packages = deleted
+    db_deleted_disabled_packages = property(__get_db_deleted_disabled_packages, __set_db_deleted_disabled_packages)
     
 
 
@@ -4279,23 +4850,23 @@ class DBModule(object):
     def __init__(self, id=None, cache=None, name=None, namespace=None, package=None, version=None, location=None, functions=None, annotations=None, controlParameters=None, portSpecs=None):
         self._db_id = id
         self._db_cache = cache
-        self._db_name = name
-        self._db_namespace = namespace
-        self._db_package = package
-        self._db_version = version
-        self.db_deleted_location = []
+        self._db_name = _intern(name)
+        self._db_namespace = _intern(namespace)
+        self._db_package = _intern(package)
+        self._db_version = _intern(version)
+        self._db_deleted_location = None
         self._db_location = location
-        self.db_deleted_functions = []
-        self.db_functions_id_index = {}
+        self._db_deleted_functions = None
+        self._db_functions_id_index = None
         if functions is None:
             self._db_functions = []
         else:
             self._db_functions = functions
             for v in self._db_functions:
                 self.db_functions_id_index[v.db_id] = v
-        self.db_deleted_annotations = []
-        self.db_annotations_id_index = {}
-        self.db_annotations_key_index = {}
+        self._db_deleted_annotations = None
+        self._db_annotations_id_index = None
+        self._db_annotations_key_index = None
         if annotations is None:
             self._db_annotations = []
         else:
@@ -4303,9 +4874,9 @@ class DBModule(object):
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
                 self.db_annotations_key_index[v.db_key] = v
-        self.db_deleted_controlParameters = []
-        self.db_controlParameters_id_index = {}
-        self.db_controlParameters_name_index = {}
+        self._db_deleted_controlParameters = None
+        self._db_controlParameters_id_index = None
+        self._db_controlParameters_name_index = None
         if controlParameters is None:
             self._db_controlParameters = []
         else:
@@ -4313,9 +4884,9 @@ class DBModule(object):
             for v in self._db_controlParameters:
                 self.db_controlParameters_id_index[v.db_id] = v
                 self.db_controlParameters_name_index[v.db_name] = v
-        self.db_deleted_portSpecs = []
-        self.db_portSpecs_id_index = {}
-        self.db_portSpecs_name_index = {}
+        self._db_deleted_portSpecs = None
+        self._db_portSpecs_id_index = None
+        self._db_portSpecs_name_index = None
         if portSpecs is None:
             self._db_portSpecs = []
         else:
@@ -4365,13 +4936,17 @@ class DBModule(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_functions_id_index = dict((v.db_id, v) for v in cp._db_functions)
-        cp.db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
-        cp.db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
-        cp.db_controlParameters_id_index = dict((v.db_id, v) for v in cp._db_controlParameters)
-        cp.db_controlParameters_name_index = dict((v.db_name, v) for v in cp._db_controlParameters)
-        cp.db_portSpecs_id_index = dict((v.db_id, v) for v in cp._db_portSpecs)
-        cp.db_portSpecs_name_index = dict(((v.db_name,v.db_type), v) for v in cp._db_portSpecs)
+        if cp._db_functions:
+            cp._db_functions_id_index = dict((v.db_id, v) for v in cp._db_functions)
+        if cp._db_annotations:
+            cp._db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
+            cp._db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
+        if cp._db_controlParameters:
+            cp._db_controlParameters_id_index = dict((v.db_id, v) for v in cp._db_controlParameters)
+            cp._db_controlParameters_name_index = dict((v.db_name, v) for v in cp._db_controlParameters)
+        if cp._db_portSpecs:
+            cp._db_portSpecs_id_index = dict((v.db_id, v) for v in cp._db_portSpecs)
+            cp._db_portSpecs_name_index = dict(((v.db_name,v.db_type), v) for v in cp._db_portSpecs)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -4510,17 +5085,22 @@ class DBModule(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_location)
-        children.extend(self.db_deleted_functions)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_controlParameters)
-        children.extend(self.db_deleted_portSpecs)
+        if self._db_deleted_location is not None:
+            children.extend(self._db_deleted_location)
+        if self._db_deleted_functions is not None:
+            children.extend(self._db_deleted_functions)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_controlParameters is not None:
+            children.extend(self._db_deleted_controlParameters)
+        if self._db_deleted_portSpecs is not None:
+            children.extend(self._db_deleted_portSpecs)
         if remove:
-            self.db_deleted_location = []
-            self.db_deleted_functions = []
-            self.db_deleted_annotations = []
-            self.db_deleted_controlParameters = []
-            self.db_deleted_portSpecs = []
+            self._db_deleted_location = None
+            self._db_deleted_functions = None
+            self._db_deleted_annotations = None
+            self._db_deleted_controlParameters = None
+            self._db_deleted_portSpecs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -4569,52 +5149,52 @@ class DBModule(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
     def __get_db_namespace(self):
         return self._db_namespace
     def __set_db_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
         self.is_dirty = True
     db_namespace = property(__get_db_namespace, __set_db_namespace)
     def db_add_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_change_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_delete_namespace(self, namespace):
         self._db_namespace = None
     
     def __get_db_package(self):
         return self._db_package
     def __set_db_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
         self.is_dirty = True
     db_package = property(__get_db_package, __set_db_package)
     def db_add_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_change_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_delete_package(self, package):
         self._db_package = None
     
     def __get_db_version(self):
         return self._db_version
     def __set_db_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
         self.is_dirty = True
     db_version = property(__get_db_version, __set_db_version)
     def db_add_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_change_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_delete_version(self, version):
         self._db_version = None
     
@@ -4632,6 +5212,13 @@ class DBModule(object):
         if not self.is_new:
             self.db_deleted_location.append(self._db_location)
         self._db_location = None
+    def __get_db_deleted_location(self):
+        if self._db_deleted_location is None:
+            self._db_deleted_location = []
+        return self._db_deleted_location
+    def __set_db_deleted_location(self, deleted):
+        self._db_deleted_location = deleted
+    db_deleted_location = property(__get_db_deleted_location, __set_db_deleted_location)
     
     def __get_db_functions(self):
         return self._db_functions
@@ -4670,10 +5257,24 @@ class DBModule(object):
             if self._db_functions[i].db_id == key:
                 return self._db_functions[i]
         return None
+    def __get_db_deleted_functions(self):
+        if self._db_deleted_functions is None:
+            self._db_deleted_functions = []
+        return self._db_deleted_functions
+    def __set_db_deleted_functions(self, deleted):
+        self._db_deleted_functions = deleted
+    db_deleted_functions = property(__get_db_deleted_functions, __set_db_deleted_functions)
+    def __get_db_functions_id_index(self):
+        if self._db_functions_id_index is None:
+            self._db_functions_id_index = {}
+        return self._db_functions_id_index
+    def __set_db_functions_id_index(self, index):
+        self._db_functions_id_index = index
+    db_functions_id_index = property(__get_db_functions_id_index, __set_db_functions_id_index)
     def db_get_function_by_id(self, key):
         return self.db_functions_id_index[key]
     def db_has_function_with_id(self, key):
-        return key in self.db_functions_id_index
+        return self._db_functions_id_index is not None and key in self._db_functions_id_index
     
     def __get_db_annotations(self):
         return self._db_annotations
@@ -4715,14 +5316,35 @@ class DBModule(object):
             if self._db_annotations[i].db_id == key:
                 return self._db_annotations[i]
         return None
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
+    def __get_db_annotations_id_index(self):
+        if self._db_annotations_id_index is None:
+            self._db_annotations_id_index = {}
+        return self._db_annotations_id_index
+    def __set_db_annotations_id_index(self, index):
+        self._db_annotations_id_index = index
+    db_annotations_id_index = property(__get_db_annotations_id_index, __set_db_annotations_id_index)
+    def __get_db_annotations_key_index(self):
+        if self._db_annotations_key_index is None:
+            self._db_annotations_key_index = {}
+        return self._db_annotations_key_index
+    def __set_db_annotations_key_index(self, index):
+        self._db_annotations_key_index = index
+    db_annotations_key_index = property(__get_db_annotations_key_index, __set_db_annotations_key_index)
     def db_get_annotation_by_id(self, key):
         return self.db_annotations_id_index[key]
     def db_has_annotation_with_id(self, key):
-        return key in self.db_annotations_id_index
+        return self._db_annotations_id_index is not None and key in self._db_annotations_id_index
     def db_get_annotation_by_key(self, key):
         return self.db_annotations_key_index[key]
     def db_has_annotation_with_key(self, key):
-        return key in self.db_annotations_key_index
+        return self._db_annotations_key_index is not None and key in self._db_annotations_key_index
     
     def __get_db_controlParameters(self):
         return self._db_controlParameters
@@ -4764,14 +5386,35 @@ class DBModule(object):
             if self._db_controlParameters[i].db_id == key:
                 return self._db_controlParameters[i]
         return None
+    def __get_db_deleted_controlParameters(self):
+        if self._db_deleted_controlParameters is None:
+            self._db_deleted_controlParameters = []
+        return self._db_deleted_controlParameters
+    def __set_db_deleted_controlParameters(self, deleted):
+        self._db_deleted_controlParameters = deleted
+    db_deleted_controlParameters = property(__get_db_deleted_controlParameters, __set_db_deleted_controlParameters)
+    def __get_db_controlParameters_id_index(self):
+        if self._db_controlParameters_id_index is None:
+            self._db_controlParameters_id_index = {}
+        return self._db_controlParameters_id_index
+    def __set_db_controlParameters_id_index(self, index):
+        self._db_controlParameters_id_index = index
+    db_controlParameters_id_index = property(__get_db_controlParameters_id_index, __set_db_controlParameters_id_index)
+    def __get_db_controlParameters_name_index(self):
+        if self._db_controlParameters_name_index is None:
+            self._db_controlParameters_name_index = {}
+        return self._db_controlParameters_name_index
+    def __set_db_controlParameters_name_index(self, index):
+        self._db_controlParameters_name_index = index
+    db_controlParameters_name_index = property(__get_db_controlParameters_name_index, __set_db_controlParameters_name_index)
     def db_get_controlParameter_by_id(self, key):
         return self.db_controlParameters_id_index[key]
     def db_has_controlParameter_with_id(self, key):
-        return key in self.db_controlParameters_id_index
+        return self._db_controlParameters_id_index is not None and key in self._db_controlParameters_id_index
     def db_get_controlParameter_by_name(self, key):
         return self.db_controlParameters_name_index[key]
     def db_has_controlParameter_with_name(self, key):
-        return key in self.db_controlParameters_name_index
+        return self._db_controlParameters_name_index is not None and key in self._db_controlParameters_name_index
     
     def __get_db_portSpecs(self):
         return self._db_portSpecs
@@ -4813,14 +5456,35 @@ class DBModule(object):
             if self._db_portSpecs[i].db_id == key:
                 return self._db_portSpecs[i]
         return None
+    def __get_db_deleted_portSpecs(self):
+        if self._db_deleted_portSpecs is None:
+            self._db_deleted_portSpecs = []
+        return self._db_deleted_portSpecs
+    def __set_db_deleted_portSpecs(self, deleted):
+        self._db_deleted_portSpecs = deleted
+    db_deleted_portSpecs = property(__get_db_deleted_portSpecs, __set_db_deleted_portSpecs)
+    def __get_db_portSpecs_id_index(self):
+        if self._db_portSpecs_id_index is None:
+            self._db_portSpecs_id_index = {}
+        return self._db_portSpecs_id_index
+    def __set_db_portSpecs_id_index(self, index):
+        self._db_portSpecs_id_index = index
+    db_portSpecs_id_index = property(__get_db_portSpecs_id_index, __set_db_portSpecs_id_index)
+    def __get_db_portSpecs_name_index(self):
+        if self._db_portSpecs_name_index is None:
+            self._db_portSpecs_name_index = {}
+        return self._db_portSpecs_name_index
+    def __set_db_portSpecs_name_index(self, index):
+        self._db_portSpecs_name_index = index
+    db_portSpecs_name_index = property(__get_db_portSpecs_name_index, __set_db_portSpecs_name_index)
     def db_get_portSpec_by_id(self, key):
         return self.db_portSpecs_id_index[key]
     def db_has_portSpec_with_id(self, key):
-        return key in self.db_portSpecs_id_index
+        return self._db_portSpecs_id_index is not None and key in self._db_portSpecs_id_index
     def db_get_portSpec_by_name(self, key):
         return self.db_portSpecs_name_index[key]
     def db_has_portSpec_with_name(self, key):
-        return key in self.db_portSpecs_name_index
+        return self._db_portSpecs_name_index is not None and key in self._db_portSpecs_name_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -4829,12 +5493,16 @@ class DBPort(object):
 
     vtType = 'port'
 
+    __slots__ = ('_db_id', '_db_type', '_db_moduleId', '_db_moduleName',
+                 '_db_name', '_db_signature', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, type=None, moduleId=None, moduleName=None, name=None, signature=None):
         self._db_id = id
-        self._db_type = type
+        self._db_type = _intern(type)
         self._db_moduleId = moduleId
-        self._db_moduleName = moduleName
-        self._db_name = name
+        self._db_moduleName = _intern(moduleName)
+        self._db_name = _intern(name)
         self._db_signature = signature
         self.is_dirty = True
         self.is_new = True
@@ -4933,13 +5601,13 @@ class DBPort(object):
     def __get_db_type(self):
         return self._db_type
     def __set_db_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
         self.is_dirty = True
     db_type = property(__get_db_type, __set_db_type)
     def db_add_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
     def db_change_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
     def db_delete_type(self, type):
         self._db_type = None
     
@@ -4959,26 +5627,26 @@ class DBPort(object):
     def __get_db_moduleName(self):
         return self._db_moduleName
     def __set_db_moduleName(self, moduleName):
-        self._db_moduleName = moduleName
+        self._db_moduleName = _intern(moduleName)
         self.is_dirty = True
     db_moduleName = property(__get_db_moduleName, __set_db_moduleName)
     def db_add_moduleName(self, moduleName):
-        self._db_moduleName = moduleName
+        self._db_moduleName = _intern(moduleName)
     def db_change_moduleName(self, moduleName):
-        self._db_moduleName = moduleName
+        self._db_moduleName = _intern(moduleName)
     def db_delete_moduleName(self, moduleName):
         self._db_moduleName = None
     
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -5002,9 +5670,12 @@ class DBOpmAgents(object):
 
     vtType = 'opm_agents'
 
+    __slots__ = ('_db_deleted_agents', '_db_agents_id_index', '_db_agents',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, agents=None):
-        self.db_deleted_agents = []
-        self.db_agents_id_index = {}
+        self._db_deleted_agents = None
+        self._db_agents_id_index = None
         if agents is None:
             self._db_agents = []
         else:
@@ -5034,7 +5705,8 @@ class DBOpmAgents(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_agents_id_index = dict((v.db_id, v) for v in cp._db_agents)
+        if cp._db_agents:
+            cp._db_agents_id_index = dict((v.db_id, v) for v in cp._db_agents)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -5075,9 +5747,10 @@ class DBOpmAgents(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_agents)
+        if self._db_deleted_agents is not None:
+            children.extend(self._db_deleted_agents)
         if remove:
-            self.db_deleted_agents = []
+            self._db_deleted_agents = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5123,10 +5796,24 @@ class DBOpmAgents(object):
             if self._db_agents[i].db_id == key:
                 return self._db_agents[i]
         return None
+    def __get_db_deleted_agents(self):
+        if self._db_deleted_agents is None:
+            self._db_deleted_agents = []
+        return self._db_deleted_agents
+    def __set_db_deleted_agents(self, deleted):
+        self._db_deleted_agents = deleted
+    db_deleted_agents = property(__get_db_deleted_agents, __set_db_deleted_agents)
+    def __get_db_agents_id_index(self):
+        if self._db_agents_id_index is None:
+            self._db_agents_id_index = {}
+        return self._db_agents_id_index
+    def __set_db_agents_id_index(self, index):
+        self._db_agents_id_index = index
+    db_agents_id_index = property(__get_db_agents_id_index, __set_db_agents_id_index)
     def db_get_agent_by_id(self, key):
         return self.db_agents_id_index[key]
     def db_has_agent_with_id(self, key):
-        return key in self.db_agents_id_index
+        return self._db_agents_id_index is not None and key in self._db_agents_id_index
     
 
 
@@ -5134,8 +5821,11 @@ class DBOpmDependencies(object):
 
     vtType = 'opm_dependencies'
 
+    __slots__ = ('_db_deleted_dependencys', '_db_dependencys', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, dependencys=None):
-        self.db_deleted_dependencys = []
+        self._db_deleted_dependencys = None
         if dependencys is None:
             self._db_dependencys = []
         else:
@@ -5225,9 +5915,10 @@ class DBOpmDependencies(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_dependencys)
+        if self._db_deleted_dependencys is not None:
+            children.extend(self._db_deleted_dependencys)
         if remove:
-            self.db_deleted_dependencys = []
+            self._db_deleted_dependencys = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5255,6 +5946,13 @@ class DBOpmDependencies(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_dependency(self, key):
         return None
+    def __get_db_deleted_dependencys(self):
+        if self._db_deleted_dependencys is None:
+            self._db_deleted_dependencys = []
+        return self._db_deleted_dependencys
+    def __set_db_deleted_dependencys(self, deleted):
+        self._db_deleted_dependencys = deleted
+    db_deleted_dependencys = property(__get_db_deleted_dependencys, __set_db_deleted_dependencys)
     
 
 
@@ -5262,13 +5960,18 @@ class DBPEFunction(object):
 
     vtType = 'pe_function'
 
+    __slots__ = ('_db_id', '_db_module_id', '_db_port_name', '_db_is_alias',
+                 '_db_deleted_parameters', '_db_parameters_id_index',
+                 '_db_parameters', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, module_id=None, port_name=None, is_alias=None, parameters=None):
         self._db_id = id
         self._db_module_id = module_id
-        self._db_port_name = port_name
+        self._db_port_name = _intern(port_name)
         self._db_is_alias = is_alias
-        self.db_deleted_parameters = []
-        self.db_parameters_id_index = {}
+        self._db_deleted_parameters = None
+        self._db_parameters_id_index = None
         if parameters is None:
             self._db_parameters = []
         else:
@@ -5303,7 +6006,8 @@ class DBPEFunction(object):
                 cp._db_module_id = id_remap[('module', self._db_module_id)]
         
         # recreate indices and set flags
-        cp.db_parameters_id_index = dict((v.db_id, v) for v in cp._db_parameters)
+        if cp._db_parameters:
+            cp._db_parameters_id_index = dict((v.db_id, v) for v in cp._db_parameters)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -5364,9 +6068,10 @@ class DBPEFunction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_parameters)
+        if self._db_deleted_parameters is not None:
+            children.extend(self._db_deleted_parameters)
         if remove:
-            self.db_deleted_parameters = []
+            self._db_deleted_parameters = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5404,13 +6109,13 @@ class DBPEFunction(object):
     def __get_db_port_name(self):
         return self._db_port_name
     def __set_db_port_name(self, port_name):
-        self._db_port_name = port_name
+        self._db_port_name = _intern(port_name)
         self.is_dirty = True
     db_port_name = property(__get_db_port_name, __set_db_port_name)
     def db_add_port_name(self, port_name):
-        self._db_port_name = port_name
+        self._db_port_name = _intern(port_name)
     def db_change_port_name(self, port_name):
-        self._db_port_name = port_name
+        self._db_port_name = _intern(port_name)
     def db_delete_port_name(self, port_name):
         self._db_port_name = None
     
@@ -5464,10 +6169,24 @@ class DBPEFunction(object):
             if self._db_parameters[i].db_id == key:
                 return self._db_parameters[i]
         return None
+    def __get_db_deleted_parameters(self):
+        if self._db_deleted_parameters is None:
+            self._db_deleted_parameters = []
+        return self._db_deleted_parameters
+    def __set_db_deleted_parameters(self, deleted):
+        self._db_deleted_parameters = deleted
+    db_deleted_parameters = property(__get_db_deleted_parameters, __set_db_deleted_parameters)
+    def __get_db_parameters_id_index(self):
+        if self._db_parameters_id_index is None:
+            self._db_parameters_id_index = {}
+        return self._db_parameters_id_index
+    def __set_db_parameters_id_index(self, index):
+        self._db_parameters_id_index = index
+    db_parameters_id_index = property(__get_db_parameters_id_index, __set_db_parameters_id_index)
     def db_get_parameter_by_id(self, key):
         return self.db_parameters_id_index[key]
     def db_has_parameter_with_id(self, key):
-        return key in self.db_parameters_id_index
+        return self._db_parameters_id_index is not None and key in self._db_parameters_id_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -5477,8 +6196,8 @@ class DBWorkflow(object):
     vtType = 'workflow'
 
     def __init__(self, modules=None, id=None, entity_type=None, name=None, version=None, last_modified=None, connections=None, annotations=None, plugin_datas=None, others=None, vistrail_id=None):
-        self.db_deleted_modules = []
-        self.db_modules_id_index = {}
+        self._db_deleted_modules = None
+        self._db_modules_id_index = None
         if modules is None:
             self._db_modules = []
         else:
@@ -5486,36 +6205,36 @@ class DBWorkflow(object):
             for v in self._db_modules:
                 self.db_modules_id_index[v.db_id] = v
         self._db_id = id
-        self._db_entity_type = entity_type
-        self._db_name = name
-        self._db_version = version
+        self._db_entity_type = _intern(entity_type)
+        self._db_name = _intern(name)
+        self._db_version = _intern(version)
         self._db_last_modified = last_modified
-        self.db_deleted_connections = []
-        self.db_connections_id_index = {}
+        self._db_deleted_connections = None
+        self._db_connections_id_index = None
         if connections is None:
             self._db_connections = []
         else:
             self._db_connections = connections
             for v in self._db_connections:
                 self.db_connections_id_index[v.db_id] = v
-        self.db_deleted_annotations = []
-        self.db_annotations_id_index = {}
+        self._db_deleted_annotations = None
+        self._db_annotations_id_index = None
         if annotations is None:
             self._db_annotations = []
         else:
             self._db_annotations = annotations
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
-        self.db_deleted_plugin_datas = []
-        self.db_plugin_datas_id_index = {}
+        self._db_deleted_plugin_datas = None
+        self._db_plugin_datas_id_index = None
         if plugin_datas is None:
             self._db_plugin_datas = []
         else:
             self._db_plugin_datas = plugin_datas
             for v in self._db_plugin_datas:
                 self.db_plugin_datas_id_index[v.db_id] = v
-        self.db_deleted_others = []
-        self.db_others_id_index = {}
+        self._db_deleted_others = None
+        self._db_others_id_index = None
         if others is None:
             self._db_others = []
         else:
@@ -5569,11 +6288,16 @@ class DBWorkflow(object):
                 cp._db_vistrail_id = id_remap[('vistrail', self._db_vistrail_id)]
         
         # recreate indices and set flags
-        cp.db_modules_id_index = dict((v.db_id, v) for v in cp._db_modules)
-        cp.db_connections_id_index = dict((v.db_id, v) for v in cp._db_connections)
-        cp.db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
-        cp.db_plugin_datas_id_index = dict((v.db_id, v) for v in cp._db_plugin_datas)
-        cp.db_others_id_index = dict((v.db_id, v) for v in cp._db_others)
+        if cp._db_modules:
+            cp._db_modules_id_index = dict((v.db_id, v) for v in cp._db_modules)
+        if cp._db_connections:
+            cp._db_connections_id_index = dict((v.db_id, v) for v in cp._db_connections)
+        if cp._db_annotations:
+            cp._db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
+        if cp._db_plugin_datas:
+            cp._db_plugin_datas_id_index = dict((v.db_id, v) for v in cp._db_plugin_datas)
+        if cp._db_others:
+            cp._db_others_id_index = dict((v.db_id, v) for v in cp._db_others)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -5728,17 +6452,22 @@ class DBWorkflow(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_connections)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_plugin_datas)
-        children.extend(self.db_deleted_others)
-        children.extend(self.db_deleted_modules)
+        if self._db_deleted_connections is not None:
+            children.extend(self._db_deleted_connections)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_plugin_datas is not None:
+            children.extend(self._db_deleted_plugin_datas)
+        if self._db_deleted_others is not None:
+            children.extend(self._db_deleted_others)
+        if self._db_deleted_modules is not None:
+            children.extend(self._db_deleted_modules)
         if remove:
-            self.db_deleted_connections = []
-            self.db_deleted_annotations = []
-            self.db_deleted_plugin_datas = []
-            self.db_deleted_others = []
-            self.db_deleted_modules = []
+            self._db_deleted_connections = None
+            self._db_deleted_annotations = None
+            self._db_deleted_plugin_datas = None
+            self._db_deleted_others = None
+            self._db_deleted_modules = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -5796,10 +6525,24 @@ class DBWorkflow(object):
             if self._db_modules[i].db_id == key:
                 return self._db_modules[i]
         return None
+    def __get_db_deleted_modules(self):
+        if self._db_deleted_modules is None:
+            self._db_deleted_modules = []
+        return self._db_deleted_modules
+    def __set_db_deleted_modules(self, deleted):
+        self._db_deleted_modules = deleted
+    db_deleted_modules = property(__get_db_deleted_modules, __set_db_deleted_modules)
+    def __get_db_modules_id_index(self):
+        if self._db_modules_id_index is None:
+            self._db_modules_id_index = {}
+        return self._db_modules_id_index
+    def __set_db_modules_id_index(self, index):
+        self._db_modules_id_index = index
+    db_modules_id_index = property(__get_db_modules_id_index, __set_db_modules_id_index)
     def db_get_module_by_id(self, key):
         return self.db_modules_id_index[key]
     def db_has_module_with_id(self, key):
-        return key in self.db_modules_id_index
+        return self._db_modules_id_index is not None and key in self._db_modules_id_index
     
     def __get_db_id(self):
         return self._db_id
@@ -5817,39 +6560,39 @@ class DBWorkflow(object):
     def __get_db_entity_type(self):
         return self._db_entity_type
     def __set_db_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
         self.is_dirty = True
     db_entity_type = property(__get_db_entity_type, __set_db_entity_type)
     def db_add_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
     def db_change_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
     def db_delete_entity_type(self, entity_type):
         self._db_entity_type = None
     
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
     def __get_db_version(self):
         return self._db_version
     def __set_db_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
         self.is_dirty = True
     db_version = property(__get_db_version, __set_db_version)
     def db_add_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_change_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_delete_version(self, version):
         self._db_version = None
     
@@ -5903,10 +6646,24 @@ class DBWorkflow(object):
             if self._db_connections[i].db_id == key:
                 return self._db_connections[i]
         return None
+    def __get_db_deleted_connections(self):
+        if self._db_deleted_connections is None:
+            self._db_deleted_connections = []
+        return self._db_deleted_connections
+    def __set_db_deleted_connections(self, deleted):
+        self._db_deleted_connections = deleted
+    db_deleted_connections = property(__get_db_deleted_connections, __set_db_deleted_connections)
+    def __get_db_connections_id_index(self):
+        if self._db_connections_id_index is None:
+            self._db_connections_id_index = {}
+        return self._db_connections_id_index
+    def __set_db_connections_id_index(self, index):
+        self._db_connections_id_index = index
+    db_connections_id_index = property(__get_db_connections_id_index, __set_db_connections_id_index)
     def db_get_connection_by_id(self, key):
         return self.db_connections_id_index[key]
     def db_has_connection_with_id(self, key):
-        return key in self.db_connections_id_index
+        return self._db_connections_id_index is not None and key in self._db_connections_id_index
     
     def __get_db_annotations(self):
         return self._db_annotations
@@ -5945,10 +6702,24 @@ class DBWorkflow(object):
             if self._db_annotations[i].db_id == key:
                 return self._db_annotations[i]
         return None
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
+    def __get_db_annotations_id_index(self):
+        if self._db_annotations_id_index is None:
+            self._db_annotations_id_index = {}
+        return self._db_annotations_id_index
+    def __set_db_annotations_id_index(self, index):
+        self._db_annotations_id_index = index
+    db_annotations_id_index = property(__get_db_annotations_id_index, __set_db_annotations_id_index)
     def db_get_annotation_by_id(self, key):
         return self.db_annotations_id_index[key]
     def db_has_annotation_with_id(self, key):
-        return key in self.db_annotations_id_index
+        return self._db_annotations_id_index is not None and key in self._db_annotations_id_index
     
     def __get_db_plugin_datas(self):
         return self._db_plugin_datas
@@ -5987,10 +6758,24 @@ class DBWorkflow(object):
             if self._db_plugin_datas[i].db_id == key:
                 return self._db_plugin_datas[i]
         return None
+    def __get_db_deleted_plugin_datas(self):
+        if self._db_deleted_plugin_datas is None:
+            self._db_deleted_plugin_datas = []
+        return self._db_deleted_plugin_datas
+    def __set_db_deleted_plugin_datas(self, deleted):
+        self._db_deleted_plugin_datas = deleted
+    db_deleted_plugin_datas = property(__get_db_deleted_plugin_datas, __set_db_deleted_plugin_datas)
+    def __get_db_plugin_datas_id_index(self):
+        if self._db_plugin_datas_id_index is None:
+            self._db_plugin_datas_id_index = {}
+        return self._db_plugin_datas_id_index
+    def __set_db_plugin_datas_id_index(self, index):
+        self._db_plugin_datas_id_index = index
+    db_plugin_datas_id_index = property(__get_db_plugin_datas_id_index, __set_db_plugin_datas_id_index)
     def db_get_plugin_data_by_id(self, key):
         return self.db_plugin_datas_id_index[key]
     def db_has_plugin_data_with_id(self, key):
-        return key in self.db_plugin_datas_id_index
+        return self._db_plugin_datas_id_index is not None and key in self._db_plugin_datas_id_index
     
     def __get_db_others(self):
         return self._db_others
@@ -6029,10 +6814,24 @@ class DBWorkflow(object):
             if self._db_others[i].db_id == key:
                 return self._db_others[i]
         return None
+    def __get_db_deleted_others(self):
+        if self._db_deleted_others is None:
+            self._db_deleted_others = []
+        return self._db_deleted_others
+    def __set_db_deleted_others(self, deleted):
+        self._db_deleted_others = deleted
+    db_deleted_others = property(__get_db_deleted_others, __set_db_deleted_others)
+    def __get_db_others_id_index(self):
+        if self._db_others_id_index is None:
+            self._db_others_id_index = {}
+        return self._db_others_id_index
+    def __set_db_others_id_index(self, index):
+        self._db_others_id_index = index
+    db_others_id_index = property(__get_db_others_id_index, __set_db_others_id_index)
     def db_get_other_by_id(self, key):
         return self.db_others_id_index[key]
     def db_has_other_with_id(self, key):
-        return key in self.db_others_id_index
+        return self._db_others_id_index is not None and key in self._db_others_id_index
     
     def __get_db_vistrail_id(self):
         return self._db_vistrail_id
@@ -6054,12 +6853,16 @@ class DBMashupAction(object):
 
     vtType = 'mashup_action'
 
+    __slots__ = ('_db_id', '_db_prevId', '_db_date', '_db_user',
+                 '_db_deleted_mashup', '_db_mashup', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, id=None, prevId=None, date=None, user=None, mashup=None):
         self._db_id = id
         self._db_prevId = prevId
         self._db_date = date
-        self._db_user = user
-        self.db_deleted_mashup = []
+        self._db_user = _intern(user)
+        self._db_deleted_mashup = None
         self._db_mashup = mashup
         self.is_dirty = True
         self.is_new = True
@@ -6143,9 +6946,10 @@ class DBMashupAction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_mashup)
+        if self._db_deleted_mashup is not None:
+            children.extend(self._db_deleted_mashup)
         if remove:
-            self.db_deleted_mashup = []
+            self._db_deleted_mashup = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6195,13 +6999,13 @@ class DBMashupAction(object):
     def __get_db_user(self):
         return self._db_user
     def __set_db_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
         self.is_dirty = True
     db_user = property(__get_db_user, __set_db_user)
     def db_add_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_change_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_delete_user(self, user):
         self._db_user = None
     
@@ -6219,6 +7023,13 @@ class DBMashupAction(object):
         if not self.is_new:
             self.db_deleted_mashup.append(self._db_mashup)
         self._db_mashup = None
+    def __get_db_deleted_mashup(self):
+        if self._db_deleted_mashup is None:
+            self._db_deleted_mashup = []
+        return self._db_deleted_mashup
+    def __set_db_deleted_mashup(self, deleted):
+        self._db_deleted_mashup = deleted
+    db_deleted_mashup = property(__get_db_deleted_mashup, __set_db_deleted_mashup)
     
     def getPrimaryKey(self):
         return self._db_id
@@ -6227,9 +7038,13 @@ class DBConfiguration(object):
 
     vtType = 'configuration'
 
+    __slots__ = ('_db_deleted_config_keys', '_db_config_keys_name_index',
+                 '_db_config_keys', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, config_keys=None):
-        self.db_deleted_config_keys = []
-        self.db_config_keys_name_index = {}
+        self._db_deleted_config_keys = None
+        self._db_config_keys_name_index = None
         if config_keys is None:
             self._db_config_keys = []
         else:
@@ -6259,7 +7074,8 @@ class DBConfiguration(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_config_keys_name_index = dict((v.db_name, v) for v in cp._db_config_keys)
+        if cp._db_config_keys:
+            cp._db_config_keys_name_index = dict((v.db_name, v) for v in cp._db_config_keys)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -6300,9 +7116,10 @@ class DBConfiguration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_config_keys)
+        if self._db_deleted_config_keys is not None:
+            children.extend(self._db_deleted_config_keys)
         if remove:
-            self.db_deleted_config_keys = []
+            self._db_deleted_config_keys = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6348,10 +7165,24 @@ class DBConfiguration(object):
             if self._db_config_keys[i].db_name == key:
                 return self._db_config_keys[i]
         return None
+    def __get_db_deleted_config_keys(self):
+        if self._db_deleted_config_keys is None:
+            self._db_deleted_config_keys = []
+        return self._db_deleted_config_keys
+    def __set_db_deleted_config_keys(self, deleted):
+        self._db_deleted_config_keys = deleted
+    db_deleted_config_keys = property(__get_db_deleted_config_keys, __set_db_deleted_config_keys)
+    def __get_db_config_keys_name_index(self):
+        if self._db_config_keys_name_index is None:
+            self._db_config_keys_name_index = {}
+        return self._db_config_keys_name_index
+    def __set_db_config_keys_name_index(self, index):
+        self._db_config_keys_name_index = index
+    db_config_keys_name_index = property(__get_db_config_keys_name_index, __set_db_config_keys_name_index)
     def db_get_config_key_by_name(self, key):
         return self.db_config_keys_name_index[key]
     def db_has_config_key_with_name(self, key):
-        return key in self.db_config_keys_name_index
+        return self._db_config_keys_name_index is not None and key in self._db_config_keys_name_index
     
 
 
@@ -6359,15 +7190,20 @@ class DBChange(object):
 
     vtType = 'change'
 
+    __slots__ = ('_db_deleted_data', '_db_data', '_db_id', '_db_what',
+                 '_db_oldObjId', '_db_newObjId', '_db_parentObjId',
+                 '_db_parentObjType', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, data=None, id=None, what=None, oldObjId=None, newObjId=None, parentObjId=None, parentObjType=None):
-        self.db_deleted_data = []
+        self._db_deleted_data = None
         self._db_data = data
         self._db_id = id
-        self._db_what = what
+        self._db_what = _intern(what)
         self._db_oldObjId = oldObjId
         self._db_newObjId = newObjId
         self._db_parentObjId = parentObjId
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
         self.is_dirty = True
         self.is_new = True
     
@@ -6528,9 +7364,10 @@ class DBChange(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_data)
+        if self._db_deleted_data is not None:
+            children.extend(self._db_deleted_data)
         if remove:
-            self.db_deleted_data = []
+            self._db_deleted_data = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6552,6 +7389,13 @@ class DBChange(object):
         if not self.is_new:
             self.db_deleted_data.append(self._db_data)
         self._db_data = None
+    def __get_db_deleted_data(self):
+        if self._db_deleted_data is None:
+            self._db_deleted_data = []
+        return self._db_deleted_data
+    def __set_db_deleted_data(self, deleted):
+        self._db_deleted_data = deleted
+    db_deleted_data = property(__get_db_deleted_data, __set_db_deleted_data)
     
     def __get_db_id(self):
         return self._db_id
@@ -6569,13 +7413,13 @@ class DBChange(object):
     def __get_db_what(self):
         return self._db_what
     def __set_db_what(self, what):
-        self._db_what = what
+        self._db_what = _intern(what)
         self.is_dirty = True
     db_what = property(__get_db_what, __set_db_what)
     def db_add_what(self, what):
-        self._db_what = what
+        self._db_what = _intern(what)
     def db_change_what(self, what):
-        self._db_what = what
+        self._db_what = _intern(what)
     def db_delete_what(self, what):
         self._db_what = None
     
@@ -6621,13 +7465,13 @@ class DBChange(object):
     def __get_db_parentObjType(self):
         return self._db_parentObjType
     def __set_db_parentObjType(self, parentObjType):
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
         self.is_dirty = True
     db_parentObjType = property(__get_db_parentObjType, __set_db_parentObjType)
     def db_add_parentObjType(self, parentObjType):
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
     def db_change_parentObjType(self, parentObjType):
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
     def db_delete_parentObjType(self, parentObjType):
         self._db_parentObjType = None
     
@@ -6638,17 +7482,24 @@ class DBPackage(object):
 
     vtType = 'package'
 
+    __slots__ = ('_db_id', '_db_name', '_db_identifier', '_db_codepath',
+                 '_db_load_configuration', '_db_version', '_db_description',
+                 '_db_deleted_module_descriptors',
+                 '_db_module_descriptors_id_index',
+                 '_db_module_descriptors_name_index', '_db_module_descriptors',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, name=None, identifier=None, codepath=None, load_configuration=None, version=None, description=None, module_descriptors=None):
         self._db_id = id
-        self._db_name = name
+        self._db_name = _intern(name)
         self._db_identifier = identifier
         self._db_codepath = codepath
         self._db_load_configuration = load_configuration
-        self._db_version = version
+        self._db_version = _intern(version)
         self._db_description = description
-        self.db_deleted_module_descriptors = []
-        self.db_module_descriptors_id_index = {}
-        self.db_module_descriptors_name_index = {}
+        self._db_deleted_module_descriptors = None
+        self._db_module_descriptors_id_index = None
+        self._db_module_descriptors_name_index = None
         if module_descriptors is None:
             self._db_module_descriptors = []
         else:
@@ -6685,8 +7536,9 @@ class DBPackage(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_module_descriptors_id_index = dict((v.db_id, v) for v in cp._db_module_descriptors)
-        cp.db_module_descriptors_name_index = dict(((v.db_name,v.db_namespace,v.db_version), v) for v in cp._db_module_descriptors)
+        if cp._db_module_descriptors:
+            cp._db_module_descriptors_id_index = dict((v.db_id, v) for v in cp._db_module_descriptors)
+            cp._db_module_descriptors_name_index = dict(((v.db_name,v.db_namespace,v.db_version), v) for v in cp._db_module_descriptors)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -6762,9 +7614,10 @@ class DBPackage(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_module_descriptors)
+        if self._db_deleted_module_descriptors is not None:
+            children.extend(self._db_deleted_module_descriptors)
         if remove:
-            self.db_deleted_module_descriptors = []
+            self._db_deleted_module_descriptors = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -6789,13 +7642,13 @@ class DBPackage(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -6841,13 +7694,13 @@ class DBPackage(object):
     def __get_db_version(self):
         return self._db_version
     def __set_db_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
         self.is_dirty = True
     db_version = property(__get_db_version, __set_db_version)
     def db_add_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_change_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_delete_version(self, version):
         self._db_version = None
     
@@ -6904,14 +7757,35 @@ class DBPackage(object):
             if self._db_module_descriptors[i].db_id == key:
                 return self._db_module_descriptors[i]
         return None
+    def __get_db_deleted_module_descriptors(self):
+        if self._db_deleted_module_descriptors is None:
+            self._db_deleted_module_descriptors = []
+        return self._db_deleted_module_descriptors
+    def __set_db_deleted_module_descriptors(self, deleted):
+        self._db_deleted_module_descriptors = deleted
+    db_deleted_module_descriptors = property(__get_db_deleted_module_descriptors, __set_db_deleted_module_descriptors)
+    def __get_db_module_descriptors_id_index(self):
+        if self._db_module_descriptors_id_index is None:
+            self._db_module_descriptors_id_index = {}
+        return self._db_module_descriptors_id_index
+    def __set_db_module_descriptors_id_index(self, index):
+        self._db_module_descriptors_id_index = index
+    db_module_descriptors_id_index = property(__get_db_module_descriptors_id_index, __set_db_module_descriptors_id_index)
+    def __get_db_module_descriptors_name_index(self):
+        if self._db_module_descriptors_name_index is None:
+            self._db_module_descriptors_name_index = {}
+        return self._db_module_descriptors_name_index
+    def __set_db_module_descriptors_name_index(self, index):
+        self._db_module_descriptors_name_index = index
+    db_module_descriptors_name_index = property(__get_db_module_descriptors_name_index, __set_db_module_descriptors_name_index)
     def db_get_module_descriptor_by_id(self, key):
         return self.db_module_descriptors_id_index[key]
     def db_has_module_descriptor_with_id(self, key):
-        return key in self.db_module_descriptors_id_index
+        return self._db_module_descriptors_id_index is not None and key in self._db_module_descriptors_id_index
     def db_get_module_descriptor_by_name(self, key):
         return self.db_module_descriptors_name_index[key]
     def db_has_module_descriptor_with_name(self, key):
-        return key in self.db_module_descriptors_name_index
+        return self._db_module_descriptors_name_index is not None and key in self._db_module_descriptors_name_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -6920,12 +7794,17 @@ class DBLoopExec(object):
 
     vtType = 'loop_exec'
 
+    __slots__ = ('_db_id', '_db_ts_start', '_db_ts_end',
+                 '_db_deleted_loop_iterations', '_db_loop_iterations_id_index',
+                 '_db_loop_iterations', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, ts_start=None, ts_end=None, loop_iterations=None):
         self._db_id = id
         self._db_ts_start = ts_start
         self._db_ts_end = ts_end
-        self.db_deleted_loop_iterations = []
-        self.db_loop_iterations_id_index = {}
+        self._db_deleted_loop_iterations = None
+        self._db_loop_iterations_id_index = None
         if loop_iterations is None:
             self._db_loop_iterations = []
         else:
@@ -6957,7 +7836,8 @@ class DBLoopExec(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_loop_iterations_id_index = dict((v.db_id, v) for v in cp._db_loop_iterations)
+        if cp._db_loop_iterations:
+            cp._db_loop_iterations_id_index = dict((v.db_id, v) for v in cp._db_loop_iterations)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -7013,9 +7893,10 @@ class DBLoopExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_loop_iterations)
+        if self._db_deleted_loop_iterations is not None:
+            children.extend(self._db_deleted_loop_iterations)
         if remove:
-            self.db_deleted_loop_iterations = []
+            self._db_deleted_loop_iterations = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7100,10 +7981,24 @@ class DBLoopExec(object):
             if self._db_loop_iterations[i].db_id == key:
                 return self._db_loop_iterations[i]
         return None
+    def __get_db_deleted_loop_iterations(self):
+        if self._db_deleted_loop_iterations is None:
+            self._db_deleted_loop_iterations = []
+        return self._db_deleted_loop_iterations
+    def __set_db_deleted_loop_iterations(self, deleted):
+        self._db_deleted_loop_iterations = deleted
+    db_deleted_loop_iterations = property(__get_db_deleted_loop_iterations, __set_db_deleted_loop_iterations)
+    def __get_db_loop_iterations_id_index(self):
+        if self._db_loop_iterations_id_index is None:
+            self._db_loop_iterations_id_index = {}
+        return self._db_loop_iterations_id_index
+    def __set_db_loop_iterations_id_index(self, index):
+        self._db_loop_iterations_id_index = index
+    db_loop_iterations_id_index = property(__get_db_loop_iterations_id_index, __set_db_loop_iterations_id_index)
     def db_get_loop_iteration_by_id(self, key):
         return self.db_loop_iterations_id_index[key]
     def db_has_loop_iteration_with_id(self, key):
-        return key in self.db_loop_iterations_id_index
+        return self._db_loop_iterations_id_index is not None and key in self._db_loop_iterations_id_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -7112,11 +8007,15 @@ class DBConnection(object):
 
     vtType = 'connection'
 
+    __slots__ = ('_db_id', '_db_deleted_ports', '_db_ports_id_index',
+                 '_db_ports_type_index', '_db_ports', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, id=None, ports=None):
         self._db_id = id
-        self.db_deleted_ports = []
-        self.db_ports_id_index = {}
-        self.db_ports_type_index = {}
+        self._db_deleted_ports = None
+        self._db_ports_id_index = None
+        self._db_ports_type_index = None
         if ports is None:
             self._db_ports = []
         else:
@@ -7147,8 +8046,9 @@ class DBConnection(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_ports_id_index = dict((v.db_id, v) for v in cp._db_ports)
-        cp.db_ports_type_index = dict((v.db_type, v) for v in cp._db_ports)
+        if cp._db_ports:
+            cp._db_ports_id_index = dict((v.db_id, v) for v in cp._db_ports)
+            cp._db_ports_type_index = dict((v.db_type, v) for v in cp._db_ports)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -7194,9 +8094,10 @@ class DBConnection(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_ports)
+        if self._db_deleted_ports is not None:
+            children.extend(self._db_deleted_ports)
         if remove:
-            self.db_deleted_ports = []
+            self._db_deleted_ports = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7258,14 +8159,35 @@ class DBConnection(object):
             if self._db_ports[i].db_id == key:
                 return self._db_ports[i]
         return None
+    def __get_db_deleted_ports(self):
+        if self._db_deleted_ports is None:
+            self._db_deleted_ports = []
+        return self._db_deleted_ports
+    def __set_db_deleted_ports(self, deleted):
+        self._db_deleted_ports = deleted
+    db_deleted_ports = property(__get_db_deleted_ports, __set_db_deleted_ports)
+    def __get_db_ports_id_index(self):
+        if self._db_ports_id_index is None:
+            self._db_ports_id_index = {}
+        return self._db_ports_id_index
+    def __set_db_ports_id_index(self, index):
+        self._db_ports_id_index = index
+    db_ports_id_index = property(__get_db_ports_id_index, __set_db_ports_id_index)
+    def __get_db_ports_type_index(self):
+        if self._db_ports_type_index is None:
+            self._db_ports_type_index = {}
+        return self._db_ports_type_index
+    def __set_db_ports_type_index(self, index):
+        self._db_ports_type_index = index
+    db_ports_type_index = property(__get_db_ports_type_index, __set_db_ports_type_index)
     def db_get_port_by_id(self, key):
         return self.db_ports_id_index[key]
     def db_has_port_with_id(self, key):
-        return key in self.db_ports_id_index
+        return self._db_ports_id_index is not None and key in self._db_ports_id_index
     def db_get_port_by_type(self, key):
         return self.db_ports_type_index[key]
     def db_has_port_with_type(self, key):
-        return key in self.db_ports_type_index
+        return self._db_ports_type_index is not None and key in self._db_ports_type_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -7274,6 +8196,8 @@ class DBConfigBool(object):
 
     vtType = 'config_bool'
 
+    __slots__ = ('_db_value', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -7344,9 +8268,16 @@ class DBAction(object):
 
     vtType = 'action'
 
+    __slots__ = ('_db_deleted_operations', '_db_operations_id_index',
+                 '_db_operations', '_db_id', '_db_prevId', '_db_date',
+                 '_db_session', '_db_user', '_db_deleted_annotations',
+                 '_db_annotations_id_index', '_db_annotations_key_index',
+                 '_db_annotations', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, operations=None, id=None, prevId=None, date=None, session=None, user=None, annotations=None):
-        self.db_deleted_operations = []
-        self.db_operations_id_index = {}
+        self._db_deleted_operations = None
+        self._db_operations_id_index = None
         if operations is None:
             self._db_operations = []
         else:
@@ -7357,10 +8288,10 @@ class DBAction(object):
         self._db_prevId = prevId
         self._db_date = date
         self._db_session = session
-        self._db_user = user
-        self.db_deleted_annotations = []
-        self.db_annotations_id_index = {}
-        self.db_annotations_key_index = {}
+        self._db_user = _intern(user)
+        self._db_deleted_annotations = None
+        self._db_annotations_id_index = None
+        self._db_annotations_key_index = None
         if annotations is None:
             self._db_annotations = []
         else:
@@ -7401,9 +8332,11 @@ class DBAction(object):
                 cp._db_prevId = id_remap[('action', self._db_prevId)]
         
         # recreate indices and set flags
-        cp.db_operations_id_index = dict((v.db_id, v) for v in cp._db_operations)
-        cp.db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
-        cp.db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
+        if cp._db_operations:
+            cp._db_operations_id_index = dict((v.db_id, v) for v in cp._db_operations)
+        if cp._db_annotations:
+            cp._db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
+            cp._db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -7499,11 +8432,13 @@ class DBAction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_operations)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_operations is not None:
+            children.extend(self._db_deleted_operations)
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_operations = []
+            self._db_deleted_annotations = None
+            self._db_deleted_operations = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7552,10 +8487,24 @@ class DBAction(object):
             if self._db_operations[i].db_id == key:
                 return self._db_operations[i]
         return None
+    def __get_db_deleted_operations(self):
+        if self._db_deleted_operations is None:
+            self._db_deleted_operations = []
+        return self._db_deleted_operations
+    def __set_db_deleted_operations(self, deleted):
+        self._db_deleted_operations = deleted
+    db_deleted_operations = property(__get_db_deleted_operations, __set_db_deleted_operations)
+    def __get_db_operations_id_index(self):
+        if self._db_operations_id_index is None:
+            self._db_operations_id_index = {}
+        return self._db_operations_id_index
+    def __set_db_operations_id_index(self, index):
+        self._db_operations_id_index = index
+    db_operations_id_index = property(__get_db_operations_id_index, __set_db_operations_id_index)
     def db_get_operation_by_id(self, key):
         return self.db_operations_id_index[key]
     def db_has_operation_with_id(self, key):
-        return key in self.db_operations_id_index
+        return self._db_operations_id_index is not None and key in self._db_operations_id_index
     
     def __get_db_id(self):
         return self._db_id
@@ -7612,13 +8561,13 @@ class DBAction(object):
     def __get_db_user(self):
         return self._db_user
     def __set_db_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
         self.is_dirty = True
     db_user = property(__get_db_user, __set_db_user)
     def db_add_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_change_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_delete_user(self, user):
         self._db_user = None
     
@@ -7662,14 +8611,35 @@ class DBAction(object):
             if self._db_annotations[i].db_id == key:
                 return self._db_annotations[i]
         return None
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
+    def __get_db_annotations_id_index(self):
+        if self._db_annotations_id_index is None:
+            self._db_annotations_id_index = {}
+        return self._db_annotations_id_index
+    def __set_db_annotations_id_index(self, index):
+        self._db_annotations_id_index = index
+    db_annotations_id_index = property(__get_db_annotations_id_index, __set_db_annotations_id_index)
+    def __get_db_annotations_key_index(self):
+        if self._db_annotations_key_index is None:
+            self._db_annotations_key_index = {}
+        return self._db_annotations_key_index
+    def __set_db_annotations_key_index(self, index):
+        self._db_annotations_key_index = index
+    db_annotations_key_index = property(__get_db_annotations_key_index, __set_db_annotations_key_index)
     def db_get_annotation_by_id(self, key):
         return self.db_annotations_id_index[key]
     def db_has_annotation_with_id(self, key):
-        return key in self.db_annotations_id_index
+        return self._db_annotations_id_index is not None and key in self._db_annotations_id_index
     def db_get_annotation_by_key(self, key):
         return self.db_annotations_key_index[key]
     def db_has_annotation_with_key(self, key):
-        return key in self.db_annotations_key_index
+        return self._db_annotations_key_index is not None and key in self._db_annotations_key_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -7678,9 +8648,12 @@ class DBStartupPackage(object):
 
     vtType = 'startup_package'
 
+    __slots__ = ('_db_name', '_db_deleted_configuration', '_db_configuration',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, name=None, configuration=None):
         self._db_name = name
-        self.db_deleted_configuration = []
+        self._db_deleted_configuration = None
         self._db_configuration = configuration
         self.is_dirty = True
         self.is_new = True
@@ -7744,9 +8717,10 @@ class DBStartupPackage(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_configuration)
+        if self._db_deleted_configuration is not None:
+            children.extend(self._db_deleted_configuration)
         if remove:
-            self.db_deleted_configuration = []
+            self._db_deleted_configuration = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -7781,6 +8755,13 @@ class DBStartupPackage(object):
         if not self.is_new:
             self.db_deleted_configuration.append(self._db_configuration)
         self._db_configuration = None
+    def __get_db_deleted_configuration(self):
+        if self._db_deleted_configuration is None:
+            self._db_deleted_configuration = []
+        return self._db_deleted_configuration
+    def __set_db_deleted_configuration(self, deleted):
+        self._db_deleted_configuration = deleted
+    db_deleted_configuration = property(__get_db_deleted_configuration, __set_db_deleted_configuration)
     
 
 
@@ -7788,6 +8769,8 @@ class DBConfigInt(object):
 
     vtType = 'config_int'
 
+    __slots__ = ('_db_value', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -7858,6 +8841,8 @@ class DBOpmProcessIdEffect(object):
 
     vtType = 'opm_process_id_effect'
 
+    __slots__ = ('_db_id', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -7930,6 +8915,9 @@ class DBRefProvPlan(object):
 
     vtType = 'ref_prov_plan'
 
+    __slots__ = ('_db_prov_ref', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -8002,16 +8990,21 @@ class DBOpmAccounts(object):
 
     vtType = 'opm_accounts'
 
+    __slots__ = ('_db_deleted_accounts', '_db_accounts_id_index',
+                 '_db_accounts', '_db_deleted_opm_overlapss',
+                 '_db_opm_overlapss', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, accounts=None, opm_overlapss=None):
-        self.db_deleted_accounts = []
-        self.db_accounts_id_index = {}
+        self._db_deleted_accounts = None
+        self._db_accounts_id_index = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
             for v in self._db_accounts:
                 self.db_accounts_id_index[v.db_id] = v
-        self.db_deleted_opm_overlapss = []
+        self._db_deleted_opm_overlapss = None
         if opm_overlapss is None:
             self._db_opm_overlapss = []
         else:
@@ -8043,7 +9036,8 @@ class DBOpmAccounts(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_accounts_id_index = dict((v.db_id, v) for v in cp._db_accounts)
+        if cp._db_accounts:
+            cp._db_accounts_id_index = dict((v.db_id, v) for v in cp._db_accounts)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -8102,11 +9096,13 @@ class DBOpmAccounts(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_overlapss)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_opm_overlapss is not None:
+            children.extend(self._db_deleted_opm_overlapss)
         if remove:
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_overlapss = []
+            self._db_deleted_accounts = None
+            self._db_deleted_opm_overlapss = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8155,10 +9151,24 @@ class DBOpmAccounts(object):
             if self._db_accounts[i].db_id == key:
                 return self._db_accounts[i]
         return None
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
+    def __get_db_accounts_id_index(self):
+        if self._db_accounts_id_index is None:
+            self._db_accounts_id_index = {}
+        return self._db_accounts_id_index
+    def __set_db_accounts_id_index(self, index):
+        self._db_accounts_id_index = index
+    db_accounts_id_index = property(__get_db_accounts_id_index, __set_db_accounts_id_index)
     def db_get_account_by_id(self, key):
         return self.db_accounts_id_index[key]
     def db_has_account_with_id(self, key):
-        return key in self.db_accounts_id_index
+        return self._db_accounts_id_index is not None and key in self._db_accounts_id_index
     
     def __get_db_opm_overlapss(self):
         return self._db_opm_overlapss
@@ -8179,6 +9189,13 @@ class DBOpmAccounts(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_opm_overlaps(self, key):
         return None
+    def __get_db_deleted_opm_overlapss(self):
+        if self._db_deleted_opm_overlapss is None:
+            self._db_deleted_opm_overlapss = []
+        return self._db_deleted_opm_overlapss
+    def __set_db_deleted_opm_overlapss(self, deleted):
+        self._db_deleted_opm_overlapss = deleted
+    db_deleted_opm_overlapss = property(__get_db_deleted_opm_overlapss, __set_db_deleted_opm_overlapss)
     
 
 
@@ -8186,6 +9203,9 @@ class DBRefProvAgent(object):
 
     vtType = 'ref_prov_agent'
 
+    __slots__ = ('_db_prov_ref', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -8258,15 +9278,21 @@ class DBPortSpec(object):
 
     vtType = 'portSpec'
 
+    __slots__ = ('_db_id', '_db_name', '_db_type', '_db_optional', '_db_depth',
+                 '_db_sort_key', '_db_deleted_portSpecItems',
+                 '_db_portSpecItems_id_index', '_db_portSpecItems',
+                 '_db_min_conns', '_db_max_conns', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, id=None, name=None, type=None, optional=None, depth=None, sort_key=None, portSpecItems=None, min_conns=None, max_conns=None):
         self._db_id = id
-        self._db_name = name
-        self._db_type = type
+        self._db_name = _intern(name)
+        self._db_type = _intern(type)
         self._db_optional = optional
         self._db_depth = depth
         self._db_sort_key = sort_key
-        self.db_deleted_portSpecItems = []
-        self.db_portSpecItems_id_index = {}
+        self._db_deleted_portSpecItems = None
+        self._db_portSpecItems_id_index = None
         if portSpecItems is None:
             self._db_portSpecItems = []
         else:
@@ -8305,7 +9331,8 @@ class DBPortSpec(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_portSpecItems_id_index = dict((v.db_id, v) for v in cp._db_portSpecItems)
+        if cp._db_portSpecItems:
+            cp._db_portSpecItems_id_index = dict((v.db_id, v) for v in cp._db_portSpecItems)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -8382,9 +9409,10 @@ class DBPortSpec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_portSpecItems)
+        if self._db_deleted_portSpecItems is not None:
+            children.extend(self._db_deleted_portSpecItems)
         if remove:
-            self.db_deleted_portSpecItems = []
+            self._db_deleted_portSpecItems = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8409,26 +9437,26 @@ class DBPortSpec(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
     def __get_db_type(self):
         return self._db_type
     def __set_db_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
         self.is_dirty = True
     db_type = property(__get_db_type, __set_db_type)
     def db_add_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
     def db_change_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
     def db_delete_type(self, type):
         self._db_type = None
     
@@ -8508,10 +9536,24 @@ class DBPortSpec(object):
             if self._db_portSpecItems[i].db_id == key:
                 return self._db_portSpecItems[i]
         return None
+    def __get_db_deleted_portSpecItems(self):
+        if self._db_deleted_portSpecItems is None:
+            self._db_deleted_portSpecItems = []
+        return self._db_deleted_portSpecItems
+    def __set_db_deleted_portSpecItems(self, deleted):
+        self._db_deleted_portSpecItems = deleted
+    db_deleted_portSpecItems = property(__get_db_deleted_portSpecItems, __set_db_deleted_portSpecItems)
+    def __get_db_portSpecItems_id_index(self):
+        if self._db_portSpecItems_id_index is None:
+            self._db_portSpecItems_id_index = {}
+        return self._db_portSpecItems_id_index
+    def __set_db_portSpecItems_id_index(self, index):
+        self._db_portSpecItems_id_index = index
+    db_portSpecItems_id_index = property(__get_db_portSpecItems_id_index, __set_db_portSpecItems_id_index)
     def db_get_portSpecItem_by_id(self, key):
         return self.db_portSpecItems_id_index[key]
     def db_has_portSpecItem_with_id(self, key):
-        return key in self.db_portSpecItems_id_index
+        return self._db_portSpecItems_id_index is not None and key in self._db_portSpecItems_id_index
     
     def __get_db_min_conns(self):
         return self._db_min_conns
@@ -8546,9 +9588,13 @@ class DBEnabledPackages(object):
 
     vtType = 'enabled_packages'
 
+    __slots__ = ('_db_deleted_packages', '_db_packages_name_index',
+                 '_db_packages', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, packages=None):
-        self.db_deleted_packages = []
-        self.db_packages_name_index = {}
+        self._db_deleted_packages = None
+        self._db_packages_name_index = None
         if packages is None:
             self._db_packages = []
         else:
@@ -8578,7 +9624,8 @@ class DBEnabledPackages(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_packages_name_index = dict((v.db_name, v) for v in cp._db_packages)
+        if cp._db_packages:
+            cp._db_packages_name_index = dict((v.db_name, v) for v in cp._db_packages)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -8619,9 +9666,10 @@ class DBEnabledPackages(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_packages)
+        if self._db_deleted_packages is not None:
+            children.extend(self._db_deleted_packages)
         if remove:
-            self.db_deleted_packages = []
+            self._db_deleted_packages = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8651,10 +9699,24 @@ class DBEnabledPackages(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_package(self, key):
         return None
+    def __get_db_deleted_packages(self):
+        if self._db_deleted_packages is None:
+            self._db_deleted_packages = []
+        return self._db_deleted_packages
+    def __set_db_deleted_packages(self, deleted):
+        self._db_deleted_packages = deleted
+    db_deleted_packages = property(__get_db_deleted_packages, __set_db_deleted_packages)
+    def __get_db_packages_name_index(self):
+        if self._db_packages_name_index is None:
+            self._db_packages_name_index = {}
+        return self._db_packages_name_index
+    def __set_db_packages_name_index(self, index):
+        self._db_packages_name_index = index
+    db_packages_name_index = property(__get_db_packages_name_index, __set_db_packages_name_index)
     def db_get_package_by_name(self, key):
         return self.db_packages_name_index[key]
     def db_has_package_with_name(self, key):
-        return key in self.db_packages_name_index
+        return self._db_packages_name_index is not None and key in self._db_packages_name_index
     
 
 
@@ -8662,11 +9724,15 @@ class DBOpmArtifact(object):
 
     vtType = 'opm_artifact'
 
+    __slots__ = ('_db_id', '_db_deleted_value', '_db_value',
+                 '_db_deleted_accounts', '_db_accounts', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, id=None, value=None, accounts=None):
         self._db_id = id
-        self.db_deleted_value = []
+        self._db_deleted_value = None
         self._db_value = value
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
@@ -8755,11 +9821,13 @@ class DBOpmArtifact(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
-        children.extend(self.db_deleted_accounts)
+        if self._db_deleted_value is not None:
+            children.extend(self._db_deleted_value)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
         if remove:
-            self.db_deleted_value = []
-            self.db_deleted_accounts = []
+            self._db_deleted_value = None
+            self._db_deleted_accounts = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8797,6 +9865,13 @@ class DBOpmArtifact(object):
         if not self.is_new:
             self.db_deleted_value.append(self._db_value)
         self._db_value = None
+    def __get_db_deleted_value(self):
+        if self._db_deleted_value is None:
+            self._db_deleted_value = []
+        return self._db_deleted_value
+    def __set_db_deleted_value(self, deleted):
+        self._db_deleted_value = deleted
+    db_deleted_value = property(__get_db_deleted_value, __set_db_deleted_value)
     
     def __get_db_accounts(self):
         return self._db_accounts
@@ -8817,6 +9892,13 @@ class DBOpmArtifact(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_account(self, key):
         return None
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     
     def getPrimaryKey(self):
         return self._db_id
@@ -8825,14 +9907,20 @@ class DBLog(object):
 
     vtType = 'log'
 
+    __slots__ = ('_db_id', '_db_entity_type', '_db_version', '_db_name',
+                 '_db_last_modified', '_db_deleted_workflow_execs',
+                 '_db_workflow_execs_id_index', '_db_workflow_execs',
+                 '_db_vistrail_id', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, entity_type=None, version=None, name=None, last_modified=None, workflow_execs=None, vistrail_id=None):
         self._db_id = id
-        self._db_entity_type = entity_type
-        self._db_version = version
-        self._db_name = name
+        self._db_entity_type = _intern(entity_type)
+        self._db_version = _intern(version)
+        self._db_name = _intern(name)
         self._db_last_modified = last_modified
-        self.db_deleted_workflow_execs = []
-        self.db_workflow_execs_id_index = {}
+        self._db_deleted_workflow_execs = None
+        self._db_workflow_execs_id_index = None
         if workflow_execs is None:
             self._db_workflow_execs = []
         else:
@@ -8870,7 +9958,8 @@ class DBLog(object):
                 cp._db_vistrail_id = id_remap[('vistrail', self._db_vistrail_id)]
         
         # recreate indices and set flags
-        cp.db_workflow_execs_id_index = dict((v.db_id, v) for v in cp._db_workflow_execs)
+        if cp._db_workflow_execs:
+            cp._db_workflow_execs_id_index = dict((v.db_id, v) for v in cp._db_workflow_execs)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -8941,9 +10030,10 @@ class DBLog(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_workflow_execs)
+        if self._db_deleted_workflow_execs is not None:
+            children.extend(self._db_deleted_workflow_execs)
         if remove:
-            self.db_deleted_workflow_execs = []
+            self._db_deleted_workflow_execs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -8968,39 +10058,39 @@ class DBLog(object):
     def __get_db_entity_type(self):
         return self._db_entity_type
     def __set_db_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
         self.is_dirty = True
     db_entity_type = property(__get_db_entity_type, __set_db_entity_type)
     def db_add_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
     def db_change_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
     def db_delete_entity_type(self, entity_type):
         self._db_entity_type = None
     
     def __get_db_version(self):
         return self._db_version
     def __set_db_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
         self.is_dirty = True
     db_version = property(__get_db_version, __set_db_version)
     def db_add_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_change_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_delete_version(self, version):
         self._db_version = None
     
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -9054,10 +10144,24 @@ class DBLog(object):
             if self._db_workflow_execs[i].db_id == key:
                 return self._db_workflow_execs[i]
         return None
+    def __get_db_deleted_workflow_execs(self):
+        if self._db_deleted_workflow_execs is None:
+            self._db_deleted_workflow_execs = []
+        return self._db_deleted_workflow_execs
+    def __set_db_deleted_workflow_execs(self, deleted):
+        self._db_deleted_workflow_execs = deleted
+    db_deleted_workflow_execs = property(__get_db_deleted_workflow_execs, __set_db_deleted_workflow_execs)
+    def __get_db_workflow_execs_id_index(self):
+        if self._db_workflow_execs_id_index is None:
+            self._db_workflow_execs_id_index = {}
+        return self._db_workflow_execs_id_index
+    def __set_db_workflow_execs_id_index(self, index):
+        self._db_workflow_execs_id_index = index
+    db_workflow_execs_id_index = property(__get_db_workflow_execs_id_index, __set_db_workflow_execs_id_index)
     def db_get_workflow_exec_by_id(self, key):
         return self.db_workflow_execs_id_index[key]
     def db_has_workflow_exec_with_id(self, key):
-        return key in self.db_workflow_execs_id_index
+        return self._db_workflow_execs_id_index is not None and key in self._db_workflow_execs_id_index
     
     def __get_db_vistrail_id(self):
         return self._db_vistrail_id
@@ -9079,9 +10183,14 @@ class DBLoopIteration(object):
 
     vtType = 'loop_iteration'
 
+    __slots__ = ('_db_deleted_item_execs', '_db_item_execs_id_index',
+                 '_db_item_execs', '_db_id', '_db_ts_start', '_db_ts_end',
+                 '_db_iteration', '_db_completed', '_db_error', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, item_execs=None, id=None, ts_start=None, ts_end=None, iteration=None, completed=None, error=None):
-        self.db_deleted_item_execs = []
-        self.db_item_execs_id_index = {}
+        self._db_deleted_item_execs = None
+        self._db_item_execs_id_index = None
         if item_execs is None:
             self._db_item_execs = []
         else:
@@ -9122,7 +10231,8 @@ class DBLoopIteration(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_item_execs_id_index = dict((v.db_id, v) for v in cp._db_item_execs)
+        if cp._db_item_execs:
+            cp._db_item_execs_id_index = dict((v.db_id, v) for v in cp._db_item_execs)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -9205,9 +10315,10 @@ class DBLoopIteration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_item_execs)
+        if self._db_deleted_item_execs is not None:
+            children.extend(self._db_deleted_item_execs)
         if remove:
-            self.db_deleted_item_execs = []
+            self._db_deleted_item_execs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -9253,10 +10364,24 @@ class DBLoopIteration(object):
             if self._db_item_execs[i].db_id == key:
                 return self._db_item_execs[i]
         return None
+    def __get_db_deleted_item_execs(self):
+        if self._db_deleted_item_execs is None:
+            self._db_deleted_item_execs = []
+        return self._db_deleted_item_execs
+    def __set_db_deleted_item_execs(self, deleted):
+        self._db_deleted_item_execs = deleted
+    db_deleted_item_execs = property(__get_db_deleted_item_execs, __set_db_deleted_item_execs)
+    def __get_db_item_execs_id_index(self):
+        if self._db_item_execs_id_index is None:
+            self._db_item_execs_id_index = {}
+        return self._db_item_execs_id_index
+    def __set_db_item_execs_id_index(self, index):
+        self._db_item_execs_id_index = index
+    db_item_execs_id_index = property(__get_db_item_execs_id_index, __set_db_item_execs_id_index)
     def db_get_item_exec_by_id(self, key):
         return self.db_item_execs_id_index[key]
     def db_has_item_exec_with_id(self, key):
-        return key in self.db_item_execs_id_index
+        return self._db_item_execs_id_index is not None and key in self._db_item_execs_id_index
     
     def __get_db_id(self):
         return self._db_id
@@ -9343,6 +10468,8 @@ class DBOpmProcessIdCause(object):
 
     vtType = 'opm_process_id_cause'
 
+    __slots__ = ('_db_id', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -9415,9 +10542,13 @@ class DBOpmArtifacts(object):
 
     vtType = 'opm_artifacts'
 
+    __slots__ = ('_db_deleted_artifacts', '_db_artifacts_id_index',
+                 '_db_artifacts', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, artifacts=None):
-        self.db_deleted_artifacts = []
-        self.db_artifacts_id_index = {}
+        self._db_deleted_artifacts = None
+        self._db_artifacts_id_index = None
         if artifacts is None:
             self._db_artifacts = []
         else:
@@ -9447,7 +10578,8 @@ class DBOpmArtifacts(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_artifacts_id_index = dict((v.db_id, v) for v in cp._db_artifacts)
+        if cp._db_artifacts:
+            cp._db_artifacts_id_index = dict((v.db_id, v) for v in cp._db_artifacts)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -9488,9 +10620,10 @@ class DBOpmArtifacts(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_artifacts)
+        if self._db_deleted_artifacts is not None:
+            children.extend(self._db_deleted_artifacts)
         if remove:
-            self.db_deleted_artifacts = []
+            self._db_deleted_artifacts = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -9536,10 +10669,24 @@ class DBOpmArtifacts(object):
             if self._db_artifacts[i].db_id == key:
                 return self._db_artifacts[i]
         return None
+    def __get_db_deleted_artifacts(self):
+        if self._db_deleted_artifacts is None:
+            self._db_deleted_artifacts = []
+        return self._db_deleted_artifacts
+    def __set_db_deleted_artifacts(self, deleted):
+        self._db_deleted_artifacts = deleted
+    db_deleted_artifacts = property(__get_db_deleted_artifacts, __set_db_deleted_artifacts)
+    def __get_db_artifacts_id_index(self):
+        if self._db_artifacts_id_index is None:
+            self._db_artifacts_id_index = {}
+        return self._db_artifacts_id_index
+    def __set_db_artifacts_id_index(self, index):
+        self._db_artifacts_id_index = index
+    db_artifacts_id_index = property(__get_db_artifacts_id_index, __set_db_artifacts_id_index)
     def db_get_artifact_by_id(self, key):
         return self.db_artifacts_id_index[key]
     def db_has_artifact_with_id(self, key):
-        return key in self.db_artifacts_id_index
+        return self._db_artifacts_id_index is not None and key in self._db_artifacts_id_index
     
 
 
@@ -9547,10 +10694,14 @@ class DBPEParameter(object):
 
     vtType = 'pe_parameter'
 
+    __slots__ = ('_db_id', '_db_pos', '_db_interpolator', '_db_value',
+                 '_db_dimension', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, pos=None, interpolator=None, value=None, dimension=None):
         self._db_id = id
         self._db_pos = pos
-        self._db_interpolator = interpolator
+        self._db_interpolator = _intern(interpolator)
         self._db_value = value
         self._db_dimension = dimension
         self.is_dirty = True
@@ -9655,13 +10806,13 @@ class DBPEParameter(object):
     def __get_db_interpolator(self):
         return self._db_interpolator
     def __set_db_interpolator(self, interpolator):
-        self._db_interpolator = interpolator
+        self._db_interpolator = _intern(interpolator)
         self.is_dirty = True
     db_interpolator = property(__get_db_interpolator, __set_db_interpolator)
     def db_add_interpolator(self, interpolator):
-        self._db_interpolator = interpolator
+        self._db_interpolator = _intern(interpolator)
     def db_change_interpolator(self, interpolator):
-        self._db_interpolator = interpolator
+        self._db_interpolator = _intern(interpolator)
     def db_delete_interpolator(self, interpolator):
         self._db_interpolator = None
     
@@ -9698,9 +10849,19 @@ class DBWorkflowExec(object):
 
     vtType = 'workflow_exec'
 
+    __slots__ = ('_db_deleted_item_execs', '_db_item_execs_id_index',
+                 '_db_item_execs', '_db_id', '_db_user', '_db_ip',
+                 '_db_session', '_db_vt_version', '_db_ts_start', '_db_ts_end',
+                 '_db_parent_id', '_db_parent_type', '_db_parent_version',
+                 '_db_completed', '_db_name', '_db_deleted_annotations',
+                 '_db_annotations_id_index', '_db_annotations',
+                 '_db_deleted_machines', '_db_machines_id_index',
+                 '_db_machines', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, item_execs=None, id=None, user=None, ip=None, session=None, vt_version=None, ts_start=None, ts_end=None, parent_id=None, parent_type=None, parent_version=None, completed=None, name=None, annotations=None, machines=None):
-        self.db_deleted_item_execs = []
-        self.db_item_execs_id_index = {}
+        self._db_deleted_item_execs = None
+        self._db_item_execs_id_index = None
         if item_execs is None:
             self._db_item_execs = []
         else:
@@ -9708,27 +10869,27 @@ class DBWorkflowExec(object):
             for v in self._db_item_execs:
                 self.db_item_execs_id_index[v.db_id] = v
         self._db_id = id
-        self._db_user = user
-        self._db_ip = ip
+        self._db_user = _intern(user)
+        self._db_ip = _intern(ip)
         self._db_session = session
-        self._db_vt_version = vt_version
+        self._db_vt_version = _intern(vt_version)
         self._db_ts_start = ts_start
         self._db_ts_end = ts_end
         self._db_parent_id = parent_id
-        self._db_parent_type = parent_type
+        self._db_parent_type = _intern(parent_type)
         self._db_parent_version = parent_version
         self._db_completed = completed
-        self._db_name = name
-        self.db_deleted_annotations = []
-        self.db_annotations_id_index = {}
+        self._db_name = _intern(name)
+        self._db_deleted_annotations = None
+        self._db_annotations_id_index = None
         if annotations is None:
             self._db_annotations = []
         else:
             self._db_annotations = annotations
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
-        self.db_deleted_machines = []
-        self.db_machines_id_index = {}
+        self._db_deleted_machines = None
+        self._db_machines_id_index = None
         if machines is None:
             self._db_machines = []
         else:
@@ -9777,9 +10938,12 @@ class DBWorkflowExec(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_item_execs_id_index = dict((v.db_id, v) for v in cp._db_item_execs)
-        cp.db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
-        cp.db_machines_id_index = dict((v.db_id, v) for v in cp._db_machines)
+        if cp._db_item_execs:
+            cp._db_item_execs_id_index = dict((v.db_id, v) for v in cp._db_item_execs)
+        if cp._db_annotations:
+            cp._db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
+        if cp._db_machines:
+            cp._db_machines_id_index = dict((v.db_id, v) for v in cp._db_machines)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -9928,13 +11092,16 @@ class DBWorkflowExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_machines)
-        children.extend(self.db_deleted_item_execs)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_machines is not None:
+            children.extend(self._db_deleted_machines)
+        if self._db_deleted_item_execs is not None:
+            children.extend(self._db_deleted_item_execs)
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_machines = []
-            self.db_deleted_item_execs = []
+            self._db_deleted_annotations = None
+            self._db_deleted_machines = None
+            self._db_deleted_item_execs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -9986,10 +11153,24 @@ class DBWorkflowExec(object):
             if self._db_item_execs[i].db_id == key:
                 return self._db_item_execs[i]
         return None
+    def __get_db_deleted_item_execs(self):
+        if self._db_deleted_item_execs is None:
+            self._db_deleted_item_execs = []
+        return self._db_deleted_item_execs
+    def __set_db_deleted_item_execs(self, deleted):
+        self._db_deleted_item_execs = deleted
+    db_deleted_item_execs = property(__get_db_deleted_item_execs, __set_db_deleted_item_execs)
+    def __get_db_item_execs_id_index(self):
+        if self._db_item_execs_id_index is None:
+            self._db_item_execs_id_index = {}
+        return self._db_item_execs_id_index
+    def __set_db_item_execs_id_index(self, index):
+        self._db_item_execs_id_index = index
+    db_item_execs_id_index = property(__get_db_item_execs_id_index, __set_db_item_execs_id_index)
     def db_get_item_exec_by_id(self, key):
         return self.db_item_execs_id_index[key]
     def db_has_item_exec_with_id(self, key):
-        return key in self.db_item_execs_id_index
+        return self._db_item_execs_id_index is not None and key in self._db_item_execs_id_index
     
     def __get_db_id(self):
         return self._db_id
@@ -10007,26 +11188,26 @@ class DBWorkflowExec(object):
     def __get_db_user(self):
         return self._db_user
     def __set_db_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
         self.is_dirty = True
     db_user = property(__get_db_user, __set_db_user)
     def db_add_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_change_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_delete_user(self, user):
         self._db_user = None
     
     def __get_db_ip(self):
         return self._db_ip
     def __set_db_ip(self, ip):
-        self._db_ip = ip
+        self._db_ip = _intern(ip)
         self.is_dirty = True
     db_ip = property(__get_db_ip, __set_db_ip)
     def db_add_ip(self, ip):
-        self._db_ip = ip
+        self._db_ip = _intern(ip)
     def db_change_ip(self, ip):
-        self._db_ip = ip
+        self._db_ip = _intern(ip)
     def db_delete_ip(self, ip):
         self._db_ip = None
     
@@ -10046,13 +11227,13 @@ class DBWorkflowExec(object):
     def __get_db_vt_version(self):
         return self._db_vt_version
     def __set_db_vt_version(self, vt_version):
-        self._db_vt_version = vt_version
+        self._db_vt_version = _intern(vt_version)
         self.is_dirty = True
     db_vt_version = property(__get_db_vt_version, __set_db_vt_version)
     def db_add_vt_version(self, vt_version):
-        self._db_vt_version = vt_version
+        self._db_vt_version = _intern(vt_version)
     def db_change_vt_version(self, vt_version):
-        self._db_vt_version = vt_version
+        self._db_vt_version = _intern(vt_version)
     def db_delete_vt_version(self, vt_version):
         self._db_vt_version = None
     
@@ -10098,13 +11279,13 @@ class DBWorkflowExec(object):
     def __get_db_parent_type(self):
         return self._db_parent_type
     def __set_db_parent_type(self, parent_type):
-        self._db_parent_type = parent_type
+        self._db_parent_type = _intern(parent_type)
         self.is_dirty = True
     db_parent_type = property(__get_db_parent_type, __set_db_parent_type)
     def db_add_parent_type(self, parent_type):
-        self._db_parent_type = parent_type
+        self._db_parent_type = _intern(parent_type)
     def db_change_parent_type(self, parent_type):
-        self._db_parent_type = parent_type
+        self._db_parent_type = _intern(parent_type)
     def db_delete_parent_type(self, parent_type):
         self._db_parent_type = None
     
@@ -10137,13 +11318,13 @@ class DBWorkflowExec(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -10184,10 +11365,24 @@ class DBWorkflowExec(object):
             if self._db_annotations[i].db_id == key:
                 return self._db_annotations[i]
         return None
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
+    def __get_db_annotations_id_index(self):
+        if self._db_annotations_id_index is None:
+            self._db_annotations_id_index = {}
+        return self._db_annotations_id_index
+    def __set_db_annotations_id_index(self, index):
+        self._db_annotations_id_index = index
+    db_annotations_id_index = property(__get_db_annotations_id_index, __set_db_annotations_id_index)
     def db_get_annotation_by_id(self, key):
         return self.db_annotations_id_index[key]
     def db_has_annotation_with_id(self, key):
-        return key in self.db_annotations_id_index
+        return self._db_annotations_id_index is not None and key in self._db_annotations_id_index
     
     def __get_db_machines(self):
         return self._db_machines
@@ -10226,10 +11421,24 @@ class DBWorkflowExec(object):
             if self._db_machines[i].db_id == key:
                 return self._db_machines[i]
         return None
+    def __get_db_deleted_machines(self):
+        if self._db_deleted_machines is None:
+            self._db_deleted_machines = []
+        return self._db_deleted_machines
+    def __set_db_deleted_machines(self, deleted):
+        self._db_deleted_machines = deleted
+    db_deleted_machines = property(__get_db_deleted_machines, __set_db_deleted_machines)
+    def __get_db_machines_id_index(self):
+        if self._db_machines_id_index is None:
+            self._db_machines_id_index = {}
+        return self._db_machines_id_index
+    def __set_db_machines_id_index(self, index):
+        self._db_machines_id_index = index
+    db_machines_id_index = property(__get_db_machines_id_index, __set_db_machines_id_index)
     def db_get_machine_by_id(self, key):
         return self.db_machines_id_index[key]
     def db_has_machine_with_id(self, key):
-        return key in self.db_machines_id_index
+        return self._db_machines_id_index is not None and key in self._db_machines_id_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -10238,6 +11447,9 @@ class DBLocation(object):
 
     vtType = 'location'
 
+    __slots__ = ('_db_id', '_db_x', '_db_y', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, x=None, y=None):
         self._db_id = id
         self._db_x = x
@@ -10349,12 +11561,16 @@ class DBFunction(object):
 
     vtType = 'function'
 
+    __slots__ = ('_db_id', '_db_pos', '_db_name', '_db_deleted_parameters',
+                 '_db_parameters_id_index', '_db_parameters', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, pos=None, name=None, parameters=None):
         self._db_id = id
         self._db_pos = pos
-        self._db_name = name
-        self.db_deleted_parameters = []
-        self.db_parameters_id_index = {}
+        self._db_name = _intern(name)
+        self._db_deleted_parameters = None
+        self._db_parameters_id_index = None
         if parameters is None:
             self._db_parameters = []
         else:
@@ -10386,7 +11602,8 @@ class DBFunction(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_parameters_id_index = dict((v.db_id, v) for v in cp._db_parameters)
+        if cp._db_parameters:
+            cp._db_parameters_id_index = dict((v.db_id, v) for v in cp._db_parameters)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -10442,9 +11659,10 @@ class DBFunction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_parameters)
+        if self._db_deleted_parameters is not None:
+            children.extend(self._db_deleted_parameters)
         if remove:
-            self.db_deleted_parameters = []
+            self._db_deleted_parameters = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -10482,13 +11700,13 @@ class DBFunction(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -10529,10 +11747,24 @@ class DBFunction(object):
             if self._db_parameters[i].db_id == key:
                 return self._db_parameters[i]
         return None
+    def __get_db_deleted_parameters(self):
+        if self._db_deleted_parameters is None:
+            self._db_deleted_parameters = []
+        return self._db_deleted_parameters
+    def __set_db_deleted_parameters(self, deleted):
+        self._db_deleted_parameters = deleted
+    db_deleted_parameters = property(__get_db_deleted_parameters, __set_db_deleted_parameters)
+    def __get_db_parameters_id_index(self):
+        if self._db_parameters_id_index is None:
+            self._db_parameters_id_index = {}
+        return self._db_parameters_id_index
+    def __set_db_parameters_id_index(self, index):
+        self._db_parameters_id_index = index
+    db_parameters_id_index = property(__get_db_parameters_id_index, __set_db_parameters_id_index)
     def db_get_parameter_by_id(self, key):
         return self.db_parameters_id_index[key]
     def db_has_parameter_with_id(self, key):
-        return key in self.db_parameters_id_index
+        return self._db_parameters_id_index is not None and key in self._db_parameters_id_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -10541,13 +11773,16 @@ class DBActionAnnotation(object):
 
     vtType = 'actionAnnotation'
 
+    __slots__ = ('_db_id', '_db_key', '_db_value', '_db_action_id', '_db_date',
+                 '_db_user', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, key=None, value=None, action_id=None, date=None, user=None):
         self._db_id = id
-        self._db_key = key
+        self._db_key = _intern(key)
         self._db_value = value
         self._db_action_id = action_id
         self._db_date = date
-        self._db_user = user
+        self._db_user = _intern(user)
         self.is_dirty = True
         self.is_new = True
     
@@ -10645,13 +11880,13 @@ class DBActionAnnotation(object):
     def __get_db_key(self):
         return self._db_key
     def __set_db_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
         self.is_dirty = True
     db_key = property(__get_db_key, __set_db_key)
     def db_add_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
     def db_change_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
     def db_delete_key(self, key):
         self._db_key = None
     
@@ -10697,13 +11932,13 @@ class DBActionAnnotation(object):
     def __get_db_user(self):
         return self._db_user
     def __set_db_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
         self.is_dirty = True
     db_user = property(__get_db_user, __set_db_user)
     def db_add_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_change_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_delete_user(self, user):
         self._db_user = None
     
@@ -10714,6 +11949,12 @@ class DBProvActivity(object):
 
     vtType = 'prov_activity'
 
+    __slots__ = ('_db_id', '_db_startTime', '_db_endTime', '_db_vt_id',
+                 '_db_vt_type', '_db_vt_cached', '_db_vt_completed',
+                 '_db_vt_machine_id', '_db_vt_error', '_db_deleted_is_part_of',
+                 '_db_is_part_of', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, startTime=None, endTime=None, vt_id=None, vt_type=None, vt_cached=None, vt_completed=None, vt_machine_id=None, vt_error=None, is_part_of=None):
         self._db_id = id
         self._db_startTime = startTime
@@ -10724,7 +11965,7 @@ class DBProvActivity(object):
         self._db_vt_completed = vt_completed
         self._db_vt_machine_id = vt_machine_id
         self._db_vt_error = vt_error
-        self.db_deleted_is_part_of = []
+        self._db_deleted_is_part_of = None
         self._db_is_part_of = is_part_of
         self.is_dirty = True
         self.is_new = True
@@ -10836,9 +12077,10 @@ class DBProvActivity(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_is_part_of)
+        if self._db_deleted_is_part_of is not None:
+            children.extend(self._db_deleted_is_part_of)
         if remove:
-            self.db_deleted_is_part_of = []
+            self._db_deleted_is_part_of = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -10977,6 +12219,13 @@ class DBProvActivity(object):
         if not self.is_new:
             self.db_deleted_is_part_of.append(self._db_is_part_of)
         self._db_is_part_of = None
+    def __get_db_deleted_is_part_of(self):
+        if self._db_deleted_is_part_of is None:
+            self._db_deleted_is_part_of = []
+        return self._db_deleted_is_part_of
+    def __set_db_deleted_is_part_of(self, deleted):
+        self._db_deleted_is_part_of = deleted
+    db_deleted_is_part_of = property(__get_db_deleted_is_part_of, __set_db_deleted_is_part_of)
     
     def getPrimaryKey(self):
         return self._db_id
@@ -10985,10 +12234,14 @@ class DBProvUsage(object):
 
     vtType = 'prov_usage'
 
+    __slots__ = ('_db_deleted_prov_activity', '_db_prov_activity',
+                 '_db_deleted_prov_entity', '_db_prov_entity', '_db_prov_role',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, prov_activity=None, prov_entity=None, prov_role=None):
-        self.db_deleted_prov_activity = []
+        self._db_deleted_prov_activity = None
         self._db_prov_activity = prov_activity
-        self.db_deleted_prov_entity = []
+        self._db_deleted_prov_entity = None
         self._db_prov_entity = prov_entity
         self._db_prov_role = prov_role
         self.is_dirty = True
@@ -11069,11 +12322,13 @@ class DBProvUsage(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_activity)
-        children.extend(self.db_deleted_prov_entity)
+        if self._db_deleted_prov_activity is not None:
+            children.extend(self._db_deleted_prov_activity)
+        if self._db_deleted_prov_entity is not None:
+            children.extend(self._db_deleted_prov_entity)
         if remove:
-            self.db_deleted_prov_activity = []
-            self.db_deleted_prov_entity = []
+            self._db_deleted_prov_activity = None
+            self._db_deleted_prov_entity = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -11097,6 +12352,13 @@ class DBProvUsage(object):
         if not self.is_new:
             self.db_deleted_prov_activity.append(self._db_prov_activity)
         self._db_prov_activity = None
+    def __get_db_deleted_prov_activity(self):
+        if self._db_deleted_prov_activity is None:
+            self._db_deleted_prov_activity = []
+        return self._db_deleted_prov_activity
+    def __set_db_deleted_prov_activity(self, deleted):
+        self._db_deleted_prov_activity = deleted
+    db_deleted_prov_activity = property(__get_db_deleted_prov_activity, __set_db_deleted_prov_activity)
     
     def __get_db_prov_entity(self):
         return self._db_prov_entity
@@ -11112,6 +12374,13 @@ class DBProvUsage(object):
         if not self.is_new:
             self.db_deleted_prov_entity.append(self._db_prov_entity)
         self._db_prov_entity = None
+    def __get_db_deleted_prov_entity(self):
+        if self._db_deleted_prov_entity is None:
+            self._db_deleted_prov_entity = []
+        return self._db_deleted_prov_entity
+    def __set_db_deleted_prov_entity(self, deleted):
+        self._db_deleted_prov_entity = deleted
+    db_deleted_prov_entity = property(__get_db_deleted_prov_entity, __set_db_deleted_prov_entity)
     
     def __get_db_prov_role(self):
         return self._db_prov_role
@@ -11132,6 +12401,8 @@ class DBOpmArtifactIdEffect(object):
 
     vtType = 'opm_artifact_id_effect'
 
+    __slots__ = ('_db_id', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -11204,16 +12475,23 @@ class DBOpmGraph(object):
 
     vtType = 'opm_graph'
 
+    __slots__ = ('_db_deleted_accounts', '_db_accounts',
+                 '_db_deleted_processes', '_db_processes',
+                 '_db_deleted_artifacts', '_db_artifacts',
+                 '_db_deleted_agents', '_db_agents',
+                 '_db_deleted_dependencies', '_db_dependencies', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, accounts=None, processes=None, artifacts=None, agents=None, dependencies=None):
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         self._db_accounts = accounts
-        self.db_deleted_processes = []
+        self._db_deleted_processes = None
         self._db_processes = processes
-        self.db_deleted_artifacts = []
+        self._db_deleted_artifacts = None
         self._db_artifacts = artifacts
-        self.db_deleted_agents = []
+        self._db_deleted_agents = None
         self._db_agents = agents
-        self.db_deleted_dependencies = []
+        self._db_deleted_dependencies = None
         self._db_dependencies = dependencies
         self.is_dirty = True
         self.is_new = True
@@ -11336,17 +12614,22 @@ class DBOpmGraph(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_processes)
-        children.extend(self.db_deleted_artifacts)
-        children.extend(self.db_deleted_agents)
-        children.extend(self.db_deleted_dependencies)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_processes is not None:
+            children.extend(self._db_deleted_processes)
+        if self._db_deleted_artifacts is not None:
+            children.extend(self._db_deleted_artifacts)
+        if self._db_deleted_agents is not None:
+            children.extend(self._db_deleted_agents)
+        if self._db_deleted_dependencies is not None:
+            children.extend(self._db_deleted_dependencies)
         if remove:
-            self.db_deleted_accounts = []
-            self.db_deleted_processes = []
-            self.db_deleted_artifacts = []
-            self.db_deleted_agents = []
-            self.db_deleted_dependencies = []
+            self._db_deleted_accounts = None
+            self._db_deleted_processes = None
+            self._db_deleted_artifacts = None
+            self._db_deleted_agents = None
+            self._db_deleted_dependencies = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -11376,6 +12659,13 @@ class DBOpmGraph(object):
         if not self.is_new:
             self.db_deleted_accounts.append(self._db_accounts)
         self._db_accounts = None
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     
     def __get_db_processes(self):
         return self._db_processes
@@ -11391,6 +12681,13 @@ class DBOpmGraph(object):
         if not self.is_new:
             self.db_deleted_processes.append(self._db_processes)
         self._db_processes = None
+    def __get_db_deleted_processes(self):
+        if self._db_deleted_processes is None:
+            self._db_deleted_processes = []
+        return self._db_deleted_processes
+    def __set_db_deleted_processes(self, deleted):
+        self._db_deleted_processes = deleted
+    db_deleted_processes = property(__get_db_deleted_processes, __set_db_deleted_processes)
     
     def __get_db_artifacts(self):
         return self._db_artifacts
@@ -11406,6 +12703,13 @@ class DBOpmGraph(object):
         if not self.is_new:
             self.db_deleted_artifacts.append(self._db_artifacts)
         self._db_artifacts = None
+    def __get_db_deleted_artifacts(self):
+        if self._db_deleted_artifacts is None:
+            self._db_deleted_artifacts = []
+        return self._db_deleted_artifacts
+    def __set_db_deleted_artifacts(self, deleted):
+        self._db_deleted_artifacts = deleted
+    db_deleted_artifacts = property(__get_db_deleted_artifacts, __set_db_deleted_artifacts)
     
     def __get_db_agents(self):
         return self._db_agents
@@ -11421,6 +12725,13 @@ class DBOpmGraph(object):
         if not self.is_new:
             self.db_deleted_agents.append(self._db_agents)
         self._db_agents = None
+    def __get_db_deleted_agents(self):
+        if self._db_deleted_agents is None:
+            self._db_deleted_agents = []
+        return self._db_deleted_agents
+    def __set_db_deleted_agents(self, deleted):
+        self._db_deleted_agents = deleted
+    db_deleted_agents = property(__get_db_deleted_agents, __set_db_deleted_agents)
     
     def __get_db_dependencies(self):
         return self._db_dependencies
@@ -11436,6 +12747,13 @@ class DBOpmGraph(object):
         if not self.is_new:
             self.db_deleted_dependencies.append(self._db_dependencies)
         self._db_dependencies = None
+    def __get_db_deleted_dependencies(self):
+        if self._db_deleted_dependencies is None:
+            self._db_deleted_dependencies = []
+        return self._db_deleted_dependencies
+    def __set_db_deleted_dependencies(self, deleted):
+        self._db_deleted_dependencies = deleted
+    db_deleted_dependencies = property(__get_db_deleted_dependencies, __set_db_deleted_dependencies)
     
 
 
@@ -11443,6 +12761,9 @@ class DBIsPartOf(object):
 
     vtType = 'is_part_of'
 
+    __slots__ = ('_db_prov_ref', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -11513,19 +12834,25 @@ class DBOpmWasDerivedFrom(object):
 
     vtType = 'opm_was_derived_from'
 
+    __slots__ = ('_db_deleted_effect', '_db_effect', '_db_deleted_role',
+                 '_db_role', '_db_deleted_cause', '_db_cause',
+                 '_db_deleted_accounts', '_db_accounts',
+                 '_db_deleted_opm_times', '_db_opm_times', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
+        self._db_deleted_effect = None
         self._db_effect = effect
-        self.db_deleted_role = []
+        self._db_deleted_role = None
         self._db_role = role
-        self.db_deleted_cause = []
+        self._db_deleted_cause = None
         self._db_cause = cause
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
+        self._db_deleted_opm_times = None
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -11663,17 +12990,22 @@ class DBOpmWasDerivedFrom(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        if self._db_deleted_effect is not None:
+            children.extend(self._db_deleted_effect)
+        if self._db_deleted_role is not None:
+            children.extend(self._db_deleted_role)
+        if self._db_deleted_cause is not None:
+            children.extend(self._db_deleted_cause)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_opm_times is not None:
+            children.extend(self._db_deleted_opm_times)
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            self._db_deleted_effect = None
+            self._db_deleted_role = None
+            self._db_deleted_cause = None
+            self._db_deleted_accounts = None
+            self._db_deleted_opm_times = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -11705,6 +13037,13 @@ class DBOpmWasDerivedFrom(object):
         if not self.is_new:
             self.db_deleted_effect.append(self._db_effect)
         self._db_effect = None
+    def __get_db_deleted_effect(self):
+        if self._db_deleted_effect is None:
+            self._db_deleted_effect = []
+        return self._db_deleted_effect
+    def __set_db_deleted_effect(self, deleted):
+        self._db_deleted_effect = deleted
+    db_deleted_effect = property(__get_db_deleted_effect, __set_db_deleted_effect)
     
     def __get_db_role(self):
         return self._db_role
@@ -11720,6 +13059,13 @@ class DBOpmWasDerivedFrom(object):
         if not self.is_new:
             self.db_deleted_role.append(self._db_role)
         self._db_role = None
+    def __get_db_deleted_role(self):
+        if self._db_deleted_role is None:
+            self._db_deleted_role = []
+        return self._db_deleted_role
+    def __set_db_deleted_role(self, deleted):
+        self._db_deleted_role = deleted
+    db_deleted_role = property(__get_db_deleted_role, __set_db_deleted_role)
     
     def __get_db_cause(self):
         return self._db_cause
@@ -11735,6 +13081,13 @@ class DBOpmWasDerivedFrom(object):
         if not self.is_new:
             self.db_deleted_cause.append(self._db_cause)
         self._db_cause = None
+    def __get_db_deleted_cause(self):
+        if self._db_deleted_cause is None:
+            self._db_deleted_cause = []
+        return self._db_deleted_cause
+    def __set_db_deleted_cause(self, deleted):
+        self._db_deleted_cause = deleted
+    db_deleted_cause = property(__get_db_deleted_cause, __set_db_deleted_cause)
     
     def __get_db_accounts(self):
         return self._db_accounts
@@ -11755,6 +13108,13 @@ class DBOpmWasDerivedFrom(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_account(self, key):
         return None
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     
     def __get_db_opm_times(self):
         return self._db_opm_times
@@ -11775,6 +13135,13 @@ class DBOpmWasDerivedFrom(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_opm_time(self, key):
         return None
+    def __get_db_deleted_opm_times(self):
+        if self._db_deleted_opm_times is None:
+            self._db_deleted_opm_times = []
+        return self._db_deleted_opm_times
+    def __set_db_deleted_opm_times(self, deleted):
+        self._db_deleted_opm_times = deleted
+    db_deleted_opm_times = property(__get_db_deleted_opm_times, __set_db_deleted_opm_times)
     
 
 
@@ -11782,9 +13149,12 @@ class DBControlParameter(object):
 
     vtType = 'controlParameter'
 
+    __slots__ = ('_db_id', '_db_name', '_db_value', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, id=None, name=None, value=None):
         self._db_id = id
-        self._db_name = name
+        self._db_name = _intern(name)
         self._db_value = value
         self.is_dirty = True
         self.is_new = True
@@ -11863,13 +13233,13 @@ class DBControlParameter(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -11893,6 +13263,9 @@ class DBPluginData(object):
 
     vtType = 'plugin_data'
 
+    __slots__ = ('_db_id', '_db_data', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, data=None):
         self._db_id = id
         self._db_data = data
@@ -11984,12 +13357,16 @@ class DBDelete(object):
 
     vtType = 'delete'
 
+    __slots__ = ('_db_id', '_db_what', '_db_objectId', '_db_parentObjId',
+                 '_db_parentObjType', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, what=None, objectId=None, parentObjId=None, parentObjType=None):
         self._db_id = id
-        self._db_what = what
+        self._db_what = _intern(what)
         self._db_objectId = objectId
         self._db_parentObjId = parentObjId
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
         self.is_dirty = True
         self.is_new = True
     
@@ -12083,13 +13460,13 @@ class DBDelete(object):
     def __get_db_what(self):
         return self._db_what
     def __set_db_what(self, what):
-        self._db_what = what
+        self._db_what = _intern(what)
         self.is_dirty = True
     db_what = property(__get_db_what, __set_db_what)
     def db_add_what(self, what):
-        self._db_what = what
+        self._db_what = _intern(what)
     def db_change_what(self, what):
-        self._db_what = what
+        self._db_what = _intern(what)
     def db_delete_what(self, what):
         self._db_what = None
     
@@ -12122,13 +13499,13 @@ class DBDelete(object):
     def __get_db_parentObjType(self):
         return self._db_parentObjType
     def __set_db_parentObjType(self, parentObjType):
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
         self.is_dirty = True
     db_parentObjType = property(__get_db_parentObjType, __set_db_parentObjType)
     def db_add_parentObjType(self, parentObjType):
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
     def db_change_parentObjType(self, parentObjType):
-        self._db_parentObjType = parentObjType
+        self._db_parentObjType = _intern(parentObjType)
     def db_delete_parentObjType(self, parentObjType):
         self._db_parentObjType = None
     
@@ -12139,12 +13516,16 @@ class DBVistrailVariable(object):
 
     vtType = 'vistrailVariable'
 
+    __slots__ = ('_db_name', '_db_uuid', '_db_package', '_db_module',
+                 '_db_namespace', '_db_value', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, name=None, uuid=None, package=None, module=None, namespace=None, value=None):
-        self._db_name = name
-        self._db_uuid = uuid
-        self._db_package = package
-        self._db_module = module
-        self._db_namespace = namespace
+        self._db_name = _intern(name)
+        self._db_uuid = _intern(uuid)
+        self._db_package = _intern(package)
+        self._db_module = _intern(module)
+        self._db_namespace = _intern(namespace)
         self._db_value = value
         self.is_dirty = True
         self.is_new = True
@@ -12228,65 +13609,65 @@ class DBVistrailVariable(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
     def __get_db_uuid(self):
         return self._db_uuid
     def __set_db_uuid(self, uuid):
-        self._db_uuid = uuid
+        self._db_uuid = _intern(uuid)
         self.is_dirty = True
     db_uuid = property(__get_db_uuid, __set_db_uuid)
     def db_add_uuid(self, uuid):
-        self._db_uuid = uuid
+        self._db_uuid = _intern(uuid)
     def db_change_uuid(self, uuid):
-        self._db_uuid = uuid
+        self._db_uuid = _intern(uuid)
     def db_delete_uuid(self, uuid):
         self._db_uuid = None
     
     def __get_db_package(self):
         return self._db_package
     def __set_db_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
         self.is_dirty = True
     db_package = property(__get_db_package, __set_db_package)
     def db_add_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_change_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_delete_package(self, package):
         self._db_package = None
     
     def __get_db_module(self):
         return self._db_module
     def __set_db_module(self, module):
-        self._db_module = module
+        self._db_module = _intern(module)
         self.is_dirty = True
     db_module = property(__get_db_module, __set_db_module)
     def db_add_module(self, module):
-        self._db_module = module
+        self._db_module = _intern(module)
     def db_change_module(self, module):
-        self._db_module = module
+        self._db_module = _intern(module)
     def db_delete_module(self, module):
         self._db_module = None
     
     def __get_db_namespace(self):
         return self._db_namespace
     def __set_db_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
         self.is_dirty = True
     db_namespace = property(__get_db_namespace, __set_db_namespace)
     def db_add_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_change_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_delete_namespace(self, namespace):
         self._db_namespace = None
     
@@ -12310,8 +13691,11 @@ class DBOpmOverlaps(object):
 
     vtType = 'opm_overlaps'
 
+    __slots__ = ('_db_deleted_opm_account_ids', '_db_opm_account_ids',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, opm_account_ids=None):
-        self.db_deleted_opm_account_ids = []
+        self._db_deleted_opm_account_ids = None
         if opm_account_ids is None:
             self._db_opm_account_ids = []
         else:
@@ -12379,9 +13763,10 @@ class DBOpmOverlaps(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_opm_account_ids)
+        if self._db_deleted_opm_account_ids is not None:
+            children.extend(self._db_deleted_opm_account_ids)
         if remove:
-            self.db_deleted_opm_account_ids = []
+            self._db_deleted_opm_account_ids = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -12409,6 +13794,13 @@ class DBOpmOverlaps(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_opm_account_id(self, key):
         return None
+    def __get_db_deleted_opm_account_ids(self):
+        if self._db_deleted_opm_account_ids is None:
+            self._db_deleted_opm_account_ids = []
+        return self._db_deleted_opm_account_ids
+    def __set_db_deleted_opm_account_ids(self, deleted):
+        self._db_deleted_opm_account_ids = deleted
+    db_deleted_opm_account_ids = property(__get_db_deleted_opm_account_ids, __set_db_deleted_opm_account_ids)
     
 
 
@@ -12416,19 +13808,25 @@ class DBOpmWasTriggeredBy(object):
 
     vtType = 'opm_was_triggered_by'
 
+    __slots__ = ('_db_deleted_effect', '_db_effect', '_db_deleted_role',
+                 '_db_role', '_db_deleted_cause', '_db_cause',
+                 '_db_deleted_accounts', '_db_accounts',
+                 '_db_deleted_opm_times', '_db_opm_times', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, effect=None, role=None, cause=None, accounts=None, opm_times=None):
-        self.db_deleted_effect = []
+        self._db_deleted_effect = None
         self._db_effect = effect
-        self.db_deleted_role = []
+        self._db_deleted_role = None
         self._db_role = role
-        self.db_deleted_cause = []
+        self._db_deleted_cause = None
         self._db_cause = cause
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
             self._db_accounts = accounts
-        self.db_deleted_opm_times = []
+        self._db_deleted_opm_times = None
         if opm_times is None:
             self._db_opm_times = []
         else:
@@ -12566,17 +13964,22 @@ class DBOpmWasTriggeredBy(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_effect)
-        children.extend(self.db_deleted_role)
-        children.extend(self.db_deleted_cause)
-        children.extend(self.db_deleted_accounts)
-        children.extend(self.db_deleted_opm_times)
+        if self._db_deleted_effect is not None:
+            children.extend(self._db_deleted_effect)
+        if self._db_deleted_role is not None:
+            children.extend(self._db_deleted_role)
+        if self._db_deleted_cause is not None:
+            children.extend(self._db_deleted_cause)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
+        if self._db_deleted_opm_times is not None:
+            children.extend(self._db_deleted_opm_times)
         if remove:
-            self.db_deleted_effect = []
-            self.db_deleted_role = []
-            self.db_deleted_cause = []
-            self.db_deleted_accounts = []
-            self.db_deleted_opm_times = []
+            self._db_deleted_effect = None
+            self._db_deleted_role = None
+            self._db_deleted_cause = None
+            self._db_deleted_accounts = None
+            self._db_deleted_opm_times = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -12608,6 +14011,13 @@ class DBOpmWasTriggeredBy(object):
         if not self.is_new:
             self.db_deleted_effect.append(self._db_effect)
         self._db_effect = None
+    def __get_db_deleted_effect(self):
+        if self._db_deleted_effect is None:
+            self._db_deleted_effect = []
+        return self._db_deleted_effect
+    def __set_db_deleted_effect(self, deleted):
+        self._db_deleted_effect = deleted
+    db_deleted_effect = property(__get_db_deleted_effect, __set_db_deleted_effect)
     
     def __get_db_role(self):
         return self._db_role
@@ -12623,6 +14033,13 @@ class DBOpmWasTriggeredBy(object):
         if not self.is_new:
             self.db_deleted_role.append(self._db_role)
         self._db_role = None
+    def __get_db_deleted_role(self):
+        if self._db_deleted_role is None:
+            self._db_deleted_role = []
+        return self._db_deleted_role
+    def __set_db_deleted_role(self, deleted):
+        self._db_deleted_role = deleted
+    db_deleted_role = property(__get_db_deleted_role, __set_db_deleted_role)
     
     def __get_db_cause(self):
         return self._db_cause
@@ -12638,6 +14055,13 @@ class DBOpmWasTriggeredBy(object):
         if not self.is_new:
             self.db_deleted_cause.append(self._db_cause)
         self._db_cause = None
+    def __get_db_deleted_cause(self):
+        if self._db_deleted_cause is None:
+            self._db_deleted_cause = []
+        return self._db_deleted_cause
+    def __set_db_deleted_cause(self, deleted):
+        self._db_deleted_cause = deleted
+    db_deleted_cause = property(__get_db_deleted_cause, __set_db_deleted_cause)
     
     def __get_db_accounts(self):
         return self._db_accounts
@@ -12658,6 +14082,13 @@ class DBOpmWasTriggeredBy(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_account(self, key):
         return None
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     
     def __get_db_opm_times(self):
         return self._db_opm_times
@@ -12678,6 +14109,13 @@ class DBOpmWasTriggeredBy(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_opm_time(self, key):
         return None
+    def __get_db_deleted_opm_times(self):
+        if self._db_deleted_opm_times is None:
+            self._db_deleted_opm_times = []
+        return self._db_deleted_opm_times
+    def __set_db_deleted_opm_times(self, deleted):
+        self._db_deleted_opm_times = deleted
+    db_deleted_opm_times = property(__get_db_deleted_opm_times, __set_db_deleted_opm_times)
     
 
 
@@ -12685,17 +14123,24 @@ class DBModuleDescriptor(object):
 
     vtType = 'module_descriptor'
 
+    __slots__ = ('_db_id', '_db_name', '_db_package', '_db_namespace',
+                 '_db_package_version', '_db_version',
+                 '_db_base_descriptor_id', '_db_deleted_portSpecs',
+                 '_db_portSpecs_id_index', '_db_portSpecs_name_index',
+                 '_db_portSpecs', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, name=None, package=None, namespace=None, package_version=None, version=None, base_descriptor_id=None, portSpecs=None):
         self._db_id = id
-        self._db_name = name
-        self._db_package = package
-        self._db_namespace = namespace
-        self._db_package_version = package_version
-        self._db_version = version
+        self._db_name = _intern(name)
+        self._db_package = _intern(package)
+        self._db_namespace = _intern(namespace)
+        self._db_package_version = _intern(package_version)
+        self._db_version = _intern(version)
         self._db_base_descriptor_id = base_descriptor_id
-        self.db_deleted_portSpecs = []
-        self.db_portSpecs_id_index = {}
-        self.db_portSpecs_name_index = {}
+        self._db_deleted_portSpecs = None
+        self._db_portSpecs_id_index = None
+        self._db_portSpecs_name_index = None
         if portSpecs is None:
             self._db_portSpecs = []
         else:
@@ -12734,8 +14179,9 @@ class DBModuleDescriptor(object):
                 cp._db_base_descriptor_id = id_remap[('module_descriptor', self._db_base_descriptor_id)]
         
         # recreate indices and set flags
-        cp.db_portSpecs_id_index = dict((v.db_id, v) for v in cp._db_portSpecs)
-        cp.db_portSpecs_name_index = dict(((v.db_name,v.db_type), v) for v in cp._db_portSpecs)
+        if cp._db_portSpecs:
+            cp._db_portSpecs_id_index = dict((v.db_id, v) for v in cp._db_portSpecs)
+            cp._db_portSpecs_name_index = dict(((v.db_name,v.db_type), v) for v in cp._db_portSpecs)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -12811,9 +14257,10 @@ class DBModuleDescriptor(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_portSpecs)
+        if self._db_deleted_portSpecs is not None:
+            children.extend(self._db_deleted_portSpecs)
         if remove:
-            self.db_deleted_portSpecs = []
+            self._db_deleted_portSpecs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -12838,65 +14285,65 @@ class DBModuleDescriptor(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
     def __get_db_package(self):
         return self._db_package
     def __set_db_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
         self.is_dirty = True
     db_package = property(__get_db_package, __set_db_package)
     def db_add_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_change_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_delete_package(self, package):
         self._db_package = None
     
     def __get_db_namespace(self):
         return self._db_namespace
     def __set_db_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
         self.is_dirty = True
     db_namespace = property(__get_db_namespace, __set_db_namespace)
     def db_add_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_change_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_delete_namespace(self, namespace):
         self._db_namespace = None
     
     def __get_db_package_version(self):
         return self._db_package_version
     def __set_db_package_version(self, package_version):
-        self._db_package_version = package_version
+        self._db_package_version = _intern(package_version)
         self.is_dirty = True
     db_package_version = property(__get_db_package_version, __set_db_package_version)
     def db_add_package_version(self, package_version):
-        self._db_package_version = package_version
+        self._db_package_version = _intern(package_version)
     def db_change_package_version(self, package_version):
-        self._db_package_version = package_version
+        self._db_package_version = _intern(package_version)
     def db_delete_package_version(self, package_version):
         self._db_package_version = None
     
     def __get_db_version(self):
         return self._db_version
     def __set_db_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
         self.is_dirty = True
     db_version = property(__get_db_version, __set_db_version)
     def db_add_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_change_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_delete_version(self, version):
         self._db_version = None
     
@@ -12953,14 +14400,35 @@ class DBModuleDescriptor(object):
             if self._db_portSpecs[i].db_id == key:
                 return self._db_portSpecs[i]
         return None
+    def __get_db_deleted_portSpecs(self):
+        if self._db_deleted_portSpecs is None:
+            self._db_deleted_portSpecs = []
+        return self._db_deleted_portSpecs
+    def __set_db_deleted_portSpecs(self, deleted):
+        self._db_deleted_portSpecs = deleted
+    db_deleted_portSpecs = property(__get_db_deleted_portSpecs, __set_db_deleted_portSpecs)
+    def __get_db_portSpecs_id_index(self):
+        if self._db_portSpecs_id_index is None:
+            self._db_portSpecs_id_index = {}
+        return self._db_portSpecs_id_index
+    def __set_db_portSpecs_id_index(self, index):
+        self._db_portSpecs_id_index = index
+    db_portSpecs_id_index = property(__get_db_portSpecs_id_index, __set_db_portSpecs_id_index)
+    def __get_db_portSpecs_name_index(self):
+        if self._db_portSpecs_name_index is None:
+            self._db_portSpecs_name_index = {}
+        return self._db_portSpecs_name_index
+    def __set_db_portSpecs_name_index(self, index):
+        self._db_portSpecs_name_index = index
+    db_portSpecs_name_index = property(__get_db_portSpecs_name_index, __set_db_portSpecs_name_index)
     def db_get_portSpec_by_id(self, key):
         return self.db_portSpecs_id_index[key]
     def db_has_portSpec_with_id(self, key):
-        return key in self.db_portSpecs_id_index
+        return self._db_portSpecs_id_index is not None and key in self._db_portSpecs_id_index
     def db_get_portSpec_by_name(self, key):
         return self.db_portSpecs_name_index[key]
     def db_has_portSpec_with_name(self, key):
-        return key in self.db_portSpecs_name_index
+        return self._db_portSpecs_name_index is not None and key in self._db_portSpecs_name_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -12969,9 +14437,12 @@ class DBTag(object):
 
     vtType = 'tag'
 
+    __slots__ = ('_db_id', '_db_name', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, name=None):
         self._db_id = id
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
         self.is_new = True
     
@@ -13045,13 +14516,13 @@ class DBTag(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -13062,6 +14533,8 @@ class DBOpmRole(object):
 
     vtType = 'opm_role'
 
+    __slots__ = ('_db_value', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -13132,50 +14605,61 @@ class DBProvDocument(object):
 
     vtType = 'prov_document'
 
+    __slots__ = ('_db_deleted_prov_entitys', '_db_prov_entitys_id_index',
+                 '_db_prov_entitys', '_db_deleted_prov_activitys',
+                 '_db_prov_activitys_id_index', '_db_prov_activitys',
+                 '_db_deleted_prov_agents', '_db_prov_agents_id_index',
+                 '_db_prov_agents', '_db_deleted_vt_connections',
+                 '_db_vt_connections_id_index', '_db_vt_connections',
+                 '_db_deleted_prov_usages', '_db_prov_usages',
+                 '_db_deleted_prov_generations', '_db_prov_generations',
+                 '_db_deleted_prov_associations', '_db_prov_associations',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, prov_entitys=None, prov_activitys=None, prov_agents=None, vt_connections=None, prov_usages=None, prov_generations=None, prov_associations=None):
-        self.db_deleted_prov_entitys = []
-        self.db_prov_entitys_id_index = {}
+        self._db_deleted_prov_entitys = None
+        self._db_prov_entitys_id_index = None
         if prov_entitys is None:
             self._db_prov_entitys = []
         else:
             self._db_prov_entitys = prov_entitys
             for v in self._db_prov_entitys:
                 self.db_prov_entitys_id_index[v.db_id] = v
-        self.db_deleted_prov_activitys = []
-        self.db_prov_activitys_id_index = {}
+        self._db_deleted_prov_activitys = None
+        self._db_prov_activitys_id_index = None
         if prov_activitys is None:
             self._db_prov_activitys = []
         else:
             self._db_prov_activitys = prov_activitys
             for v in self._db_prov_activitys:
                 self.db_prov_activitys_id_index[v.db_id] = v
-        self.db_deleted_prov_agents = []
-        self.db_prov_agents_id_index = {}
+        self._db_deleted_prov_agents = None
+        self._db_prov_agents_id_index = None
         if prov_agents is None:
             self._db_prov_agents = []
         else:
             self._db_prov_agents = prov_agents
             for v in self._db_prov_agents:
                 self.db_prov_agents_id_index[v.db_id] = v
-        self.db_deleted_vt_connections = []
-        self.db_vt_connections_id_index = {}
+        self._db_deleted_vt_connections = None
+        self._db_vt_connections_id_index = None
         if vt_connections is None:
             self._db_vt_connections = []
         else:
             self._db_vt_connections = vt_connections
             for v in self._db_vt_connections:
                 self.db_vt_connections_id_index[v.db_id] = v
-        self.db_deleted_prov_usages = []
+        self._db_deleted_prov_usages = None
         if prov_usages is None:
             self._db_prov_usages = []
         else:
             self._db_prov_usages = prov_usages
-        self.db_deleted_prov_generations = []
+        self._db_deleted_prov_generations = None
         if prov_generations is None:
             self._db_prov_generations = []
         else:
             self._db_prov_generations = prov_generations
-        self.db_deleted_prov_associations = []
+        self._db_deleted_prov_associations = None
         if prov_associations is None:
             self._db_prov_associations = []
         else:
@@ -13227,10 +14711,14 @@ class DBProvDocument(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_prov_entitys_id_index = dict((v.db_id, v) for v in cp._db_prov_entitys)
-        cp.db_prov_activitys_id_index = dict((v.db_id, v) for v in cp._db_prov_activitys)
-        cp.db_prov_agents_id_index = dict((v.db_id, v) for v in cp._db_prov_agents)
-        cp.db_vt_connections_id_index = dict((v.db_id, v) for v in cp._db_vt_connections)
+        if cp._db_prov_entitys:
+            cp._db_prov_entitys_id_index = dict((v.db_id, v) for v in cp._db_prov_entitys)
+        if cp._db_prov_activitys:
+            cp._db_prov_activitys_id_index = dict((v.db_id, v) for v in cp._db_prov_activitys)
+        if cp._db_prov_agents:
+            cp._db_prov_agents_id_index = dict((v.db_id, v) for v in cp._db_prov_agents)
+        if cp._db_vt_connections:
+            cp._db_vt_connections_id_index = dict((v.db_id, v) for v in cp._db_vt_connections)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -13379,21 +14867,28 @@ class DBProvDocument(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_entitys)
-        children.extend(self.db_deleted_prov_activitys)
-        children.extend(self.db_deleted_prov_agents)
-        children.extend(self.db_deleted_vt_connections)
-        children.extend(self.db_deleted_prov_usages)
-        children.extend(self.db_deleted_prov_generations)
-        children.extend(self.db_deleted_prov_associations)
+        if self._db_deleted_prov_entitys is not None:
+            children.extend(self._db_deleted_prov_entitys)
+        if self._db_deleted_prov_activitys is not None:
+            children.extend(self._db_deleted_prov_activitys)
+        if self._db_deleted_prov_agents is not None:
+            children.extend(self._db_deleted_prov_agents)
+        if self._db_deleted_vt_connections is not None:
+            children.extend(self._db_deleted_vt_connections)
+        if self._db_deleted_prov_usages is not None:
+            children.extend(self._db_deleted_prov_usages)
+        if self._db_deleted_prov_generations is not None:
+            children.extend(self._db_deleted_prov_generations)
+        if self._db_deleted_prov_associations is not None:
+            children.extend(self._db_deleted_prov_associations)
         if remove:
-            self.db_deleted_prov_entitys = []
-            self.db_deleted_prov_activitys = []
-            self.db_deleted_prov_agents = []
-            self.db_deleted_vt_connections = []
-            self.db_deleted_prov_usages = []
-            self.db_deleted_prov_generations = []
-            self.db_deleted_prov_associations = []
+            self._db_deleted_prov_entitys = None
+            self._db_deleted_prov_activitys = None
+            self._db_deleted_prov_agents = None
+            self._db_deleted_vt_connections = None
+            self._db_deleted_prov_usages = None
+            self._db_deleted_prov_generations = None
+            self._db_deleted_prov_associations = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -13457,10 +14952,24 @@ class DBProvDocument(object):
             if self._db_prov_entitys[i].db_id == key:
                 return self._db_prov_entitys[i]
         return None
+    def __get_db_deleted_prov_entitys(self):
+        if self._db_deleted_prov_entitys is None:
+            self._db_deleted_prov_entitys = []
+        return self._db_deleted_prov_entitys
+    def __set_db_deleted_prov_entitys(self, deleted):
+        self._db_deleted_prov_entitys = deleted
+    db_deleted_prov_entitys = property(__get_db_deleted_prov_entitys, __set_db_deleted_prov_entitys)
+    def __get_db_prov_entitys_id_index(self):
+        if self._db_prov_entitys_id_index is None:
+            self._db_prov_entitys_id_index = {}
+        return self._db_prov_entitys_id_index
+    def __set_db_prov_entitys_id_index(self, index):
+        self._db_prov_entitys_id_index = index
+    db_prov_entitys_id_index = property(__get_db_prov_entitys_id_index, __set_db_prov_entitys_id_index)
     def db_get_prov_entity_by_id(self, key):
         return self.db_prov_entitys_id_index[key]
     def db_has_prov_entity_with_id(self, key):
-        return key in self.db_prov_entitys_id_index
+        return self._db_prov_entitys_id_index is not None and key in self._db_prov_entitys_id_index
     
     def __get_db_prov_activitys(self):
         return self._db_prov_activitys
@@ -13499,10 +15008,24 @@ class DBProvDocument(object):
             if self._db_prov_activitys[i].db_id == key:
                 return self._db_prov_activitys[i]
         return None
+    def __get_db_deleted_prov_activitys(self):
+        if self._db_deleted_prov_activitys is None:
+            self._db_deleted_prov_activitys = []
+        return self._db_deleted_prov_activitys
+    def __set_db_deleted_prov_activitys(self, deleted):
+        self._db_deleted_prov_activitys = deleted
+    db_deleted_prov_activitys = property(__get_db_deleted_prov_activitys, __set_db_deleted_prov_activitys)
+    def __get_db_prov_activitys_id_index(self):
+        if self._db_prov_activitys_id_index is None:
+            self._db_prov_activitys_id_index = {}
+        return self._db_prov_activitys_id_index
+    def __set_db_prov_activitys_id_index(self, index):
+        self._db_prov_activitys_id_index = index
+    db_prov_activitys_id_index = property(__get_db_prov_activitys_id_index, __set_db_prov_activitys_id_index)
     def db_get_prov_activity_by_id(self, key):
         return self.db_prov_activitys_id_index[key]
     def db_has_prov_activity_with_id(self, key):
-        return key in self.db_prov_activitys_id_index
+        return self._db_prov_activitys_id_index is not None and key in self._db_prov_activitys_id_index
     
     def __get_db_prov_agents(self):
         return self._db_prov_agents
@@ -13541,10 +15064,24 @@ class DBProvDocument(object):
             if self._db_prov_agents[i].db_id == key:
                 return self._db_prov_agents[i]
         return None
+    def __get_db_deleted_prov_agents(self):
+        if self._db_deleted_prov_agents is None:
+            self._db_deleted_prov_agents = []
+        return self._db_deleted_prov_agents
+    def __set_db_deleted_prov_agents(self, deleted):
+        self._db_deleted_prov_agents = deleted
+    db_deleted_prov_agents = property(__get_db_deleted_prov_agents, __set_db_deleted_prov_agents)
+    def __get_db_prov_agents_id_index(self):
+        if self._db_prov_agents_id_index is None:
+            self._db_prov_agents_id_index = {}
+        return self._db_prov_agents_id_index
+    def __set_db_prov_agents_id_index(self, index):
+        self._db_prov_agents_id_index = index
+    db_prov_agents_id_index = property(__get_db_prov_agents_id_index, __set_db_prov_agents_id_index)
     def db_get_prov_agent_by_id(self, key):
         return self.db_prov_agents_id_index[key]
     def db_has_prov_agent_with_id(self, key):
-        return key in self.db_prov_agents_id_index
+        return self._db_prov_agents_id_index is not None and key in self._db_prov_agents_id_index
     
     def __get_db_vt_connections(self):
         return self._db_vt_connections
@@ -13583,10 +15120,24 @@ class DBProvDocument(object):
             if self._db_vt_connections[i].db_id == key:
                 return self._db_vt_connections[i]
         return None
+    def __get_db_deleted_vt_connections(self):
+        if self._db_deleted_vt_connections is None:
+            self._db_deleted_vt_connections = []
+        return self._db_deleted_vt_connections
+    def __set_db_deleted_vt_connections(self, deleted):
+        self._db_deleted_vt_connections = deleted
+    db_deleted_vt_connections = property(__get_db_deleted_vt_connections, __set_db_deleted_vt_connections)
+    def __get_db_vt_connections_id_index(self):
+        if self._db_vt_connections_id_index is None:
+            self._db_vt_connections_id_index = {}
+        return self._db_vt_connections_id_index
+    def __set_db_vt_connections_id_index(self, index):
+        self._db_vt_connections_id_index = index
+    db_vt_connections_id_index = property(__get_db_vt_connections_id_index, __set_db_vt_connections_id_index)
     def db_get_vt_connection_by_id(self, key):
         return self.db_vt_connections_id_index[key]
     def db_has_vt_connection_with_id(self, key):
-        return key in self.db_vt_connections_id_index
+        return self._db_vt_connections_id_index is not None and key in self._db_vt_connections_id_index
     
     def __get_db_prov_usages(self):
         return self._db_prov_usages
@@ -13607,6 +15158,13 @@ class DBProvDocument(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_prov_usage(self, key):
         return None
+    def __get_db_deleted_prov_usages(self):
+        if self._db_deleted_prov_usages is None:
+            self._db_deleted_prov_usages = []
+        return self._db_deleted_prov_usages
+    def __set_db_deleted_prov_usages(self, deleted):
+        self._db_deleted_prov_usages = deleted
+    db_deleted_prov_usages = property(__get_db_deleted_prov_usages, __set_db_deleted_prov_usages)
     
     def __get_db_prov_generations(self):
         return self._db_prov_generations
@@ -13627,6 +15185,13 @@ class DBProvDocument(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_prov_generation(self, key):
         return None
+    def __get_db_deleted_prov_generations(self):
+        if self._db_deleted_prov_generations is None:
+            self._db_deleted_prov_generations = []
+        return self._db_deleted_prov_generations
+    def __set_db_deleted_prov_generations(self, deleted):
+        self._db_deleted_prov_generations = deleted
+    db_deleted_prov_generations = property(__get_db_deleted_prov_generations, __set_db_deleted_prov_generations)
     
     def __get_db_prov_associations(self):
         return self._db_prov_associations
@@ -13647,6 +15212,13 @@ class DBProvDocument(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_prov_association(self, key):
         return None
+    def __get_db_deleted_prov_associations(self):
+        if self._db_deleted_prov_associations is None:
+            self._db_deleted_prov_associations = []
+        return self._db_deleted_prov_associations
+    def __set_db_deleted_prov_associations(self, deleted):
+        self._db_deleted_prov_associations = deleted
+    db_deleted_prov_associations = property(__get_db_deleted_prov_associations, __set_db_deleted_prov_associations)
     
 
 
@@ -13654,9 +15226,13 @@ class DBOpmProcesses(object):
 
     vtType = 'opm_processes'
 
+    __slots__ = ('_db_deleted_processs', '_db_processs_id_index',
+                 '_db_processs', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, processs=None):
-        self.db_deleted_processs = []
-        self.db_processs_id_index = {}
+        self._db_deleted_processs = None
+        self._db_processs_id_index = None
         if processs is None:
             self._db_processs = []
         else:
@@ -13686,7 +15262,8 @@ class DBOpmProcesses(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_processs_id_index = dict((v.db_id, v) for v in cp._db_processs)
+        if cp._db_processs:
+            cp._db_processs_id_index = dict((v.db_id, v) for v in cp._db_processs)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -13727,9 +15304,10 @@ class DBOpmProcesses(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_processs)
+        if self._db_deleted_processs is not None:
+            children.extend(self._db_deleted_processs)
         if remove:
-            self.db_deleted_processs = []
+            self._db_deleted_processs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -13775,10 +15353,24 @@ class DBOpmProcesses(object):
             if self._db_processs[i].db_id == key:
                 return self._db_processs[i]
         return None
+    def __get_db_deleted_processs(self):
+        if self._db_deleted_processs is None:
+            self._db_deleted_processs = []
+        return self._db_deleted_processs
+    def __set_db_deleted_processs(self, deleted):
+        self._db_deleted_processs = deleted
+    db_deleted_processs = property(__get_db_deleted_processs, __set_db_deleted_processs)
+    def __get_db_processs_id_index(self):
+        if self._db_processs_id_index is None:
+            self._db_processs_id_index = {}
+        return self._db_processs_id_index
+    def __set_db_processs_id_index(self, index):
+        self._db_processs_id_index = index
+    db_processs_id_index = property(__get_db_processs_id_index, __set_db_processs_id_index)
     def db_get_process_by_id(self, key):
         return self.db_processs_id_index[key]
     def db_has_process_with_id(self, key):
-        return key in self.db_processs_id_index
+        return self._db_processs_id_index is not None and key in self._db_processs_id_index
     
 
 
@@ -13786,6 +15378,8 @@ class DBOpmAccountId(object):
 
     vtType = 'opm_account_id'
 
+    __slots__ = ('_db_id', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None):
         self._db_id = id
         self.is_dirty = True
@@ -13858,16 +15452,21 @@ class DBPortSpecItem(object):
 
     vtType = 'portSpecItem'
 
+    __slots__ = ('_db_id', '_db_pos', '_db_module', '_db_package',
+                 '_db_namespace', '_db_label', '_db_default', '_db_values',
+                 '_db_entry_type', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, pos=None, module=None, package=None, namespace=None, label=None, default=None, values=None, entry_type=None):
         self._db_id = id
         self._db_pos = pos
-        self._db_module = module
-        self._db_package = package
-        self._db_namespace = namespace
+        self._db_module = _intern(module)
+        self._db_package = _intern(package)
+        self._db_namespace = _intern(namespace)
         self._db_label = label
         self._db_default = default
         self._db_values = values
-        self._db_entry_type = entry_type
+        self._db_entry_type = _intern(entry_type)
         self.is_dirty = True
         self.is_new = True
     
@@ -13994,39 +15593,39 @@ class DBPortSpecItem(object):
     def __get_db_module(self):
         return self._db_module
     def __set_db_module(self, module):
-        self._db_module = module
+        self._db_module = _intern(module)
         self.is_dirty = True
     db_module = property(__get_db_module, __set_db_module)
     def db_add_module(self, module):
-        self._db_module = module
+        self._db_module = _intern(module)
     def db_change_module(self, module):
-        self._db_module = module
+        self._db_module = _intern(module)
     def db_delete_module(self, module):
         self._db_module = None
     
     def __get_db_package(self):
         return self._db_package
     def __set_db_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
         self.is_dirty = True
     db_package = property(__get_db_package, __set_db_package)
     def db_add_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_change_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_delete_package(self, package):
         self._db_package = None
     
     def __get_db_namespace(self):
         return self._db_namespace
     def __set_db_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
         self.is_dirty = True
     db_namespace = property(__get_db_namespace, __set_db_namespace)
     def db_add_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_change_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_delete_namespace(self, namespace):
         self._db_namespace = None
     
@@ -14072,13 +15671,13 @@ class DBPortSpecItem(object):
     def __get_db_entry_type(self):
         return self._db_entry_type
     def __set_db_entry_type(self, entry_type):
-        self._db_entry_type = entry_type
+        self._db_entry_type = _intern(entry_type)
         self.is_dirty = True
     db_entry_type = property(__get_db_entry_type, __set_db_entry_type)
     def db_add_entry_type(self, entry_type):
-        self._db_entry_type = entry_type
+        self._db_entry_type = _intern(entry_type)
     def db_change_entry_type(self, entry_type):
-        self._db_entry_type = entry_type
+        self._db_entry_type = _intern(entry_type)
     def db_delete_entry_type(self, entry_type):
         self._db_entry_type = None
     
@@ -14089,24 +15688,30 @@ class DBMashupComponent(object):
 
     vtType = 'mashup_component'
 
+    __slots__ = ('_db_id', '_db_vtid', '_db_vttype', '_db_vtparent_type',
+                 '_db_vtparent_id', '_db_vtpos', '_db_vtmid', '_db_pos',
+                 '_db_type', '_db_val', '_db_minVal', '_db_maxVal',
+                 '_db_stepSize', '_db_strvaluelist', '_db_widget', '_db_seq',
+                 '_db_parent', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, vtid=None, vttype=None, vtparent_type=None, vtparent_id=None, vtpos=None, vtmid=None, pos=None, type=None, val=None, minVal=None, maxVal=None, stepSize=None, strvaluelist=None, widget=None, seq=None, parent=None):
         self._db_id = id
         self._db_vtid = vtid
-        self._db_vttype = vttype
-        self._db_vtparent_type = vtparent_type
+        self._db_vttype = _intern(vttype)
+        self._db_vtparent_type = _intern(vtparent_type)
         self._db_vtparent_id = vtparent_id
         self._db_vtpos = vtpos
         self._db_vtmid = vtmid
         self._db_pos = pos
-        self._db_type = type
+        self._db_type = _intern(type)
         self._db_val = val
-        self._db_minVal = minVal
-        self._db_maxVal = maxVal
-        self._db_stepSize = stepSize
+        self._db_minVal = _intern(minVal)
+        self._db_maxVal = _intern(maxVal)
+        self._db_stepSize = _intern(stepSize)
         self._db_strvaluelist = strvaluelist
-        self._db_widget = widget
+        self._db_widget = _intern(widget)
         self._db_seq = seq
-        self._db_parent = parent
+        self._db_parent = _intern(parent)
         self.is_dirty = True
         self.is_new = True
     
@@ -14281,26 +15886,26 @@ class DBMashupComponent(object):
     def __get_db_vttype(self):
         return self._db_vttype
     def __set_db_vttype(self, vttype):
-        self._db_vttype = vttype
+        self._db_vttype = _intern(vttype)
         self.is_dirty = True
     db_vttype = property(__get_db_vttype, __set_db_vttype)
     def db_add_vttype(self, vttype):
-        self._db_vttype = vttype
+        self._db_vttype = _intern(vttype)
     def db_change_vttype(self, vttype):
-        self._db_vttype = vttype
+        self._db_vttype = _intern(vttype)
     def db_delete_vttype(self, vttype):
         self._db_vttype = None
     
     def __get_db_vtparent_type(self):
         return self._db_vtparent_type
     def __set_db_vtparent_type(self, vtparent_type):
-        self._db_vtparent_type = vtparent_type
+        self._db_vtparent_type = _intern(vtparent_type)
         self.is_dirty = True
     db_vtparent_type = property(__get_db_vtparent_type, __set_db_vtparent_type)
     def db_add_vtparent_type(self, vtparent_type):
-        self._db_vtparent_type = vtparent_type
+        self._db_vtparent_type = _intern(vtparent_type)
     def db_change_vtparent_type(self, vtparent_type):
-        self._db_vtparent_type = vtparent_type
+        self._db_vtparent_type = _intern(vtparent_type)
     def db_delete_vtparent_type(self, vtparent_type):
         self._db_vtparent_type = None
     
@@ -14359,13 +15964,13 @@ class DBMashupComponent(object):
     def __get_db_type(self):
         return self._db_type
     def __set_db_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
         self.is_dirty = True
     db_type = property(__get_db_type, __set_db_type)
     def db_add_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
     def db_change_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
     def db_delete_type(self, type):
         self._db_type = None
     
@@ -14385,39 +15990,39 @@ class DBMashupComponent(object):
     def __get_db_minVal(self):
         return self._db_minVal
     def __set_db_minVal(self, minVal):
-        self._db_minVal = minVal
+        self._db_minVal = _intern(minVal)
         self.is_dirty = True
     db_minVal = property(__get_db_minVal, __set_db_minVal)
     def db_add_minVal(self, minVal):
-        self._db_minVal = minVal
+        self._db_minVal = _intern(minVal)
     def db_change_minVal(self, minVal):
-        self._db_minVal = minVal
+        self._db_minVal = _intern(minVal)
     def db_delete_minVal(self, minVal):
         self._db_minVal = None
     
     def __get_db_maxVal(self):
         return self._db_maxVal
     def __set_db_maxVal(self, maxVal):
-        self._db_maxVal = maxVal
+        self._db_maxVal = _intern(maxVal)
         self.is_dirty = True
     db_maxVal = property(__get_db_maxVal, __set_db_maxVal)
     def db_add_maxVal(self, maxVal):
-        self._db_maxVal = maxVal
+        self._db_maxVal = _intern(maxVal)
     def db_change_maxVal(self, maxVal):
-        self._db_maxVal = maxVal
+        self._db_maxVal = _intern(maxVal)
     def db_delete_maxVal(self, maxVal):
         self._db_maxVal = None
     
     def __get_db_stepSize(self):
         return self._db_stepSize
     def __set_db_stepSize(self, stepSize):
-        self._db_stepSize = stepSize
+        self._db_stepSize = _intern(stepSize)
         self.is_dirty = True
     db_stepSize = property(__get_db_stepSize, __set_db_stepSize)
     def db_add_stepSize(self, stepSize):
-        self._db_stepSize = stepSize
+        self._db_stepSize = _intern(stepSize)
     def db_change_stepSize(self, stepSize):
-        self._db_stepSize = stepSize
+        self._db_stepSize = _intern(stepSize)
     def db_delete_stepSize(self, stepSize):
         self._db_stepSize = None
     
@@ -14437,13 +16042,13 @@ class DBMashupComponent(object):
     def __get_db_widget(self):
         return self._db_widget
     def __set_db_widget(self, widget):
-        self._db_widget = widget
+        self._db_widget = _intern(widget)
         self.is_dirty = True
     db_widget = property(__get_db_widget, __set_db_widget)
     def db_add_widget(self, widget):
-        self._db_widget = widget
+        self._db_widget = _intern(widget)
     def db_change_widget(self, widget):
-        self._db_widget = widget
+        self._db_widget = _intern(widget)
     def db_delete_widget(self, widget):
         self._db_widget = None
     
@@ -14463,13 +16068,13 @@ class DBMashupComponent(object):
     def __get_db_parent(self):
         return self._db_parent
     def __set_db_parent(self, parent):
-        self._db_parent = parent
+        self._db_parent = _intern(parent)
         self.is_dirty = True
     db_parent = property(__get_db_parent, __set_db_parent)
     def db_add_parent(self, parent):
-        self._db_parent = parent
+        self._db_parent = _intern(parent)
     def db_change_parent(self, parent):
-        self._db_parent = parent
+        self._db_parent = _intern(parent)
     def db_delete_parent(self, parent):
         self._db_parent = None
     
@@ -14480,19 +16085,24 @@ class DBMashup(object):
 
     vtType = 'mashup'
 
+    __slots__ = ('_db_id', '_db_name', '_db_version', '_db_deleted_aliases',
+                 '_db_aliases_id_index', '_db_aliases', '_db_type', '_db_vtid',
+                 '_db_layout', '_db_geometry', '_db_has_seq', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, name=None, version=None, aliases=None, type=None, vtid=None, layout=None, geometry=None, has_seq=None):
         self._db_id = id
-        self._db_name = name
+        self._db_name = _intern(name)
         self._db_version = version
-        self.db_deleted_aliases = []
-        self.db_aliases_id_index = {}
+        self._db_deleted_aliases = None
+        self._db_aliases_id_index = None
         if aliases is None:
             self._db_aliases = []
         else:
             self._db_aliases = aliases
             for v in self._db_aliases:
                 self.db_aliases_id_index[v.db_id] = v
-        self._db_type = type
+        self._db_type = _intern(type)
         self._db_vtid = vtid
         self._db_layout = layout
         self._db_geometry = geometry
@@ -14529,7 +16139,8 @@ class DBMashup(object):
                 cp._db_vtid = id_remap[('vistrail', self._db_vtid)]
         
         # recreate indices and set flags
-        cp.db_aliases_id_index = dict((v.db_id, v) for v in cp._db_aliases)
+        if cp._db_aliases:
+            cp._db_aliases_id_index = dict((v.db_id, v) for v in cp._db_aliases)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -14610,9 +16221,10 @@ class DBMashup(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_aliases)
+        if self._db_deleted_aliases is not None:
+            children.extend(self._db_deleted_aliases)
         if remove:
-            self.db_deleted_aliases = []
+            self._db_deleted_aliases = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -14637,13 +16249,13 @@ class DBMashup(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -14697,21 +16309,35 @@ class DBMashup(object):
             if self._db_aliases[i].db_id == key:
                 return self._db_aliases[i]
         return None
+    def __get_db_deleted_aliases(self):
+        if self._db_deleted_aliases is None:
+            self._db_deleted_aliases = []
+        return self._db_deleted_aliases
+    def __set_db_deleted_aliases(self, deleted):
+        self._db_deleted_aliases = deleted
+    db_deleted_aliases = property(__get_db_deleted_aliases, __set_db_deleted_aliases)
+    def __get_db_aliases_id_index(self):
+        if self._db_aliases_id_index is None:
+            self._db_aliases_id_index = {}
+        return self._db_aliases_id_index
+    def __set_db_aliases_id_index(self, index):
+        self._db_aliases_id_index = index
+    db_aliases_id_index = property(__get_db_aliases_id_index, __set_db_aliases_id_index)
     def db_get_alias_by_id(self, key):
         return self.db_aliases_id_index[key]
     def db_has_alias_with_id(self, key):
-        return key in self.db_aliases_id_index
+        return self._db_aliases_id_index is not None and key in self._db_aliases_id_index
     
     def __get_db_type(self):
         return self._db_type
     def __set_db_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
         self.is_dirty = True
     db_type = property(__get_db_type, __set_db_type)
     def db_add_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
     def db_change_type(self, type):
-        self._db_type = type
+        self._db_type = _intern(type)
     def db_delete_type(self, type):
         self._db_type = None
     
@@ -14774,12 +16400,16 @@ class DBMachine(object):
 
     vtType = 'machine'
 
+    __slots__ = ('_db_id', '_db_name', '_db_os', '_db_architecture',
+                 '_db_processor', '_db_ram', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, name=None, os=None, architecture=None, processor=None, ram=None):
         self._db_id = id
-        self._db_name = name
-        self._db_os = os
-        self._db_architecture = architecture
-        self._db_processor = processor
+        self._db_name = _intern(name)
+        self._db_os = _intern(os)
+        self._db_architecture = _intern(architecture)
+        self._db_processor = _intern(processor)
         self._db_ram = ram
         self.is_dirty = True
         self.is_new = True
@@ -14878,52 +16508,52 @@ class DBMachine(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
     def __get_db_os(self):
         return self._db_os
     def __set_db_os(self, os):
-        self._db_os = os
+        self._db_os = _intern(os)
         self.is_dirty = True
     db_os = property(__get_db_os, __set_db_os)
     def db_add_os(self, os):
-        self._db_os = os
+        self._db_os = _intern(os)
     def db_change_os(self, os):
-        self._db_os = os
+        self._db_os = _intern(os)
     def db_delete_os(self, os):
         self._db_os = None
     
     def __get_db_architecture(self):
         return self._db_architecture
     def __set_db_architecture(self, architecture):
-        self._db_architecture = architecture
+        self._db_architecture = _intern(architecture)
         self.is_dirty = True
     db_architecture = property(__get_db_architecture, __set_db_architecture)
     def db_add_architecture(self, architecture):
-        self._db_architecture = architecture
+        self._db_architecture = _intern(architecture)
     def db_change_architecture(self, architecture):
-        self._db_architecture = architecture
+        self._db_architecture = _intern(architecture)
     def db_delete_architecture(self, architecture):
         self._db_architecture = None
     
     def __get_db_processor(self):
         return self._db_processor
     def __set_db_processor(self, processor):
-        self._db_processor = processor
+        self._db_processor = _intern(processor)
         self.is_dirty = True
     db_processor = property(__get_db_processor, __set_db_processor)
     def db_add_processor(self, processor):
-        self._db_processor = processor
+        self._db_processor = _intern(processor)
     def db_change_processor(self, processor):
-        self._db_processor = processor
+        self._db_processor = _intern(processor)
     def db_delete_processor(self, processor):
         self._db_processor = None
     
@@ -14947,6 +16577,8 @@ class DBConfigFloat(object):
 
     vtType = 'config_float'
 
+    __slots__ = ('_db_value', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, value=None):
         self._db_value = value
         self.is_dirty = True
@@ -15017,10 +16649,13 @@ class DBOther(object):
 
     vtType = 'other'
 
+    __slots__ = ('_db_id', '_db_key', '_db_value', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, id=None, key=None, value=None):
         self._db_id = id
-        self._db_key = key
-        self._db_value = value
+        self._db_key = _intern(key)
+        self._db_value = _intern(value)
         self.is_dirty = True
         self.is_new = True
     
@@ -15098,26 +16733,26 @@ class DBOther(object):
     def __get_db_key(self):
         return self._db_key
     def __set_db_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
         self.is_dirty = True
     db_key = property(__get_db_key, __set_db_key)
     def db_add_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
     def db_change_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
     def db_delete_key(self, key):
         self._db_key = None
     
     def __get_db_value(self):
         return self._db_value
     def __set_db_value(self, value):
-        self._db_value = value
+        self._db_value = _intern(value)
         self.is_dirty = True
     db_value = property(__get_db_value, __set_db_value)
     def db_add_value(self, value):
-        self._db_value = value
+        self._db_value = _intern(value)
     def db_change_value(self, value):
-        self._db_value = value
+        self._db_value = _intern(value)
     def db_delete_value(self, value):
         self._db_value = None
     
@@ -15128,6 +16763,9 @@ class DBRefProvActivity(object):
 
     vtType = 'ref_prov_activity'
 
+    __slots__ = ('_db_prov_ref', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, prov_ref=None):
         self._db_prov_ref = prov_ref
         self.is_dirty = True
@@ -15200,27 +16838,38 @@ class DBAbstraction(object):
 
     vtType = 'abstraction'
 
+    __slots__ = ('_db_id', '_db_cache', '_db_name', '_db_namespace',
+                 '_db_package', '_db_version', '_db_internal_version',
+                 '_db_deleted_location', '_db_location',
+                 '_db_deleted_functions', '_db_functions_id_index',
+                 '_db_functions', '_db_deleted_annotations',
+                 '_db_annotations_id_index', '_db_annotations_key_index',
+                 '_db_annotations', '_db_deleted_controlParameters',
+                 '_db_controlParameters_id_index',
+                 '_db_controlParameters_name_index', '_db_controlParameters',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, cache=None, name=None, namespace=None, package=None, version=None, internal_version=None, location=None, functions=None, annotations=None, controlParameters=None):
         self._db_id = id
         self._db_cache = cache
-        self._db_name = name
-        self._db_namespace = namespace
-        self._db_package = package
-        self._db_version = version
-        self._db_internal_version = internal_version
-        self.db_deleted_location = []
+        self._db_name = _intern(name)
+        self._db_namespace = _intern(namespace)
+        self._db_package = _intern(package)
+        self._db_version = _intern(version)
+        self._db_internal_version = _intern(internal_version)
+        self._db_deleted_location = None
         self._db_location = location
-        self.db_deleted_functions = []
-        self.db_functions_id_index = {}
+        self._db_deleted_functions = None
+        self._db_functions_id_index = None
         if functions is None:
             self._db_functions = []
         else:
             self._db_functions = functions
             for v in self._db_functions:
                 self.db_functions_id_index[v.db_id] = v
-        self.db_deleted_annotations = []
-        self.db_annotations_id_index = {}
-        self.db_annotations_key_index = {}
+        self._db_deleted_annotations = None
+        self._db_annotations_id_index = None
+        self._db_annotations_key_index = None
         if annotations is None:
             self._db_annotations = []
         else:
@@ -15228,9 +16877,9 @@ class DBAbstraction(object):
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
                 self.db_annotations_key_index[v.db_key] = v
-        self.db_deleted_controlParameters = []
-        self.db_controlParameters_id_index = {}
-        self.db_controlParameters_name_index = {}
+        self._db_deleted_controlParameters = None
+        self._db_controlParameters_id_index = None
+        self._db_controlParameters_name_index = None
         if controlParameters is None:
             self._db_controlParameters = []
         else:
@@ -15277,11 +16926,14 @@ class DBAbstraction(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_functions_id_index = dict((v.db_id, v) for v in cp._db_functions)
-        cp.db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
-        cp.db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
-        cp.db_controlParameters_id_index = dict((v.db_id, v) for v in cp._db_controlParameters)
-        cp.db_controlParameters_name_index = dict((v.db_name, v) for v in cp._db_controlParameters)
+        if cp._db_functions:
+            cp._db_functions_id_index = dict((v.db_id, v) for v in cp._db_functions)
+        if cp._db_annotations:
+            cp._db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
+            cp._db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
+        if cp._db_controlParameters:
+            cp._db_controlParameters_id_index = dict((v.db_id, v) for v in cp._db_controlParameters)
+            cp._db_controlParameters_name_index = dict((v.db_name, v) for v in cp._db_controlParameters)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -15407,15 +17059,19 @@ class DBAbstraction(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_location)
-        children.extend(self.db_deleted_functions)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_controlParameters)
+        if self._db_deleted_location is not None:
+            children.extend(self._db_deleted_location)
+        if self._db_deleted_functions is not None:
+            children.extend(self._db_deleted_functions)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_controlParameters is not None:
+            children.extend(self._db_deleted_controlParameters)
         if remove:
-            self.db_deleted_location = []
-            self.db_deleted_functions = []
-            self.db_deleted_annotations = []
-            self.db_deleted_controlParameters = []
+            self._db_deleted_location = None
+            self._db_deleted_functions = None
+            self._db_deleted_annotations = None
+            self._db_deleted_controlParameters = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -15461,65 +17117,65 @@ class DBAbstraction(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
     def __get_db_namespace(self):
         return self._db_namespace
     def __set_db_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
         self.is_dirty = True
     db_namespace = property(__get_db_namespace, __set_db_namespace)
     def db_add_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_change_namespace(self, namespace):
-        self._db_namespace = namespace
+        self._db_namespace = _intern(namespace)
     def db_delete_namespace(self, namespace):
         self._db_namespace = None
     
     def __get_db_package(self):
         return self._db_package
     def __set_db_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
         self.is_dirty = True
     db_package = property(__get_db_package, __set_db_package)
     def db_add_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_change_package(self, package):
-        self._db_package = package
+        self._db_package = _intern(package)
     def db_delete_package(self, package):
         self._db_package = None
     
     def __get_db_version(self):
         return self._db_version
     def __set_db_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
         self.is_dirty = True
     db_version = property(__get_db_version, __set_db_version)
     def db_add_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_change_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_delete_version(self, version):
         self._db_version = None
     
     def __get_db_internal_version(self):
         return self._db_internal_version
     def __set_db_internal_version(self, internal_version):
-        self._db_internal_version = internal_version
+        self._db_internal_version = _intern(internal_version)
         self.is_dirty = True
     db_internal_version = property(__get_db_internal_version, __set_db_internal_version)
     def db_add_internal_version(self, internal_version):
-        self._db_internal_version = internal_version
+        self._db_internal_version = _intern(internal_version)
     def db_change_internal_version(self, internal_version):
-        self._db_internal_version = internal_version
+        self._db_internal_version = _intern(internal_version)
     def db_delete_internal_version(self, internal_version):
         self._db_internal_version = None
     
@@ -15537,6 +17193,13 @@ class DBAbstraction(object):
         if not self.is_new:
             self.db_deleted_location.append(self._db_location)
         self._db_location = None
+    def __get_db_deleted_location(self):
+        if self._db_deleted_location is None:
+            self._db_deleted_location = []
+        return self._db_deleted_location
+    def __set_db_deleted_location(self, deleted):
+        self._db_deleted_location = deleted
+    db_deleted_location = property(__get_db_deleted_location, __set_db_deleted_location)
     
     def __get_db_functions(self):
         return self._db_functions
@@ -15575,10 +17238,24 @@ class DBAbstraction(object):
             if self._db_functions[i].db_id == key:
                 return self._db_functions[i]
         return None
+    def __get_db_deleted_functions(self):
+        if self._db_deleted_functions is None:
+            self._db_deleted_functions = []
+        return self._db_deleted_functions
+    def __set_db_deleted_functions(self, deleted):
+        self._db_deleted_functions = deleted
+    db_deleted_functions = property(__get_db_deleted_functions, __set_db_deleted_functions)
+    def __get_db_functions_id_index(self):
+        if self._db_functions_id_index is None:
+            self._db_functions_id_index = {}
+        return self._db_functions_id_index
+    def __set_db_functions_id_index(self, index):
+        self._db_functions_id_index = index
+    db_functions_id_index = property(__get_db_functions_id_index, __set_db_functions_id_index)
     def db_get_function_by_id(self, key):
         return self.db_functions_id_index[key]
     def db_has_function_with_id(self, key):
-        return key in self.db_functions_id_index
+        return self._db_functions_id_index is not None and key in self._db_functions_id_index
     
     def __get_db_annotations(self):
         return self._db_annotations
@@ -15620,14 +17297,35 @@ class DBAbstraction(object):
             if self._db_annotations[i].db_id == key:
                 return self._db_annotations[i]
         return None
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
+    def __get_db_annotations_id_index(self):
+        if self._db_annotations_id_index is None:
+            self._db_annotations_id_index = {}
+        return self._db_annotations_id_index
+    def __set_db_annotations_id_index(self, index):
+        self._db_annotations_id_index = index
+    db_annotations_id_index = property(__get_db_annotations_id_index, __set_db_annotations_id_index)
+    def __get_db_annotations_key_index(self):
+        if self._db_annotations_key_index is None:
+            self._db_annotations_key_index = {}
+        return self._db_annotations_key_index
+    def __set_db_annotations_key_index(self, index):
+        self._db_annotations_key_index = index
+    db_annotations_key_index = property(__get_db_annotations_key_index, __set_db_annotations_key_index)
     def db_get_annotation_by_id(self, key):
         return self.db_annotations_id_index[key]
     def db_has_annotation_with_id(self, key):
-        return key in self.db_annotations_id_index
+        return self._db_annotations_id_index is not None and key in self._db_annotations_id_index
     def db_get_annotation_by_key(self, key):
         return self.db_annotations_key_index[key]
     def db_has_annotation_with_key(self, key):
-        return key in self.db_annotations_key_index
+        return self._db_annotations_key_index is not None and key in self._db_annotations_key_index
     
     def __get_db_controlParameters(self):
         return self._db_controlParameters
@@ -15669,14 +17367,35 @@ class DBAbstraction(object):
             if self._db_controlParameters[i].db_id == key:
                 return self._db_controlParameters[i]
         return None
+    def __get_db_deleted_controlParameters(self):
+        if self._db_deleted_controlParameters is None:
+            self._db_deleted_controlParameters = []
+        return self._db_deleted_controlParameters
+    def __set_db_deleted_controlParameters(self, deleted):
+        self._db_deleted_controlParameters = deleted
+    db_deleted_controlParameters = property(__get_db_deleted_controlParameters, __set_db_deleted_controlParameters)
+    def __get_db_controlParameters_id_index(self):
+        if self._db_controlParameters_id_index is None:
+            self._db_controlParameters_id_index = {}
+        return self._db_controlParameters_id_index
+    def __set_db_controlParameters_id_index(self, index):
+        self._db_controlParameters_id_index = index
+    db_controlParameters_id_index = property(__get_db_controlParameters_id_index, __set_db_controlParameters_id_index)
+    def __get_db_controlParameters_name_index(self):
+        if self._db_controlParameters_name_index is None:
+            self._db_controlParameters_name_index = {}
+        return self._db_controlParameters_name_index
+    def __set_db_controlParameters_name_index(self, index):
+        self._db_controlParameters_name_index = index
+    db_controlParameters_name_index = property(__get_db_controlParameters_name_index, __set_db_controlParameters_name_index)
     def db_get_controlParameter_by_id(self, key):
         return self.db_controlParameters_id_index[key]
     def db_has_controlParameter_with_id(self, key):
-        return key in self.db_controlParameters_id_index
+        return self._db_controlParameters_id_index is not None and key in self._db_controlParameters_id_index
     def db_get_controlParameter_by_name(self, key):
         return self.db_controlParameters_name_index[key]
     def db_has_controlParameter_with_name(self, key):
-        return key in self.db_controlParameters_name_index
+        return self._db_controlParameters_name_index is not None and key in self._db_controlParameters_name_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -15685,6 +17404,11 @@ class DBProvAgent(object):
 
     vtType = 'prov_agent'
 
+    __slots__ = ('_db_id', '_db_vt_id', '_db_prov_type', '_db_prov_label',
+                 '_db_vt_machine_os', '_db_vt_machine_architecture',
+                 '_db_vt_machine_processor', '_db_vt_machine_ram', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, vt_id=None, prov_type=None, prov_label=None, vt_machine_os=None, vt_machine_architecture=None, vt_machine_processor=None, vt_machine_ram=None):
         self._db_id = id
         self._db_vt_id = vt_id
@@ -15896,23 +17620,34 @@ class DBMashuptrail(object):
 
     vtType = 'mashuptrail'
 
+    __slots__ = ('_db_id', '_db_name', '_db_version', '_db_vtVersion',
+                 '_db_last_modified', '_db_deleted_actions',
+                 '_db_actions_id_index', '_db_actions',
+                 '_db_deleted_annotations', '_db_annotations_id_index',
+                 '_db_annotations_key_index', '_db_annotations',
+                 '_db_deleted_actionAnnotations',
+                 '_db_actionAnnotations_id_index',
+                 '_db_actionAnnotations_action_id_index',
+                 '_db_actionAnnotations_key_index', '_db_actionAnnotations',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, name=None, version=None, vtVersion=None, last_modified=None, actions=None, annotations=None, actionAnnotations=None):
         self._db_id = id
-        self._db_name = name
-        self._db_version = version
+        self._db_name = _intern(name)
+        self._db_version = _intern(version)
         self._db_vtVersion = vtVersion
         self._db_last_modified = last_modified
-        self.db_deleted_actions = []
-        self.db_actions_id_index = {}
+        self._db_deleted_actions = None
+        self._db_actions_id_index = None
         if actions is None:
             self._db_actions = []
         else:
             self._db_actions = actions
             for v in self._db_actions:
                 self.db_actions_id_index[v.db_id] = v
-        self.db_deleted_annotations = []
-        self.db_annotations_id_index = {}
-        self.db_annotations_key_index = {}
+        self._db_deleted_annotations = None
+        self._db_annotations_id_index = None
+        self._db_annotations_key_index = None
         if annotations is None:
             self._db_annotations = []
         else:
@@ -15920,10 +17655,10 @@ class DBMashuptrail(object):
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
                 self.db_annotations_key_index[v.db_key] = v
-        self.db_deleted_actionAnnotations = []
-        self.db_actionAnnotations_id_index = {}
-        self.db_actionAnnotations_action_id_index = {}
-        self.db_actionAnnotations_key_index = {}
+        self._db_deleted_actionAnnotations = None
+        self._db_actionAnnotations_id_index = None
+        self._db_actionAnnotations_action_id_index = None
+        self._db_actionAnnotations_key_index = None
         if actionAnnotations is None:
             self._db_actionAnnotations = []
         else:
@@ -15967,12 +17702,15 @@ class DBMashuptrail(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_actions_id_index = dict((v.db_id, v) for v in cp._db_actions)
-        cp.db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
-        cp.db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
-        cp.db_actionAnnotations_id_index = dict((v.db_id, v) for v in cp._db_actionAnnotations)
-        cp.db_actionAnnotations_action_id_index = dict(((v.db_action_id,v.db_key), v) for v in cp._db_actionAnnotations)
-        cp.db_actionAnnotations_key_index = dict(((v.db_key,v.db_value), v) for v in cp._db_actionAnnotations)
+        if cp._db_actions:
+            cp._db_actions_id_index = dict((v.db_id, v) for v in cp._db_actions)
+        if cp._db_annotations:
+            cp._db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
+            cp._db_annotations_key_index = dict((v.db_key, v) for v in cp._db_annotations)
+        if cp._db_actionAnnotations:
+            cp._db_actionAnnotations_id_index = dict((v.db_id, v) for v in cp._db_actionAnnotations)
+            cp._db_actionAnnotations_action_id_index = dict(((v.db_action_id,v.db_key), v) for v in cp._db_actionAnnotations)
+            cp._db_actionAnnotations_key_index = dict(((v.db_key,v.db_value), v) for v in cp._db_actionAnnotations)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -16074,13 +17812,16 @@ class DBMashuptrail(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_actions)
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_actionAnnotations)
+        if self._db_deleted_actions is not None:
+            children.extend(self._db_deleted_actions)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_actionAnnotations is not None:
+            children.extend(self._db_deleted_actionAnnotations)
         if remove:
-            self.db_deleted_actions = []
-            self.db_deleted_annotations = []
-            self.db_deleted_actionAnnotations = []
+            self._db_deleted_actions = None
+            self._db_deleted_annotations = None
+            self._db_deleted_actionAnnotations = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -16111,26 +17852,26 @@ class DBMashuptrail(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
     def __get_db_version(self):
         return self._db_version
     def __set_db_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
         self.is_dirty = True
     db_version = property(__get_db_version, __set_db_version)
     def db_add_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_change_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_delete_version(self, version):
         self._db_version = None
     
@@ -16197,10 +17938,24 @@ class DBMashuptrail(object):
             if self._db_actions[i].db_id == key:
                 return self._db_actions[i]
         return None
+    def __get_db_deleted_actions(self):
+        if self._db_deleted_actions is None:
+            self._db_deleted_actions = []
+        return self._db_deleted_actions
+    def __set_db_deleted_actions(self, deleted):
+        self._db_deleted_actions = deleted
+    db_deleted_actions = property(__get_db_deleted_actions, __set_db_deleted_actions)
+    def __get_db_actions_id_index(self):
+        if self._db_actions_id_index is None:
+            self._db_actions_id_index = {}
+        return self._db_actions_id_index
+    def __set_db_actions_id_index(self, index):
+        self._db_actions_id_index = index
+    db_actions_id_index = property(__get_db_actions_id_index, __set_db_actions_id_index)
     def db_get_action_by_id(self, key):
         return self.db_actions_id_index[key]
     def db_has_action_with_id(self, key):
-        return key in self.db_actions_id_index
+        return self._db_actions_id_index is not None and key in self._db_actions_id_index
     
     def __get_db_annotations(self):
         return self._db_annotations
@@ -16242,14 +17997,35 @@ class DBMashuptrail(object):
             if self._db_annotations[i].db_id == key:
                 return self._db_annotations[i]
         return None
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
+    def __get_db_annotations_id_index(self):
+        if self._db_annotations_id_index is None:
+            self._db_annotations_id_index = {}
+        return self._db_annotations_id_index
+    def __set_db_annotations_id_index(self, index):
+        self._db_annotations_id_index = index
+    db_annotations_id_index = property(__get_db_annotations_id_index, __set_db_annotations_id_index)
+    def __get_db_annotations_key_index(self):
+        if self._db_annotations_key_index is None:
+            self._db_annotations_key_index = {}
+        return self._db_annotations_key_index
+    def __set_db_annotations_key_index(self, index):
+        self._db_annotations_key_index = index
+    db_annotations_key_index = property(__get_db_annotations_key_index, __set_db_annotations_key_index)
     def db_get_annotation_by_id(self, key):
         return self.db_annotations_id_index[key]
     def db_has_annotation_with_id(self, key):
-        return key in self.db_annotations_id_index
+        return self._db_annotations_id_index is not None and key in self._db_annotations_id_index
     def db_get_annotation_by_key(self, key):
         return self.db_annotations_key_index[key]
     def db_has_annotation_with_key(self, key):
-        return key in self.db_annotations_key_index
+        return self._db_annotations_key_index is not None and key in self._db_annotations_key_index
     
     def __get_db_actionAnnotations(self):
         return self._db_actionAnnotations
@@ -16297,18 +18073,46 @@ class DBMashuptrail(object):
             if self._db_actionAnnotations[i].db_id == key:
                 return self._db_actionAnnotations[i]
         return None
+    def __get_db_deleted_actionAnnotations(self):
+        if self._db_deleted_actionAnnotations is None:
+            self._db_deleted_actionAnnotations = []
+        return self._db_deleted_actionAnnotations
+    def __set_db_deleted_actionAnnotations(self, deleted):
+        self._db_deleted_actionAnnotations = deleted
+    db_deleted_actionAnnotations = property(__get_db_deleted_actionAnnotations, __set_db_deleted_actionAnnotations)
+    def __get_db_actionAnnotations_id_index(self):
+        if self._db_actionAnnotations_id_index is None:
+            self._db_actionAnnotations_id_index = {}
+        return self._db_actionAnnotations_id_index
+    def __set_db_actionAnnotations_id_index(self, index):
+        self._db_actionAnnotations_id_index = index
+    db_actionAnnotations_id_index = property(__get_db_actionAnnotations_id_index, __set_db_actionAnnotations_id_index)
+    def __get_db_actionAnnotations_action_id_index(self):
+        if self._db_actionAnnotations_action_id_index is None:
+            self._db_actionAnnotations_action_id_index = {}
+        return self._db_actionAnnotations_action_id_index
+    def __set_db_actionAnnotations_action_id_index(self, index):
+        self._db_actionAnnotations_action_id_index = index
+    db_actionAnnotations_action_id_index = property(__get_db_actionAnnotations_action_id_index, __set_db_actionAnnotations_action_id_index)
+    def __get_db_actionAnnotations_key_index(self):
+        if self._db_actionAnnotations_key_index is None:
+            self._db_actionAnnotations_key_index = {}
+        return self._db_actionAnnotations_key_index
+    def __set_db_actionAnnotations_key_index(self, index):
+        self._db_actionAnnotations_key_index = index
+    db_actionAnnotations_key_index = property(__get_db_actionAnnotations_key_index, __set_db_actionAnnotations_key_index)
     def db_get_actionAnnotation_by_id(self, key):
         return self.db_actionAnnotations_id_index[key]
     def db_has_actionAnnotation_with_id(self, key):
-        return key in self.db_actionAnnotations_id_index
+        return self._db_actionAnnotations_id_index is not None and key in self._db_actionAnnotations_id_index
     def db_get_actionAnnotation_by_action_id(self, key):
         return self.db_actionAnnotations_action_id_index[key]
     def db_has_actionAnnotation_with_action_id(self, key):
-        return key in self.db_actionAnnotations_action_id_index
+        return self._db_actionAnnotations_action_id_index is not None and key in self._db_actionAnnotations_action_id_index
     def db_get_actionAnnotation_by_key(self, key):
         return self.db_actionAnnotations_key_index[key]
     def db_has_actionAnnotation_with_key(self, key):
-        return key in self.db_actionAnnotations_key_index
+        return self._db_actionAnnotations_key_index is not None and key in self._db_actionAnnotations_key_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -16317,16 +18121,22 @@ class DBRegistry(object):
 
     vtType = 'registry'
 
+    __slots__ = ('_db_id', '_db_entity_type', '_db_version',
+                 '_db_root_descriptor_id', '_db_name', '_db_last_modified',
+                 '_db_deleted_packages', '_db_packages_id_index',
+                 '_db_packages_identifier_index', '_db_packages', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, entity_type=None, version=None, root_descriptor_id=None, name=None, last_modified=None, packages=None):
         self._db_id = id
-        self._db_entity_type = entity_type
-        self._db_version = version
+        self._db_entity_type = _intern(entity_type)
+        self._db_version = _intern(version)
         self._db_root_descriptor_id = root_descriptor_id
-        self._db_name = name
+        self._db_name = _intern(name)
         self._db_last_modified = last_modified
-        self.db_deleted_packages = []
-        self.db_packages_id_index = {}
-        self.db_packages_identifier_index = {}
+        self._db_deleted_packages = None
+        self._db_packages_id_index = None
+        self._db_packages_identifier_index = None
         if packages is None:
             self._db_packages = []
         else:
@@ -16364,8 +18174,9 @@ class DBRegistry(object):
                 cp._db_root_descriptor_id = id_remap[('module_descriptor', self._db_root_descriptor_id)]
         
         # recreate indices and set flags
-        cp.db_packages_id_index = dict((v.db_id, v) for v in cp._db_packages)
-        cp.db_packages_identifier_index = dict(((v.db_identifier,v.db_version), v) for v in cp._db_packages)
+        if cp._db_packages:
+            cp._db_packages_id_index = dict((v.db_id, v) for v in cp._db_packages)
+            cp._db_packages_identifier_index = dict(((v.db_identifier,v.db_version), v) for v in cp._db_packages)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -16436,9 +18247,10 @@ class DBRegistry(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_packages)
+        if self._db_deleted_packages is not None:
+            children.extend(self._db_deleted_packages)
         if remove:
-            self.db_deleted_packages = []
+            self._db_deleted_packages = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -16463,26 +18275,26 @@ class DBRegistry(object):
     def __get_db_entity_type(self):
         return self._db_entity_type
     def __set_db_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
         self.is_dirty = True
     db_entity_type = property(__get_db_entity_type, __set_db_entity_type)
     def db_add_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
     def db_change_entity_type(self, entity_type):
-        self._db_entity_type = entity_type
+        self._db_entity_type = _intern(entity_type)
     def db_delete_entity_type(self, entity_type):
         self._db_entity_type = None
     
     def __get_db_version(self):
         return self._db_version
     def __set_db_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
         self.is_dirty = True
     db_version = property(__get_db_version, __set_db_version)
     def db_add_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_change_version(self, version):
-        self._db_version = version
+        self._db_version = _intern(version)
     def db_delete_version(self, version):
         self._db_version = None
     
@@ -16502,13 +18314,13 @@ class DBRegistry(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -16565,14 +18377,35 @@ class DBRegistry(object):
             if self._db_packages[i].db_id == key:
                 return self._db_packages[i]
         return None
+    def __get_db_deleted_packages(self):
+        if self._db_deleted_packages is None:
+            self._db_deleted_packages = []
+        return self._db_deleted_packages
+    def __set_db_deleted_packages(self, deleted):
+        self._db_deleted_packages = deleted
+    db_deleted_packages = property(__get_db_deleted_packages, __set_db_deleted_packages)
+    def __get_db_packages_id_index(self):
+        if self._db_packages_id_index is None:
+            self._db_packages_id_index = {}
+        return self._db_packages_id_index
+    def __set_db_packages_id_index(self, index):
+        self._db_packages_id_index = index
+    db_packages_id_index = property(__get_db_packages_id_index, __set_db_packages_id_index)
+    def __get_db_packages_identifier_index(self):
+        if self._db_packages_identifier_index is None:
+            self._db_packages_identifier_index = {}
+        return self._db_packages_identifier_index
+    def __set_db_packages_identifier_index(self, index):
+        self._db_packages_identifier_index = index
+    db_packages_identifier_index = property(__get_db_packages_identifier_index, __set_db_packages_identifier_index)
     def db_get_package_by_id(self, key):
         return self.db_packages_id_index[key]
     def db_has_package_with_id(self, key):
-        return key in self.db_packages_id_index
+        return self._db_packages_id_index is not None and key in self._db_packages_id_index
     def db_get_package_by_identifier(self, key):
         return self.db_packages_identifier_index[key]
     def db_has_package_with_identifier(self, key):
-        return key in self.db_packages_identifier_index
+        return self._db_packages_identifier_index is not None and key in self._db_packages_identifier_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -16581,10 +18414,13 @@ class DBOpmAgent(object):
 
     vtType = 'opm_agent'
 
+    __slots__ = ('_db_id', '_db_value', '_db_deleted_accounts', '_db_accounts',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, value=None, accounts=None):
         self._db_id = id
         self._db_value = value
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
@@ -16663,9 +18499,10 @@ class DBOpmAgent(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_accounts)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
         if remove:
-            self.db_deleted_accounts = []
+            self._db_deleted_accounts = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -16719,6 +18556,13 @@ class DBOpmAgent(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_account(self, key):
         return None
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     
     def getPrimaryKey(self):
         return self._db_id
@@ -16727,6 +18571,13 @@ class DBProvEntity(object):
 
     vtType = 'prov_entity'
 
+    __slots__ = ('_db_id', '_db_prov_type', '_db_prov_label', '_db_prov_value',
+                 '_db_vt_id', '_db_vt_type', '_db_vt_desc', '_db_vt_package',
+                 '_db_vt_version', '_db_vt_cache', '_db_vt_location_x',
+                 '_db_vt_location_y', '_db_deleted_is_part_of',
+                 '_db_is_part_of', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, prov_type=None, prov_label=None, prov_value=None, vt_id=None, vt_type=None, vt_desc=None, vt_package=None, vt_version=None, vt_cache=None, vt_location_x=None, vt_location_y=None, is_part_of=None):
         self._db_id = id
         self._db_prov_type = prov_type
@@ -16740,7 +18591,7 @@ class DBProvEntity(object):
         self._db_vt_cache = vt_cache
         self._db_vt_location_x = vt_location_x
         self._db_vt_location_y = vt_location_y
-        self.db_deleted_is_part_of = []
+        self._db_deleted_is_part_of = None
         self._db_is_part_of = is_part_of
         self.is_dirty = True
         self.is_new = True
@@ -16870,9 +18721,10 @@ class DBProvEntity(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_is_part_of)
+        if self._db_deleted_is_part_of is not None:
+            children.extend(self._db_deleted_is_part_of)
         if remove:
-            self.db_deleted_is_part_of = []
+            self._db_deleted_is_part_of = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17050,6 +18902,13 @@ class DBProvEntity(object):
         if not self.is_new:
             self.db_deleted_is_part_of.append(self._db_is_part_of)
         self._db_is_part_of = None
+    def __get_db_deleted_is_part_of(self):
+        if self._db_deleted_is_part_of is None:
+            self._db_deleted_is_part_of = []
+        return self._db_deleted_is_part_of
+    def __set_db_deleted_is_part_of(self, deleted):
+        self._db_deleted_is_part_of = deleted
+    db_deleted_is_part_of = property(__get_db_deleted_is_part_of, __set_db_deleted_is_part_of)
     
     def getPrimaryKey(self):
         return self._db_id
@@ -17058,9 +18917,12 @@ class DBAnnotation(object):
 
     vtType = 'annotation'
 
+    __slots__ = ('_db_id', '_db_key', '_db_value', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, id=None, key=None, value=None):
         self._db_id = id
-        self._db_key = key
+        self._db_key = _intern(key)
         self._db_value = value
         self.is_dirty = True
         self.is_new = True
@@ -17139,13 +19001,13 @@ class DBAnnotation(object):
     def __get_db_key(self):
         return self._db_key
     def __set_db_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
         self.is_dirty = True
     db_key = property(__get_db_key, __set_db_key)
     def db_add_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
     def db_change_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
     def db_delete_key(self, key):
         self._db_key = None
     
@@ -17169,6 +19031,9 @@ class DBOpmTime(object):
 
     vtType = 'opm_time'
 
+    __slots__ = ('_db_no_later_than', '_db_no_earlier_than', '_db_clock_id',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, no_later_than=None, no_earlier_than=None, clock_id=None):
         self._db_no_later_than = no_later_than
         self._db_no_earlier_than = no_earlier_than
@@ -17279,16 +19144,21 @@ class DBParameterExploration(object):
 
     vtType = 'parameter_exploration'
 
+    __slots__ = ('_db_id', '_db_action_id', '_db_name', '_db_date', '_db_user',
+                 '_db_dims', '_db_layout', '_db_deleted_functions',
+                 '_db_functions_id_index', '_db_functions', 'is_dirty',
+                 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, action_id=None, name=None, date=None, user=None, dims=None, layout=None, functions=None):
         self._db_id = id
         self._db_action_id = action_id
-        self._db_name = name
+        self._db_name = _intern(name)
         self._db_date = date
-        self._db_user = user
-        self._db_dims = dims
-        self._db_layout = layout
-        self.db_deleted_functions = []
-        self.db_functions_id_index = {}
+        self._db_user = _intern(user)
+        self._db_dims = _intern(dims)
+        self._db_layout = _intern(layout)
+        self._db_deleted_functions = None
+        self._db_functions_id_index = None
         if functions is None:
             self._db_functions = []
         else:
@@ -17326,7 +19196,8 @@ class DBParameterExploration(object):
                 cp._db_action_id = id_remap[('action', self._db_action_id)]
         
         # recreate indices and set flags
-        cp.db_functions_id_index = dict((v.db_id, v) for v in cp._db_functions)
+        if cp._db_functions:
+            cp._db_functions_id_index = dict((v.db_id, v) for v in cp._db_functions)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -17402,9 +19273,10 @@ class DBParameterExploration(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_functions)
+        if self._db_deleted_functions is not None:
+            children.extend(self._db_deleted_functions)
         if remove:
-            self.db_deleted_functions = []
+            self._db_deleted_functions = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17442,13 +19314,13 @@ class DBParameterExploration(object):
     def __get_db_name(self):
         return self._db_name
     def __set_db_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
         self.is_dirty = True
     db_name = property(__get_db_name, __set_db_name)
     def db_add_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_change_name(self, name):
-        self._db_name = name
+        self._db_name = _intern(name)
     def db_delete_name(self, name):
         self._db_name = None
     
@@ -17468,39 +19340,39 @@ class DBParameterExploration(object):
     def __get_db_user(self):
         return self._db_user
     def __set_db_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
         self.is_dirty = True
     db_user = property(__get_db_user, __set_db_user)
     def db_add_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_change_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_delete_user(self, user):
         self._db_user = None
     
     def __get_db_dims(self):
         return self._db_dims
     def __set_db_dims(self, dims):
-        self._db_dims = dims
+        self._db_dims = _intern(dims)
         self.is_dirty = True
     db_dims = property(__get_db_dims, __set_db_dims)
     def db_add_dims(self, dims):
-        self._db_dims = dims
+        self._db_dims = _intern(dims)
     def db_change_dims(self, dims):
-        self._db_dims = dims
+        self._db_dims = _intern(dims)
     def db_delete_dims(self, dims):
         self._db_dims = None
     
     def __get_db_layout(self):
         return self._db_layout
     def __set_db_layout(self, layout):
-        self._db_layout = layout
+        self._db_layout = _intern(layout)
         self.is_dirty = True
     db_layout = property(__get_db_layout, __set_db_layout)
     def db_add_layout(self, layout):
-        self._db_layout = layout
+        self._db_layout = _intern(layout)
     def db_change_layout(self, layout):
-        self._db_layout = layout
+        self._db_layout = _intern(layout)
     def db_delete_layout(self, layout):
         self._db_layout = None
     
@@ -17541,10 +19413,24 @@ class DBParameterExploration(object):
             if self._db_functions[i].db_id == key:
                 return self._db_functions[i]
         return None
+    def __get_db_deleted_functions(self):
+        if self._db_deleted_functions is None:
+            self._db_deleted_functions = []
+        return self._db_deleted_functions
+    def __set_db_deleted_functions(self, deleted):
+        self._db_deleted_functions = deleted
+    db_deleted_functions = property(__get_db_deleted_functions, __set_db_deleted_functions)
+    def __get_db_functions_id_index(self):
+        if self._db_functions_id_index is None:
+            self._db_functions_id_index = {}
+        return self._db_functions_id_index
+    def __set_db_functions_id_index(self, index):
+        self._db_functions_id_index = index
+    db_functions_id_index = property(__get_db_functions_id_index, __set_db_functions_id_index)
     def db_get_function_by_id(self, key):
         return self.db_functions_id_index[key]
     def db_has_function_with_id(self, key):
-        return key in self.db_functions_id_index
+        return self._db_functions_id_index is not None and key in self._db_functions_id_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -17553,13 +19439,16 @@ class DBMashupActionAnnotation(object):
 
     vtType = 'mashup_actionAnnotation'
 
+    __slots__ = ('_db_id', '_db_key', '_db_value', '_db_action_id', '_db_date',
+                 '_db_user', 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, id=None, key=None, value=None, action_id=None, date=None, user=None):
         self._db_id = id
-        self._db_key = key
+        self._db_key = _intern(key)
         self._db_value = value
         self._db_action_id = action_id
         self._db_date = date
-        self._db_user = user
+        self._db_user = _intern(user)
         self.is_dirty = True
         self.is_new = True
     
@@ -17657,13 +19546,13 @@ class DBMashupActionAnnotation(object):
     def __get_db_key(self):
         return self._db_key
     def __set_db_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
         self.is_dirty = True
     db_key = property(__get_db_key, __set_db_key)
     def db_add_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
     def db_change_key(self, key):
-        self._db_key = key
+        self._db_key = _intern(key)
     def db_delete_key(self, key):
         self._db_key = None
     
@@ -17709,13 +19598,13 @@ class DBMashupActionAnnotation(object):
     def __get_db_user(self):
         return self._db_user
     def __set_db_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
         self.is_dirty = True
     db_user = property(__get_db_user, __set_db_user)
     def db_add_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_change_user(self, user):
-        self._db_user = user
+        self._db_user = _intern(user)
     def db_delete_user(self, user):
         self._db_user = None
     
@@ -17726,11 +19615,15 @@ class DBOpmProcess(object):
 
     vtType = 'opm_process'
 
+    __slots__ = ('_db_id', '_db_deleted_value', '_db_value',
+                 '_db_deleted_accounts', '_db_accounts', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, id=None, value=None, accounts=None):
         self._db_id = id
-        self.db_deleted_value = []
+        self._db_deleted_value = None
         self._db_value = value
-        self.db_deleted_accounts = []
+        self._db_deleted_accounts = None
         if accounts is None:
             self._db_accounts = []
         else:
@@ -17819,11 +19712,13 @@ class DBOpmProcess(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
-        children.extend(self.db_deleted_accounts)
+        if self._db_deleted_value is not None:
+            children.extend(self._db_deleted_value)
+        if self._db_deleted_accounts is not None:
+            children.extend(self._db_deleted_accounts)
         if remove:
-            self.db_deleted_value = []
-            self.db_deleted_accounts = []
+            self._db_deleted_value = None
+            self._db_deleted_accounts = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17861,6 +19756,13 @@ class DBOpmProcess(object):
         if not self.is_new:
             self.db_deleted_value.append(self._db_value)
         self._db_value = None
+    def __get_db_deleted_value(self):
+        if self._db_deleted_value is None:
+            self._db_deleted_value = []
+        return self._db_deleted_value
+    def __set_db_deleted_value(self, deleted):
+        self._db_deleted_value = deleted
+    db_deleted_value = property(__get_db_deleted_value, __set_db_deleted_value)
     
     def __get_db_accounts(self):
         return self._db_accounts
@@ -17881,6 +19783,13 @@ class DBOpmProcess(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_account(self, key):
         return None
+    def __get_db_deleted_accounts(self):
+        if self._db_deleted_accounts is None:
+            self._db_deleted_accounts = []
+        return self._db_deleted_accounts
+    def __set_db_deleted_accounts(self, deleted):
+        self._db_deleted_accounts = deleted
+    db_deleted_accounts = property(__get_db_deleted_accounts, __set_db_deleted_accounts)
     
     def getPrimaryKey(self):
         return self._db_id
@@ -17889,9 +19798,13 @@ class DBDisabledPackages(object):
 
     vtType = 'disabled_packages'
 
+    __slots__ = ('_db_deleted_packages', '_db_packages_name_index',
+                 '_db_packages', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, packages=None):
-        self.db_deleted_packages = []
-        self.db_packages_name_index = {}
+        self._db_deleted_packages = None
+        self._db_packages_name_index = None
         if packages is None:
             self._db_packages = []
         else:
@@ -17921,7 +19834,8 @@ class DBDisabledPackages(object):
             cp.db_id = new_id
         
         # recreate indices and set flags
-        cp.db_packages_name_index = dict((v.db_name, v) for v in cp._db_packages)
+        if cp._db_packages:
+            cp._db_packages_name_index = dict((v.db_name, v) for v in cp._db_packages)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -17962,9 +19876,10 @@ class DBDisabledPackages(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_packages)
+        if self._db_deleted_packages is not None:
+            children.extend(self._db_deleted_packages)
         if remove:
-            self.db_deleted_packages = []
+            self._db_deleted_packages = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -17994,10 +19909,24 @@ class DBDisabledPackages(object):
         raise Exception('Cannot delete a non-keyed object')
     def db_get_package(self, key):
         return None
+    def __get_db_deleted_packages(self):
+        if self._db_deleted_packages is None:
+            self._db_deleted_packages = []
+        return self._db_deleted_packages
+    def __set_db_deleted_packages(self, deleted):
+        self._db_deleted_packages = deleted
+    db_deleted_packages = property(__get_db_deleted_packages, __set_db_deleted_packages)
+    def __get_db_packages_name_index(self):
+        if self._db_packages_name_index is None:
+            self._db_packages_name_index = {}
+        return self._db_packages_name_index
+    def __set_db_packages_name_index(self, index):
+        self._db_packages_name_index = index
+    db_packages_name_index = property(__get_db_packages_name_index, __set_db_packages_name_index)
     def db_get_package_by_name(self, key):
         return self.db_packages_name_index[key]
     def db_has_package_with_name(self, key):
-        return key in self.db_packages_name_index
+        return self._db_packages_name_index is not None and key in self._db_packages_name_index
     
 
 
@@ -18005,26 +19934,34 @@ class DBModuleExec(object):
 
     vtType = 'module_exec'
 
+    __slots__ = ('_db_id', '_db_ts_start', '_db_ts_end', '_db_cached',
+                 '_db_module_id', '_db_module_name', '_db_completed',
+                 '_db_error', '_db_machine_id', '_db_deleted_annotations',
+                 '_db_annotations_id_index', '_db_annotations',
+                 '_db_deleted_loop_execs', '_db_loop_execs_id_index',
+                 '_db_loop_execs', 'is_dirty', 'is_new', '__dict__',
+                 '__weakref__')
+
     def __init__(self, id=None, ts_start=None, ts_end=None, cached=None, module_id=None, module_name=None, completed=None, error=None, machine_id=None, annotations=None, loop_execs=None):
         self._db_id = id
         self._db_ts_start = ts_start
         self._db_ts_end = ts_end
         self._db_cached = cached
         self._db_module_id = module_id
-        self._db_module_name = module_name
+        self._db_module_name = _intern(module_name)
         self._db_completed = completed
         self._db_error = error
         self._db_machine_id = machine_id
-        self.db_deleted_annotations = []
-        self.db_annotations_id_index = {}
+        self._db_deleted_annotations = None
+        self._db_annotations_id_index = None
         if annotations is None:
             self._db_annotations = []
         else:
             self._db_annotations = annotations
             for v in self._db_annotations:
                 self.db_annotations_id_index[v.db_id] = v
-        self.db_deleted_loop_execs = []
-        self.db_loop_execs_id_index = {}
+        self._db_deleted_loop_execs = None
+        self._db_loop_execs_id_index = None
         if loop_execs is None:
             self._db_loop_execs = []
         else:
@@ -18070,8 +20007,10 @@ class DBModuleExec(object):
                 cp._db_machine_id = id_remap[('machine', self._db_machine_id)]
         
         # recreate indices and set flags
-        cp.db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
-        cp.db_loop_execs_id_index = dict((v.db_id, v) for v in cp._db_loop_execs)
+        if cp._db_annotations:
+            cp._db_annotations_id_index = dict((v.db_id, v) for v in cp._db_annotations)
+        if cp._db_loop_execs:
+            cp._db_loop_execs_id_index = dict((v.db_id, v) for v in cp._db_loop_execs)
         if not new_ids:
             cp.is_dirty = self.is_dirty
             cp.is_new = self.is_new
@@ -18175,11 +20114,13 @@ class DBModuleExec(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_annotations)
-        children.extend(self.db_deleted_loop_execs)
+        if self._db_deleted_annotations is not None:
+            children.extend(self._db_deleted_annotations)
+        if self._db_deleted_loop_execs is not None:
+            children.extend(self._db_deleted_loop_execs)
         if remove:
-            self.db_deleted_annotations = []
-            self.db_deleted_loop_execs = []
+            self._db_deleted_annotations = None
+            self._db_deleted_loop_execs = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -18259,13 +20200,13 @@ class DBModuleExec(object):
     def __get_db_module_name(self):
         return self._db_module_name
     def __set_db_module_name(self, module_name):
-        self._db_module_name = module_name
+        self._db_module_name = _intern(module_name)
         self.is_dirty = True
     db_module_name = property(__get_db_module_name, __set_db_module_name)
     def db_add_module_name(self, module_name):
-        self._db_module_name = module_name
+        self._db_module_name = _intern(module_name)
     def db_change_module_name(self, module_name):
-        self._db_module_name = module_name
+        self._db_module_name = _intern(module_name)
     def db_delete_module_name(self, module_name):
         self._db_module_name = None
     
@@ -18345,10 +20286,24 @@ class DBModuleExec(object):
             if self._db_annotations[i].db_id == key:
                 return self._db_annotations[i]
         return None
+    def __get_db_deleted_annotations(self):
+        if self._db_deleted_annotations is None:
+            self._db_deleted_annotations = []
+        return self._db_deleted_annotations
+    def __set_db_deleted_annotations(self, deleted):
+        self._db_deleted_annotations = deleted
+    db_deleted_annotations = property(__get_db_deleted_annotations, __set_db_deleted_annotations)
+    def __get_db_annotations_id_index(self):
+        if self._db_annotations_id_index is None:
+            self._db_annotations_id_index = {}
+        return self._db_annotations_id_index
+    def __set_db_annotations_id_index(self, index):
+        self._db_annotations_id_index = index
+    db_annotations_id_index = property(__get_db_annotations_id_index, __set_db_annotations_id_index)
     def db_get_annotation_by_id(self, key):
         return self.db_annotations_id_index[key]
     def db_has_annotation_with_id(self, key):
-        return key in self.db_annotations_id_index
+        return self._db_annotations_id_index is not None and key in self._db_annotations_id_index
     
     def __get_db_loop_execs(self):
         return self._db_loop_execs
@@ -18387,10 +20342,24 @@ class DBModuleExec(object):
             if self._db_loop_execs[i].db_id == key:
                 return self._db_loop_execs[i]
         return None
+    def __get_db_deleted_loop_execs(self):
+        if self._db_deleted_loop_execs is None:
+            self._db_deleted_loop_execs = []
+        return self._db_deleted_loop_execs
+    def __set_db_deleted_loop_execs(self, deleted):
+        self._db_deleted_loop_execs = deleted
+    db_deleted_loop_execs = property(__get_db_deleted_loop_execs, __set_db_deleted_loop_execs)
+    def __get_db_loop_execs_id_index(self):
+        if self._db_loop_execs_id_index is None:
+            self._db_loop_execs_id_index = {}
+        return self._db_loop_execs_id_index
+    def __set_db_loop_execs_id_index(self, index):
+        self._db_loop_execs_id_index = index
+    db_loop_execs_id_index = property(__get_db_loop_execs_id_index, __set_db_loop_execs_id_index)
     def db_get_loop_exec_by_id(self, key):
         return self.db_loop_execs_id_index[key]
     def db_has_loop_exec_with_id(self, key):
-        return key in self.db_loop_execs_id_index
+        return self._db_loop_execs_id_index is not None and key in self._db_loop_execs_id_index
     
     def getPrimaryKey(self):
         return self._db_id
@@ -18399,12 +20368,17 @@ class DBProvAssociation(object):
 
     vtType = 'prov_association'
 
+    __slots__ = ('_db_deleted_prov_activity', '_db_prov_activity',
+                 '_db_deleted_prov_agent', '_db_prov_agent',
+                 '_db_deleted_prov_plan', '_db_prov_plan', '_db_prov_role',
+                 'is_dirty', 'is_new', '__dict__', '__weakref__')
+
     def __init__(self, prov_activity=None, prov_agent=None, prov_plan=None, prov_role=None):
-        self.db_deleted_prov_activity = []
+        self._db_deleted_prov_activity = None
         self._db_prov_activity = prov_activity
-        self.db_deleted_prov_agent = []
+        self._db_deleted_prov_agent = None
         self._db_prov_agent = prov_agent
-        self.db_deleted_prov_plan = []
+        self._db_deleted_prov_plan = None
         self._db_prov_plan = prov_plan
         self._db_prov_role = prov_role
         self.is_dirty = True
@@ -18501,13 +20475,16 @@ class DBProvAssociation(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_prov_activity)
-        children.extend(self.db_deleted_prov_agent)
-        children.extend(self.db_deleted_prov_plan)
+        if self._db_deleted_prov_activity is not None:
+            children.extend(self._db_deleted_prov_activity)
+        if self._db_deleted_prov_agent is not None:
+            children.extend(self._db_deleted_prov_agent)
+        if self._db_deleted_prov_plan is not None:
+            children.extend(self._db_deleted_prov_plan)
         if remove:
-            self.db_deleted_prov_activity = []
-            self.db_deleted_prov_agent = []
-            self.db_deleted_prov_plan = []
+            self._db_deleted_prov_activity = None
+            self._db_deleted_prov_agent = None
+            self._db_deleted_prov_plan = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -18533,6 +20510,13 @@ class DBProvAssociation(object):
         if not self.is_new:
             self.db_deleted_prov_activity.append(self._db_prov_activity)
         self._db_prov_activity = None
+    def __get_db_deleted_prov_activity(self):
+        if self._db_deleted_prov_activity is None:
+            self._db_deleted_prov_activity = []
+        return self._db_deleted_prov_activity
+    def __set_db_deleted_prov_activity(self, deleted):
+        self._db_deleted_prov_activity = deleted
+    db_deleted_prov_activity = property(__get_db_deleted_prov_activity, __set_db_deleted_prov_activity)
     
     def __get_db_prov_agent(self):
         return self._db_prov_agent
@@ -18548,6 +20532,13 @@ class DBProvAssociation(object):
         if not self.is_new:
             self.db_deleted_prov_agent.append(self._db_prov_agent)
         self._db_prov_agent = None
+    def __get_db_deleted_prov_agent(self):
+        if self._db_deleted_prov_agent is None:
+            self._db_deleted_prov_agent = []
+        return self._db_deleted_prov_agent
+    def __set_db_deleted_prov_agent(self, deleted):
+        self._db_deleted_prov_agent = deleted
+    db_deleted_prov_agent = property(__get_db_deleted_prov_agent, __set_db_deleted_prov_agent)
     
     def __get_db_prov_plan(self):
         return self._db_prov_plan
@@ -18563,6 +20554,13 @@ class DBProvAssociation(object):
         if not self.is_new:
             self.db_deleted_prov_plan.append(self._db_prov_plan)
         self._db_prov_plan = None
+    def __get_db_deleted_prov_plan(self):
+        if self._db_deleted_prov_plan is None:
+            self._db_deleted_prov_plan = []
+        return self._db_deleted_prov_plan
+    def __set_db_deleted_prov_plan(self, deleted):
+        self._db_deleted_prov_plan = deleted
+    db_deleted_prov_plan = property(__get_db_deleted_prov_plan, __set_db_deleted_prov_plan)
     
     def __get_db_prov_role(self):
         return self._db_prov_role
@@ -18583,8 +20581,11 @@ class DBOpmProcessValue(object):
 
     vtType = 'opm_process_value'
 
+    __slots__ = ('_db_deleted_value', '_db_value', 'is_dirty', 'is_new',
+                 '__dict__', '__weakref__')
+
     def __init__(self, value=None):
-        self.db_deleted_value = []
+        self._db_deleted_value = None
         self._db_value = value
         self.is_dirty = True
         self.is_new = True
@@ -18655,9 +20656,10 @@ class DBOpmProcessValue(object):
         return children
     def db_deleted_children(self, remove=False):
         children = []
-        children.extend(self.db_deleted_value)
+        if self._db_deleted_value is not None:
+            children.extend(self._db_deleted_value)
         if remove:
-            self.db_deleted_value = []
+            self._db_deleted_value = None
         return children
     def has_changes(self):
         if self.is_dirty:
@@ -18679,6 +20681,13 @@ class DBOpmProcessValue(object):
         if not self.is_new:
             self.db_deleted_value.append(self._db_value)
         self._db_value = None
+    def __get_db_deleted_value(self):
+        if self._db_deleted_value is None:
+            self._db_deleted_value = []
+        return self._db_deleted_value
+    def __set_db_deleted_value(self, deleted):
+        self._db_deleted_value = deleted
+    db_deleted_value = property(__get_db_deleted_value, __set_db_deleted_value)
     
 
 
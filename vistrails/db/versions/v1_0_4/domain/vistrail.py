@@ -38,6 +38,7 @@ import hashlib
 from auto_gen import DBVistrail as _DBVistrail
 from auto_gen import DBAdd, DBChange, DBDelete, DBAbstraction, DBGroup, \
     DBModule, DBAnnotation, DBActionAnnotation, DBParameterExploration
+from action import DBLazyOperationList
 from id_scope import IdScope
 
 class DBVistrail(_DBVistrail):
@@ -59,6 +60,14 @@ class DBVistrail(_DBVistrail):
         self.db_log_filename = None
         self.log = None
 
+        # checkpoints used to materialize workflows, see
+        # vistrails.db.services.checkpoints
+        self.db_checkpoints = None
+
+        # fetches the operations of actions opened lazily from the
+        # database, see vistrails.db.services.io.DBActionLoader
+        self.db_action_loader = None
+
     def __copy__(self):
         return DBVistrail.do_copy(self)
 
@@ -69,6 +78,8 @@ class DBVistrail(_DBVistrail):
         cp.idScope = copy.copy(self.idScope)
         cp.db_objects = copy.copy(self.db_objects)
         cp.db_log_filename = self.db_log_filename
+        cp.db_checkpoints = None
+        cp.db_action_loader = self.db_action_loader
         if self.log is not None:
             cp.log = copy.copy(self.log)
         else:
@@ -86,6 +97,8 @@ class DBVistrail(_DBVistrail):
             new_obj.db_log_filename = old_obj.db_log_filename
         if hasattr(old_obj, 'log'):
             new_obj.log = old_obj.log
+        if hasattr(old_obj, 'db_checkpoints'):
+            new_obj.db_checkpoints = old_obj.db_checkpoints
         return new_obj
 
     def update_id_scope(self):
@@ -103,7 +116,13 @@ class DBVistrail(_DBVistrail):
             self.idScope.updateBeginId('action', action.db_id+1)
             if action.db_session is not None:
                 self.idScope.updateBeginId('session', action.db_session + 1)
-            for operation in action.db_operations:
+            operations = action.db_operations
+            if isinstance(operations, DBLazyOperationList) and \
+                    operations.is_pending():
+                # the loader has already reserved the ids of the
+                # operations that are still in the database
+                operations = []
+            for operation in operations:
                 self.idScope.updateBeginId('operation', operation.db_id+1)
                 if operation.vtType == 'add' or operation.vtType == 'change':
                     # update ids of data
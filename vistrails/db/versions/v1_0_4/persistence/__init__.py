@@ -39,11 +39,29 @@ from vistrails.core.system import get_elementtree_library
 from vistrails.db import VistrailsDBException
 from vistrails.db.versions.v1_0_4 import version as my_version
 from vistrails.db.versions.v1_0_4.domain import DBGroup, DBWorkflow, DBVistrail, DBLog, \
-    DBRegistry, DBMashuptrail
+    DBRegistry, DBMashuptrail, DBAction, DBAdd, DBChange, DBDelete, DBModule, \
+    DBLocation, DBFunction, DBParameter, DBConnection, DBPort, DBAnnotation, \
+    DBPortSpec, DBPortSpecItem, DBAbstraction, DBPluginData, DBOther, \
+    DBControlParameter
 
 root_set = set([DBVistrail.vtType, DBWorkflow.vtType, 
                 DBLog.vtType, DBRegistry.vtType, DBMashuptrail.vtType])
 
+# objects of a vistrail that belong to its operations, and are only read
+# when the operations are needed (see DAOList.open_skeleton_from_db)
+operation_set = set([DBAdd.vtType, DBChange.vtType, DBDelete.vtType])
+payload_set = set([DBModule.vtType, DBLocation.vtType, DBFunction.vtType,
+                   DBParameter.vtType, DBConnection.vtType, DBPort.vtType,
+                   DBAnnotation.vtType, DBPortSpec.vtType,
+                   DBPortSpecItem.vtType, DBGroup.vtType,
+                   DBAbstraction.vtType, DBPluginData.vtType,
+                   DBOther.vtType, DBControlParameter.vtType])
+# payload objects can also hang from these, they are read with the skeleton
+skeleton_parent_types = [DBVistrail.vtType, DBAction.vtType]
+
+# maximum number of ids in a single IN (...) clause
+SELECT_IDS_SIZE = 1000
+
 ElementTree = get_elementtree_library()
 
 
@@ -176,6 +194,182 @@ class DAOList(dict):
 
         return res
 
+    def open_skeleton_from_db(self, db_connection, vtType, id, lock=False):
+        """open_skeleton_from_db(db_connection, vtType: str, id: long,
+                                 lock: bool) -> (object, dict)
+
+        Reads an entity without the operations of its actions, which are
+        returned with empty operation lists; open_operations_from_db
+        reads them later. The dict maps the types of the objects left in
+        the database to their largest id, so that new ids can be
+        reserved for them.
+
+        """
+        all_objects = {}
+        res_objects = self['sql'][vtType].get_sql_columns(db_connection,
+                                                          {'id': id},
+                                                          lock)
+        if len(res_objects) > 1:
+            raise VistrailsDBException("More than object of type '%s' and "
+                                       "id '%s' exist in the database" % \
+                                           (vtType, id))
+        elif len(res_objects) <= 0:
+            raise VistrailsDBException("No objects of type '%s' and "
+                                       "id '%s' exist in the database" % \
+                                           (vtType, id))
+
+        all_objects.update(res_objects)
+        res = res_objects.values()[0]
+        global_props = {'entity_id': res.db_id,
+                        'entity_type': res.vtType}
+
+        daoList = []
+        dbCommandList = []
+        for dao_type, dao in self['sql'].iteritems():
+            if dao_type in root_set or dao_type in operation_set or \
+                    dao_type == DBPortSpecItem.vtType:
+                continue
+            props = global_props
+            if dao_type in payload_set:
+                # only the ones that do not belong to operations
+                props = dict(global_props)
+                props['parent_type'] = skeleton_parent_types
+            daoList.append([dao_type, dao, None])
+            dbCommand = dao.get_sql_select(db_connection, props, lock)
+            dbCommandList.append(dbCommand)
+
+        # largest ids of the objects that are not read
+        max_types = sorted(operation_set | payload_set)
+        for dao_type in max_types:
+            dbCommand = self['sql'][dao_type].createSQLSelect(
+                self['sql'][dao_type].table, ['MAX(id)'], global_props)
+            dbCommandList.append(dbCommand)
+
+        results = self['sql'][vtType].executeSQLGroup(db_connection,
+                                                      dbCommandList, True)
+        for i in xrange(len(daoList)):
+            daoList[i][2] = results[i]
+
+        for dao_type, dao, data in daoList:
+            current_objs = dao.process_sql_columns(data, global_props)
+            all_objects.update(current_objs)
+
+        max_ids = {}
+        for dao_type, data in zip(max_types, results[len(daoList):]):
+            if data and data[0][0] is not None:
+                max_ids[dao_type] = long(data[0][0])
+
+        for key, obj in all_objects.iteritems():
+            if key[0] == vtType and key[1] == id:
+                continue
+            self['sql'][obj.vtType].from_sql_fast(obj, all_objects)
+        for obj in all_objects.itervalues():
+            obj.is_dirty = False
+            obj.is_new = False
+
+        return res, max_ids
+
+    def open_operations_from_db(self, db_connection, entity_id, entity_type,
+                                action_ids, lock=False):
+        """open_operations_from_db(db_connection, entity_id: long,
+                                   entity_type: str, action_ids: list,
+                                   lock: bool) -> dict
+
+        Reads the operations of the given actions of an entity opened
+        with open_skeleton_from_db, together with everything below them.
+        Objects are read one level of the tree at a time, so the number
+        of queries depends on the depth of the tree and not on the
+        number of actions. Returns a dict mapping each action id to its
+        list of operations.
+
+        """
+        def split(ids):
+            ids = sorted(ids)
+            return [ids[i:i+SELECT_IDS_SIZE]
+                    for i in xrange(0, len(ids), SELECT_IDS_SIZE)]
+
+        def get_parent(obj):
+            if obj.vtType == DBPortSpecItem.vtType:
+                return (DBPortSpec.vtType, obj.db_portSpec)
+            return (obj.db_parentType, obj.db_parent)
+
+        global_props = {'entity_id': entity_id,
+                        'entity_type': entity_type}
+        all_objects = {}
+
+        daoList = []
+        dbCommandList = []
+        for dao_type in operation_set:
+            dao = self['sql'][dao_type]
+            for ids in split(action_ids):
+                props = dict(global_props)
+                props['action_id'] = ids
+                daoList.append(dao)
+                dbCommandList.append(dao.get_sql_select(db_connection, props,
+                                                        lock))
+        results = self['sql'][entity_type].executeSQLGroup(db_connection,
+                                                           dbCommandList, True)
+        for dao, data in zip(daoList, results):
+            all_objects.update(dao.process_sql_columns(data, global_props))
+
+        # read the children of the previous level until none is left
+        parents = set(all_objects.iterkeys())
+        while parents:
+            parent_ids = {}
+            for parent_type, parent_id in parents:
+                parent_ids.setdefault(parent_type, set()).add(parent_id)
+            all_ids = set()
+            for ids in parent_ids.itervalues():
+                all_ids.update(ids)
+
+            daoList = []
+            dbCommandList = []
+            for dao_type in payload_set:
+                dao = self['sql'][dao_type]
+                if dao_type == DBPortSpecItem.vtType:
+                    props_list = [{'parent_id': ids} for ids in
+                                  split(parent_ids.get(DBPortSpec.vtType, []))]
+                else:
+                    props_list = [{'parent_type': sorted(parent_ids),
+                                   'parent_id': ids} for ids in split(all_ids)]
+                for props in props_list:
+                    props.update(global_props)
+                    daoList.append(dao)
+                    dbCommandList.append(dao.get_sql_select(db_connection,
+                                                            props, lock))
+            results = self['sql'][entity_type].executeSQLGroup(db_connection,
+                                                               dbCommandList,
+                                                               True)
+            children = set()
+            for dao, data in zip(daoList, results):
+                current_objs = dao.process_sql_columns(data, global_props)
+                for key, obj in current_objs.iteritems():
+                    # the query matches every parent type with every id
+                    if key in all_objects or get_parent(obj) not in parents:
+                        continue
+                    all_objects[key] = obj
+                    children.add(key)
+                    if obj.vtType == DBGroup.vtType:
+                        new_props = {'parent_id': key[1],
+                                     'entity_id': entity_id,
+                                     'entity_type': entity_type}
+                        res_obj = self.open_from_db(db_connection,
+                                                    DBWorkflow.vtType,
+                                                    None, lock, new_props)
+                        all_objects[(res_obj.vtType, res_obj.db_id)] = res_obj
+            parents = children
+
+        operations = dict((action_id, []) for action_id in action_ids)
+        for key, obj in all_objects.iteritems():
+            self['sql'][obj.vtType].from_sql_fast(obj, all_objects)
+            if key[0] in operation_set:
+                operations[obj.db_action].append(obj)
+        for obj in all_objects.itervalues():
+            obj.is_dirty = False
+            obj.is_new = False
+
+        return operations
+
     def open_many_from_db(self, db_connection, vtType, ids, lock=False):
         """ Loads multiple objects. They need to be loaded as one single
             multiple select statement command for performance reasons.
@@ -314,10 +508,11 @@ class DAOList(dict):
         #results = [self['sql'][children[0][0].vtType].executeSQL(
         #                      db_connection, c, False) for c in dbCommandList]
 
-        # Execute all insert/update statements
-        results = self['sql'][children[0][0].vtType].executeSQLGroup(
-                                                    db_connection,
-                                                    dbCommandList, False)
+        # Execute all insert/update statements, in bulk for each table
+        results = self['sql'][children[0][0].vtType].executeSQLBatch(
+                        db_connection, dbCommandList,
+                        [getattr(c, 'db_id', 0) is None
+                         for c in writtenChildren])
         resultDict = dict(zip(writtenChildren, results))
         # process remaining children
         for (child, _, _) in children:
@@ -366,9 +561,10 @@ class DAOList(dict):
             global_propsDict[child] = global_props
 
         # Execute all insert/update statements for the main objects
-        results = self['sql'][children[0][0].vtType].executeSQLGroup(
-                                                    db_connection,
-                                                    dbCommandList, False)
+        results = self['sql'][children[0][0].vtType].executeSQLBatch(
+                        db_connection, dbCommandList,
+                        [getattr(c, 'db_id', 0) is None
+                         for c in writtenChildren])
         resultDict = dict(zip(writtenChildren, results))
         dbCommandList = []
         writtenChildren = []
@@ -406,9 +602,10 @@ class DAOList(dict):
                 self['sql'][child.vtType].to_sql_fast(child, do_copy)
     
         # Execute all child insert/update statements
-        results = self['sql'][children[0][0].vtType].executeSQLGroup(
-                                                        db_connection,
-                                                        dbCommandList, False)
+        results = self['sql'][children[0][0].vtType].executeSQLBatch(
+                        db_connection, dbCommandList,
+                        [getattr(c, 'db_id', 0) is None
+                         for c in writtenChildren])
         resultDict = dict(zip(writtenChildren, results))
 
         for child, children in childrenDict.iteritems():
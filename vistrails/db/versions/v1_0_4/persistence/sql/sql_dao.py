@@ -40,6 +40,8 @@ from vistrails.core.system import strftime, time_strptime
 from vistrails.db import VistrailsDBException
 from vistrails.db.services.io import get_db_lib
 
+import unittest
+
 class SQLDAO:
     def __init__(self):
         pass
@@ -134,9 +136,15 @@ class SQLDAO:
         whereClause = ''
         values = []
         for column, value in whereMap.iteritems():
-            whereStr += '%s%s = %%s' % \
-                        (whereClause, column)
-            values.append(value)
+            if isinstance(value, (list, tuple)):
+                # match any of the values
+                whereStr += '%s%s IN (%s)' % \
+                            (whereClause, column, ', '.join(['%s'] * len(value)))
+                values.extend(value)
+            else:
+                whereStr += '%s%s = %%s' % \
+                            (whereClause, column)
+                values.append(value)
             whereClause = ' AND '
         dbCommand = """SELECT %s FROM %s WHERE %s""" % \
                     (columnStr, table, whereStr)
@@ -249,6 +257,44 @@ class SQLDAO:
             n += BUNDLE_SIZE
         return data
 
+    def executeSQLBatch(self, db, dbCommandList, needsIdList=None):
+        """executeSQLBatch(db, dbCommandList: list, needsIdList: list)
+             -> list
+        Executes INSERT and UPDATE statements. Statements that share the
+        same prepared command (same table and columns) are sent together
+        with executemany, which the database library turns into bulk
+        inserts. Statements flagged in needsIdList are executed on their
+        own so that their lastrowid can be returned; the results for the
+        other statements are None.
+
+        """
+        BATCH_SIZE = 1000
+        if needsIdList is None:
+            needsIdList = [False] * len(dbCommandList)
+        results = [None] * len(dbCommandList)
+        batches = {}
+        commands = []
+        for i, (dbCommand, values) in enumerate(dbCommandList):
+            if needsIdList[i]:
+                results[i] = self.executeSQL(db, (dbCommand, values), False)
+            elif dbCommand in batches:
+                batches[dbCommand].append(values)
+            else:
+                batches[dbCommand] = [values]
+                commands.append(dbCommand)
+        for dbCommand in commands:
+            rows = batches[dbCommand]
+            cur = db.cursor()
+            try:
+                for n in xrange(0, len(rows), BATCH_SIZE):
+                    cur.executemany(dbCommand, rows[n:n+BATCH_SIZE])
+            except Exception, e:
+                raise VistrailsDBException('Command "%s" failed for %d rows: '
+                                           '%s' % (dbCommand, len(rows), e))
+            finally:
+                cur.close()
+        return results
+
     def start_transaction(self, db):
         db.begin()
 
@@ -257,3 +303,69 @@ class SQLDAO:
 
     def rollback_transaction(self, db):
         db.rollback()
+
+
+class TestSQLDAO(unittest.TestCase):
+    class FormatCursor(object):
+        """Runs 'format' paramstyle statements on sqlite3."""
+        def __init__(self, cursor, calls):
+            self.cursor = cursor
+            self.calls = calls
+            self.lastrowid = None
+
+        def execute(self, command, values):
+            self.calls.append(('execute', command))
+            self.cursor.execute(command.replace('%s', '?'), values)
+            self.lastrowid = self.cursor.lastrowid
+
+        def executemany(self, command, rows):
+            self.calls.append(('executemany', command))
+            self.cursor.executemany(command.replace('%s', '?'), rows)
+
+        def close(self):
+            self.cursor.close()
+
+    def test_batch(self):
+        import sqlite3
+        db = sqlite3.connect(':memory:')
+        db.execute('CREATE TABLE module(id INTEGER PRIMARY KEY, name TEXT, '
+                   'package TEXT)')
+        db.execute('CREATE TABLE port(id INTEGER PRIMARY KEY, name TEXT)')
+        calls = []
+        class Connection(object):
+            def cursor(_self):
+                return self.FormatCursor(db.cursor(), calls)
+
+        dao = SQLDAO()
+        commands = [dao.createSQLInsert('module', {'id': '10', 'name': 'a'}),
+                    dao.createSQLInsert('port', {'id': '1', 'name': 'p'}),
+                    dao.createSQLInsert('module', {'id': '11', 'name': 'b'}),
+                    dao.createSQLInsert('module', {'name': 'c',
+                                                  'package': 'x'}),
+                    dao.createSQLUpdate('port', {'name': 'q'}, {'id': '1'})]
+        results = dao.executeSQLBatch(Connection(), commands,
+                                      [False, False, False, True, False])
+        # statements that need their id are run first
+        self.assertEqual(results, [None, None, None, 1, None])
+        self.assertEqual([c[0] for c in calls],
+                         ['execute', 'executemany', 'executemany',
+                          'executemany'])
+        self.assertEqual(
+            db.execute('SELECT id, name FROM module ORDER BY id').fetchall(),
+            [(1, 'c'), (10, 'a'), (11, 'b')])
+        self.assertEqual(db.execute('SELECT id, name FROM port').fetchall(),
+                         [(1, 'q')])
+
+        self.assertRaises(VistrailsDBException, dao.executeSQLBatch,
+                          Connection(),
+                          [dao.createSQLInsert('module', {'id': '10',
+                                                         'name': 'd'})])
+
+    def test_select_in(self):
+        dao = SQLDAO()
+        command, values = dao.createSQLSelect('module', ['id', 'name'],
+                                              {'parent_id': [3L, 4L, 7L]},
+                                              'id')
+        self.assertEqual(command, 'SELECT id, name FROM module WHERE '
+                         'parent_id IN (%s, %s, %s) ORDER BY id;')
+        self.assertEqual(values, (3L, 4L, 7L))
@@ -57,6 +57,11 @@ import tempfile
 from ast import literal_eval
 import unittest
 
+# these only copy objects into the new schema (see translate_object)
+structural_translations = ['translateVistrail',
+                           'translateWorkflow',
+                           'translateRegistry']
+
 id_scope = None
 
 def translateVistrail(_vistrail):
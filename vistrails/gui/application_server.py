@@ -33,7 +33,6 @@
 ##
 ###############################################################################
 """ This is the application for vistrails when running as a server. """
-import Queue
 import base64
 import hashlib
 import inspect
@@ -70,6 +69,8 @@ from vistrails.core.modules.module_registry import get_module_registry as module
 from vistrails.core import interpreter
 from vistrails.core.packagemanager import get_package_manager
 from vistrails.core.thumbnails import ThumbnailCache
+from vistrails.gui.server_workers import WorkerPool, ResultCache, \
+    prune_directory
 import vistrails.db.services.io
 import gc
 
@@ -80,6 +81,10 @@ from vistrails.db.versions import currentVersion
 
 ElementTree = system.get_elementtree_library()
 
+# seconds to wait for the other instances to answer requests after
+# starting them
+INSTANCE_START_TIMEOUT = 120
+
 
 
 ################################################################################
@@ -114,6 +119,8 @@ class ThreadedXMLRPCServer(SocketServer.ThreadingMixIn,
     related objects because they won't be in the main thread."""
 ################################################################################
 
+################################################################################
+
 class RequestHandler(object):
     """This class will handle all the requests sent to the server.
     Add new methods here and they will be exposed through the XML-RPC interface
@@ -121,8 +128,10 @@ class RequestHandler(object):
     def __init__(self, logger, instances):
         self.server_logger = logger
         self.instances = instances
-        self.proxies_queue = None
+        self.workers = None
         self.instantiate_proxies()
+        self.result_cache = ResultCache(os.path.join(media_dir, 'cache'),
+                                        cache_size)
 
     #proxies
     def instantiate_proxies(self):
@@ -131,15 +140,50 @@ class RequestHandler(object):
         the client proxies to connect to them.
         """
         if len(self.instances) > 0:
-            self.proxies_queue = Queue.Queue()
-            for uri in self.instances:
-                try:
-                    proxy = xmlrpclib.ServerProxy(uri)
-                    self.proxies_queue.put(proxy)
-                    self.server_logger.info("Instantiated client for %s" % uri)
-                except Exception, e:
-                    self.server_logger.error("Error when instantiating proxy %s" % uri)
-                    self.server_logger.error(str(e))
+            self.workers = WorkerPool(self.instances, self.server_logger)
+            if len(self.workers) == 0:
+                self.workers = None
+
+    def _forward(self, key, method, *args):
+        """_forward(key: tuple, method: str, *args) -> tuple
+        Sends the request to one of the other instances, preferably the
+        one that already served requests with the same key.
+        """
+        try:
+            result = self.workers.call(key, method, *args)
+            self.server_logger.info("returning %s" % str(result))
+            return result
+        except xmlrpclib.ProtocolError, err:
+            err_msg = ("A protocol error occurred\n"
+                       "URL: %s\n"
+                       "HTTP/HTTPS headers: %s\n"
+                       "Error code: %d\n"
+                       "Error message: %s\n") % (err.url, err.headers,
+                                                 err.errcode, err.errmsg)
+            self.server_logger.error(err_msg)
+            return (str(err), 0)
+        except Exception, e:
+            self.server_logger.error(str(e))
+            self.server_logger.error(traceback.format_exc())
+            return (str(e), 0)
+
+    def _result_key(self, kind, host, port, db_name, vt_id, *args):
+        """_result_key(kind: str, host: str, port: int, db_name: str,
+                       vt_id: int, *args) -> str
+        Returns the key of a result about the vistrail in the result
+        cache. It changes whenever the vistrail is modified.
+        """
+        locator = DBLocator(host=host,
+                            port=int(port),
+                            database=db_name,
+                            user=db_read_user,
+                            passwd=db_read_pass,
+                            obj_id=int(vt_id),
+                            obj_type=None,
+                            connection_id=None)
+        return ResultCache.get_vistrail_key(locator, kind, host, int(port),
+                                            db_name, long(vt_id), args)
+
     #utils
     def memory_usage(self):
         """memory_usage() -> dict
@@ -328,18 +372,14 @@ class RequestHandler(object):
         self.server_logger.info("Request: get_server_packages()")
 
         messages = []
-        if self.proxies_queue is not None:
+        if self.workers is not None:
             # collect all proxies:
-            proxies = []
-            while len(proxies) < len(self.instances):
-                self.server_logger.info("Proxies: %s Instances: %s" % (len(proxies), len(self.instances)))
-                if self.proxies_queue.empty():
-                    for p in  proxies:
-                        self.proxies_queue.put(p)
-                    return [[[],
-                        "Not all vistrail instances are free, please try again."], 1]
-                proxies.append(self.proxies_queue.get())
-            for proxy in proxies:
+            indices = self.workers.acquire_all()
+            if indices is None:
+                return [[[],
+                    "Not all vistrail instances are free, please try again."], 1]
+            for index in indices:
+                proxy = self.workers.proxies[index]
                 result, s = 'Please contact the server admin', 0
                 try:
                     if codepath and status is not None:
@@ -354,8 +394,11 @@ class RequestHandler(object):
                            "Error message: %s\n") % (err.url, err.headers,
                                                  err.errcode, err.errmsg)
                     self.server_logger.error(err_msg)
+                except Exception, e:
+                    self.server_logger.error(str(e))
+                    result = str(e)
                 finally:
-                    self.proxies_queue.put(proxy)
+                    self.workers.release(index)
                 if s == 0:
                     messages.append('An error occurred: %s' % result)
                 else:
@@ -541,14 +584,14 @@ class RequestHandler(object):
         config['passwd'] = db_write_pass
         conn = None
         try:
-            conn = vistrails.db.services.io.open_db_connection(config)
+            conn = vistrails.db.services.io.get_db_connection(config)
             vistrails.db.services.io.delete_entity_from_db(conn,'vistrail', vt_id)
-            vistrails.db.services.io.close_db_connection(conn)
+            vistrails.db.services.io.release_db_connection(conn)
             return (1, 1)
         except Exception, e:
             self.server_logger.error(str(e))
             if conn is not None:
-                vistrails.db.services.io.close_db_connection(conn)
+                vistrails.db.services.io.release_db_connection(conn)
             return (str(e), 0)
 
     def get_runnable_workflows(self, host, port, db_name, vt_id):
@@ -721,21 +764,17 @@ class RequestHandler(object):
             path_to_images = \
                os.path.join(media_dir, 'medleys/images', subdir)
             if (not self.path_exists_and_not_empty(path_to_images) and
-                self.proxies_queue is not None):
+                self.workers is not None):
                 #this server can send requests to other instances
-                proxy = self.proxies_queue.get()
-                try:
-                    self.server_logger.info("Sending request to %s" % proxy)
-                    if extra_info is not None:
-                        result = proxy.executeMedley(xml_medley, extra_info)
-                    else:
-                        result = proxy.executeMedley(xml_medley)
-                    self.proxies_queue.put(proxy)
-                    self.server_logger.info("returning %s"% result)
-                    return result
-                except Exception, e:
-                    self.server_logger.error(str(e))
-                    return (str(e), 0)
+                if medley is not None:
+                    key = (db_host, medley._vtid)
+                else:
+                    key = subdir
+                if extra_info is not None:
+                    return self._forward(key, 'executeMedley',
+                                         xml_medley, extra_info)
+                else:
+                    return self._forward(key, 'executeMedley', xml_medley)
 
             if extra_info is None:
                 extra_info = {}
@@ -910,7 +949,7 @@ class RequestHandler(object):
 
         self.server_logger.info("path_exists_and_not_empty? %s" % self.path_exists_and_not_empty(path_to_figures))
         self.server_logger.info("build_always? %s" % build_always)
-        self.server_logger.info(str(self.proxies_queue))
+        self.server_logger.info("instances: %s" % self.instances)
 
         if not is_local:
             # use same hashing as on crowdlabs webserver
@@ -919,30 +958,13 @@ class RequestHandler(object):
             path_to_figures = os.path.join(media_dir, "photos", "wf_execution", dest_version)
 
         if ((not self.path_exists_and_not_empty(path_to_figures) or 
-             build_always) and self.proxies_queue is not None):
+             build_always) and self.workers is not None):
             self.server_logger.info("will forward request")
             #this server can send requests to other instances
-            proxy = self.proxies_queue.get()
-            try:
-                self.server_logger.info("Sending request to %s" % proxy)
-                result = proxy.run_from_db(host, port, db_name, vt_id,
-                                           path_to_figures, version, pdf, vt_tag,
-                                           build_always, parameters, is_local)
-                self.proxies_queue.put(proxy)
-                self.server_logger.info("returning %s" % result)
-                return result
-            except xmlrpclib.ProtocolError, err:
-                err_msg = ("A protocol error occurred\n"
-                           "URL: %s\n"
-                           "HTTP/HTTPS headers: %s\n"
-                           "Error code: %d\n"
-                           "Error message: %s\n") % (err.url, err.headers,
-                                                     err.errcode, err.errmsg)
-                self.server_logger.error(err_msg)
-                return (str(err), 0)
-            except Exception, e:
-                self.server_logger.error(str(e))
-                return (str(e), 0)
+            return self._forward((host, port, db_name, vt_id), 'run_from_db',
+                                 host, port, db_name, vt_id,
+                                 path_to_figures, version, pdf, vt_tag,
+                                 build_always, parameters, is_local)
 
         extra_info = {}
         extra_info['pathDumpCells'] = path_to_figures
@@ -1119,6 +1141,16 @@ class RequestHandler(object):
         self.server_logger.info("Request: get_vt_xml(%s,%s,%s,%s)" % \
                                 (host, port, db_name, vt_id))
         try:
+            key = self._result_key('vt_xml', host, port, db_name, vt_id)
+            result = self.result_cache.lookup(key, '.xml')
+            if result is not None:
+                self.server_logger.info("found cached xml")
+                return (result, 1)
+            if self.workers is not None:
+                #this server can send requests to other instances
+                return self._forward((host, port, db_name, vt_id),
+                                     'get_vt_xml', host, port, db_name, vt_id)
+
             locator = DBLocator(host=host,
                                 port=int(port),
                                 database=db_name,
@@ -1130,6 +1162,7 @@ class RequestHandler(object):
 
             (v, _ , _, _)  = io.load_vistrail(locator)
             result = io.serialize(v)
+            self.result_cache.store(key, result, '.xml')
             return (result, 1)
         except xmlrpclib.ProtocolError, err:
             err_msg = ("A protocol error occurred\n"
@@ -1149,6 +1182,18 @@ class RequestHandler(object):
         self.server_logger.info("Request: get_wf_xml(%s,%s,%s,%s,%s)" % \
                                 (host, port, db_name, vt_id, version))
         try:
+            key = self._result_key('wf_xml', host, port, db_name, vt_id,
+                                   long(version))
+            result = self.result_cache.lookup(key, '.xml')
+            if result is not None:
+                self.server_logger.info("found cached xml")
+                return (result, 1)
+            if self.workers is not None:
+                #this server can send requests to other instances
+                return self._forward((host, port, db_name, vt_id),
+                                     'get_wf_xml', host, port, db_name, vt_id,
+                                     version)
+
             locator = DBLocator(host=host,
                                 port=int(port),
                                 database=db_name,
@@ -1162,6 +1207,7 @@ class RequestHandler(object):
             p = v.getPipeline(long(version))
             if p:
                 result = io.serialize(p)
+                self.result_cache.store(key, result, '.xml')
                 self.server_logger.info("success")
                 return (result, 1)
             else:
@@ -1194,31 +1240,17 @@ class RequestHandler(object):
             version = long(version)
             subdir = 'workflows'
             filepath = os.path.join(media_dir, 'graphs', subdir)
-            base_fname = "graph_%s_%s.pdf" % (vt_id, version)
+            # the name changes with the vistrail, stale images are
+            # never returned
+            key = self._result_key('wf_graph', host, port, db_name, vt_id,
+                                   version)
+            base_fname = "graph_%s.pdf" % key
             filename = os.path.join(filepath,base_fname)
-            if ((not os.path.exists(filepath) or
-                os.path.exists(filepath) and not os.path.exists(filename))
-                and self.proxies_queue is not None):
+            if not os.path.exists(filename) and self.workers is not None:
                 #this server can send requests to other instances
-                proxy = self.proxies_queue.get()
-                try:
-                    result = proxy.get_wf_graph_pdf(host,port,db_name, vt_id, version, is_local)
-                    self.proxies_queue.put(proxy)
-                    self.server_logger.info("get_wf_graph_pdf returning %s"% result)
-                    return result
-                except xmlrpclib.ProtocolError, err:
-                    err_msg = ("A protocol error occurred\n"
-                               "URL: %s\n"
-                               "HTTP/HTTPS headers: %s\n"
-                               "Error code: %d\n"
-                               "Error message: %s\n") % (err.url, err.headers,
-                                                         err.errcode, err.errmsg)
-                    self.server_logger.error(err_msg)
-                    return (str(err), 0)
-                except Exception, e:
-                    self.server_logger.error(str(e))
-                    self.server_logger.error(traceback.format_exc())
-                    return (str(e), 0)
+                return self._forward((host, port, db_name, vt_id),
+                                     'get_wf_graph_pdf', host, port, db_name,
+                                     vt_id, version, is_local)
 
             if not os.path.exists(filepath):
                 os.mkdir(filepath)
@@ -1241,6 +1273,8 @@ class RequestHandler(object):
                 controller.change_selected_version(version)
                 controller.updatePipelineScene()
                 controller.current_pipeline_scene.saveToPDF(filename)
+                # graphs of older versions of the vistrail are never used
+                prune_directory(filepath, cache_size)
             else:
                 self.server_logger.info("found cached pdf: %s" % filename)
 
@@ -1278,32 +1312,17 @@ class RequestHandler(object):
             version = long(version)
             subdir = 'workflows'
             filepath = os.path.join(media_dir, 'graphs', subdir)
-            base_fname = "graph_%s_%s.png" % (vt_id, version)
+            # the name changes with the vistrail, stale images are
+            # never returned
+            key = self._result_key('wf_graph', host, port, db_name, vt_id,
+                                   version)
+            base_fname = "graph_%s.png" % key
             filename = os.path.join(filepath,base_fname)
-            if ((not os.path.exists(filepath) or
-                os.path.exists(filepath) and not os.path.exists(filename))
-                and self.proxies_queue is not None):
+            if not os.path.exists(filename) and self.workers is not None:
                 #this server can send requests to other instances
-                proxy = self.proxies_queue.get()
-                try:
-                    self.server_logger.info("Sending request to %s" % proxy)
-                    result = proxy.get_wf_graph_png(host, port, db_name, vt_id, version, is_local)
-                    self.proxies_queue.put(proxy)
-                    self.server_logger.info("returning %s" % result)
-                    return result
-                except xmlrpclib.ProtocolError, err:
-                    err_msg = ("A protocol error occurred\n"
-                               "URL: %s\n"
-                               "HTTP/HTTPS headers: %s\n"
-                               "Error code: %d\n"
-                               "Error message: %s\n") % (err.url, err.headers,
-                                                         err.errcode, err.errmsg)
-                    self.server_logger.error(err_msg)
-                    return (str(err), 0)
-                except Exception, e:
-                    self.server_logger.error(str(e))
-                    self.server_logger.error(traceback.format_exc())
-                    return (str(e), 0)
+                return self._forward((host, port, db_name, vt_id),
+                                     'get_wf_graph_png', host, port, db_name,
+                                     vt_id, version, is_local)
             #if it gets here, this means that we will execute on this instance
             if not os.path.exists(filepath):
                 os.mkdir(filepath)
@@ -1325,6 +1344,8 @@ class RequestHandler(object):
                 controller.change_selected_version(version)
                 controller.updatePipelineScene()
                 controller.current_pipeline_scene.saveToPNG(filename)
+                # graphs of older versions of the vistrail are never used
+                prune_directory(filepath, cache_size)
             else:
                 self.server_logger.info("found cached image: %s" % filename)
             if is_local:
@@ -1382,28 +1403,11 @@ class RequestHandler(object):
             if ((not os.path.exists(filepath) or
                 (os.path.exists(filepath) and not os.path.exists(filename)) or
                  self._is_image_stale(filename, host, port, db_name, vt_id)) and 
-                self.proxies_queue is not None):
+                self.workers is not None):
                 #this server can send requests to other instances
-                proxy = self.proxies_queue.get()
-                try:
-                    self.server_logger.info("Sending request to %s" % proxy)
-                    result = proxy.get_vt_graph_png(host, port, db_name, vt_id, is_local)
-                    self.proxies_queue.put(proxy)
-                    self.server_logger.info("returning %s" % result)
-                    return result
-                except xmlrpclib.ProtocolError, err:
-                    err_msg = ("A protocol error occurred\n"
-                               "URL: %s\n"
-                               "HTTP/HTTPS headers: %s\n"
-                               "Error code: %d\n"
-                               "Error message: %s\n") % (err.url, err.headers,
-                                                         err.errcode, err.errmsg)
-                    self.server_logger.error(err_msg)
-                    return (str(err), 0)
-                except Exception, e:
-                    self.server_logger.error(str(e))
-                    self.server_logger.error(traceback.format_exc())
-                    return (str(e), 0)
+                return self._forward((host, port, db_name, vt_id),
+                                     'get_vt_graph_png', host, port, db_name,
+                                     vt_id, is_local)
 
             #if it gets here, this means that we will execute on this instance
             if (not os.path.exists(filepath) or
@@ -1471,28 +1475,11 @@ class RequestHandler(object):
             if ((not os.path.exists(filepath) or
                 (os.path.exists(filepath) and not os.path.exists(filename)) or
                  self._is_image_stale(filename, host, port, db_name, vt_id)) and 
-                self.proxies_queue is not None):
+                self.workers is not None):
                 #this server can send requests to other instances
-                proxy = self.proxies_queue.get()
-                try:
-                    self.server_logger.info("Sending request to %s" % proxy)
-                    result = proxy.get_vt_graph_pdf(host, port, db_name, vt_id, is_local)
-                    self.proxies_queue.put(proxy)
-                    self.server_logger.info("returning %s" % result)
-                    return result
-                except xmlrpclib.ProtocolError, err:
-                    err_msg = ("A protocol error occurred\n"
-                               "URL: %s\n"
-                               "HTTP/HTTPS headers: %s\n"
-                               "Error code: %d\n"
-                               "Error message: %s\n") % (err.url, err.headers,
-                                                         err.errcode, err.errmsg)
-                    self.server_logger.error(err_msg)
-                    return (str(err), 0)
-                except Exception, e:
-                    self.server_logger.error(str(e))
-                    self.server_logger.error(traceback.format_exc())
-                    return (str(e), 0)
+                return self._forward((host, port, db_name, vt_id),
+                                     'get_vt_graph_pdf', host, port, db_name,
+                                     vt_id, is_local)
 
 
             #if it gets here, this means that we will execute on this instance
@@ -1554,6 +1541,16 @@ class RequestHandler(object):
         self.server_logger.info("Request: get_vt_zip(%s,%s,%s,%s)" % \
                                 (host, port, db_name, vt_id))
         try:
+            key = self._result_key('vt_zip', host, port, db_name, vt_id)
+            contents = self.result_cache.lookup(key, '.vt')
+            if contents is not None:
+                self.server_logger.info("found cached vt")
+                return (base64.b64encode(contents), 1)
+            if self.workers is not None:
+                #this server can send requests to other instances
+                return self._forward((host, port, db_name, vt_id),
+                                     'get_vt_zip', host, port, db_name, vt_id)
+
             locator = DBLocator(host=host,
                                 port=int(port),
                                 database=db_name,
@@ -1572,7 +1569,8 @@ class RequestHandler(object):
             try:
                 fileLocator = FileLocator(name)
                 fileLocator.save(save_bundle)
-                contents = open(name).read()
+                contents = open(name, 'rb').read()
+                self.result_cache.store(key, contents, '.vt')
                 result = base64.b64encode(contents)
             finally:
                 os.unlink(name)
@@ -2112,7 +2110,7 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
         If parameters are missing, write them in and raise error.
         If file doesn't exist, create one and raise error. """
 
-        global accessList, db_host, db_read_user, db_read_pass, db_write_user, db_write_pass, media_dir, script_file, virtual_display
+        global accessList, db_host, db_read_user, db_read_pass, db_write_user, db_write_pass, media_dir, script_file, virtual_display, cache_size
         accessList = []
         db_host = ''
         db_read_user = ''
@@ -2120,6 +2118,7 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
         db_write_user = ''
         db_write_pass = ''
         media_dir = ''
+        cache_size = 1024 * 1024 * 1024
         script_file = ''
         virtual_display = ''
 
@@ -2186,6 +2185,11 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
             if not os.path.exists(media_dir):
                 raise ValueError("media_dir %s doesn't exist." % media_dir)
 
+        # optional: size of the cached results and of the cached workflow
+        # graphs, in megabytes (0 for no limit)
+        if config.has_option("media", "cache_size"):
+            cache_size = config.getint("media", "cache_size") * 1024 * 1024
+
         if not config.has_section("script"):
             config.add_section("script")
             has_changed = True
@@ -2243,6 +2247,10 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
 
         """
         VistrailsApplicationInterface.init(self,optionsDict, args)
+        if optionsDict is None or 'lazyDB' not in optionsDict:
+            # requests mostly need the version tree and a few workflows,
+            # only read the operations of the versions that are used
+            self.temp_configuration.lazyDB.enabled = True
 
         # self.vistrailsStartup.init()
         self.server_logger = self.make_logger(self.temp_configuration.check('rpcLogFile'),
@@ -2253,10 +2261,16 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
         return True
 
     def start_other_instances(self, number):
+        """start_other_instances(number: int) -> None
+        Starts the instances in parallel and waits until they answer
+        requests, instead of waiting a fixed time for each of them.
+        """
         self.others = []
+        self.ready = []
         host = self.temp_configuration.check('rpcServer')
         port = self.temp_configuration.check('rpcPort')
         virt_disp = int(virtual_display)
+        started = []
         for x in xrange(number):
             port += 1   # each instance needs one port space for now
                         #later we might need 2 (normal requests and status requests)
@@ -2264,23 +2278,50 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
             args = [script_file,":%s"%virt_disp,host,str(port),'0', '0']
             try:
                 subprocess.Popen(args)
-                time.sleep(20)
-                self.others.append("http://%s:%s"%(host,port))
+                started.append("http://%s:%s"%(host,port))
             except Exception, e:
                 self.server_logger.error(("Couldn't start the instance on display:"
-                                          "%s port: %s") % (virtual_display, port))
+                                          "%s port: %s") % (virt_disp, port))
                 self.server_logger.error(str(e))
+        # all of them are stopped on exit, but only the ones that answered
+        # are sent requests
+        self.others = started
+        self.ready = self.wait_for_instances(started)
+
+    def wait_for_instances(self, uris, timeout=INSTANCE_START_TIMEOUT):
+        """wait_for_instances(uris: list, timeout: int) -> list
+        Polls the instances until they all answer a ping or the timeout
+        expires. Returns the instances that answered.
+        """
+        waiting = list(uris)
+        deadline = time.time() + timeout
+        while waiting and time.time() < deadline:
+            time.sleep(1)
+            for uri in list(waiting):
+                try:
+                    xmlrpclib.ServerProxy(uri).try_ping()
+                except Exception:
+                    # not listening yet
+                    continue
+                waiting.remove(uri)
+                self.server_logger.info("Instance %s is ready" % uri)
+        for uri in waiting:
+            self.server_logger.error("Instance %s didn't answer in %s seconds" %
+                                     (uri, timeout))
+        return [uri for uri in uris if uri not in waiting]
 
     def stop_other_instances(self):
         script = os.path.join(system.vistrails_root_directory(), "stop_vistrails_server.py")
+        processes = []
         for o in self.others:
             args = ['python', script, o]
             try:
-                subprocess.Popen(args)
-                time.sleep(15)
+                processes.append(subprocess.Popen(args))
             except Exception, e:
                 self.server_logger.error("Couldn't stop instance: %s" % o)
                 self.server_logger.error(str(e))
+        for process in processes:
+            process.wait()
 
     def run_server(self):
         """run_server() -> None
@@ -2311,7 +2352,7 @@ class VistrailsServerSingleton(VistrailsApplicationInterface,
             self.server_logger.info("    singlethreaded instance")
         #self.rpcserver.register_introspection_functions()
         self.rpcserver.register_instance(RequestHandler(self.server_logger,
-                                                        self.others))
+                                                        self.ready))
         if self.pingserver:
             self.pingserver.register_instance(RequestHandler(
                                                       self.server_logger, []))
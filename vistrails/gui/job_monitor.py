@@ -103,7 +103,7 @@ class QJobView(QtGui.QWidget, QVistrailsPaletteInterface):
         buttonsLayout = QtGui.QHBoxLayout()
         run_now = QDockPushButton("Check now")
         run_now.setToolTip("Check all jobs now")
-        run_now.clicked.connect(self.timerEvent)
+        run_now.clicked.connect(self.check_now)
         buttonsLayout.addWidget(run_now)
         label = QtGui.QLabel('Refresh interval (seconds):')
         buttonsLayout.addWidget(label)
@@ -177,26 +177,47 @@ class QJobView(QtGui.QWidget, QVistrailsPaletteInterface):
             self.interval.setEditText(str(refresh))
         else:
             refresh = int(refresh)
+        conf = configuration.get_vistrails_configuration()
+        conf.jobCheckInterval = refresh
         if refresh:
-            if self.timer_id is not None:
-                self.killTimer(self.timer_id)
-            self.timer_id = self.startTimer(refresh*1000)
+            self.schedule_next_check()
         else:
             if self.timer_id:
                 self.killTimer(self.timer_id)
                 self.timer_id = None
-        conf = configuration.get_vistrails_configuration()
-        conf.jobCheckInterval = refresh
         self.updating_now = False
 
-    def update_jobs(self):
+    def schedule_next_check(self):
+        """Restarts the timer for the next job that is due.
+
+        The refresh interval is the longest wait; jobs whose handle has a
+        shorter check_interval are checked when they are due.
+        """
+        conf = configuration.get_vistrails_configuration()
+        delay = conf.jobCheckInterval
+        if not delay:
+            return
+        for controller in self.widgets:
+            scheduler = controller.jobMonitor.scheduler
+            next_check = scheduler.next_check()
+            if next_check is not None:
+                delay = min(delay, max(next_check - scheduler.clock(), 1))
+        if self.timer_id is not None:
+            self.killTimer(self.timer_id)
+        self.timer_id = self.startTimer(int(delay * 1000))
+
+    def update_jobs(self, force=False):
         """Called via a timer.
 
-        Checks jobs for all workflows both with and without monitors.
+        Checks jobs for all workflows both with and without monitors. Jobs
+        known to the scheduler are only checked when they are due, unless
+        force is True.
         """
         for i in xrange(self.jobView.topLevelItemCount()):
             vistrail = self.jobView.topLevelItem(i)
             jm = vistrail.jobMonitor
+            scheduler = jm.scheduler
+            scheduler.poll(force)
             for workflow_item in vistrail.workflowItems.values():
                 workflow = workflow_item.workflow
                 # jobs without a handle can also be checked
@@ -213,8 +234,11 @@ class QJobView(QtGui.QWidget, QVistrailsPaletteInterface):
                     if job.jobFinished:
                         continue
                     try:
-                        # call monitor
-                        job.jobFinished = jm.isDone(job.handle)
+                        if scheduler.has_job(job.job.id):
+                            job.jobFinished = scheduler.is_finished(job.job.id)
+                        else:
+                            # call monitor
+                            job.jobFinished = jm.isDone(job.handle)
                         if job.jobFinished:
                             job.setText(1, "Finished")
                     except Exception, e:
@@ -238,14 +262,18 @@ class QJobView(QtGui.QWidget, QVistrailsPaletteInterface):
                         workflow_item.execute()
                         self.updating_now = True
 
-    def timerEvent(self, id=None):
+    def timerEvent(self, id=None, force=False):
         if self.updating_now:
             return
         self.updating_now = True
         try:
-            self.update_jobs()
+            self.update_jobs(force)
         finally:
             self.updating_now = False
+            self.schedule_next_check()
+
+    def check_now(self):
+        self.timerEvent(force=True)
 
     def keyPressEvent(self, event):
         if event.key() in [QtCore.Qt.Key_Delete, QtCore.Qt.Key_Backspace]:
@@ -387,6 +415,8 @@ class QVistrailItem(QtGui.QTreeWidgetItem):
         if workflowItem:
             workflowItem.updateJobs()
             QJobView.instance().set_visible(True)
+        # new jobs may be due before the current timer
+        QJobView.instance().schedule_next_check()
 
     def checkJob(self, module, id, handle):
         """ checkJob(module: VistrailsModule, id: str, handle: object)
@@ -503,8 +533,14 @@ class QWorkflowItem(QtGui.QTreeWidgetItem):
 
     def execute(self):
         """ Shows and executes this pipeline
+
+        Only the modules that depend on the jobs are executed again, see
+        JobMonitor.resume_sinks().
         """
-        self.goto().execute()
+        view = self.goto()
+        sinks = self.parent().jobMonitor.resume_sinks(
+                self.workflow, self.parent().controller.current_pipeline)
+        view.execute(sinks=sinks)
 
 
 class QJobItem(QtGui.QTreeWidgetItem):
@@ -211,6 +211,10 @@ class _DefaultModuleConfigurationWidget(StandardModuleConfigurationWidget):
         return QtCore.QSize(384, 512)
         
     def saveTriggered(self, checked = False):
+        # the visible ports are changed in place, the module must not be
+        # shared with other versions of the pipeline
+        self.module = self.controller.current_pipeline.get_module_for_update(
+            self.module.id)
         for port in self.inputPorts:
             if (port.optional and
                 self.inputDict[port.name].checkState()==QtCore.Qt.Checked):
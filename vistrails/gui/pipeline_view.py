@@ -2269,12 +2269,12 @@ class QPipelineScene(QInteractiveGraphicsScene):
                 smid = connection.source.moduleId
                 s = connection.source.spec
                 if s and s.optional:
-                    smm = pipeline.modules[smid]
+                    smm = pipeline.get_module_for_update(smid)
                     smm.portVisible.add((PortEndPoint.Source,s.name))
                 dmid = connection.destination.moduleId   
                 d = connection.destination.spec
                 if d and d.optional:
-                    dmm = pipeline.modules[dmid]
+                    dmm = pipeline.get_module_for_update(dmid)
                     dmm.portVisible.add((PortEndPoint.Destination,d.name))
 
             # remove old connection shapes
@@ -3089,13 +3089,15 @@ class QPipelineScene(QInteractiveGraphicsScene):
         Toggles the breakpoint attribute for the module with given id
         """
         if self.controller:
-            module = self.controller.current_pipeline.modules[id]
+            pipeline = self.controller.current_pipeline
+            module = pipeline.get_module_for_update(id)
             module.toggle_breakpoint()
             self.recreate_module(self.controller.current_pipeline, id)
 
     def toggle_watched(self, id):
         if self.controller:
-            module = self.controller.current_pipeline.modules[id]
+            pipeline = self.controller.current_pipeline
+            module = pipeline.get_module_for_update(id)
             module.toggle_watched()
 
     def print_error(self, id):
@@ -3593,12 +3595,16 @@ class QPipelineView(QInteractiveGraphicsView, BaseView):
             return self.pipeline_non_empty(self.controller.current_pipeline)
         return False
     
-    def execute(self, target=None):
+    def execute(self, target=None, sinks=None):
         # reset job view
         if target is not None:
             self.controller.execute_user_workflow(
                     sinks=[target],
                     reason="Execute specific module")
+        elif sinks is not None:
+            self.controller.execute_user_workflow(
+                    sinks=sinks,
+                    reason="Resume jobs")
         else:
             self.controller.execute_user_workflow()
         from vistrails.gui.vistrails_window import _app
@@ -569,6 +569,12 @@ class PortsList(QtGui.QTreeWidget):
         if item.parent() is not None:
             return
 
+        if col == 1:
+            # the visible ports are changed in place, the module must not
+            # be shared with other versions of the pipeline
+            self.module = \
+                self.controller.current_pipeline.get_module_for_update(
+                    self.module.id)
         if self.port_type == 'input':
             visible_ports = self.module.visible_input_ports
             editable_ports = self.module.editable_input_ports
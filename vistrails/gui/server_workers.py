@@ -0,0 +1,371 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+""" Worker pool and result cache of the VisTrails server.
+
+These do not depend on Qt, so that they can be tested without a display.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import xmlrpclib
+
+
+class WorkerPool(object):
+    """WorkerPool(uris: list, logger: Logger)
+
+    Client proxies to the other VisTrails instances started by this
+    server. Requests about the same vistrail are routed to the same
+    instance while it is free, so that its caches stay warm; when that
+    instance is busy another free one is used instead of waiting, and a
+    request only blocks when all instances are busy.
+
+    """
+    def __init__(self, uris, logger):
+        self.logger = logger
+        self.proxies = []
+        for uri in uris:
+            try:
+                self.proxies.append(xmlrpclib.ServerProxy(uri))
+                self.logger.info("Instantiated client for %s" % uri)
+            except Exception, e:
+                self.logger.error("Error when instantiating proxy %s" % uri)
+                self.logger.error(str(e))
+        self.free = set(xrange(len(self.proxies)))
+        self.condition = threading.Condition()
+
+    def __len__(self):
+        return len(self.proxies)
+
+    def preferred(self, key):
+        """preferred(key: tuple) -> int
+        Returns the index of the instance requests with this key should
+        go to.
+
+        """
+        return int(hashlib.sha1(repr(key)).hexdigest(), 16) % len(self.proxies)
+
+    def acquire(self, key=None):
+        """acquire(key: tuple) -> int
+        Waits for a free instance and reserves it, preferring the one
+        associated with key.
+
+        """
+        self.condition.acquire()
+        try:
+            while not self.free:
+                self.condition.wait()
+            index = None
+            if key is not None:
+                index = self.preferred(key)
+                if index not in self.free:
+                    index = None
+            if index is None:
+                index = min(self.free)
+            self.free.remove(index)
+            return index
+        finally:
+            self.condition.release()
+
+    def acquire_all(self):
+        """acquire_all() -> list
+        Reserves all instances if they are all free, otherwise returns
+        None without waiting.
+
+        """
+        self.condition.acquire()
+        try:
+            if len(self.free) < len(self.proxies):
+                return None
+            indices = sorted(self.free)
+            self.free.clear()
+            return indices
+        finally:
+            self.condition.release()
+
+    def release(self, index):
+        self.condition.acquire()
+        try:
+            self.free.add(index)
+            self.condition.notify()
+        finally:
+            self.condition.release()
+
+    def call(self, key, method, *args):
+        """call(key: tuple, method: str, *args) -> object
+        Sends the request to a free instance, always giving it back to
+        the pool, even if the request fails.
+
+        """
+        index = self.acquire(key)
+        try:
+            proxy = self.proxies[index]
+            self.logger.info("Sending request to %s" % proxy)
+            return getattr(proxy, method)(*args)
+        finally:
+            self.release(index)
+
+
+def prune_directory(directory, max_size):
+    """prune_directory(directory: str, max_size: int) -> None
+    Removes the files of directory with the oldest modification times
+    until their total size is at most max_size bytes.
+
+    """
+    if not max_size:
+        return
+    files = []
+    total = 0
+    for name in os.listdir(directory):
+        filename = os.path.join(directory, name)
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            # removed by another thread
+            continue
+        if not os.path.isfile(filename) or name.startswith('tmp'):
+            continue
+        files.append((stat.st_mtime, stat.st_size, filename))
+        total += stat.st_size
+    if total <= max_size:
+        return
+    files.sort()
+    for mtime, size, filename in files:
+        if total <= max_size:
+            break
+        try:
+            os.remove(filename)
+        except OSError:
+            continue
+        total -= size
+
+
+class ResultCache(object):
+    """ResultCache(directory: str, max_size: int)
+
+    Content-addressed store for the results of requests that are costly
+    to compute (.vt files, workflow and vistrail XML). Keys include the
+    modification time of the vistrail in the database and a summary of
+    its rows, so a result is never served after the vistrail changed,
+    even within the same second. Once the cache is larger than
+    max_size bytes, the least recently used results are removed.
+
+    """
+    def __init__(self, directory, max_size=None):
+        self.directory = directory
+        self.max_size = max_size
+        if not os.path.exists(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                # another instance may have created it in the meantime
+                if not os.path.isdir(self.directory):
+                    raise
+
+    @staticmethod
+    def get_key(*args):
+        return hashlib.sha1(repr(args)).hexdigest()
+
+    @staticmethod
+    def get_vistrail_key(locator, *args):
+        """get_vistrail_key(locator: DBLocator, *args) -> str
+        Returns a key for a result about the vistrail of locator, that
+        changes whenever the vistrail is modified.
+
+        """
+        return ResultCache.get_key(args,
+                                   str(locator.get_db_modification_time()),
+                                   locator.get_db_state())
+
+    def get_filename(self, key, suffix=''):
+        return os.path.join(self.directory, key + suffix)
+
+    def lookup(self, key, suffix=''):
+        """lookup(key: str, suffix: str) -> str
+        Returns the cached contents or None if there are none.
+
+        """
+        filename = self.get_filename(key, suffix)
+        try:
+            f = open(filename, 'rb')
+        except IOError:
+            return None
+        try:
+            contents = f.read()
+        finally:
+            f.close()
+        try:
+            # the modification time is the last use, for pruning
+            os.utime(filename, None)
+        except OSError:
+            pass
+        return contents
+
+    def store(self, key, contents, suffix=''):
+        filename = self.get_filename(key, suffix)
+        (fd, name) = tempfile.mkstemp(prefix='tmp', suffix=suffix,
+                                      dir=self.directory)
+        try:
+            f = os.fdopen(fd, 'wb')
+            try:
+                f.write(contents)
+            finally:
+                f.close()
+            # renaming is atomic, other instances reading the cache
+            # never see partially written results
+            os.rename(name, filename)
+        except Exception:
+            if os.path.exists(name):
+                os.unlink(name)
+            raise
+        prune_directory(self.directory, self.max_size)
+
+################################################################################
+
+import logging
+import shutil
+import time
+import unittest
+from SimpleXMLRPCServer import SimpleXMLRPCServer
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger('vistrails.test.server_workers')
+        self.logger.addHandler(logging.NullHandler())
+        self.logger.propagate = False
+
+    def test_acquire_release(self):
+        pool = WorkerPool(['http://localhost:%d' % port
+                           for port in (9001, 9002, 9003)], self.logger)
+        self.assertEqual(len(pool), 3)
+        key = ('host', 3306, 'vistrails', 1)
+        preferred = pool.preferred(key)
+        self.assertEqual(pool.acquire(key), preferred)
+        # the preferred instance is busy, another one is used
+        other = pool.acquire(key)
+        self.assertNotEqual(other, preferred)
+        self.assertIsNone(pool.acquire_all())
+        pool.release(preferred)
+        self.assertEqual(pool.acquire(key), preferred)
+        pool.release(preferred)
+        pool.release(other)
+        self.assertEqual(pool.acquire_all(), [0, 1, 2])
+
+        # all busy: acquire() waits for a release
+        acquired = []
+        thread = threading.Thread(target=lambda: acquired.append(
+                                          pool.acquire(key)))
+        thread.start()
+        time.sleep(0.1)
+        self.assertEqual(acquired, [])
+        pool.release(1)
+        thread.join(5)
+        self.assertEqual(acquired, [1])
+
+    def test_call(self):
+        server = SimpleXMLRPCServer(('127.0.0.1', 0), logRequests=False)
+        def fail():
+            raise ValueError("failed")
+        server.register_function(lambda a, b: a + b, 'add')
+        server.register_function(fail, 'fail')
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        try:
+            pool = WorkerPool(['http://127.0.0.1:%d' %
+                               server.server_address[1]], self.logger)
+            self.assertEqual(pool.call(('key',), 'add', 2, 3), 5)
+            self.assertRaises(xmlrpclib.Fault, pool.call, ('key',), 'fail')
+            # the instance was given back both times
+            self.assertEqual(pool.acquire_all(), [0])
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='vt_test_results_')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_modification_time(self):
+        class Locator(object):
+            mod_time = '2014-03-01 10:00:00'
+            state = (12, 3952042741L)
+            def get_db_modification_time(self):
+                return self.mod_time
+            def get_db_state(self):
+                return self.state
+        locator = Locator()
+        cache = ResultCache(self.directory)
+        key = cache.get_vistrail_key(locator, 'vt_xml', 'host', 1)
+        self.assertIsNone(cache.lookup(key, '.xml'))
+        cache.store(key, '<vistrail/>', '.xml')
+        self.assertEqual(cache.lookup(cache.get_vistrail_key(
+                                 locator, 'vt_xml', 'host', 1), '.xml'),
+                         '<vistrail/>')
+        self.assertIsNone(cache.lookup(cache.get_vistrail_key(
+                                  locator, 'wf_xml', 'host', 1), '.xml'))
+        # modifying the vistrail invalidates its results
+        locator.mod_time = '2014-03-01 10:05:00'
+        self.assertIsNone(cache.lookup(cache.get_vistrail_key(
+                                  locator, 'vt_xml', 'host', 1), '.xml'))
+        cache.store(cache.get_vistrail_key(locator, 'vt_xml', 'host', 1),
+                    '<vistrail/>', '.xml')
+        # so does saving it again within the same second
+        locator.state = (13, 1278362919L)
+        self.assertIsNone(cache.lookup(cache.get_vistrail_key(
+                                  locator, 'vt_xml', 'host', 1), '.xml'))
+
+    def test_size_bound(self):
+        cache = ResultCache(self.directory, 25)
+        now = time.time()
+        for i, key in enumerate(['a', 'b', 'c']):
+            cache.store(key, 'x' * 10)
+            os.utime(cache.get_filename(key), (now - 10 + i, now - 10 + i))
+        self.assertIsNone(cache.lookup('a'))
+        # looking 'b' up makes 'c' the least recently used
+        self.assertEqual(cache.lookup('b'), 'x' * 10)
+        cache.store('d', 'x' * 10)
+        self.assertIsNone(cache.lookup('c'))
+        self.assertEqual(sorted(os.listdir(self.directory)), ['b', 'd'])
+
+
+if __name__ == '__main__':
+    unittest.main()
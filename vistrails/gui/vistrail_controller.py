@@ -1501,9 +1501,19 @@ class VistrailController(QtCore.QObject, BaseController):
             
             images = {}
             errors = []
-            for pi in xrange(len(modifiedPipelines)):
+            # an error stops its cell; continuing after it has to be
+            # enabled explicitly
+            stop_on_error = getattr(get_vistrails_configuration(),
+                                    'stopOnError')
+            # the cells of a sheet run together, so that the modules they
+            # share only run once
+            sheets = {}
+            for pi, position in enumerate(pipelinePositions):
+                sheets.setdefault(position[2], []).append(pi)
+            for sheet in sorted(sheets):
+                indices = sheets[sheet]
                 if showProgress:
-                    progress.setValue(mCount[pi])
+                    progress.setValue(mCount[indices[0]])
                     QtCore.QCoreApplication.processEvents()
                     if progress.wasCanceled():
                         break
@@ -1511,20 +1521,26 @@ class VistrailController(QtCore.QObject, BaseController):
                         if not progress.wasCanceled():
                             progress.setValue(progress.value()+1)
                             QtCore.QCoreApplication.processEvents()
-                if use_spreadsheet:
-                    name = os.path.splitext(self.name)[0] + \
-                                         ("_%s_%s_%s" % pipelinePositions[pi])
-                    extra_info['nameDumpCells'] = name
-                    if 'pathDumpCells' in extra_info:
-                        images[pipelinePositions[pi]] = \
-                                   os.path.join(extra_info['pathDumpCells'], name)
-                pe_cell_id = (pe_log_id,) + pipelinePositions[pi]
+                point_kwargs = []
+                for pi in indices:
+                    cell_extra_info = dict(extra_info)
+                    if use_spreadsheet:
+                        name = os.path.splitext(self.name)[0] + \
+                                             ("_%s_%s_%s" % pipelinePositions[pi])
+                        cell_extra_info['nameDumpCells'] = name
+                        if 'pathDumpCells' in extra_info:
+                            images[pipelinePositions[pi]] = \
+                                       os.path.join(extra_info['pathDumpCells'], name)
+                    pe_cell_id = (pe_log_id,) + pipelinePositions[pi]
+                    point_kwargs.append({
+                            'reason': 'Parameter Exploration %s %s_%s_%s' % pe_cell_id,
+                            'actions': performedActions[pi],
+                            'extra_info': cell_extra_info})
                 kwargs = {'locator': self.locator,
                           'current_version': self.current_version,
-                          'reason': 'Parameter Exploration %s %s_%s_%s' % pe_cell_id,
                           'logger': self.get_logger(),
-                          'actions': performedActions[pi],
-                          'extra_info': extra_info
+                          'point_kwargs': point_kwargs,
+                          'stop_on_error': stop_on_error,
                           }
                 if view:
                     kwargs['view'] = view
@@ -1535,13 +1551,15 @@ class VistrailController(QtCore.QObject, BaseController):
                     vars = dict([(v.uuid, v) for v in self.get_vistrail_variables()
                             if v.uuid not in vistrail_vars])
                     kwargs['vistrail_variables'] = lambda x: vars.get(x, None)
-                result = interpreter.execute(modifiedPipelines[pi], **kwargs)
-                for error in result.errors.itervalues():
-                    if use_spreadsheet:
-                        pp = pipelinePositions[pi]
-                        errors.append(((pp[1], pp[0], pp[2]), error))
-                    else:
-                        errors.append(((0,0,0), error))
+                results = interpreter.execute_many(
+                        [modifiedPipelines[pi] for pi in indices], **kwargs)
+                for pi, result in zip(indices, results):
+                    for error in result.errors.itervalues():
+                        if use_spreadsheet:
+                            pp = pipelinePositions[pi]
+                            errors.append(((pp[1], pp[0], pp[2]), error))
+                        else:
+                            errors.append(((0,0,0), error))
 
             if showProgress:
                 progress.setValue(totalProgress)
@@ -1071,7 +1071,7 @@ class QVistrailView(QtGui.QWidget):
         prop = QVersionProp.instance()
         prop.versionNotes.commit_changes()
 
-    def execute(self):
+    def execute(self, sinks=None):
         # makes sure we are not already executing
         if self.is_executing:
             return
@@ -1081,7 +1081,10 @@ class QVistrailView(QtGui.QWidget):
         try:
             if hasattr(view, 'execute'):
                 view.setFocus(QtCore.Qt.MouseFocusReason)
-                view.execute()
+                if sinks is not None and isinstance(view, QPipelineView):
+                    view.execute(sinks=sinks)
+                else:
+                    view.execute()
         finally:
             self.is_executing = False
 
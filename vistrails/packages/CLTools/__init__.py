@@ -33,9 +33,13 @@
 ##
 ###############################################################################
 """ This package provides a way to wrap command line tools into VisTrails modules
+
+When a list is connected to one of their ports, up to max_processes processes
+are run at a time (default: the number of CPUs).
 """
 from vistrails.core.configuration import ConfigurationObject
 
 from identifiers import *
 
-configuration = ConfigurationObject(env=(None, str))
+configuration = ConfigurationObject(env=(None, str),
+                                    max_processes=(None, int))
@@ -35,17 +35,22 @@
 
 import errno
 import json
+import multiprocessing
 import os
+import Queue
 import shutil
 import subprocess
 import sys
+import threading
+import time
 
 from vistrails.core.modules.vistrails_module import Module, ModuleError, IncompleteImplementation, new_module
 import vistrails.core.modules.module_registry
 from vistrails.core import debug
 from vistrails.core.packagemanager import get_package_manager
 import vistrails.core.system
-from vistrails.core.system import packages_directory, vistrails_root_directory
+from vistrails.core.system import packages_directory, systemType, \
+    vistrails_root_directory
 
 import identifiers
 
@@ -62,54 +67,36 @@ class CLTools(Module):
     def compute(self):
         raise IncompleteImplementation # pragma: no cover
 
+    def _input_list(self, inputs, name):
+        # inputs holds the values of the current iteration, see
+        # compute_batch()
+        if name in inputs:
+            return [inputs[name]]
+        return self.force_get_input_list(name)
 
-SUFFIX = '.clt'
-DEFAULTFILESUFFIX = '.cld'
-
-
-def _eintr_retry_call(func, *args):
-    """Fixes OSErrors and IOErrors
+    def _input(self, inputs, name):
+        if name in inputs:
+            return inputs[name]
+        return self.get_input(name)
 
-    From: http://code.google.com/p/seascope/source/detail?spec=svn8dbe5e23d41db673727ce90fd338e9a43f8877e8&name=8dbe5e23d41d&r=8dbe5e23d41db673727ce90fd338e9a43f8877e8
-    IOError added
-    """
-    while True:
-        try:
-            return func(*args)
-        except (OSError, IOError), e: # pragma: no cover
-            if e.errno == errno.EINTR:
-                continue
-            raise
+    def prepare_invocation(self, inputs):
+        """prepare_invocation(inputs: dict) -> Invocation
+        Builds the command line and the files of a process.
 
+        inputs overrides the values of the module's input ports.
 
-def _add_tool(path):
-    # first create classes
-    tool_name = os.path.basename(path)
-    if not tool_name.endswith(SUFFIX): # pragma: no cover
-        return
-    (tool_name, _) = os.path.splitext(tool_name)
-
-    if tool_name in cl_tools: # pragma: no cover
-        debug.critical("Package CLTools already added: '%s'" % tool_name)
-    try:
-        conf = json.load(open(path))
-    except ValueError as exc: # pragma: no cover
-        debug.critical("Package CLTools could not parse '%s'" % path, exc)
-        return
-
-    def compute(self):
-        """ 1. read inputs
-            2. call with inputs
-            3. set outputs
         """
-        # add all arguments as an unordered list
-        args = [self.conf['command']]
-        file_std = 'options' in self.conf and 'std_using_files' in self.conf['options']
+        invocation = Invocation()
+        args = invocation.args = [self.conf['command']]
+        invocation.file_std = file_std = \
+                'options' in self.conf and \
+                'std_using_files' in self.conf['options']
         fail_with_cmd = 'options' in self.conf and 'fail_with_cmd' in self.conf['options']
-        setOutput = [] # (name, File) - set File contents as output for name
-        open_files = []
-        stdin = None
-        kwargs = {}
+        # (name, File) - set File contents as output for name
+        setOutput = invocation.file_outputs
+        outputs = invocation.outputs
+        std_files = invocation.std_files
+        kwargs = invocation.kwargs
         for type, name, klass, options in self.conf['args']:
             type = type.lower()
             klass = klass.lower()
@@ -123,7 +110,7 @@ def _add_tool(path):
                         args.append('%s%s' % (options.get('prefix', ''), name))
             elif "input" == type:
                 # handle multiple inputs
-                values = self.force_get_input_list(name)
+                values = self._input_list(inputs, name)
                 if values and 'list' == klass:
                     values = values[0]
                     klass = options['type'].lower() \
@@ -157,14 +144,14 @@ def _add_tool(path):
                     args.append(options['flag'])
                 args.append(fname)
                 if "file" == klass:
-                    self.set_output(name, file)
+                    outputs[name] = file
                 elif "string" == klass:
                     setOutput.append((name, file))
                 else:
                     raise ValueError
             elif "inputoutput" == type:
                 # handle single file that is both input and output
-                value = self.get_input(name)
+                value = self._input(inputs, name)
 
                 # create copy of infile to operate on
                 outfile = self.interpreter.filePool.create_file(
@@ -180,74 +167,50 @@ def _add_tool(path):
                 if 'flag' in options:
                     args.append(options['flag'])
                 args.append(value)
-                self.set_output(name, outfile)
+                outputs[name] = outfile
         if "stdin" in self.conf:
             name, type, options = self.conf["stdin"]
             type = type.lower()
-            if self.has_input(name):
-                value = self.get_input(name)
+            if name in inputs or self.has_input(name):
+                value = self._input(inputs, name)
                 if "file" == type:
-                    if file_std:
-                        f = open(value.name, 'rb')
-                    else:
-                        f = open(value.name, 'rb')
-                        stdin = f.read()
-                        f.close()
+                    # the process reads the file directly
+                    std_files['stdin'] = (value.name, 'rb')
                 elif "string" == type:
                     if file_std:
                         file = self.interpreter.filePool.create_file()
                         f = open(file.name, 'wb')
                         f.write(value)
                         f.close()
-                        f = open(file.name, 'rb')
+                        std_files['stdin'] = (file.name, 'rb')
                     else:
-                        stdin = value
+                        invocation.stdin = value
+                        kwargs['stdin'] = subprocess.PIPE
                 else: # pragma: no cover
                     raise ValueError
-                if file_std:
-                    open_files.append(f)
-                    kwargs['stdin'] = f.fileno()
-                else:
-                    kwargs['stdin'] = subprocess.PIPE
-        if "stdout" in self.conf:
-            if file_std:
-                name, type, options = self.conf["stdout"]
-                type = type.lower()
-                file = self.interpreter.filePool.create_file(
-                        suffix=DEFAULTFILESUFFIX)
-                if "file" == type:
-                    self.set_output(name, file)
-                elif "string" == type:
-                    setOutput.append((name, file))
-                else: # pragma: no cover
-                    raise ValueError
-                f = open(file.name, 'wb')
-                open_files.append(f)
-                kwargs['stdout'] = f.fileno()
-            else:
-                kwargs['stdout'] = subprocess.PIPE
-        if "stderr" in self.conf:
-            if file_std:
-                name, type, options = self.conf["stderr"]
+        for std in ('stdout', 'stderr'):
+            if std in self.conf:
+                name, type, options = self.conf[std]
                 type = type.lower()
-                file = self.interpreter.filePool.create_file(
-                        suffix=DEFAULTFILESUFFIX)
-                if "file" == type:
-                    self.set_output(name, file)
+                if "file" == type or (file_std and "string" == type):
+                    # large outputs are streamed to the file, not buffered
+                    file = self.interpreter.filePool.create_file(
+                            suffix=DEFAULTFILESUFFIX)
+                    if "file" == type:
+                        outputs[name] = file
+                    else:
+                        setOutput.append((name, file))
+                    std_files[std] = (file.name, 'wb')
                 elif "string" == type:
-                    setOutput.append((name, file))
+                    invocation.pipe_outputs[std] = name
+                    kwargs[std] = subprocess.PIPE
                 else: # pragma: no cover
                     raise ValueError
-                f = open(file.name, 'wb')
-                open_files.append(f)
-                kwargs['stderr'] = f.fileno()
-            else:
-                kwargs['stderr'] = subprocess.PIPE
 
         if fail_with_cmd:
-            return_code = 0
+            invocation.return_code = 0
         else:
-            return_code = self.conf.get('return_code', None)
+            invocation.return_code = self.conf.get('return_code', None)
 
         env = {}
         # 0. add defaults
@@ -281,7 +244,7 @@ def _add_tool(path):
                                   debug.format_exception(e)))
             
         if 'options' in self.conf and 'env_port' in self.conf['options']:
-            for e in self.force_get_input_list('env'):
+            for e in self._input_list(inputs, 'env'):
                 try:
                     for var in e.split(';'):
                         if not var:
@@ -306,69 +269,194 @@ def _add_tool(path):
         if 'dir' in self.conf:
             kwargs['cwd'] = self.conf['dir']
 
-        process = subprocess.Popen(args, **kwargs)
-        if file_std:
-            process.wait()
-        else:
-            #if stdin:
-            #    print "stdin:", len(stdin), stdin[:30]
-            stdout, stderr = _eintr_retry_call(process.communicate, stdin)
-            #stdout, stderr = process.communicate(stdin)
-            #if stdout:
-            #    print "stdout:", len(stdout), stdout[:30]
-            #if stderr:
-            #    print "stderr:", len(stderr), stderr[:30]
-
-        if return_code is not None:
-            if process.returncode != return_code:
-                raise ModuleError(self, "Command returned %d (!= %d)" % (
-                                  process.returncode, return_code))
-        self.set_output('return_code', process.returncode)
+        return invocation
 
-        for f in open_files:
-            f.close()
+    def finish_invocation(self, invocation):
+        """finish_invocation(invocation: Invocation) -> dict
+        Checks the result of a process and returns the output values.
 
-        for name, file in setOutput:
+        """
+        if invocation.error is not None:
+            raise ModuleError(self, "Error running command: %s" %
+                              debug.format_exception(invocation.error))
+        if invocation.return_code is not None:
+            if invocation.returncode != invocation.return_code:
+                raise ModuleError(self, "Command returned %d (!= %d)" % (
+                                  invocation.returncode,
+                                  invocation.return_code))
+        outputs = dict(invocation.outputs)
+        outputs['return_code'] = invocation.returncode
+
+        for name, file in invocation.file_outputs:
             f = open(file.name, 'rb')
-            self.set_output(name, f.read())
+            outputs[name] = f.read()
             f.close()
 
-        if not file_std:
-            if "stdout" in self.conf:
-                name, type, options = self.conf["stdout"]
-                type = type.lower()
-                if "file" == type:
-                    file = self.interpreter.filePool.create_file(
-                            suffix=DEFAULTFILESUFFIX)
-                    f = open(file.name, 'wb')
-                    f.write(stdout)
-                    f.close()
-                    self.set_output(name, file)
-                elif "string" == type:
-                    self.set_output(name, stdout)
-                else: # pragma: no cover
-                    raise ValueError
-            if "stderr" in self.conf:
-                name, type, options = self.conf["stderr"]
-                type = type.lower()
-                if "file" == type:
-                    file = self.interpreter.filePool.create_file(
-                            suffix=DEFAULTFILESUFFIX)
-                    f = open(file.name, 'wb')
-                    f.write(stderr)
-                    f.close()
-                    self.set_output(name, file)
-                elif "string" == type:
-                    self.set_output(name, stderr)
-                else: # pragma: no cover
-                    raise ValueError
+        for std, name in invocation.pipe_outputs.iteritems():
+            outputs[name] = getattr(invocation, std)
+        return outputs
+
 
+class Invocation(object):
+    """ A single run of a command line tool.
+
+    Built by CLTools.prepare_invocation() and run with run(), possibly from
+    another thread; it doesn't touch the module. Files redirected to the
+    standard streams are only opened by run(), so that pending invocations
+    don't hold file descriptors.
+    """
+    def __init__(self):
+        self.args = []
+        self.kwargs = {}
+        self.stdin = None
+        self.file_std = False
+        # std -> (filename, mode)
+        self.std_files = {}
+        self.outputs = {}
+        self.file_outputs = []
+        self.pipe_outputs = {}
+        self.return_code = None
+
+        self.returncode = None
+        self.stdout = None
+        self.stderr = None
+        self.elapsed = 0.0
+        self.error = None
+
+    def run(self):
+        start = time.time()
+        open_files = []
+        try:
+            kwargs = dict(self.kwargs)
+            for std, (filename, mode) in self.std_files.iteritems():
+                f = open(filename, mode)
+                open_files.append(f)
+                kwargs[std] = f
+            if not systemType in ['Windows', 'Microsoft']:
+                # don't leak the pipes of concurrent processes
+                kwargs['close_fds'] = True
+            process = subprocess.Popen(self.args, **kwargs)
+            self.stdout, self.stderr = _eintr_retry_call(process.communicate,
+                                                         self.stdin)
+            self.returncode = process.returncode
+        except (OSError, IOError), e:
+            self.error = e
+        finally:
+            self.elapsed = time.time() - start
+            for f in open_files:
+                f.close()
+
+
+def max_processes():
+    """max_processes() -> int
+    Returns the number of processes that list iterations can run at once.
+
+    """
+    if configuration.check('max_processes'):
+        return max(configuration.max_processes, 1)
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError: # pragma: no cover
+        return 1
+
+
+def run_invocations(invocations, processes):
+    """run_invocations(invocations: list, processes: int) -> None
+    Runs the invocations, with at most the given number of processes at a
+    time.
+
+    """
+    if processes <= 1 or len(invocations) <= 1:
+        for invocation in invocations:
+            invocation.run()
+        return
+    tasks = Queue.Queue()
+    for invocation in invocations:
+        tasks.put(invocation)
+    def worker():
+        while True:
+            try:
+                invocation = tasks.get_nowait()
+            except Queue.Empty:
+                return
+            invocation.run()
+    threads = [threading.Thread(target=worker)
+               for _ in xrange(min(processes, len(invocations)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+SUFFIX = '.clt'
+DEFAULTFILESUFFIX = '.cld'
+
+
+def _eintr_retry_call(func, *args):
+    """Fixes OSErrors and IOErrors
+
+    From: http://code.google.com/p/seascope/source/detail?spec=svn8dbe5e23d41db673727ce90fd338e9a43f8877e8&name=8dbe5e23d41d&r=8dbe5e23d41db673727ce90fd338e9a43f8877e8
+    IOError added
+    """
+    while True:
+        try:
+            return func(*args)
+        except (OSError, IOError), e: # pragma: no cover
+            if e.errno == errno.EINTR:
+                continue
+            raise
+
+
+def _add_tool(path):
+    # first create classes
+    tool_name = os.path.basename(path)
+    if not tool_name.endswith(SUFFIX): # pragma: no cover
+        return
+    (tool_name, _) = os.path.splitext(tool_name)
+
+    if tool_name in cl_tools: # pragma: no cover
+        debug.critical("Package CLTools already added: '%s'" % tool_name)
+    try:
+        conf = json.load(open(path))
+    except ValueError as exc: # pragma: no cover
+        debug.critical("Package CLTools could not parse '%s'" % path, exc)
+        return
+
+    def compute(self):
+        """ 1. read inputs
+            2. call with inputs
+            3. set outputs
+        """
+        invocation = self.prepare_invocation({})
+        invocation.run()
+        for name, value in self.finish_invocation(invocation).iteritems():
+            self.set_output(name, value)
+        self.annotate({'process_time': '%.3f' % invocation.elapsed})
+
+    def compute_batch(self, inputs):
+        """ Runs one process per iteration, at most max_processes at a time
+        """
+        names = inputs.keys()
+        invocations = [self.prepare_invocation(
+                               dict((name, inputs[name][i]) for name in names))
+                       for i in xrange(len(inputs[names[0]]))]
+        run_invocations(invocations, max_processes())
+
+        outputs = {}
+        for invocation in invocations:
+            for name, value in self.finish_invocation(invocation).iteritems():
+                outputs.setdefault(name, []).append(value)
+        for name, values in outputs.iteritems():
+            self.set_output(name, values)
+        self.annotate(dict(('process_time_%d' % i, '%.3f' % invocation.elapsed)
+                           for i, invocation in enumerate(invocations)))
 
     # create docstring
     d = """This module is a wrapper for the command line tool '%s'""" % \
         conf['command']
     # create module
     M = new_module(CLTools, tool_name,{"compute": compute,
+                                           "compute_batch": compute_batch,
                                            "conf": conf,
                                            "tool_name": tool_name,
                                            "__doc__": d})
@@ -581,3 +669,71 @@ class TestCLTools(unittest.TestCase):
         """With std_using_files: use files instead of pipes.
         """
         self.do_the_test('intern_cltools_2')
+
+    def do_the_batch_test(self, toolname):
+        stdins = ['some line\nignored', 'wrong line\n'] * 3
+        with intercept_results(
+                self._tools[toolname],
+                'return_code', 'f_out', 'stdout') as (
+                return_code, f_out, stdout):
+            self.assertFalse(execute([
+                    ('List', 'org.vistrails.vistrails.basic', [
+                        ('value', [('List', repr(stdins))]),
+                    ]),
+                    (toolname, 'org.vistrails.vistrails.cltools', [
+                        ('f_in', [('File', self.testdir + '/test_1.cltest')]),
+                        ('chars', [('List', '["a", "b", "c"]')]),
+                        ('false', [('Boolean', 'False')]),
+                        ('true', [('Boolean', 'True')]),
+                        ('nb', [('Integer', '42')]),
+                    ]),
+                ],
+                [
+                    (0, 'value', 1, 'stdin'),
+                ]))
+        self.assertEqual(return_code, [[0, 1] * 3])
+        self.assertEqual(f_out, [['ok\nmessage received', ''] * 3])
+        self.assertEqual(stdout, [['program output here', ''] * 3])
+
+    def test_batch_with_pipes(self):
+        """List iteration runs the processes concurrently.
+        """
+        self.do_the_batch_test('intern_cltools_1')
+
+    def test_batch_with_files(self):
+        """List iteration with std_using_files.
+        """
+        self.do_the_batch_test('intern_cltools_2')
+
+    def test_batch_file_descriptors(self):
+        """Pending iterations don't hold file descriptors.
+        """
+        try:
+            import resource
+        except ImportError: # pragma: no cover
+            self.skipTest("resource module is not available")
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        nb = 150
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(256, hard), hard))
+        try:
+            with intercept_results(
+                    self._tools['intern_cltools_2'],
+                    'return_code') as (return_code,):
+                self.assertFalse(execute([
+                        ('List', 'org.vistrails.vistrails.basic', [
+                            ('value', [('List', repr(['some line\nignored'] * nb))]),
+                        ]),
+                        ('intern_cltools_2', 'org.vistrails.vistrails.cltools', [
+                            ('f_in', [('File', self.testdir + '/test_1.cltest')]),
+                            ('chars', [('List', '["a", "b", "c"]')]),
+                            ('false', [('Boolean', 'False')]),
+                            ('true', [('Boolean', 'True')]),
+                            ('nb', [('Integer', '42')]),
+                        ]),
+                    ],
+                    [
+                        (0, 'value', 1, 'stdin'),
+                    ]))
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+        self.assertEqual(return_code, [[0] * nb])
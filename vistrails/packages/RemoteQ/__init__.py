@@ -45,7 +45,9 @@ configuration = ConfigurationObject(server=(None, str),
                                     password=True,
                                     username=(None, str),
                                     uris=(None, str),
-                                    defaultFS=(None, str))
+                                    defaultFS=(None, str),
+                                    pollInterval=10,
+                                    maxPollInterval=300)
 
 def package_requirements():
     import vistrails.core.requirements
@@ -177,7 +177,8 @@ class HadoopBaseModule(RQModule):
             status = job.status()
             # The Subshell class provides the JobHandle interface, i.e.
             # finished()
-            raise ModuleSuspended(self, '%s' % status, handle=job)
+            raise ModuleSuspended(self, '%s' % status,
+                                  handle=self.watch_job(machine, job))
         self.is_cacheable = lambda *args, **kwargs: True
         return job.standard_error()
 
@@ -42,6 +42,7 @@ from vistrails.core.modules.basic_modules import File, Boolean, String, \
 from vistrails.core.modules.config import IPort, OPort, ModuleSettings
 from vistrails.core.modules.vistrails_module import ModuleError
 from base import HadoopBaseModule
+from init import discard_on_connection_error
 
 
 ################################################################################
@@ -62,6 +63,7 @@ class HDFSPut(HadoopBaseModule):
     def __init__(self):
         HadoopBaseModule.__init__(self)
 
+    @discard_on_connection_error
     def compute(self):
         machine = self.get_machine()
         jm = self.job_monitor()
@@ -110,6 +112,7 @@ class HDFSGet(HadoopBaseModule):
     def __init__(self):
         HadoopBaseModule.__init__(self)
 
+    @discard_on_connection_error
     def compute(self):
         machine = self.get_machine()
         jm = self.job_monitor()
@@ -164,6 +167,7 @@ class HDFSEnsureNew(HadoopBaseModule):
     def __init__(self):
         HadoopBaseModule.__init__(self)
 
+    @discard_on_connection_error
     def compute(self):
         machine = self.get_machine()
         jm = self.job_monitor()
@@ -32,6 +32,9 @@
 ## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
 ##
 ###############################################################################
+import functools
+
+from vistrails.core import debug
 from vistrails.core.modules.config import ModuleSettings
 from vistrails.core.modules.module_registry import get_module_registry
 from vistrails.core.modules.vistrails_module import Module, ModuleError, \
@@ -47,6 +50,8 @@ from remoteq.batch.commandline import PBS, PBSScript, Subshell
 from remoteq.batch.directories import CreateDirectory
 from remoteq.batch.files import TransferFiles
 
+from sessions import SessionPool, JobStatusService, CONNECTION_ERRORS
+
 
 class Machine(Module):
     _input_ports = [('server', '(edu.utah.sci.vistrails.basic:String)', True),
@@ -75,6 +80,13 @@ class Machine(Module):
 
     @staticmethod
     def create_machine(server, username, password, port):
+        """ Returns the shared session for this server and user, connecting
+            if there is none yet
+        """
+        return machine_pool.acquire(server, username, password, port)
+
+    @staticmethod
+    def _connect(server, username, password, port):
         machine = BQMachine(server, username, password, port,
                             accept_fingerprint=True)
         machine.params = {}
@@ -87,6 +99,36 @@ class Machine(Module):
         end_machine()
         return machine
 
+# Sessions are shared by all the modules using the same server and user
+machine_pool = SessionPool(Machine._connect)
+# Status of the submitted jobs, see RQModule.watch_job()
+job_status = None
+
+def get_job_status():
+    global job_status
+    if job_status is None:
+        job_status = JobStatusService(configuration.pollInterval,
+                                      configuration.maxPollInterval,
+                                      pool=machine_pool)
+    return job_status
+
+def discard_on_connection_error(compute):
+    """ Decorator for the compute() methods of RQModules
+
+    If the connection to the machine is lost, its session is dropped from
+    the pool so that the next module connects again.
+    """
+    @functools.wraps(compute)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return compute(self, *args, **kwargs)
+        except CONNECTION_ERRORS, e:
+            if self.machine is not None:
+                machine_pool.discard(self.machine)
+            raise ModuleError(self, "Connection to the machine lost: %s" %
+                                    debug.format_exception(e))
+    return wrapper
+
 class RQModule(JobMixin, Module):
     """ This is the base class of all RemoteQ modules and handles the
         connections to servers
@@ -94,26 +136,28 @@ class RQModule(JobMixin, Module):
     """
 
     _settings = ModuleSettings(abstract=True)
-    # a tuple (server, port, username, machine)
-    default_machine = None
     machine = None
 
+    @discard_on_connection_error
+    def compute(self):
+        JobMixin.compute(self)
+
     def get_machine(self):
         if self.has_input('machine'):
-            return self.get_input('machine')
-        default = False
+            self.machine = self.get_input('machine')
+            return self.machine
         # check if machine is specified in a job
         machine = self.get_job_machine()
         if not machine:
             machine = self.get_default_machine()
-            default = True
         if not machine:
             raise ModuleError(self, 'No Machine specified. Either add a '
                                     'default machine, or a Machine module.')
         server, port, username, password = machine
-        if RQModule.default_machine and \
-           (server, port, username) == RQModule.default_machine[:3]:
-            return RQModule.default_machine[3]
+        session = machine_pool.get(server, port, username)
+        if session is not None:
+            self.machine = session
+            return session
         if password:
             text = 'Enter password for %s@%s' % (username, server)
             from PyQt4 import QtGui
@@ -121,10 +165,16 @@ class RQModule(JobMixin, Module):
                                                      QtGui.QLineEdit.Password)
             if not ok:
                 raise ModuleError(self, "Canceled password")
-        machine = Machine.create_machine(server, username, password, port)
-        if default:
-            RQModule.default_machine = (server, port, username, machine)
-        return machine
+        self.machine = Machine.create_machine(server, username, password, port)
+        return self.machine
+
+    def watch_job(self, machine, handle, job_id=None):
+        """ Returns the handle to give to the JobMonitor for a job
+
+            Its status is then checked with the other jobs of the machine,
+            job_id being the identifier of the job in the PBS queue.
+        """
+        return get_job_status().watch(machine, handle, job_id)
 
     def get_job_machine(self):
         """ Get machine info from job
@@ -181,6 +231,7 @@ class RunCommand(RQModule):
                      ('output', '(edu.utah.sci.vistrails.basic:String)'),
                     ]
     
+    @discard_on_connection_error
     def compute(self):
         machine = self.get_machine()
 
@@ -252,7 +303,7 @@ class RunJob(RQModule):
     def job_get_handle(self, params):
         if not self.job:
             self.job_start(params)
-        return self.job
+        return self.watch_job(self.machine, self.job)
 
     def job_finish(self, params):
         params['stdout'] = self.job.standard_output()
@@ -291,6 +342,7 @@ class PBSJob(RQModule):
                      ('file_list', '(edu.utah.sci.vistrails.basic:List)'),
                     ]
     
+    @discard_on_connection_error
     def compute(self):
         machine = self.get_machine()
         if not self.has_input('command'):
@@ -317,6 +369,7 @@ class PBSJob(RQModule):
                   **additional_arguments)
         job.run()
         ret = job._ret
+        job_id = None
         if ret:
             try:
                 job_id = int(ret)
@@ -337,7 +390,8 @@ class PBSJob(RQModule):
                     status += ': ' + comment[10:]
             end_machine()
             # The PBS class provides the JobHandle interface, i.e. finished()
-            raise ModuleSuspended(self, '%s' % status, handle=job)
+            raise ModuleSuspended(self, '%s' % status,
+                                  handle=self.watch_job(machine, job, job_id))
         # copies the created files to the client
         get_result = TransferFiles("local", input_directory, working_directory,
                               dependencies = [cdir])
@@ -372,6 +426,7 @@ class RunPBSScript(RQModule):
                     ]
     
     job = None
+    job_id = None
     def job_read_inputs(self):
         d = {}
         if not self.has_input('command'):
@@ -402,7 +457,7 @@ class RunPBSScript(RQModule):
         ret = self.job._ret
         if ret:
             try:
-                job_id = int(ret.split('\n')[0])
+                self.job_id = int(ret.split('\n')[0])
             except ValueError:
                 end_machine()
                 raise ModuleError(self, "Error submitting job: %s" % ret)
@@ -412,7 +467,7 @@ class RunPBSScript(RQModule):
     def job_get_handle(self, params):
         if not self.job:
             self.job_start(params)
-        return self.job
+        return self.watch_job(self.machine, self.job, self.job_id)
 
     def job_finish(self, params):
         job_info = self.job.get_job_info()
@@ -446,6 +501,7 @@ class SyncDirectories(RQModule):
     _output_ports = [('machine', Machine),
                     ]
     
+    @discard_on_connection_error
     def compute(self):
         machine = self.get_machine()
         jm = self.job_monitor()
@@ -488,6 +544,7 @@ class CopyFile(RQModule):
                     ('output', '(edu.utah.sci.vistrails.basic:String)'),
                     ]
     
+    @discard_on_connection_error
     def compute(self):
         machine = self.get_machine()
         jm = self.job_monitor()
@@ -0,0 +1,535 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+""" Shared remote sessions and batched job status checks """
+
+import re
+import socket
+import threading
+import time
+
+from vistrails.core import debug
+
+try:
+    from paramiko import SSHException
+except ImportError: # pragma: no cover
+    CONNECTION_ERRORS = (socket.error, EOFError)
+else:
+    CONNECTION_ERRORS = (socket.error, EOFError, SSHException)
+
+
+################################################################################
+class SessionPool(object):
+    """ Keeps a single session for each (server, port, username)
+
+    factory(server, username, password, port) is called to open a session
+    when there is none for these parameters yet. Connections to different
+    keys are opened concurrently.
+    """
+    def __init__(self, factory):
+        self.factory = factory
+        self.sessions = {}
+        self.lock = threading.Lock()
+        # key -> lock held while connecting
+        self.key_locks = {}
+
+    def get(self, server, port, username):
+        """ Returns the open session or None, without connecting
+        """
+        with self.lock:
+            return self.sessions.get((server, port, username))
+
+    def acquire(self, server, username, password, port):
+        """ Returns the open session, connecting if there is none
+        """
+        key = (server, port, username)
+        with self.lock:
+            session = self.sessions.get(key)
+            if session is not None:
+                return session
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self.lock:
+                session = self.sessions.get(key)
+            if session is None:
+                # connect without blocking the other keys
+                session = self.factory(server, username, password, port)
+                with self.lock:
+                    self.sessions[key] = session
+            return session
+
+    def discard(self, session):
+        """ Forgets a session, for instance after the connection was lost
+        """
+        with self.lock:
+            for key, value in self.sessions.items():
+                if value is session:
+                    del self.sessions[key]
+
+    def clear(self):
+        with self.lock:
+            self.sessions.clear()
+
+
+################################################################################
+class PolledHandle(object):
+    """ JobHandle that checks its job through a JobStatusService
+
+    The wrapped handle is only asked directly once the batched query says the
+    job may be over, or for jobs without a queue identifier.
+    """
+    def __init__(self, service, machine, handle, job_id):
+        self.service = service
+        self.machine = machine
+        self.handle = handle
+        self.job_id = job_id
+        self.added = service.clock()
+        self.done = False
+        self.interval = service.min_interval
+        self.next_check = 0
+
+    def finished(self):
+        return self.service.is_finished(self)
+
+    def forget(self):
+        """ Called by the JobMonitor when the job is deleted
+        """
+        self.service.unwatch(self)
+
+
+class JobStatusService(object):
+    """ Checks the status of the pending jobs of each machine
+
+    The queue of a machine is queried with a single qstat call for all of
+    its watched jobs, at most every min_interval seconds. Each query that
+    sees no change, or fails, doubles that delay, up to max_interval; any
+    change resets it. Jobs without a queue identifier are checked individually, with the
+    same backoff.
+
+    If pool is given, queries use the session it currently holds for the
+    machine of a job, and a failed query discards that session so that the
+    next one connects again.
+    """
+
+    # PBS/Torque states of jobs that are not done yet
+    PENDING_STATES = frozenset('QRHWTES')
+    QSTAT_LINE = re.compile(r'^(\d+)\S*\s+\S+\s+\S+\s+\S+\s+([A-Z])\s')
+
+    def __init__(self, min_interval=10, max_interval=300, clock=time.time,
+                 pool=None):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.clock = clock
+        self.pool = pool
+        self.lock = threading.RLock()
+        # machine key -> {job_id: PolledHandle}
+        self.watched = {}
+        # machine key -> [last query, next query, interval, {job_id: state}]
+        self.queues = {}
+
+    @staticmethod
+    def machine_key(machine):
+        params = getattr(machine, 'params', None)
+        if params:
+            return (params['server'], params['port'], params['username'])
+        return id(machine)
+
+    def watch(self, machine, handle, job_id=None):
+        """watch(machine, handle, job_id: str) -> PolledHandle
+        Returns a handle to give to the JobMonitor instead of handle.
+
+        job_id is the identifier of the job in the PBS queue, if any.
+
+        """
+        if job_id is not None:
+            job_id = str(job_id)
+        polled = PolledHandle(self, machine, handle, job_id)
+        if job_id is not None:
+            with self.lock:
+                key = self.machine_key(machine)
+                self.watched.setdefault(key, {})[job_id] = polled
+        return polled
+
+    def unwatch(self, polled):
+        """ Stops querying the status of a job
+        """
+        if polled.job_id is None:
+            return
+        with self.lock:
+            watched = self.watched.get(self.machine_key(polled.machine), {})
+            if watched.get(polled.job_id) is polled:
+                del watched[polled.job_id]
+
+    def is_finished(self, polled):
+        with self.lock:
+            if polled.done:
+                return True
+            now = self.clock()
+            if polled.job_id is not None:
+                key = self.machine_key(polled.machine)
+                last_query, state = self._queue_state(polled.machine, key, now,
+                                                      polled.job_id)
+                if state in self.PENDING_STATES:
+                    return False
+                if state is None and polled.added >= last_query:
+                    # submitted after the last query, wait for the next one
+                    return False
+            if now < polled.next_check:
+                return False
+            done = self._check_handle(polled.handle)
+            if done:
+                polled.done = True
+                if polled.job_id is not None:
+                    self.watched[key].pop(polled.job_id, None)
+            else:
+                polled.next_check = now + polled.interval
+                polled.interval = min(polled.interval * 2, self.max_interval)
+            return done
+
+    @staticmethod
+    def _check_handle(handle):
+        finished = handle.finished()
+        if hasattr(finished, 'val'):
+            finished = finished.val()
+        if not finished and hasattr(handle, 'failed'):
+            finished = handle.failed()
+            if hasattr(finished, 'val'):
+                finished = finished.val()
+        return bool(finished)
+
+    def _queue_state(self, machine, key, now, job_id):
+        """ Returns the time of the last query and the state of the job
+        """
+        queue = self.queues.get(key)
+        if queue is None:
+            queue = self.queues[key] = [0, 0, self.min_interval, {}]
+        if now >= queue[1]:
+            states = self.query(machine, sorted(self.watched.get(key, {})))
+            if states is None:
+                # keep the last known states, don't hammer a failing host
+                queue[2] = min(queue[2] * 2, self.max_interval)
+                queue[1] = now + queue[2]
+            else:
+                if states != queue[3]:
+                    queue[2] = self.min_interval
+                else:
+                    queue[2] = min(queue[2] * 2, self.max_interval)
+                queue[0] = now
+                queue[1] = now + queue[2]
+                queue[3] = states
+        return queue[0], queue[3].get(job_id)
+
+    def query(self, machine, job_ids):
+        """query(machine, job_ids: list) -> dict
+        Runs a single qstat for all the jobs, returns {job_id: state}.
+
+        Finished jobs may be missing from the result. Returns None if the
+        query failed.
+
+        """
+        if not job_ids:
+            return {}
+        session = self.session(machine)
+        try:
+            output = session.remote.send_command(
+                    'qstat %s 2>/dev/null' % ' '.join(job_ids))
+        except Exception, e:
+            debug.warning("Error querying job status", e)
+            if self.pool is not None:
+                self.pool.discard(session)
+            return None
+        states = {}
+        for line in output.splitlines():
+            m = self.QSTAT_LINE.match(line.strip())
+            if m is not None:
+                states[m.group(1)] = m.group(2)
+        return states
+
+    def session(self, machine):
+        """session(machine) -> session
+        Returns the session of the pool for the machine a job was submitted
+        with, which may have been replaced after a connection error.
+        Connects again if needed and no password is required.
+
+        """
+        params = getattr(machine, 'params', None)
+        if self.pool is None or not params:
+            return machine
+        session = self.pool.get(params['server'], params['port'],
+                                params['username'])
+        if session is None and not params['password']:
+            try:
+                session = self.pool.acquire(params['server'],
+                                            params['username'], '',
+                                            params['port'])
+            except Exception, e:
+                debug.warning("Error connecting to %s" % params['server'], e)
+        if session is None:
+            return machine
+        return session
+
+
+################################################################################
+
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+import unittest
+
+
+class LocalShell(object):
+    """ Stand-in for a remote machine, running commands in a local shell
+    """
+    def __init__(self, env=None):
+        self.remote = self
+        self.params = {'server': 'localhost', 'port': 22,
+                       'username': 'test', 'password': False}
+        self.env = env
+        self.commands = []
+
+    def send_command(self, command):
+        self.commands.append(command)
+        proc = subprocess.Popen(['/bin/sh', '-c', command],
+                                stdout=subprocess.PIPE, env=self.env)
+        return proc.communicate()[0]
+
+
+class FakeJob(object):
+    def __init__(self):
+        self.done = False
+        self.checks = 0
+
+    def finished(self):
+        self.checks += 1
+        return self.done
+
+
+class TestSessionPool(unittest.TestCase):
+    def test_reuse(self):
+        created = []
+        def factory(server, username, password, port):
+            created.append((server, port, username))
+            return object()
+        pool = SessionPool(factory)
+        self.assertIsNone(pool.get('host', 22, 'user'))
+        session = pool.acquire('host', 'user', 'pw', 22)
+        self.assertIs(pool.acquire('host', 'user', '', 22), session)
+        self.assertIs(pool.get('host', 22, 'user'), session)
+        other = pool.acquire('host', 'other', 'pw', 22)
+        self.assertIsNot(other, session)
+        self.assertEqual(len(created), 2)
+        pool.discard(session)
+        self.assertIsNot(pool.acquire('host', 'user', 'pw', 22), session)
+        self.assertEqual(len(created), 3)
+
+    def test_concurrent_connections(self):
+        created = []
+        def factory(server, username, password, port):
+            time.sleep(0.3)
+            created.append(server)
+            return object()
+        pool = SessionPool(factory)
+        results = []
+        threads = [threading.Thread(
+                           target=lambda h=host: results.append(
+                                   pool.acquire(h, 'user', 'pw', 22)))
+                   for host in ('a', 'b', 'a')]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # different hosts connect at the same time, a host only once
+        self.assertLess(time.time() - start, 0.55)
+        self.assertEqual(sorted(created), ['a', 'b'])
+        self.assertEqual(len(set(results)), 2)
+
+
+class TestJobStatusService(unittest.TestCase):
+    def setUp(self):
+        # fake qstat printing the lines of the 'queue' file for the given ids
+        self.directory = tempfile.mkdtemp(prefix='vt_test_remoteq_')
+        self.queue = os.path.join(self.directory, 'queue')
+        qstat = os.path.join(self.directory, 'qstat')
+        with open(qstat, 'w') as fp:
+            fp.write('#!/bin/sh\n'
+                     'echo "Job id  Name  User  Time Use S Queue"\n'
+                     'echo "------- ----- ----- -------- - -----"\n'
+                     'for id in "$@"; do\n'
+                     '    grep "^$id\\." %s\n'
+                     'done\n'
+                     'exit 0\n' % self.queue)
+        os.chmod(qstat, stat.S_IRWXU)
+        env = dict(os.environ)
+        env['PATH'] = self.directory + os.pathsep + env.get('PATH', '')
+        self.machine = LocalShell(env)
+        self.now = 1000.0
+        self.service = JobStatusService(10, 40, clock=lambda: self.now)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def set_queue(self, states):
+        with open(self.queue, 'w') as fp:
+            for job_id, state in states.iteritems():
+                fp.write('%s.server  job  test  00:00:00 %s batch\n' % (
+                         job_id, state))
+
+    def test_batched(self):
+        jobs = dict((str(i), FakeJob()) for i in xrange(20))
+        self.set_queue(dict((i, 'Q') for i in jobs))
+        self.now -= 1
+        handles = dict((i, self.service.watch(self.machine, job, i))
+                       for i, job in jobs.iteritems())
+        self.now += 1
+        self.assertFalse(any(h.finished() for h in handles.itervalues()))
+        # a single query for all the jobs, the jobs are not asked
+        self.assertEqual(len(self.machine.commands), 1)
+        self.assertFalse(any(job.checks for job in jobs.itervalues()))
+        # no new query before the interval
+        self.now += 5
+        self.assertFalse(any(h.finished() for h in handles.itervalues()))
+        self.assertEqual(len(self.machine.commands), 1)
+
+        # job 3 leaves the queue: only this job is asked
+        jobs['3'].done = True
+        self.set_queue(dict((i, 'R') for i in jobs if i != '3'))
+        self.now += 5
+        finished = [i for i, h in handles.iteritems() if h.finished()]
+        self.assertEqual(finished, ['3'])
+        self.assertEqual(len(self.machine.commands), 2)
+        self.assertEqual([i for i, job in jobs.iteritems() if job.checks],
+                         ['3'])
+        self.assertTrue(handles['3'].finished())
+        self.assertEqual(jobs['3'].checks, 1)
+        # and is not queried anymore
+        self.now += 10
+        self.assertFalse(handles['4'].finished())
+        self.assertEqual(len(self.machine.commands), 3)
+        self.assertNotIn('3', self.machine.commands[-1].split())
+
+    def test_backoff(self):
+        job = FakeJob()
+        self.set_queue({'7': 'R'})
+        handle = self.service.watch(self.machine, job, 7)
+        self.now += 1
+        times = []
+        for i in xrange(150):
+            count = len(self.machine.commands)
+            handle.finished()
+            if len(self.machine.commands) > count:
+                times.append(self.now)
+            self.now += 1
+        # intervals grow from 10 up to 40 seconds
+        self.assertEqual([b - a for a, b in zip(times, times[1:])],
+                         [10, 20, 40, 40])
+
+    def test_backoff_on_failure(self):
+        class FailingShell(LocalShell):
+            def send_command(self, command):
+                self.commands.append(command)
+                raise IOError("connection lost")
+        machine = FailingShell()
+        job = FakeJob()
+        handle = self.service.watch(machine, job, 7)
+        self.now += 1
+        times = []
+        for i in xrange(150):
+            count = len(machine.commands)
+            self.assertFalse(handle.finished())
+            if len(machine.commands) > count:
+                times.append(self.now)
+            self.now += 1
+        self.assertEqual([b - a for a, b in zip(times, times[1:])],
+                         [20, 40, 40, 40])
+        self.assertEqual(job.checks, 0)
+
+    def test_reconnect(self):
+        sessions = []
+        def factory(server, username, password, port):
+            session = LocalShell(self.machine.env)
+            sessions.append(session)
+            return session
+        pool = SessionPool(factory)
+        service = JobStatusService(10, 40, clock=lambda: self.now, pool=pool)
+        machine = pool.acquire('localhost', 'test', '', 22)
+        def fail(command):
+            machine.commands.append(command)
+            raise EOFError("connection lost")
+        machine.send_command = fail
+        self.set_queue({'7': 'R'})
+        handle = service.watch(machine, FakeJob(), 7)
+        self.now += 1
+        self.assertFalse(handle.finished())
+        # the failed session was dropped, the next query connects again
+        self.assertIsNone(pool.get('localhost', 22, 'test'))
+        self.now += 20
+        self.assertFalse(handle.finished())
+        self.assertEqual(len(sessions), 2)
+        self.assertIs(pool.get('localhost', 22, 'test'), sessions[1])
+        self.assertEqual(len(sessions[1].commands), 1)
+
+    def test_deleted_job(self):
+        from vistrails.core.vistrail.job import JobMonitor
+        jm = JobMonitor()
+        handles = {}
+        for job_id in ('1', '2'):
+            handles[job_id] = self.service.watch(self.machine, FakeJob(),
+                                                 job_id)
+            jm.addJob(job_id, {})
+            jm.scheduler.schedule(job_id, handles[job_id])
+        jm.deleteJob('1')
+        self.set_queue({'2': 'R'})
+        self.now += 1
+        self.assertFalse(handles['2'].finished())
+        self.assertEqual(self.machine.commands[-1].split()[:-1],
+                         ['qstat', '2'])
+
+    def test_without_queue(self):
+        job = FakeJob()
+        handle = self.service.watch(self.machine, job)
+        self.assertFalse(handle.finished())
+        self.assertFalse(handle.finished())
+        self.assertEqual(job.checks, 1)
+        job.done = True
+        self.now += 10
+        self.assertTrue(handle.finished())
+        self.assertEqual(job.checks, 2)
+        self.assertEqual(self.machine.commands, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
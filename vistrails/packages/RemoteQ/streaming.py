@@ -41,6 +41,7 @@ from vistrails.core.modules.basic_modules import File, String
 from vistrails.core.modules.config import IPort, OPort, ModuleSettings
 from vistrails.core.modules.vistrails_module import ModuleError
 from base import HadoopBaseModule
+from init import discard_on_connection_error
 from remoteq.core.stack import use_machine
 from remoteq.batch.commandline import Subshell
 
@@ -214,6 +215,7 @@ class URICreator(HadoopBaseModule):
                            '(org.vistrails.vistrails.remoteq:Machine)'),
                      OPort('URI', String)]
 
+    @discard_on_connection_error
     def compute(self):
         machine = self.get_machine()
         jm = self.job_monitor()
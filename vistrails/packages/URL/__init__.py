@@ -40,7 +40,15 @@ without its associated data.
 
 This package uses a local cache, inside the per-user VisTrails directory. This
 way, files that haven't been changed do not need to be downloaded again. The
-check is performed efficiently using HTTP headers.
+check is performed efficiently using HTTP headers. Files are stored by content,
+and the least recently used ones are removed once the cache is larger than
+cache_size megabytes (0 for no limit). Lists of URLs are downloaded by up to
+download_threads concurrent connections.
 """
 
+from vistrails.core.configuration import ConfigurationObject
+
 from identifiers import *
+
+configuration = ConfigurationObject(cache_size=1024,
+                                    download_threads=4)
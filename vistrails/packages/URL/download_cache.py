@@ -0,0 +1,518 @@
+###############################################################################
+##
+## Copyright (C) 2011-2014, NYU-Poly.
+## Copyright (C) 2006-2011, University of Utah. 
+## All rights reserved.
+## Contact: contact@vistrails.org
+##
+## This file is part of VisTrails.
+##
+## "Redistribution and use in source and binary forms, with or without 
+## modification, are permitted provided that the following conditions are met:
+##
+##  - Redistributions of source code must retain the above copyright notice, 
+##    this list of conditions and the following disclaimer.
+##  - Redistributions in binary form must reproduce the above copyright 
+##    notice, this list of conditions and the following disclaimer in the 
+##    documentation and/or other materials provided with the distribution.
+##  - Neither the name of the University of Utah nor the names of its 
+##    contributors may be used to endorse or promote products derived from 
+##    this software without specific prior written permission.
+##
+## THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" 
+## AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, 
+## THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR 
+## PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR 
+## CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+## EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+## PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+## OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+## WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+## OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+## ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+##
+###############################################################################
+
+"""Content-addressed cache for downloaded files.
+
+Files are stored under the SHA-1 hash of their contents, so the same data
+served from several URLs is only kept once. An index maps each URL to its
+file and to the validators sent by the server (ETag, Last-Modified), which
+are used to revalidate it with a conditional request. Once the cache grows
+over its maximum size, the least recently used files are evicted, except
+those pinned by a download that is still using them.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import posixpath
+import Queue
+import sys
+import tempfile
+import threading
+import time
+import urllib2
+import urlparse
+
+from vistrails.core import debug
+
+
+CHUNK_SIZE = 65536
+
+
+def _replace(src, dst):
+    """_replace(src: str, dst: str) -> None
+    Renames src to dst, overwriting dst if it exists.
+
+    """
+    try:
+        os.rename(src, dst)
+    except OSError:
+        # rename() doesn't overwrite on Windows
+        if not os.path.exists(dst):
+            raise
+        os.remove(dst)
+        os.rename(src, dst)
+
+
+class DownloadCache(object):
+    """A bounded, content-addressed store of downloaded files.
+
+    Entries of the index are dictionaries with keys 'file' (name of the file
+    in the cache directory), 'etag', 'last_modified', 'size' and 'used' (time
+    of last use). All the methods are thread-safe.
+
+    Files can be evicted as soon as they are returned; callers should copy
+    them somewhere else inside a pinned() block.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, directory, max_size=None):
+        self.directory = directory
+        self.max_size = max_size
+        self.lock = threading.RLock()
+        # url -> number of pinned() blocks using it
+        self.pins = {}
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.index = self._read_index()
+
+    def _read_index(self):
+        try:
+            with open(os.path.join(self.directory, self.INDEX_FILE),
+                      'rb') as fp:
+                index = json.load(fp)
+        except (IOError, ValueError):
+            return {}
+        # Forget the entries which file has been removed
+        return dict((url, entry) for url, entry in index.iteritems()
+                    if os.path.isfile(self.get_filename(entry)))
+
+    def _write_index(self):
+        fd, temp = tempfile.mkstemp(prefix='.index', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                json.dump(self.index, fp)
+            _replace(temp, os.path.join(self.directory, self.INDEX_FILE))
+        except Exception:
+            if os.path.exists(temp):
+                os.remove(temp)
+            raise
+
+    def get_filename(self, entry):
+        """get_filename(entry: dict) -> str
+        Returns the path of the file for an entry of the index.
+
+        """
+        return os.path.join(self.directory, entry['file'])
+
+    def lookup(self, url):
+        """lookup(url: str) -> dict
+        Returns the entry for this URL, or None if it is not in the cache.
+
+        """
+        with self.lock:
+            entry = self.index.get(url)
+            if entry is None or not os.path.isfile(self.get_filename(entry)):
+                return None
+            return dict(entry)
+
+    def touch(self, url):
+        """touch(url: str) -> str
+        Marks the file for this URL as used and returns its path, or None if
+        it has been evicted in the meantime.
+
+        """
+        with self.lock:
+            entry = self.index.get(url)
+            if entry is None:
+                return None
+            entry['used'] = time.time()
+            self._write_index()
+            return self.get_filename(entry)
+
+    @contextlib.contextmanager
+    def pinned(self, url):
+        """pinned(url: str) -> context manager
+        Keeps the file for this URL from being evicted inside the block.
+
+        """
+        with self.lock:
+            self.pins[url] = self.pins.get(url, 0) + 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.pins[url] -= 1
+                if not self.pins[url]:
+                    del self.pins[url]
+
+    def store(self, url, fp, etag=None, last_modified=None, progress=None,
+              size=None):
+        """store(url: str, fp: file, etag: str, last_modified: str,
+                 progress: callable, size: int) -> str
+        Reads fp to its end and stores the data as the file for this URL.
+
+        progress, if given, is called with the fraction of size that has
+        been read so far. Returns the path of the file in the cache.
+
+        """
+        ext = posixpath.splitext(urlparse.urlparse(url).path)[1]
+        if len(ext) > 16 or not ext[1:].isalnum():
+            ext = ''
+        fd, temp = tempfile.mkstemp(prefix='.download', suffix=ext,
+                                    dir=self.directory)
+        try:
+            hasher = hashlib.sha1()
+            read = 0
+            with os.fdopen(fd, 'wb') as out:
+                while True:
+                    if progress is not None and size:
+                        progress(min(read * 1.0 / size, 1.0))
+                    chunk = fp.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    read += len(chunk)
+                    hasher.update(chunk)
+                    out.write(chunk)
+            name = hasher.hexdigest() + ext
+
+            with self.lock:
+                filename = os.path.join(self.directory, name)
+                if os.path.isfile(filename):
+                    # Same contents are already in the cache
+                    os.remove(temp)
+                else:
+                    _replace(temp, filename)
+                self.index[url] = {'file': name,
+                                   'etag': etag,
+                                   'last_modified': last_modified,
+                                   'size': read,
+                                   'used': time.time()}
+                self._evict(keep=name)
+                self._write_index()
+                return filename
+        except Exception:
+            if os.path.exists(temp):
+                os.remove(temp)
+            raise
+
+    def _evict(self, keep=None):
+        """Removes least recently used files until the cache fits max_size.
+        """
+        if not self.max_size:
+            return
+        files = {}
+        for url, entry in self.index.iteritems():
+            size, used, urls = files.get(entry['file'], (entry['size'], 0, []))
+            urls.append(url)
+            files[entry['file']] = size, max(used, entry['used']), urls
+        total = sum(size for size, used, urls in files.itervalues())
+        if total <= self.max_size:
+            return
+        for name, (size, used, urls) in sorted(files.iteritems(),
+                                               key=lambda i: i[1][1]):
+            if total <= self.max_size:
+                break
+            if name == keep or any(url in self.pins for url in urls):
+                continue
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                debug.warning("Couldn't remove %s from the download cache" %
+                              name)
+                continue
+            for url in urls:
+                del self.index[url]
+            total -= size
+
+    def clear(self):
+        """Removes every file from the cache.
+        """
+        with self.lock:
+            for name in set(entry['file']
+                            for entry in self.index.itervalues()):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+            self.index = {}
+            self._write_index()
+
+
+def fetch(url, cache, opener, progress=None, revalidate=True):
+    """fetch(url: str, cache: DownloadCache, opener: OpenerDirector,
+             progress: callable, revalidate: bool) -> str
+    Downloads a URL through the cache and returns the path of the file.
+
+    If the URL is in the cache and revalidate is True, a conditional request
+    is sent using the validators stored with the file and the cached file is
+    used if the server answers 304 Not Modified. Network errors are not
+    caught.
+
+    """
+    entry = cache.lookup(url)
+    request = urllib2.Request(url)
+    if entry is not None and revalidate:
+        if entry['etag']:
+            request.add_header('If-None-Match', entry['etag'])
+        if entry['last_modified']:
+            request.add_header('If-Modified-Since', entry['last_modified'])
+    try:
+        response = opener.open(request)
+    except urllib2.HTTPError, e:
+        if e.code == 304 and entry is not None:
+            filename = cache.touch(url)
+            if filename is not None:
+                return filename
+            # Evicted by another thread, download it again
+            response = opener.open(urllib2.Request(url))
+        else:
+            raise
+    try:
+        headers = response.info()
+        try:
+            size = int(headers.get('Content-Length'))
+        except (TypeError, ValueError):
+            size = None
+        return cache.store(url, response,
+                           etag=headers.get('ETag'),
+                           last_modified=headers.get('Last-Modified'),
+                           progress=progress, size=size)
+    finally:
+        response.close()
+
+
+def map_threaded(function, items, max_workers=4):
+    """map_threaded(function: callable, items: list, max_workers: int) -> list
+    Calls function on every item using a pool of threads.
+
+    Results are returned in the order of items. If a call raises, the
+    remaining items are not started and the first exception is re-raised.
+
+    """
+    items = list(items)
+    results = [None] * len(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [function(item) for item in items]
+
+    tasks = Queue.Queue()
+    for i, item in enumerate(items):
+        tasks.put((i, item))
+    errors = []
+
+    def worker():
+        while not errors:
+            try:
+                i, item = tasks.get_nowait()
+            except Queue.Empty:
+                return
+            try:
+                results[i] = function(item)
+            except Exception:
+                errors.append(sys.exc_info())
+
+    threads = [threading.Thread(target=worker)
+               for _ in xrange(min(max_workers, len(items)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0][0], errors[0][1], errors[0][2]
+    return results
+
+
+###############################################################################
+
+import unittest
+import BaseHTTPServer
+import shutil
+import SocketServer
+
+
+class LocalHTTPServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """HTTP server serving files from a dict, for tests.
+
+    files maps paths to (contents, etag) pairs; requests is a list of the
+    paths that were served with a 200 response.
+    """
+    daemon_threads = True
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        def do_GET(self):
+            try:
+                contents, etag = self.server.files[self.path]
+            except KeyError:
+                self.send_error(404)
+                return
+            if etag is not None and self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.server.requests.append(self.path)
+            self.send_response(200)
+            if contents.startswith('<html>'):
+                self.send_header('Content-Type', 'text/html')
+            else:
+                self.send_header('Content-Type', 'application/octet-stream')
+            self.send_header('Content-Length', str(len(contents)))
+            if etag is not None:
+                self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(contents)
+
+        def log_message(self, format, *args):
+            pass
+
+    def __init__(self, files):
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', 0),
+                                           self.Handler)
+        self.files = files
+        self.requests = []
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def url(self, path):
+        return 'http://127.0.0.1:%d%s' % (self.server_address[1], path)
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class TestDownloadCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='vt_test_dlcache_')
+        self.server = LocalHTTPServer({
+                '/a.txt': ('aaa', '"a1"'),
+                '/b.txt': ('bbbb', None),
+                '/copy.txt': ('aaa', '"c1"'),
+                })
+        self.opener = urllib2.build_opener()
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.directory)
+
+    def read(self, filename):
+        with open(filename, 'rb') as fp:
+            return fp.read()
+
+    def test_revalidate(self):
+        cache = DownloadCache(self.directory)
+        url = self.server.url('/a.txt')
+        filename = fetch(url, cache, self.opener)
+        self.assertEqual(self.read(filename), 'aaa')
+        self.assertTrue(filename.endswith('.txt'))
+        # Not modified: answered with 304, not downloaded again
+        self.assertEqual(fetch(url, cache, self.opener), filename)
+        self.assertEqual(self.server.requests, ['/a.txt'])
+        # Modified on the server
+        self.server.files['/a.txt'] = ('new', '"a2"')
+        filename = fetch(url, cache, self.opener)
+        self.assertEqual(self.read(filename), 'new')
+        self.assertEqual(self.server.requests, ['/a.txt', '/a.txt'])
+        # No validator: always downloaded
+        fetch(self.server.url('/b.txt'), cache, self.opener)
+        fetch(self.server.url('/b.txt'), cache, self.opener)
+        self.assertEqual(self.server.requests.count('/b.txt'), 2)
+
+    def test_persistence(self):
+        url = self.server.url('/a.txt')
+        filename = fetch(url, DownloadCache(self.directory), self.opener)
+        cache = DownloadCache(self.directory)
+        self.assertEqual(fetch(url, cache, self.opener), filename)
+        self.assertEqual(self.server.requests, ['/a.txt'])
+
+    def test_dedup(self):
+        cache = DownloadCache(self.directory)
+        file1 = fetch(self.server.url('/a.txt'), cache, self.opener)
+        file2 = fetch(self.server.url('/copy.txt'), cache, self.opener)
+        self.assertEqual(file1, file2)
+        self.assertEqual(len([n for n in os.listdir(self.directory)
+                              if n.endswith('.txt')]),
+                         1)
+
+    def test_eviction(self):
+        cache = DownloadCache(self.directory, max_size=8)
+        url_a = self.server.url('/a.txt')
+        url_b = self.server.url('/b.txt')
+        file_a = fetch(url_a, cache, self.opener)
+        fetch(url_b, cache, self.opener)
+        # 3 + 4 bytes fit, using a.txt makes b.txt the oldest
+        cache.touch(url_a)
+        self.server.files['/c.txt'] = ('ccccc', None)
+        file_c = fetch(self.server.url('/c.txt'), cache, self.opener)
+        self.assertIsNone(cache.lookup(url_b))
+        self.assertTrue(os.path.isfile(file_a))
+        self.assertTrue(os.path.isfile(file_c))
+        # A file larger than the cache is still kept until the next store
+        self.server.files['/d.txt'] = ('d' * 20, None)
+        file_d = fetch(self.server.url('/d.txt'), cache, self.opener)
+        self.assertTrue(os.path.isfile(file_d))
+        self.assertIsNone(cache.lookup(url_a))
+        self.assertFalse(os.path.exists(file_a))
+
+    def test_pinned(self):
+        cache = DownloadCache(self.directory, max_size=4)
+        url_a = self.server.url('/a.txt')
+        with cache.pinned(url_a):
+            file_a = fetch(url_a, cache, self.opener)
+            fetch(self.server.url('/b.txt'), cache, self.opener)
+            # over the limit, but a.txt is in use
+            self.assertTrue(os.path.isfile(file_a))
+        self.assertEqual(cache.pins, {})
+        self.server.files['/c.txt'] = ('c', None)
+        fetch(self.server.url('/c.txt'), cache, self.opener)
+        self.assertFalse(os.path.exists(file_a))
+
+    def test_concurrent(self):
+        cache = DownloadCache(self.directory)
+        paths = ['/f%d.txt' % i for i in xrange(20)]
+        for i, path in enumerate(paths):
+            self.server.files[path] = ('file %d' % i, None)
+        filenames = map_threaded(
+                lambda p: fetch(self.server.url(p), cache, self.opener),
+                paths, 4)
+        self.assertEqual([self.read(f) for f in filenames],
+                         ['file %d' % i for i in xrange(20)])
+        self.assertEqual(sorted(self.server.requests), sorted(paths))
+
+    def test_map_threaded_error(self):
+        def function(i):
+            if i == 3:
+                raise ValueError("three")
+            return i * 2
+        self.assertEqual(map_threaded(function, range(3), 2), [0, 2, 4])
+        with self.assertRaises(ValueError):
+            map_threaded(function, range(10), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
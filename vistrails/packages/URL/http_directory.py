@@ -2,7 +2,10 @@
 
 from HTMLParser import HTMLParser
 import os
+import Queue
 import re
+import sys
+import threading
 
 from .https_if_available import build_opener
 
@@ -54,51 +57,90 @@ class ListingParser(HTMLParser):
                     break
 
 
-def download_directory(url, target, insecure=False):
-    def mkdir():
-        if not mkdir.done:
-            try:
-                os.mkdir(target)
-            except OSError:
-                pass
-            mkdir.done = True
-    mkdir.done = False
-
-    opener = build_opener(insecure=insecure)
-    response = opener.open(url)
-
-    if response.info().type == 'text/html':
-        contents = response.read()
-
-        parser = ListingParser(url)
-        parser.feed(contents)
-        for link in parser.links:
-            link = resolve_link(link, url)
-            if link[-1] == '/':
-                link = link[:-1]
-            if not link.startswith(url):
-                continue
-            name = link.rsplit('/', 1)[1]
-            if '?' in name:
-                continue
-            mkdir()
-            download_directory(link, os.path.join(target, name), insecure)
-        if not mkdir.done:
-            # We didn't find anything to write inside this directory
-            # Maybe it's a HTML file?
-            if url[-1] != '/':
-                end = target[-5:].lower()
-                if not (end.endswith('.htm') or end.endswith('.html')):
-                    target = target + '.html'
-                with open(target, 'wb') as fp:
-                    fp.write(contents)
-    else:
-        buffer_size = 4096
-        with open(target, 'wb') as fp:
-            chunk = response.read(buffer_size)
-            while chunk:
-                fp.write(chunk)
+def download_directory(url, target, insecure=False, max_workers=4):
+    """Downloads a directory listing recursively into target.
+
+    The listings are walked and the files fetched by a pool of max_workers
+    threads.
+    """
+    tasks = Queue.Queue()
+    errors = []
+    local = threading.local()
+
+    def download(url, target):
+        if not hasattr(local, 'opener'):
+            local.opener = build_opener(insecure=insecure)
+        response = local.opener.open(url)
+
+        if response.info().type == 'text/html':
+            contents = response.read()
+
+            parser = ListingParser(url)
+            parser.feed(contents)
+            children = []
+            for link in parser.links:
+                link = resolve_link(link, url)
+                if link[-1] == '/':
+                    link = link[:-1]
+                if not link.startswith(url):
+                    continue
+                name = link.rsplit('/', 1)[1]
+                if '?' in name:
+                    continue
+                children.append((link, os.path.join(target, name)))
+            if children:
+                try:
+                    os.mkdir(target)
+                except OSError:
+                    pass
+                for child in children:
+                    tasks.put(child)
+            else:
+                # We didn't find anything to write inside this directory
+                # Maybe it's a HTML file?
+                if url[-1] != '/':
+                    end = target[-5:].lower()
+                    if not (end.endswith('.htm') or end.endswith('.html')):
+                        target = target + '.html'
+                    with open(target, 'wb') as fp:
+                        fp.write(contents)
+        else:
+            buffer_size = 65536
+            with open(target, 'wb') as fp:
                 chunk = response.read(buffer_size)
+                while chunk:
+                    fp.write(chunk)
+                    chunk = response.read(buffer_size)
+        response.close()
+
+    def worker():
+        while True:
+            task = tasks.get()
+            try:
+                if task is None:
+                    return
+                if not errors:
+                    download(*task)
+            except Exception:
+                errors.append(sys.exc_info())
+            finally:
+                tasks.task_done()
+
+    tasks.put((url, target))
+    threads = [threading.Thread(target=worker)
+               for _ in xrange(max(max_workers, 1))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    # Listings add their entries to the queue before being marked done, so
+    # the queue only gets empty once the whole tree has been downloaded
+    tasks.join()
+    for thread in threads:
+        tasks.put(None)
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0][0], errors[0][1], errors[0][2]
 
 
 ###############################################################################
@@ -175,3 +217,36 @@ Index of /test</title></head><body><h1>Index of /test</h1><table><tr><th>
                 'http://a.remram.fr/cc/',
                 'http://a.remram.fr/dd',
         ]))
+
+
+class TestDownloadDirectory(unittest.TestCase):
+    def test_download(self):
+        import shutil
+        import tempfile
+        from .download_cache import LocalHTTPServer
+
+        listing = '<html><body>%s</body></html>'
+        server = LocalHTTPServer({
+                '/test/': (listing % ''.join(
+                               '<a href="%s">%s</a>' % (l, l)
+                               for l in ['/', '?C=N;O=D', 'a', 'bb', 'cc/',
+                                         'f.html']),
+                           None),
+                '/test/a': ('aa\n', None),
+                '/test/bb': ('bb\n', None),
+                '/test/cc': (listing % '<a href="d">d</a>', None),
+                '/test/cc/d': ('dd\n', None),
+                '/test/f.html': (listing % '', None),
+                })
+        testdir = tempfile.mkdtemp(prefix='vt_test_http_')
+        try:
+            download_directory(server.url('/test/'), testdir, max_workers=3)
+            self.assertEqual(sorted(os.listdir(testdir)),
+                             ['a', 'bb', 'cc', 'f.html'])
+            for name, contents in [('a', 'aa\n'), ('bb', 'bb\n'),
+                                   (os.path.join('cc', 'd'), 'dd\n')]:
+                with open(os.path.join(testdir, name), 'rb') as fp:
+                    self.assertEqual(fp.read(), contents)
+        finally:
+            server.stop()
+            shutil.rmtree(testdir)
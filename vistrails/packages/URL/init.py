@@ -43,8 +43,6 @@ way, files that haven't been changed do not need to be downloaded again. The
 check is performed efficiently using HTTP headers.
 """
 
-from datetime import datetime
-import email.utils
 import hashlib
 import os
 import re
@@ -58,7 +56,7 @@ import vistrails.core.modules.basic_modules
 from vistrails.core.modules.basic_modules import PathObject
 import vistrails.core.modules.module_registry
 from vistrails.core.modules.vistrails_module import Module, ModuleError
-from vistrails.core.system import current_dot_vistrails, strptime
+from vistrails.core.system import current_dot_vistrails
 from vistrails.core.upgradeworkflow import UpgradeWorkflowHandler
 import vistrails.gui.repository
 from vistrails.gui.utils import show_warning
@@ -67,180 +65,76 @@ from vistrails.core.repository.poster.encode import multipart_encode
 from vistrails.core.repository.poster.streaminghttp import register_openers
 
 from .identifiers import identifier
+from .download_cache import DownloadCache, fetch, map_threaded
 from .http_directory import download_directory
 from .https_if_available import build_opener
 
 
 package_directory = None
+download_cache = None
 
 
 ###############################################################################
 
 class Downloader(object):
-    def __init__(self, url, module, insecure):
+    """Downloads a file through the download cache.
+
+    Files are always downloaded again, unless the server is unreachable and
+    the cache has a copy. See HTTPDownloader for conditional requests.
+    """
+    revalidate = False
+
+    def __init__(self, url, module, insecure, report_progress=True):
         self.url = url
         self.module = module
         self.opener = build_opener(insecure=insecure)
+        self.report_progress = report_progress
 
     def execute(self):
         """ Tries to download a file from url.
 
-        Returns the path to the local file.
+        Returns the path to the local file, which is a link to or a copy of
+        the cached file in the module's file pool, so that it stays valid
+        after being evicted from the cache.
         """
-        self.local_filename = os.path.join(package_directory,
-                                           urllib.quote_plus(self.url))
-
-        # Before download
-        self.pre_download()
+        with download_cache.pinned(self.url):
+            filename = self._fetch()
+            return self.module.interpreter.filePool.make_local_copy(
+                    filename).name
+
+    def _fetch(self):
+        if self.report_progress:
+            def progress(fraction):
+                self.module.logging.update_progress(self.module, fraction)
+        else:
+            progress = None
 
-        # Send request
         try:
-            response = self.send_request()
+            return fetch(self.url, download_cache, self.opener,
+                         progress=progress, revalidate=self.revalidate)
         except urllib2.URLError, e:
-            if self.is_in_local_cache:
+            filename = download_cache.touch(self.url)
+            if filename is not None and os.path.isfile(filename):
                 debug.warning("A network error occurred. DownloadFile will "
                               "use a cached version of the file")
-                return self.local_filename
+                return filename
             else:
                 raise ModuleError(
                         self.module,
                         "Network error: %s" % debug.format_exception(e))
-        if response is None:
-            return self.local_filename
-
-        # Read response headers
-        self.size_header = None
-        if not self.read_headers(response):
-            return self.local_filename
-
-        # Download
-        self.download(response)
-
-        # Post download
-        self.post_download(response)
-
-        return self.local_filename
-
-    def pre_download(self):
-        pass
-
-    def send_request(self):
-        return self.opener.open(self.url)
-
-    def read_headers(self, response):
-        return True
-
-    def download(self, response):
-        try:
-            dl_size = 0
-            CHUNKSIZE = 4096
-            f2 = open(self.local_filename, 'wb')
-            while True:
-                if self.size_header is not None:
-                    self.module.logging.update_progress(
-                            self.module,
-                            dl_size*1.0/self.size_header)
-                chunk = response.read(CHUNKSIZE)
-                if not chunk:
-                    break
-                dl_size += len(chunk)
-                f2.write(chunk)
-            f2.close()
-            response.close()
-
         except Exception, e:
-            try:
-                os.unlink(self.local_filename)
-            except OSError:
-                pass
             raise ModuleError(
                     self.module,
                     "Error retrieving URL: %s" % debug.format_exception(e))
 
-    def post_download(self, response):
-        pass
-
-    @property
-    def is_in_local_cache(self):
-        return os.path.isfile(self.local_filename)
-
 
 class HTTPDownloader(Downloader):
-    def pre_download(self):
-        # Get ETag from disk
-        try:
-            with open(self.local_filename + '.etag') as etag_file:
-                self.etag = etag_file.read()
-        except IOError:
-            self.etag = None
-
-    def send_request(self):
-        try:
-            request = urllib2.Request(self.url)
-            if self.etag is not None:
-                request.add_header(
-                    'If-None-Match',
-                    self.etag)
-            try:
-                mtime = email.utils.formatdate(
-                        os.path.getmtime(self.local_filename),
-                        usegmt=True)
-                request.add_header(
-                    'If-Modified-Since',
-                    mtime)
-            except OSError:
-                pass
-            return self.opener.open(request)
-        except urllib2.HTTPError, e:
-            if e.code == 304:
-                # Not modified
-                return None
-            raise
-
-    def read_headers(self, response):
-        try:
-            self.mod_header = response.headers['last-modified']
-        except KeyError:
-            self.mod_header = None
-        try:
-            size_header = response.headers['content-length']
-            if not size_header:
-                raise ValueError
-            self.size_header = int(size_header)
-        except (KeyError, ValueError):
-            self.size_header = None
-        return True
+    """Downloads a file over HTTP, revalidating the cached copy.
 
-    def _is_outdated(self):
-        local_time = datetime.utcfromtimestamp(
-                os.path.getmtime(self.local_filename))
-        try:
-            remote_time = strptime(self.mod_header,
-                                   "%a, %d %b %Y %H:%M:%S %Z")
-        except ValueError:
-            try:
-                remote_time = strptime(self.mod_header,
-                                       "%a, %d %B %Y %H:%M:%S %Z")
-            except ValueError:
-                # unable to parse last-modified header, download file again
-                debug.warning("Unable to parse Last-Modified header, "
-                              "downloading file")
-                return True
-        return remote_time > local_time
-
-    def download(self, response):
-        if (not self.is_in_local_cache or
-                not self.mod_header or self._is_outdated()):
-            Downloader.download(self, response)
-
-    def post_download(self, response):
-        try:
-            etag = response.headers['ETag']
-        except KeyError:
-            pass
-        else:
-            with open(self.local_filename + '.etag', 'w') as etag_file:
-                etag = etag_file.write(etag)
+    The ETag and Last-Modified headers received with the file are sent back
+    so that the server only sends it again if it has changed.
+    """
+    revalidate = True
 
 
 class SSHDownloader(object):
@@ -281,7 +175,7 @@ class SSHDownloader(object):
             '$'
             )
 
-    def __init__(self, url, module, insecure):
+    def __init__(self, url, module, insecure, report_progress=True):
         self.url = url
         self.module = module
 
@@ -378,14 +272,26 @@ class DownloadFile(Module):
         result = PathObject(local_filename)
         self.set_output('file', result)
 
-    def download(self, url, insecure):
+    def compute_batch(self, inputs):
+        # Fetches all the URLs concurrently
+        insecure = self.get_input('insecure')
+        local_filenames = map_threaded(
+                lambda url: self.download(url, insecure,
+                                          report_progress=False),
+                inputs['url'],
+                configuration.download_threads)
+        self.set_output('local_filename', local_filenames)
+        self.set_output('file', [PathObject(local_filename)
+                                 for local_filename in local_filenames])
+
+    def download(self, url, insecure, report_progress=True):
         """ Tries to download a file from url.
 
         Returns the path to the local file.
         """
         scheme = urllib2.splittype(url)[0]
         DL = downloaders.get(scheme, Downloader)
-        return DL(url, self, insecure).execute()
+        return DL(url, self, insecure, report_progress).execute()
 
 
 class HTTPDirectory(Module):
@@ -404,7 +310,8 @@ class HTTPDirectory(Module):
     def download(self, url, insecure):
         local_path = self.interpreter.filePool.create_directory(
                 prefix='vt_http').name
-        download_directory(url, local_path, insecure)
+        download_directory(url, local_path, insecure,
+                           configuration.download_threads)
         return local_path
 
 
@@ -519,15 +426,20 @@ class RepoSync(Module):
                 # local file not present or out of date, download or use cache
                 self.url = "%s/datasets/download/%s" % (self.base_url,
                                                        self.checksum)
-                local_filename = package_directory + '/' + \
-                        urllib.quote_plus(self.url)
-                if not self._file_is_in_local_cache(local_filename):
-                    # file not in cache, download.
-                    try:
-                        urllib.urlretrieve(self.url, local_filename)
-                    except IOError, e:
-                        raise ModuleError(self, ("Invalid URL: %s" % e))
-                out_file = PathObject(local_filename)
+                # the checksum is in the URL, no need to revalidate
+                with download_cache.pinned(self.url):
+                    entry = download_cache.lookup(self.url)
+                    if entry is not None:
+                        local_filename = download_cache.touch(self.url)
+                    else:
+                        # file not in cache, download.
+                        try:
+                            local_filename = fetch(self.url, download_cache,
+                                                   urllib2.build_opener())
+                        except IOError, e:
+                            raise ModuleError(self, ("Invalid URL: %s" % e))
+                    out_file = self.interpreter.filePool.make_local_copy(
+                            local_filename)
                 debug.warning('RepoSync is using repository data')
                 self.set_output("file", out_file)
 
@@ -648,6 +560,11 @@ def initialize(*args, **keywords):
             raise RuntimeError("Failed to create cache directory: %s" %
                                package_directory, e)
 
+    global download_cache
+    download_cache = DownloadCache(
+            os.path.join(package_directory, 'cache'),
+            configuration.cache_size * 1024 * 1024)
+
 
 def handle_module_upgrade_request(controller, module_id, pipeline):
     module_remap = {
@@ -695,6 +612,96 @@ class TestDownloadFile(unittest.TestCase):
                 ]),
             ]))
 
+    def test_local_server(self):
+        from vistrails.tests.utils import execute, intercept_result
+        from .download_cache import LocalHTTPServer
+
+        server = LocalHTTPServer({'/a.txt': ('aa', '"a"'),
+                                  '/b.txt': ('bb', None)})
+        try:
+            url = server.url('/a.txt')
+            for i in xrange(2):
+                with intercept_result(DownloadFile, 'local_filename') as res:
+                    self.assertFalse(execute([
+                            ('DownloadFile', identifier, [
+                                ('url', [('String', url)]),
+                            ]),
+                        ]))
+                self.assertEqual(len(res), 1)
+                with open(res[0], 'rb') as fp:
+                    self.assertEqual(fp.read(), 'aa')
+            # The second execution got a 304 Not Modified
+            self.assertEqual(server.requests, ['/a.txt'])
+        finally:
+            server.stop()
+
+    def test_list(self):
+        from vistrails.tests.utils import execute, intercept_result
+        from .download_cache import LocalHTTPServer
+
+        server = LocalHTTPServer(dict(('/f%d' % i, ('file %d' % i, None))
+                                      for i in xrange(6)))
+        try:
+            urls = [server.url('/f%d' % i) for i in xrange(6)]
+            with intercept_result(DownloadFile, 'local_filename') as res:
+                self.assertFalse(execute([
+                        ('List', 'org.vistrails.vistrails.basic', [
+                            ('value', [('List', repr(urls))]),
+                        ]),
+                        ('DownloadFile', identifier, []),
+                    ],
+                    [
+                        (0, 'value', 1, 'url'),
+                    ]))
+            self.assertEqual(len(res), 1)
+            contents = []
+            for filename in res[0]:
+                with open(filename, 'rb') as fp:
+                    contents.append(fp.read())
+            self.assertEqual(contents, ['file %d' % i for i in xrange(6)])
+        finally:
+            server.stop()
+
+    def test_list_larger_than_cache(self):
+        """The files of a batch survive evictions made by the batch"""
+        import shutil
+        import tempfile
+        from vistrails.tests.utils import execute, intercept_result
+        from .download_cache import LocalHTTPServer
+
+        global download_cache
+        server = LocalHTTPServer(dict(('/f%d' % i, ('ff %d' % i, None))
+                                      for i in xrange(6)))
+        directory = tempfile.mkdtemp(prefix='vt_test_dlcache_')
+        old_cache = download_cache
+        download_cache = DownloadCache(directory, max_size=10)
+        try:
+            urls = [server.url('/f%d' % i) for i in xrange(6)]
+            with intercept_result(DownloadFile, 'local_filename') as res:
+                self.assertFalse(execute([
+                        ('List', 'org.vistrails.vistrails.basic', [
+                            ('value', [('List', repr(urls))]),
+                        ]),
+                        ('DownloadFile', identifier, []),
+                    ],
+                    [
+                        (0, 'value', 1, 'url'),
+                    ]))
+            self.assertEqual(len(res), 1)
+            contents = []
+            for filename in res[0]:
+                with open(filename, 'rb') as fp:
+                    contents.append(fp.read())
+            self.assertEqual(contents, ['ff %d' % i for i in xrange(6)])
+            self.assertLessEqual(
+                    sum(entry['size']
+                        for entry in download_cache.index.itervalues()),
+                    10)
+        finally:
+            download_cache = old_cache
+            server.stop()
+            shutil.rmtree(directory)
+
 
 class TestHTTPDirectory(unittest.TestCase):
     def test_download(self):
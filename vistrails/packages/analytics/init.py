@@ -35,6 +35,8 @@
 from vistrails.core.modules.vistrails_module import Module, ModuleError
 import vistrails.core.vistrail.vistrail
 import vistrails.core.log.log 
+import vistrails.core.log.workflow_exec
+import vistrails.db
 import vistrails.db.services.io
 
 
@@ -44,6 +46,9 @@ class Vistrail(Module):
 class Log(Module):
     pass
 
+class WorkflowExec(Module):
+    pass
+
 class ReadVistrail(Module):
     _input_ports = [('file', '(basic:File)')]
     _output_ports = [('vistrail','(Vistrail)'),
@@ -89,6 +94,42 @@ class ReadVistrail(Module):
         log = self.read_log(fname)
         self.set_output('log', log)
 
+class ReadWorkflowExec(Module):
+    _input_ports = [('file', '(basic:File)'),
+                    ('id', '(basic:Integer)')]
+    _output_ports = [('workflow_exec', '(WorkflowExec)')]
+
+    def read_workflow_exec(self, fname, exec_id):
+        # only the vistrail and the log are needed from the bundle
+        bundle, save_dir = \
+            vistrails.db.services.io.open_vistrail_bundle_from_zip_xml(
+                fname, lazy=True)
+        try:
+            log_fname = bundle.vistrail.db_log_filename
+            if log_fname is None:
+                raise ModuleError(self, "No log file accessible")
+
+            # indexed logs only read this execution
+            try:
+                workflow_exec = \
+                    vistrails.db.services.io.open_workflow_exec_from_log(
+                        log_fname, exec_id)
+            except vistrails.db.VistrailsDBException, e:
+                raise ModuleError(self, str(e))
+        finally:
+            # the log was extracted to a temporary directory
+            vistrails.db.services.io.close_zip_xml(save_dir)
+
+        # convert the execution from a db object
+        vistrails.core.log.workflow_exec.WorkflowExec.convert(workflow_exec)
+        return workflow_exec
+
+    def compute(self):
+        fname = self.get_input('file').name
+        exec_id = self.get_input('id')
+        self.set_output('workflow_exec',
+                        self.read_workflow_exec(fname, exec_id))
+
 class CountActions(Module):
     _input_ports = [('vistrail', '(Vistrail)')]
     _output_ports = [('counts', '(basic:Dictionary)')]
@@ -176,4 +217,42 @@ class TotalDays(Module):
     #Compare a few workflows to see how long the project took vs. how many tags were made
  #   pass
 
-_modules = [Vistrail, Log, ReadVistrail, CountActions, CountExecutedWorkflows, TotalDays]
+_modules = [Vistrail, Log, WorkflowExec, ReadVistrail, ReadWorkflowExec,
+            CountActions, CountExecutedWorkflows, TotalDays]
+
+
+import unittest
+
+
+class TestReadWorkflowExec(unittest.TestCase):
+    def test_read_workflow_exec(self):
+        """Test that the temporary files of the bundle are removed."""
+        import os
+        import vistrails.core.system
+
+        filename = os.path.join(
+                vistrails.core.system.vistrails_root_directory(),
+                'tests/resources/spx_loop.vt')
+        save_dirs = []
+        old_open_bundle = \
+            vistrails.db.services.io.open_vistrail_bundle_from_zip_xml
+        def open_bundle(*args, **kwargs):
+            result = old_open_bundle(*args, **kwargs)
+            save_dirs.append(result[1])
+            return result
+        vistrails.db.services.io.open_vistrail_bundle_from_zip_xml = \
+            open_bundle
+        try:
+            module = ReadWorkflowExec()
+            workflow_exec = module.read_workflow_exec(filename, 1)
+            self.assertIsInstance(workflow_exec,
+                                  vistrails.core.log.workflow_exec.WorkflowExec)
+            self.assertEqual(workflow_exec.id, 1)
+            with self.assertRaises(ModuleError):
+                module.read_workflow_exec(filename, 1000)
+        finally:
+            vistrails.db.services.io.open_vistrail_bundle_from_zip_xml = \
+                old_open_bundle
+        self.assertEqual(len(save_dirs), 2)
+        for save_dir in save_dirs:
+            self.assertFalse(os.path.exists(save_dir))
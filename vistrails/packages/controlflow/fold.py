@@ -55,6 +55,9 @@ class Fold(Module):
 
     To use it, create a subclass and override the setInitialValue() and
     operation() methods.
+
+    A streamed InputList is folded one chunk at a time, as it arrives,
+    instead of being gathered in a list first.
     """
 
     def __init__(self):
@@ -73,6 +76,30 @@ class Fold(Module):
 
         self.set_output('Result', self.partialResult)
 
+    def reduce_stream(self, accumulator, inputs):
+        """Folds a chunk of a streamed InputList into the partial result.
+        The accumulator only tells whether this is the first chunk."""
+
+        if accumulator is None:
+            self.setInitialValue()
+            self.partialResult = self.initialValue
+            self.elementResult = None
+
+        for element in inputs['InputList']:
+            self.element = element
+            self.operation()
+
+        return True
+
+    def finish_stream(self, accumulator):
+        """Sets the result once the stream is exhausted."""
+
+        if accumulator is None:
+            self.setInitialValue()
+            self.partialResult = self.initialValue
+
+        self.set_output('Result', self.partialResult)
+
     def setInitialValue(self): # pragma: no cover
         """This method defines the initial value of the Fold structure. It must
         be defined before the operation() method."""
@@ -95,6 +122,9 @@ class FoldWithModule(Fold):
     that this module will use.
     """
 
+    # the operation needs the other module, it can't reduce a stream
+    reduce_stream = None
+
     def update_upstream(self):
         """A modified version of the update_upstream method."""
 
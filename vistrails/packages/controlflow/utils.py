@@ -237,6 +237,37 @@ class TestUtils(unittest.TestCase):
                 ]))
         self.assertEqual(results, [28.7])
 
+    def test_sum_stream(self):
+        """Sums a stream, one chunk at a time."""
+        src = urllib2.quote(
+                "self.set_streaming_output('o', iter(xrange(1, 11)), 10,\n"
+                "                          chunk_size=4)")
+        chunks = []
+        reduce_stream = Sum.reduce_stream.im_func
+        def record_chunks(self, accumulator, inputs):
+            chunks.append(list(inputs['InputList']))
+            return reduce_stream(self, accumulator, inputs)
+        Sum.reduce_stream = record_chunks
+        try:
+            with intercept_result(Sum, 'Result') as results:
+                self.assertFalse(execute([
+                        ('PythonSource', 'org.vistrails.vistrails.basic', [
+                            ('source', [('String', src)]),
+                        ]),
+                        ('Sum', 'org.vistrails.vistrails.control_flow', []),
+                    ],
+                    [
+                        (0, 'o', 1, 'InputList'),
+                    ],
+                    add_port_specs=[
+                        (0, 'output', 'o',
+                         'org.vistrails.vistrails.basic:List'),
+                    ]))
+        finally:
+            del Sum.reduce_stream
+        self.assertEqual(results, [55])
+        self.assertEqual(chunks, [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]])
+
     def do_andor(self, l):
         with intercept_result(And, 'Result') as and_results:
             with intercept_result(Or, 'Result') as or_results:
@@ -114,3 +114,48 @@ def parallel_map(function, *args, **kwargs):
         return result, ipython
     else:
         return result
+
+
+_local_pool = None
+
+
+def local_pool_size():
+    """Returns the number of processes in the local pool.
+    """
+    import multiprocessing
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def local_pool():
+    """Returns a pool of local worker processes, for when no IPython cluster
+    is available.
+
+    The processes are started on first use and kept until cleanup_local_pool()
+    is called, so that they can keep their cache between executions.
+
+    The workers are forked from VisTrails: they use the application, module
+    registry and packages they inherit, and are not initialized again. This
+    returns None on platforms without fork(), where they would start with
+    nothing loaded.
+    """
+    global _local_pool
+    if _local_pool is None:
+        import os
+        if not hasattr(os, 'fork'):
+            return None
+        import multiprocessing
+        _local_pool = multiprocessing.Pool(local_pool_size())
+    return _local_pool
+
+
+def cleanup_local_pool():
+    """Stops the local worker processes, if they were started.
+    """
+    global _local_pool
+    if _local_pool is not None:
+        _local_pool.terminate()
+        _local_pool.join()
+        _local_pool = None
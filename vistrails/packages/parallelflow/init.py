@@ -2,7 +2,7 @@ from vistrails.core.modules.vistrails_module import Module
 from vistrails.core.modules.module_registry import get_module_registry
 from vistrails.core.modules.basic_modules import List, String
 
-from engine_manager import EngineManager
+from api import cleanup_local_pool
 from map import Map
 
 
@@ -18,10 +18,20 @@ def initialize(*args,**keywords):
 
 
 def finalize():
+    cleanup_local_pool()
+    try:
+        from engine_manager import EngineManager
+    except ImportError:
+        # IPython is not installed, Map runs on local processes
+        return
     EngineManager.cleanup()
 
 
 def menu_items():
+    try:
+        from engine_manager import EngineManager
+    except ImportError:
+        return ()
     return (
             ("Start new engine processes",
              lambda: EngineManager.start_engines()),
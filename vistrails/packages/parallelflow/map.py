@@ -1,9 +1,9 @@
-import vistrails.core.db.action
-from vistrails.core.db.locator import XMLFileLocator
 from vistrails.core.db.io import serialize, unserialize
 from vistrails.core import debug
 from vistrails.core.interpreter.default import get_default_interpreter
+from vistrails.core.log.controller import LogController
 from vistrails.core.log.group_exec import GroupExec
+from vistrails.core.log.log import Log
 from vistrails.core.log.machine import Machine
 from vistrails.core.log.module_exec import ModuleExec
 from vistrails.core.modules.basic_modules import Constant
@@ -11,27 +11,22 @@ import vistrails.core.modules.module_registry
 import vistrails.core.modules.utils
 from vistrails.core.modules.vistrails_module import Module, ModuleError, \
     InvalidOutput
+from vistrails.core.utils import InvalidPipeline
 from vistrails.core.vistrail.annotation import Annotation
-from vistrails.core.vistrail.controller import VistrailController
 from vistrails.core.vistrail.group import Group
 from vistrails.core.vistrail.module_function import ModuleFunction
 from vistrails.core.vistrail.module_param import ModuleParam
 from vistrails.core.vistrail.pipeline import Pipeline
-from vistrails.core.vistrail.vistrail import Vistrail
 from vistrails.db.domain import IdScope
 import vistrails.db.versions
 
 import copy
 import inspect
 from itertools import izip
-import os
 import re
 import sys
-import tempfile
 
-from IPython.parallel.error import CompositeError
-
-from .api import get_client
+from .api import get_client, local_pool, local_pool_size
 
 try:
     import hashlib
@@ -44,99 +39,109 @@ except ImportError:
 ###############################################################################
 # This function is sent to the engines which execute it
 #
-# It receives the workflow, and the list of targeted output ports
+# It receives the serialized workflow and its key, the input ports with their
+# types, a chunk of input elements, and the targeted output port
+#
+# The workflow is only parsed the first time an engine sees its key; its
+# results stay in the engine's interpreter cache between calls
 #
-# It returns the corresponding computed outputs and the execution log
+# It returns the corresponding computed outputs and the execution log of each
+# element
 #
-def execute_wf(wf, output_port):
-    # Save the workflow in a temporary file
-    temp_wf_fd, temp_wf = tempfile.mkstemp()
+wf_cache = {}
 
+def execute_wf_chunk(key, wf, input_ports, elements, output_port):
+    # Load the workflow, unless this engine already has it
     try:
-        f = open(temp_wf, 'w')
-        f.write(wf)
-        f.close()
-        os.close(temp_wf_fd)
-
-        # Clean the cache
-        interpreter = get_default_interpreter()
-        interpreter.flush()
-
-        # Load the Pipeline from the temporary file
-        vistrail = Vistrail()
-        locator = XMLFileLocator(temp_wf)
-        workflow = locator.load(Pipeline)
-
-        # Build a Vistrail from this single Pipeline
-        action_list = []
-        for module in workflow.module_list:
-            action_list.append(('add', module))
-        for connection in workflow.connection_list:
-            action_list.append(('add', connection))
-        action = vistrails.core.db.action.create_action(action_list)
-
-        vistrail.add_action(action, 0L)
-        vistrail.update_id_scope()
-        tag = 'parallel flow'
-        vistrail.addTag(tag, action.id)
-
-        # Build a controller and execute
-        controller = VistrailController()
-        controller.set_vistrail(vistrail, None)
-        controller.change_selected_version(vistrail.get_version_number(tag))
-        execution = controller.execute_current_workflow(
-                custom_aliases=None,
-                custom_params=None,
-                extra_info=None,
-                reason='API Pipeline Execution')
+        workflow = wf_cache[key]
+    except KeyError:
+        if len(wf_cache) >= 10:
+            wf_cache.clear()
+        workflow = wf_cache[key] = unserialize(wf, Pipeline)
+
+    interpreter = get_default_interpreter()
+    reg = vistrails.core.modules.module_registry.get_module_registry()
+    results = []
+    for element in elements:
+        # Set the inputs on a copy of the workflow
+        pipeline = copy.copy(workflow)
+        module = pipeline.module_list[0]
+        if module.functions:
+            high_id = max(function.db_id for function in module.functions)
+        else:
+            high_id = 0
+        id_scope = IdScope(beginId=long(high_id+1))
+        for value, (port, port_type) in izip(element, input_ports):
+            function = ModuleFunction(
+                    id=id_scope.getNewId(ModuleFunction.vtType),
+                    pos=0,
+                    name=port)
+            # same conversion as when the values went through XML
+            function.add_parameter(ModuleParam(id=0L, pos=0, type=port_type,
+                                               val=str(value)))
+            module.add_function(function)
+
+        # Check the workflow against the registry before running it
+        try:
+            pipeline.validate()
+        except InvalidPipeline, e:
+            results.append(dict(errors=[
+                    "Invalid workflow: %s" % ', '.join(
+                            str(exc) for exc in e.get_exception_set())]))
+            continue
+
+        # Execute
+        log = Log()
+        execution = interpreter.execute(pipeline,
+                                        logger=LogController(log),
+                                        reason='API Pipeline Execution')
 
         # Build a list of errors
         errors = []
-        pipeline = vistrail.getPipeline(tag)
-        execution_errors = execution[0][0].errors
-        if execution_errors:
-            for key in execution_errors:
-                module = pipeline.modules[key]
-                msg = '%s: %s' %(module.name, execution_errors[key])
+        if execution.errors:
+            for key_ in execution.errors:
+                msg = '%s: %s' % (pipeline.modules[key_].name,
+                                  execution.errors[key_])
                 errors.append(msg)
 
-        # Get the execution log from the controller
+        # Get the execution log
         try:
-            module_log = controller.log.workflow_execs[0].item_execs[0]
+            module_log = log.workflow_execs[0].item_execs[0]
         except IndexError:
             errors.append("Module log not found")
-            return dict(errors=errors)
-        else:
-            machine = controller.log.workflow_execs[0].machines[
-                    module_log.machine_id]
-            xml_log = serialize(module_log)
-            machine_log = serialize(machine)
+            results.append(dict(errors=errors))
+            continue
+        machine = log.workflow_execs[0].machines[module_log.machine_id]
+        xml_log = serialize(module_log)
+        machine_log = serialize(machine)
 
         # Get the output value
         output = None
         serializable = None
-        if not execution_errors:
-            executed_module, = execution[0][0].executed
-            executed_module = execution[0][0].objects[executed_module]
+        if not execution.errors:
+            executed_module = execution.objects[module.id]
             try:
                 output = executed_module.get_output(output_port)
             except ModuleError:
                 errors.append("Output port not found: %s" % output_port)
-                return dict(errors=errors)
-            reg = vistrails.core.modules.module_registry.get_module_registry()
+                results.append(dict(errors=errors))
+                continue
             base_classes = inspect.getmro(type(output))
             if Module in base_classes:
                 serializable = reg.get_descriptor(type(output)).sigstring
                 output = output.serialize()
 
-        # Return the dictionary, that will be sent back to the client
-        return dict(errors=errors,
-                    output=output,
-                    serializable=serializable,
-                    xml_log=xml_log,
-                    machine_log=machine_log)
-    finally:
-        os.unlink(temp_wf)
+        # Add the dictionary, that will be sent back to the client
+        results.append(dict(errors=errors,
+                            output=output,
+                            serializable=serializable,
+                            xml_log=xml_log,
+                            machine_log=machine_log))
+    return results
+
+def execute_wf_chunk_local(args):
+    """Runs execute_wf_chunk() in a process of the local pool."""
+    return execute_wf_chunk(*args)
 
 ###############################################################################
 
@@ -194,6 +199,61 @@ class Map(Module):
                                   e_msg)
                 for e_type, e_msg, tb, infos in e.elist)
 
+    def init_engines(self, rc):
+        """
+        Imports modules and initializes the VisTrails application in the
+        engines *only* in the first execution on this engine.
+        """
+        from IPython.parallel.error import CompositeError
+
+        uninitialized = []
+        for eng in rc.ids:
+            try:
+                rc[eng]['init']
+            except Exception:
+                uninitialized.append(eng)
+        if not uninitialized:
+            return
+        init_view = rc[uninitialized]
+        with init_view.sync_imports():
+            import copy
+            import inspect
+            from itertools import izip
+
+            # VisTrails API
+            import vistrails
+            import vistrails.core
+            import vistrails.core.application
+            import vistrails.core.modules.module_registry
+            from vistrails.core.db.io import serialize, unserialize
+            from vistrails.core.interpreter.default import get_default_interpreter
+            from vistrails.core.log.controller import LogController
+            from vistrails.core.log.log import Log
+            from vistrails.core.modules.vistrails_module import Module, \
+                ModuleError
+            from vistrails.core.vistrail.module_function import ModuleFunction
+            from vistrails.core.vistrail.module_param import ModuleParam
+            from vistrails.core.utils import InvalidPipeline
+            from vistrails.core.vistrail.pipeline import Pipeline
+            from vistrails.db.domain import IdScope
+
+        # initializing a VisTrails application
+        try:
+            init_view.execute(
+                    'app = vistrails.core.application.init('
+                    '        {"spawned": True},'
+                    '        args=[])',
+                    block=True)
+        except CompositeError, e:
+            self.print_compositeerror(e)
+            raise ModuleError(self, "Error initializing application on "
+                              "IPython engines:\n"
+                              "%s" % self.list_exceptions(e))
+
+        # workflows already loaded on the engine, see execute_wf_chunk()
+        init_view['wf_cache'] = {}
+        init_view['init'] = True
+
     def updateFunctionPort(self):
         """
         Function to be used inside the updateUsptream method of the Map module. It
@@ -213,9 +273,9 @@ class Map(Module):
             element_is_iter = True
             inputList = rawInputList
 
-        workflows = []
         module = None
         vtType = None
+        wf = None
 
         # iterating through the connectors
         for connector in self.inputPorts.get('FunctionPort'):
@@ -228,151 +288,112 @@ class Map(Module):
             module_id = connector.obj.moduleInfo['moduleId']
             vtType = original_pipeline.modules[module_id].vtType
 
-            # serialize the module for each value in the list
+            # checking type and setting input in the module
             for i, element in enumerate(inputList):
                 if element_is_iter:
                     self.element = element
                 else:
                     self.element = element[0]
-
-                # checking type and setting input in the module
                 self.typeChecking(connector.obj, nameInput, inputList)
                 self.setInputValues(connector.obj, nameInput, element, i)
 
-                pipeline_db_module = original_pipeline.modules[module_id].do_copy()
-
-                # transforming a subworkflow in a group
-                # TODO: should we also transform inner subworkflows?
-                if pipeline_db_module.is_abstraction():
-                    group = Group(id=pipeline_db_module.id,
-                                  cache=pipeline_db_module.cache,
-                                  location=pipeline_db_module.location,
-                                  functions=pipeline_db_module.functions,
-                                  annotations=pipeline_db_module.annotations)
-
-                    source_port_specs = pipeline_db_module.sourcePorts()
-                    dest_port_specs = pipeline_db_module.destinationPorts()
-                    for source_port_spec in source_port_specs:
-                        group.add_port_spec(source_port_spec)
-                    for dest_port_spec in dest_port_specs:
-                        group.add_port_spec(dest_port_spec)
-
-                    group.pipeline = pipeline_db_module.pipeline
-                    pipeline_db_module = group
-
-                # getting highest id between functions to guarantee unique ids
-                # TODO: can get current IdScope here?
-                if pipeline_db_module.functions:
-                    high_id = max(function.db_id
-                                  for function in pipeline_db_module.functions)
-                else:
-                    high_id = 0
-
-                # adding function and parameter to module in pipeline
-                # TODO: 'pos' should not be always 0 here
-                id_scope = IdScope(beginId=long(high_id+1))
-                for elementValue, inputPort in izip(element, nameInput):
-
-                    p_spec = pipeline_db_module.get_port_spec(inputPort, 'input')
-                    descrs = p_spec.descriptors()
-                    if len(descrs) != 1:
-                        raise ModuleError(
-                                self,
-                                "Tuple input ports are not supported")
-                    if not issubclass(descrs[0].module, Constant):
-                        raise ModuleError(
-                                self,
-                                "Module inputs should be Constant types")
-                    type = p_spec.sigstring[1:-1]
-
-                    mod_function = ModuleFunction(id=id_scope.getNewId(ModuleFunction.vtType),
-                                                  pos=0,
-                                                  name=inputPort)
-                    mod_param = ModuleParam(id=0L,
-                                            pos=0,
-                                            type=type,
-                                            val=elementValue)
-
-                    mod_function.add_parameter(mod_param)
-                    pipeline_db_module.add_function(mod_function)
-
-                # serializing module
-                wf = self.serialize_module(pipeline_db_module)
-                workflows.append(wf)
+            pipeline_db_module = original_pipeline.modules[module_id].do_copy()
+
+            # transforming a subworkflow in a group
+            # TODO: should we also transform inner subworkflows?
+            if pipeline_db_module.is_abstraction():
+                group = Group(id=pipeline_db_module.id,
+                              cache=pipeline_db_module.cache,
+                              location=pipeline_db_module.location,
+                              functions=pipeline_db_module.functions,
+                              annotations=pipeline_db_module.annotations)
+
+                source_port_specs = pipeline_db_module.sourcePorts()
+                dest_port_specs = pipeline_db_module.destinationPorts()
+                for source_port_spec in source_port_specs:
+                    group.add_port_spec(source_port_spec)
+                for dest_port_spec in dest_port_specs:
+                    group.add_port_spec(dest_port_spec)
+
+                group.pipeline = pipeline_db_module.pipeline
+                pipeline_db_module = group
+
+            # getting the types of the inputs, that the engines set as
+            # functions on the module
+            # TODO: 'pos' should not be always 0 here
+            input_ports = []
+            for inputPort in nameInput:
+                p_spec = pipeline_db_module.get_port_spec(inputPort, 'input')
+                descrs = p_spec.descriptors()
+                if len(descrs) != 1:
+                    raise ModuleError(
+                            self,
+                            "Tuple input ports are not supported")
+                if not issubclass(descrs[0].module, Constant):
+                    raise ModuleError(
+                            self,
+                            "Module inputs should be Constant types")
+                input_ports.append((inputPort, p_spec.sigstring[1:-1]))
+
+            # serializing module once, engines cache it using its hash
+            wf = self.serialize_module(pipeline_db_module)
 
             # getting first connector, ignoring the rest
             break
 
+        key = sha1_hash(wf).hexdigest()
+
         # IPython stuff
         try:
             rc = get_client()
         except Exception, error:
-            raise ModuleError(self, "Exception while loading IPython: %s" %
-                              debug.format_exception(error))
-        if rc is None:
-            raise ModuleError(self, "Couldn't get an IPython connection")
-        engines = rc.ids
-        if not engines:
-            raise ModuleError(
-                    self,
-                    "Exception while loading IPython: No IPython engines "
-                    "detected!")
-
-        # initializes each engine
-        # importing modules and initializing the VisTrails application
-        # in the engines *only* in the first execution on this engine
-        uninitialized = []
-        for eng in engines:
-            try:
-                rc[eng]['init']
-            except Exception:
-                uninitialized.append(eng)
-        if uninitialized:
-            init_view = rc[uninitialized]
-            with init_view.sync_imports():
-                import tempfile
-                import inspect
-
-                # VisTrails API
-                import vistrails
-                import vistrails.core
-                import vistrails.core.db.action
-                import vistrails.core.application
-                import vistrails.core.modules.module_registry
-                from vistrails.core.db.io import serialize
-                from vistrails.core.vistrail.vistrail import Vistrail
-                from vistrails.core.vistrail.pipeline import Pipeline
-                from vistrails.core.db.locator import XMLFileLocator
-                from vistrails.core.vistrail.controller import VistrailController
-                from vistrails.core.interpreter.default import get_default_interpreter
-
-            # initializing a VisTrails application
-            try:
-                init_view.execute(
-                        'app = vistrails.core.application.init('
-                        '        {"spawned": True},'
-                        '        args=[])',
-                        block=True)
-            except CompositeError, e:
-                self.print_compositeerror(e)
-                raise ModuleError(self, "Error initializing application on "
-                                  "IPython engines:\n"
-                                  "%s" % self.list_exceptions(e))
+            debug.warning("Exception while loading IPython, running Map "
+                          "locally", error)
+            rc = None
+        if rc is None or not rc.ids:
+            view = None
+            nb_engines = local_pool_size()
+        else:
+            view = rc.load_balanced_view()
+            nb_engines = len(rc.ids)
+            self.init_engines(rc)
 
-            init_view['init'] = True
+        # a few chunks per engine keeps them balanced, without paying for
+        # a round trip per element
+        chunk_size = max(1, -(-len(inputList) // (nb_engines * 4)))
+        chunks = [inputList[i:i + chunk_size]
+                  for i in xrange(0, len(inputList), chunk_size)]
 
         # setting computing color
         module.logging.set_computing(module)
 
         # executing function in engines
-        # each map returns a dictionary
-        try:
-            ldview = rc.load_balanced_view()
-            map_result = ldview.map_sync(execute_wf, workflows, [nameOutput]*len(workflows))
-        except CompositeError, e:
-            self.print_compositeerror(e)
-            raise ModuleError(self, "Error from IPython engines:\n"
-                              "%s" % self.list_exceptions(e))
+        # each chunk returns a list of dictionaries
+        args = ([key] * len(chunks), [wf] * len(chunks),
+                [input_ports] * len(chunks), chunks,
+                [nameOutput] * len(chunks))
+        if view is None:
+            pool = local_pool()
+            if pool is None:
+                raise ModuleError(self, "No IPython engines are available, "
+                                  "and local workers can't be started on "
+                                  "this platform")
+            try:
+                chunk_results = pool.map(execute_wf_chunk_local, zip(*args))
+            except Exception, e:
+                raise ModuleError(self, "Error from local engines: %s" %
+                                  debug.format_exception(e))
+        else:
+            from IPython.parallel.error import CompositeError
+            try:
+                chunk_results = view.map_sync(execute_wf_chunk, *args)
+            except CompositeError, e:
+                self.print_compositeerror(e)
+                raise ModuleError(self, "Error from IPython engines:\n"
+                                  "%s" % self.list_exceptions(e))
+        map_result = [result
+                      for chunk_result in chunk_results
+                      for result in chunk_result]
 
         # verifying errors
         errors = []
@@ -520,3 +541,92 @@ def get_module(value, signature):
         debug.warning("Could not identify the type of the list element.")
         debug.warning("Type checking is not going to be done inside Map module.")
         return None
+
+
+###############################################################################
+
+import unittest
+
+
+class TestMap(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from vistrails.core.packagemanager import get_package_manager
+        from vistrails.core.modules.module_registry import MissingPackage
+        pm = get_package_manager()
+        try:
+            pm.get_package('edu.poly.vistrails.parallel_flow')
+        except MissingPackage:
+            pm.late_enable_package('parallelflow')
+
+    def make_workflow(self, package='org.vistrails.vistrails.pythoncalc'):
+        """Serializes a PythonCalc module adding 1 to its value1 port.
+        """
+        from vistrails.core.vistrail.module import Module as PipelineModule
+        if package == 'org.vistrails.vistrails.pythoncalc':
+            reg = vistrails.core.modules.module_registry.get_module_registry()
+            version = reg.get_package_by_name(package).version
+        else:
+            version = '1.0'
+        functions = [
+                ModuleFunction(id=0, pos=0, name='value2', parameters=[
+                        ModuleParam(id=0, pos=0, type='Float', val='1.0')]),
+                ModuleFunction(id=1, pos=1, name='op', parameters=[
+                        ModuleParam(id=1, pos=0, type='String', val='+')])]
+        module = PipelineModule(id=0, name='PythonCalc', package=package,
+                                version=version, functions=functions)
+        pipeline = Pipeline(version=vistrails.db.versions.currentVersion)
+        pipeline.add_module(module)
+        return serialize(pipeline)
+
+    def test_execute_chunk(self):
+        """Runs a chunk of elements with a workflow kept in the cache.
+        """
+        wf = self.make_workflow()
+        key = sha1_hash(wf).hexdigest()
+        input_ports = [('value1', 'org.vistrails.vistrails.basic:Float')]
+        wf_cache.pop(key, None)
+        results = execute_wf_chunk(key, wf, input_ports, [[1.0], [2.5]],
+                                   'value')
+        self.assertEqual([r['errors'] for r in results], [[], []])
+        self.assertEqual([r['output'] for r in results], [2.0, 3.5])
+        self.assertIn(key, wf_cache)
+
+        # the engine doesn't parse the workflow again
+        results = execute_wf_chunk(key, None, input_ports, [[4.0]], 'value')
+        self.assertEqual([r['output'] for r in results], [5.0])
+
+    def test_execute_chunk_invalid(self):
+        """A workflow that doesn't validate is reported, not executed.
+        """
+        wf = self.make_workflow('org.vistrails.tests.missing')
+        key = sha1_hash(wf).hexdigest()
+        results = execute_wf_chunk(
+                key, wf, [('value1', 'org.vistrails.vistrails.basic:Float')],
+                [[1.0], [2.0]], 'value')
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertEqual(len(result['errors']), 1)
+            self.assertTrue(result['errors'][0].startswith(
+                    "Invalid workflow: "))
+
+    def test_local_pool(self):
+        """The local workers use the packages loaded in VisTrails.
+        """
+        from .api import cleanup_local_pool
+        wf = self.make_workflow()
+        key = sha1_hash(wf).hexdigest()
+        input_ports = [('value1', 'org.vistrails.vistrails.basic:Float')]
+        pool = local_pool()
+        if pool is None:
+            self.skipTest("local workers need fork()")
+        try:
+            chunk_results = pool.map(execute_wf_chunk_local,
+                                     [(key, wf, input_ports, [[1.0]], 'value'),
+                                      (key, wf, input_ports, [[2.0]], 'value')])
+        finally:
+            cleanup_local_pool()
+        self.assertEqual([r['errors'] for c in chunk_results for r in c],
+                         [[], []])
+        self.assertEqual([r['output'] for c in chunk_results for r in c],
+                         [2.0, 3.0])
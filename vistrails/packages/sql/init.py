@@ -36,11 +36,15 @@
 from sqlalchemy.engine import create_engine
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import SQLAlchemyError
+from collections import namedtuple
+from itertools import izip
+import threading
 import urllib
 
 from vistrails.core.db.action import create_action
 from vistrails.core.bundles.installbundle import install
 from vistrails.core import debug
+from vistrails.core.modules.basic_modules import ListType
 from vistrails.core.modules.config import ModuleSettings
 from vistrails.core.modules.module_registry import get_module_registry
 from vistrails.core.modules.vistrails_module import Module, ModuleError
@@ -50,6 +54,23 @@ from vistrails.core.utils import versions_increasing
 from vistrails.packages.tabledata.common import TableObject
 
 
+# Engines are shared by the DBConnection modules using the same parameters,
+# so that their connection pools are reused across executions
+_engines = {}
+_engines_lock = threading.Lock()
+
+def get_engine(url):
+    """Returns the engine for this URL, creating it if needed.
+    """
+    key = (url.drivername, url.username, url.password, url.host, url.port,
+           url.database, tuple(sorted(url.query.items())))
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _engines[key] = create_engine(url)
+        return engine
+
+
 class DBConnection(Module):
     """Connects to a database.
 
@@ -77,7 +98,7 @@ class DBConnection(Module):
                   database=self.get_input('db_name'))
 
         try:
-            engine = create_engine(url)
+            engine = get_engine(url)
         except ImportError, e:
             driver = url.drivername
             installed = False
@@ -119,7 +140,7 @@ class DBConnection(Module):
                 raise ModuleError(self,
                                   "Failed to install required driver")
             try:
-                engine = create_engine(url)
+                engine = get_engine(url)
             except Exception, e:
                 raise ModuleError(self,
                                   "Couldn't connect to the database: %s" %
@@ -135,12 +156,105 @@ class DBConnection(Module):
         self.set_output('connection', engine.connect())
 
 
+def make_row_type(names):
+    """Returns a tuple type for rows with these column names.
+
+    Like the rows SQLAlchemy returns, its fields can be read by index, by
+    attribute or by column name.
+    """
+    base = namedtuple('Row', names, rename=True)
+    columns = dict((name, i) for i, name in enumerate(names))
+
+    class Row(base):
+        __slots__ = ()
+
+        def __getitem__(self, key):
+            if isinstance(key, basestring):
+                key = columns[key]
+            return base.__getitem__(self, key)
+
+        def keys(self):
+            return list(names)
+
+    return Row
+
+
+class ResultSet(object):
+    """The rows of a query result, read from the columns of its table.
+
+    This is the resultSet output of SQLSource; it avoids keeping a second
+    copy of the result in memory.
+    """
+    def __init__(self, table):
+        self.table = table
+        self.row_type = make_row_type(table.names)
+
+    def _get_columns(self):
+        return [self.table.get_column(i) for i in xrange(self.table.columns)]
+
+    def __len__(self):
+        return self.table.rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in xrange(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        return self.row_type._make(column[index]
+                                   for column in self._get_columns())
+
+    def __iter__(self):
+        return (self.row_type._make(row)
+                for row in izip(*self._get_columns()))
+
+    def __repr__(self):
+        return repr(list(self))
+
+ListType.register(ResultSet)
+
+
+def stream_rows(results, rows, transaction, chunk_size):
+    """Yields the rows of a query result, fetching them chunk by chunk.
+
+    rows is the first chunk, that was already fetched. The transaction is
+    committed once all the rows have been read; it is rolled back if
+    reading fails or if the generator is closed before the end.
+    """
+    completed = False
+    try:
+        while rows:
+            for row in rows:
+                yield row
+            rows = results.fetchmany(chunk_size)
+        completed = True
+    finally:
+        try:
+            results.close()
+        finally:
+            if completed:
+                transaction.commit()
+            else:
+                transaction.rollback()
+
+
 class SQLSource(Module):
+    """Runs a SQL query and outputs the result as a table.
+
+    Rows are fetched in chunks of chunkSize through a server-side cursor if
+    the database supports it. If streaming is set, the rows are passed
+    downstream on resultSet as they are read, and result is not set.
+    """
     _settings = ModuleSettings(configure_widget=
             'vistrails.packages.sql.widgets:SQLSourceConfigurationWidget')
     _input_ports = [('connection', '(DBConnection)'),
                     ('cacheResults', '(basic:Boolean)'),
-                    ('source', '(basic:String)')]
+                    ('source', '(basic:String)'),
+                    ('streaming', '(basic:Boolean)',
+                     {'optional': True, 'defaults': "['False']"}),
+                    ('chunkSize', '(basic:Integer)',
+                     {'optional': True, 'defaults': "['1000']"})]
     _output_ports = [('result', '(org.vistrails.vistrails.tabledata:Table)'),
                      ('resultSet', '(basic:List)')]
 
@@ -154,25 +268,53 @@ class SQLSource(Module):
             self.is_cacheable = lambda: cached
         connection = self.get_input('connection')
         inputs = dict((k, self.get_input(k)) for k in self.inputPorts.iterkeys()
-                  if k not in ('source', 'connection', 'cacheResults'))
+                  if k not in ('source', 'connection', 'cacheResults',
+                               'streaming', 'chunkSize'))
         s = urllib.unquote(str(self.get_input('source')))
+        streaming = self.get_input('streaming')
+        chunk_size = max(1, self.get_input('chunkSize'))
 
         try:
             transaction = connection.begin()
-            results = connection.execute(s, inputs)
+            results = connection.execution_options(stream_results=True) \
+                    .execute(s, inputs)
             try:
-                rows = results.fetchall()
+                names = list(results.keys())
+                rows = results.fetchmany(chunk_size)
             except Exception:
                 self.set_output('result', None)
                 self.set_output('resultSet', None)
-            else:
-                # results.returns_rows is True
-                # We don't use 'if return_rows' because this attribute didn't
-                # use to exist
-                table = TableObject.from_dicts(rows, results.keys())
-                self.set_output('result', table)
-                self.set_output('resultSet', rows)
+                transaction.commit()
+                return
+            # results.returns_rows is True
+            # We don't use 'if return_rows' because this attribute didn't
+            # use to exist
+            if streaming:
+                self.set_output('result', None)
+                self.set_streaming_output('resultSet',
+                                          stream_rows(results, rows,
+                                                      transaction,
+                                                      chunk_size),
+                                          chunk_size=chunk_size)
+                return
+
+            columns = [[] for name in names]
+            nb_rows = 0
+            try:
+                while rows:
+                    for column, values in izip(columns, izip(*rows)):
+                        column.extend(values)
+                    nb_rows += len(rows)
+                    rows = results.fetchmany(chunk_size)
+            except Exception:
+                transaction.rollback()
+                raise
+            finally:
+                results.close()
             transaction.commit()
+            table = TableObject(columns, nb_rows, names)
+            self.set_output('result', table)
+            self.set_output('resultSet', ResultSet(table))
         except SQLAlchemyError, e:
             raise ModuleError(self, debug.format_exception(e))
 
@@ -239,7 +381,8 @@ class TestSQL(unittest.TestCase):
         import sqlite3
         import tempfile
         import urllib2
-        from vistrails.tests.utils import execute, intercept_results
+        from vistrails.tests.utils import execute, intercept_results, \
+            capture_stdout
         identifier = 'org.vistrails.vistrails.sql'
 
         test_db_fd, test_db = tempfile.mkstemp(suffix='.sqlite3')
@@ -325,8 +468,115 @@ class TestSQL(unittest.TestCase):
             self.assertEqual((table.rows, table.columns), (2, 3))
             self.assertEqual(set(table.get_column(1)),
                              set(['Smith', 'Buck']))
+
+            source = "SELECT name FROM test ORDER BY name"
+
+            with intercept_results(DBConnection, 'connection') as (
+                    connection,):
+                with capture_stdout() as output:
+                    self.assertFalse(execute([
+                            ('DBConnection', identifier, [
+                                ('protocol', [('String', 'sqlite')]),
+                                ('db_name', [('String', test_db)]),
+                            ]),
+                            ('SQLSource', identifier, [
+                                ('source', [('String',
+                                             urllib2.quote(source))]),
+                                ('streaming', [('Boolean', 'True')]),
+                                ('chunkSize', [('Integer', '2')]),
+                            ]),
+                            ('StandardOutput', 'org.vistrails.vistrails.basic',
+                             []),
+                        ],
+                        [
+                            (0, 'connection', 1, 'connection'),
+                            (1, 'resultSet', 2, 'value'),
+                        ]))
+
+            self.assertEqual(len(connection), 1)
+            connection[0].close()
+            self.assertEqual(len(output), 1)
+            for name in ('John', 'Lara', 'Michael'):
+                self.assertIn(name, output[0])
         finally:
             try:
                 os.remove(test_db)
             except OSError:
                 pass # Oops, we are leaking the file here...
+
+    def test_result_set(self):
+        """Reads rows from the columns of a result table.
+        """
+        rows = ResultSet(TableObject([['John', 'Lara'], [25, 21]], 2,
+                                     ['name', 'age']))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1], ('Lara', 21))
+        self.assertEqual(rows[-2], ('John', 25))
+        self.assertEqual(rows[:1], [('John', 25)])
+        self.assertEqual(list(rows), [('John', 25), ('Lara', 21)])
+        self.assertRaises(IndexError, lambda: rows[2])
+        self.assertTrue(isinstance(rows, ListType))
+        # columns can be read by name, as with SQLAlchemy rows
+        self.assertEqual(rows[0].name, 'John')
+        self.assertEqual(rows[1]['age'], 21)
+        self.assertEqual([row['name'] for row in rows], ['John', 'Lara'])
+        self.assertEqual(rows[0].keys(), ['name', 'age'])
+
+    def test_stream_rows_cleanup(self):
+        """Streamed results are closed even if not read to the end.
+        """
+        class Results(object):
+            def __init__(self, chunks):
+                self.chunks = chunks
+                self.closed = False
+            def fetchmany(self, size):
+                chunk = self.chunks.pop(0)
+                if isinstance(chunk, Exception):
+                    raise chunk
+                return chunk
+            def close(self):
+                self.closed = True
+
+        class Transaction(object):
+            state = None
+            def commit(self):
+                self.state = 'committed'
+            def rollback(self):
+                self.state = 'rolled back'
+
+        results, transaction = Results([[(3,)], []]), Transaction()
+        rows = stream_rows(results, [(1,), (2,)], transaction, 2)
+        self.assertEqual(list(rows), [(1,), (2,), (3,)])
+        self.assertTrue(results.closed)
+        self.assertEqual(transaction.state, 'committed')
+
+        results, transaction = Results([[(3,)], []]), Transaction()
+        rows = stream_rows(results, [(1,), (2,)], transaction, 2)
+        self.assertEqual(next(rows), (1,))
+        rows.close()
+        self.assertTrue(results.closed)
+        self.assertEqual(transaction.state, 'rolled back')
+
+        results = Results([SQLAlchemyError("connection lost")])
+        transaction = Transaction()
+        rows = stream_rows(results, [(1,)], transaction, 1)
+        self.assertEqual(next(rows), (1,))
+        self.assertRaises(SQLAlchemyError, next, rows)
+        self.assertTrue(results.closed)
+        self.assertEqual(transaction.state, 'rolled back')
+
+    def test_engine_reuse(self):
+        """Connections with the same parameters share their engine.
+        """
+        url = URL(drivername='sqlite', database=':memory:')
+        self.assertIs(get_engine(url),
+                      get_engine(URL(drivername='sqlite',
+                                     database=':memory:')))
+        self.assertIsNot(get_engine(url),
+                         get_engine(URL(drivername='sqlite',
+                                        database='other.sqlite3')))
+        # Options in the query string are part of the engine's identity
+        self.assertIsNot(get_engine(url),
+                         get_engine(URL(drivername='sqlite',
+                                        database=':memory:',
+                                        query={'timeout': '5'})))
@@ -4,6 +4,9 @@ This package contains data extraction and manipulation facilities. It wraps
 numpy and csv and allows the use of several file types from VisTrails, with
 extraction and conversion routines.
 
+The numeric columns of the CSV files that are read are cached inside the
+per-user VisTrails directory. The least recently used files are removed from
+this cache once it is larger than csv_cache_size megabytes (0 for no limit).
 """
 
 # ChangeLog:
@@ -21,10 +24,13 @@ extraction and conversion routines.
 # 2013-05-16 -- 0.1.0
 #   * Package created (for DAT project)
 
+from vistrails.core.configuration import ConfigurationObject
 from vistrails.core.packagemanager import get_package_manager
 
 from .identifiers import *
 
+configuration = ConfigurationObject(csv_cache_size=1024)
+
 
 def package_dependencies():
     pm = get_package_manager()
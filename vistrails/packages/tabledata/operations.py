@@ -2,6 +2,7 @@ try:
     import numpy
 except ImportError: # pragma: no cover
     numpy = None
+import operator
 import re
 
 from vistrails.core.modules.vistrails_module import ModuleError
@@ -20,6 +21,74 @@ def utf8(obj):
         return bytes(obj)
 
 
+def take(column, rows, numeric=False):
+    """Gets the values of a column at the given row indexes.
+
+    numpy arrays are indexed directly. Other columns give a list, or a numpy
+    array if numeric is set, like TableObject.get_column().
+    """
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return column[rows]
+    result = [column[i] for i in rows]
+    if numeric and numpy is not None:
+        result = numpy.array(result, dtype=numpy.float32)
+    return result
+
+
+def join_rows(left_keys, right_keys):
+    """Matches two lists of keys using a sort-merge join.
+
+    Returns the arrays of matching left and right row indexes, in the order of
+    the left rows. If a key appears several times on the right, the last row
+    is used.
+    """
+    left = numpy.array(left_keys, dtype=str)
+    right = numpy.array(right_keys, dtype=str)
+    if len(left) == 0 or len(right) == 0:
+        empty = numpy.zeros(0, dtype=numpy.intp)
+        return empty, empty
+    # unique() returns the first occurrence, get the last one by reversing
+    keys, reversed_rows = numpy.unique(right[::-1], return_index=True)
+    last_rows = len(right) - 1 - reversed_rows
+    pos = numpy.searchsorted(keys, left)
+    pos[pos == len(keys)] = 0
+    matched = keys[pos] == left
+    return numpy.nonzero(matched)[0], last_rows[pos[matched]]
+
+
+class SelectedTable(TableObject):
+    """Rows of another table, in the given order.
+
+    Columns are only extracted from the original table when requested.
+    """
+    def __init__(self, table, row_idxs):
+        self.table = table
+        self.row_idxs = row_idxs
+        self.rows = len(row_idxs)
+        self.columns = table.columns
+        self.names = table.names
+        self.column_cache = {}
+
+    def get_column(self, index, numeric=False):
+        if (index, numeric) in self.column_cache:
+            return self.column_cache[(index, numeric)]
+
+        try:
+            result = take(self.table.get_column(index, numeric),
+                          self.row_idxs, numeric)
+        except ValueError:
+            if not numeric:
+                raise
+            # the rows that were not selected might not be numbers
+            result = take(self.table.get_column(index), self.row_idxs)
+            if numpy is not None:
+                result = numpy.array(result, dtype=numpy.float32)
+            else:
+                result = [float(e) for e in result]
+        self.column_cache[(index, numeric)] = result
+        return result
+
+
 class JoinedTables(TableObject):
     def __init__(self, left_t, right_t, left_key_col, right_key_col,
                  case_sensitive=False, always_prefix=False):
@@ -33,7 +102,7 @@ class JoinedTables(TableObject):
         self.build_column_names()
         self.compute_row_map()
         self.column_cache = {}
-        self.rows = len(self.row_map)
+        self.rows = len(self.left_rows)
 
     def build_column_names(self):
         left_name = self.left_t.name
@@ -67,46 +136,38 @@ class JoinedTables(TableObject):
         if (index, numeric) in self.column_cache:
             return self.column_cache[(index, numeric)]
 
-        result = []
         if index < self.left_t.columns:
             column = self.left_t.get_column(index, numeric)
-            for i in xrange(self.left_t.rows):
-                if i in self.row_map:
-                    result.append(column[i])
+            result = take(column, self.left_rows, numeric)
         else:
             column = self.right_t.get_column(index - self.left_t.columns,
                                              numeric)
-            for i in xrange(self.left_t.rows):
-                if i in self.row_map:
-                    j = self.row_map[i]
-                    result.append(column[j])
+            result = take(column, self.right_rows, numeric)
 
-        if numeric and numpy is not None:
-            result = numpy.array(result, dtype=numpy.float32)
         self.column_cache[(index, numeric)] = result
         return result
 
     def compute_row_map(self):
-        def build_key_dict(table, key_col):
+        def get_keys(table, key_col):
             column = table.get_column(key_col)
             if self.case_sensitive:
-                key_dict = dict((utf8(val).strip(), i)
-                                for i, val in enumerate(column))
+                return [utf8(val).strip() for val in column]
             else:
-                key_dict = dict((utf8(val).strip().upper(), i)
-                                for i, val in enumerate(column))
-            return key_dict
+                return [utf8(val).strip().upper() for val in column]
 
-        right_keys = build_key_dict(self.right_t, self.right_key_col)
+        left_keys = get_keys(self.left_t, self.left_key_col)
+        right_keys = get_keys(self.right_t, self.right_key_col)
 
-        self.row_map = {}
-        for left_row_idx, key in enumerate(
-                self.left_t.get_column(self.left_key_col)):
-            key = utf8(key).strip()
-            if not self.case_sensitive:
-                key = key.upper()
-            if key in right_keys:
-                self.row_map[left_row_idx] = right_keys[key]
+        if numpy is not None:
+            self.left_rows, self.right_rows = join_rows(left_keys, right_keys)
+        else:
+            right_rows = dict((key, i) for i, key in enumerate(right_keys))
+            self.left_rows = []
+            self.right_rows = []
+            for i, key in enumerate(left_keys):
+                if key in right_rows:
+                    self.left_rows.append(i)
+                    self.right_rows.append(right_rows[key])
 
 
 class JoinTables(Table):
@@ -235,6 +296,13 @@ class SelectFromTable(Table):
                       'values': "[[], ['==', '!=', '<', '>', '<=', '>='], []]"})]
     _output_ports = [('value', Table)]
 
+    _operators = {'==': operator.eq,
+                  '!=': operator.ne,
+                  '<': operator.lt,
+                  '>': operator.gt,
+                  '<=': operator.le,
+                  '>=': operator.ge}
+
     @staticmethod
     def make_condition(comparand, comparer):
         if isinstance(comparand, float):
@@ -285,14 +353,16 @@ class SelectFromTable(Table):
         condition = self.make_condition(comparand, comparer)
         numeric = isinstance(comparand, float)
         column = table.get_column(idx, numeric)
-        matched_rows = [i
-                        for i, col_val in enumerate(column)
-                        if condition(col_val)]
-        columns = []
-        for col in xrange(table.columns):
-            column = table.get_column(col)
-            columns.append([column[row] for row in matched_rows])
-        selected_table = TableObject(columns, len(matched_rows), table.names)
+        if numeric and numpy is not None:
+            # compare the whole column at once; float64, like float() does
+            column = numpy.asarray(column, dtype=numpy.float64)
+            mask = self._operators[comparer](column, comparand)
+            matched_rows = numpy.nonzero(mask)[0]
+        else:
+            matched_rows = [i
+                            for i, col_val in enumerate(column)
+                            if condition(col_val)]
+        selected_table = SelectedTable(table, matched_rows)
         self.set_output('value', selected_table)
 
 
@@ -306,44 +376,92 @@ class AggregatedTable(TableObject):
         self.build_map()
 
     def build_map(self):
-        agg_map = {}
-        for i, val in enumerate(self.table.get_column(self.group_col)):
-            if val in agg_map:
-                agg_map[val].append(i)
-            else:
-                agg_map[val] = [i]
-        self.agg_rows = [(min(rows), rows) for rows in agg_map.itervalues()]
-        self.agg_rows.sort()
-        self.rows = len(self.agg_rows)
+        column = self.table.get_column(self.group_col)
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            values, first_rows, row_groups = numpy.unique(
+                    column, return_index=True, return_inverse=True)
+            # number the groups in the order they first appear
+            order = numpy.argsort(first_rows)
+            renumber = numpy.empty_like(order)
+            renumber[order] = numpy.arange(len(order))
+            self.first_rows = first_rows[order]
+            self.row_groups = renumber[row_groups]
+        else:
+            groups = {}
+            first_rows = []
+            row_groups = []
+            for i, val in enumerate(column):
+                group = groups.get(val)
+                if group is None:
+                    group = groups[val] = len(first_rows)
+                    first_rows.append(i)
+                row_groups.append(group)
+            self.first_rows = first_rows
+            self.row_groups = row_groups
+            if numpy is not None:
+                self.row_groups = numpy.array(row_groups, dtype=numpy.intp)
+        self.rows = len(self.first_rows)
         self.columns = 2
         if self.table.names is not None:
             self.names = [self.table.names[self.group_col],
                           self.table.names[self.col]]
+        self.column_cache = {}
 
     def get_column(self, index, numeric=False):
-        def average(value_iter):
-            # value_iter can only be used once
-            sum = 0
-            count = 0
-            for count, v in enumerate(value_iter):
-                sum += v
-            return sum / (count+1)
-        op_map = {'sum': sum,
+        if (index, numeric) in self.column_cache:
+            return self.column_cache[(index, numeric)]
+
+        if index == 0:
+            col = self.table.get_column(self.group_col, numeric)
+            result = take(col, self.first_rows, numeric)
+        elif self.op not in ('count', 'sum', 'average', 'min', 'max'):
+            raise ValueError('Unknown operation: "%s"' % self.op)
+        elif numpy is not None:
+            result = self.aggregate_numpy().tolist()
+        else:
+            result = self.aggregate_python()
+
+        self.column_cache[(index, numeric)] = result
+        return result
+
+    def aggregate_numpy(self):
+        """Computes the aggregated column with vectorized operations.
+        """
+        if self.rows == 0:
+            return numpy.zeros(0)
+        counts = numpy.bincount(self.row_groups, minlength=self.rows)
+        if self.op == 'count':
+            return counts
+        values = numpy.asarray(self.table.get_column(self.col, True),
+                               dtype=numpy.float64)
+        if self.op in ('sum', 'average'):
+            sums = numpy.bincount(self.row_groups, weights=values,
+                                  minlength=self.rows)
+            if self.op == 'sum':
+                return sums
+            return sums / counts
+        # sort the values by group, each group is then a contiguous slice
+        order = numpy.argsort(self.row_groups, kind='mergesort')
+        starts = numpy.concatenate(([0], numpy.cumsum(counts)[:-1]))
+        ufunc = numpy.minimum if self.op == 'min' else numpy.maximum
+        return ufunc.reduceat(values[order], starts)
+
+    def aggregate_python(self):
+        def average(values):
+            return sum(values) / len(values)
+        op_map = {'count': len,
+                  'sum': sum,
                   'average': average,
                   'min': min,
                   'max': max}
-        if index == 0:
-            col = self.table.get_column(self.group_col, numeric)
-            return [col[x[0]] for x in self.agg_rows]
+        members = [[] for i in xrange(self.rows)]
+        if self.op == 'count':
+            col = [None] * len(self.row_groups)
         else:
-            if self.op == 'count':
-                return [len(x[1]) for x in self.agg_rows]
-            elif self.op in op_map:
-                col = self.table.get_column(self.col, True)
-                return [op_map[self.op](col[idx] for idx in x[1])
-                        for x in self.agg_rows]
-            else:
-                raise ValueError('Unknown operation: "%s"' % self.op)
+            col = self.table.get_column(self.col, True)
+        for group, value in zip(self.row_groups, col):
+            members[group].append(value)
+        return [op_map[self.op](values) for values in members]
 
 
 class AggregateColumn(Table):
@@ -483,6 +601,18 @@ class TestJoin(unittest.TestCase):
         self.assertEqual(table.get_column(0, False), ['1', '2', '5'])
         self.assertEqual(table.get_column(1, False), ['one', '2', 'five'])
 
+    def test_join_rows(self):
+        """Tests the sort-merge join of keys.
+        """
+        left, right = join_rows(['b', 'a', 'c', 'a', 'd'],
+                                ['a', 'c', 'x', 'c', ''])
+        self.assertEqual(list(left), [1, 2, 3])
+        # the last duplicate key on the right is used, like with a dict
+        self.assertEqual(list(right), [0, 3, 0])
+        left, right = join_rows(['a'], [])
+        self.assertEqual(len(left), 0)
+        self.assertEqual(len(right), 0)
+
 
 class TestProjection(unittest.TestCase):
     def do_project(self, project_functions, error=None):
@@ -645,6 +775,17 @@ class TestSelect(unittest.TestCase):
             ])
         self.assertEqual(table.get_column(0, False), ['22', '43', '-7'])
 
+    def test_selected_numeric(self):
+        """Gets numbers from rows selected from a partly numeric column.
+        """
+        table = SelectedTable(
+                TableObject([['1', 'x', '3'], ['a', 'b', 'c']], 3, None),
+                [2, 0])
+        self.assertEqual(table.rows, 2)
+        self.assertEqual(list(table.get_column(0, True)), [3, 1])
+        self.assertEqual(table.get_column(1), ['c', 'a'])
+
+
 class TestAggregate(unittest.TestCase):
     def do_aggregate(self, agg_functions):
         with intercept_result(AggregateColumn, 'value') as results:
@@ -695,3 +836,16 @@ class TestAggregate(unittest.TestCase):
                                    ('group_by_index', [('Integer', '2')])])
         self.assertEqual(table.get_column(0, False), ['T', 'F'])
         self.assertEqual(table.get_column(1, True), [-7, 21])
+
+    def test_aggregate_max(self):
+        table = self.do_aggregate([('op', [('String', 'max')]),
+                                   ('column_index', [('Integer', '3')]),
+                                   ('group_by_index', [('Integer', '1')])])
+        self.assertEqual(table.get_column(0, False), ['a', 'b', 'd', 'e'])
+        self.assertEqual(table.get_column(1, True), [100, 23, 41, 21])
+
+    def test_aggregate_count(self):
+        table = self.do_aggregate([('op', [('String', 'count')]),
+                                   ('column_index', [('Integer', '0')]),
+                                   ('group_by_index', [('Integer', '1')])])
+        self.assertEqual(table.get_column(1, True), [3, 2, 1, 1])
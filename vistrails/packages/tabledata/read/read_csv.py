@@ -1,9 +1,18 @@
 import csv
+import hashlib
+from itertools import islice, izip
+import json
+import os
+import shutil
+import tempfile
 try:
     import numpy
 except ImportError: # pragma: no cover
     numpy = None
 
+from vistrails.core.system import current_dot_vistrails
+
+from .. import configuration
 from ..common import TableObject, Table, InternalModuleError
 
 
@@ -14,11 +23,187 @@ def count_lines(fp):
     return lines
 
 
-# FIXME : test coverage for CSVTable
+def dialect_key(dialect):
+    """Returns a representation of a csv dialect that can be hashed.
+    """
+    if dialect is None or isinstance(dialect, basestring):
+        return dialect
+    return tuple(getattr(dialect, attr, None)
+                 for attr in ('delimiter', 'doublequote', 'escapechar',
+                              'lineterminator', 'quotechar', 'quoting',
+                              'skipinitialspace', 'strict'))
+
+
+class CSVColumnCache(object):
+    """Columnar cache of the numeric columns of the CSV files that were read.
+
+    Each file is parsed once, a chunk of rows at a time, and its numeric
+    columns are written as raw float32 files that are memory-mapped when
+    read. Other columns are not cached. A manifest records the size and
+    modification time of the file, the entry is rebuilt if they change.
+    Once the cache is larger than max_size bytes, the least recently used
+    entries are removed.
+    """
+    MANIFEST = 'manifest.json'
+    CHUNK_ROWS = 16384
+
+    def __init__(self, directory, max_size=None):
+        self.directory = directory
+        self.max_size = max_size
+
+    def get_entry_directory(self, filename, options):
+        key = hashlib.sha1(repr((os.path.abspath(filename), options)))
+        return os.path.join(self.directory, key.hexdigest())
+
+    def lookup(self, filename, options):
+        """Returns the entry for this file, or None if it is not cached.
+        """
+        directory = self.get_entry_directory(filename, options)
+        manifest_file = os.path.join(directory, self.MANIFEST)
+        try:
+            with open(manifest_file, 'rb') as fp:
+                manifest = json.load(fp)
+        except (IOError, ValueError):
+            return None
+        stat = os.stat(filename)
+        if (manifest['size'] != stat.st_size or
+                manifest['mtime'] != stat.st_mtime):
+            return None
+        try:
+            # the manifest's mtime is the last use, for eviction
+            os.utime(manifest_file, None)
+        except OSError: # pragma: no cover
+            pass
+        return CSVColumnCacheEntry(directory, manifest)
+
+    def store(self, filename, options, columns, rows):
+        """Writes the numeric columns of this file and returns the new entry.
+
+        rows is an iterable over the rows of the file, that are lists of at
+        least `columns` values.
+        """
+        stat = os.stat(filename)
+        directory = self.get_entry_directory(filename, options)
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        tmp_directory = tempfile.mkdtemp(prefix='tmp', dir=self.directory)
+        files = [open(os.path.join(tmp_directory, 'num_%d.f32' % i), 'wb')
+                 for i in xrange(columns)]
+        try:
+            numeric = [True] * columns
+            nb_rows = 0
+            rows = iter(rows)
+            while True:
+                chunk = list(islice(rows, self.CHUNK_ROWS))
+                if not chunk:
+                    break
+                nb_rows += len(chunk)
+                for i, column in enumerate(izip(*chunk)):
+                    if i >= columns:
+                        break
+                    if not numeric[i]:
+                        continue
+                    try:
+                        values = numpy.array(column).astype(numpy.float32)
+                    except ValueError:
+                        numeric[i] = False
+                        files[i].close()
+                        os.remove(files[i].name)
+                    else:
+                        values.tofile(files[i])
+                del chunk
+            for fp in files:
+                fp.close()
+            manifest = {'filename': os.path.abspath(filename),
+                        'size': stat.st_size,
+                        'mtime': stat.st_mtime,
+                        'rows': nb_rows,
+                        'numeric': numeric,
+                        'bytes': 4 * nb_rows * sum(numeric)}
+            with open(os.path.join(tmp_directory, self.MANIFEST), 'wb') as fp:
+                json.dump(manifest, fp)
+            if os.path.exists(directory):
+                shutil.rmtree(directory)
+            os.rename(tmp_directory, directory)
+        except Exception:
+            for fp in files:
+                fp.close()
+            shutil.rmtree(tmp_directory, ignore_errors=True)
+            raise
+        self.evict(keep=directory)
+        return CSVColumnCacheEntry(directory, manifest)
+
+    def evict(self, keep=None):
+        """Removes least recently used entries until the cache fits max_size.
+        """
+        if not self.max_size:
+            return
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            directory = os.path.join(self.directory, name)
+            manifest_file = os.path.join(directory, self.MANIFEST)
+            try:
+                with open(manifest_file, 'rb') as fp:
+                    size = json.load(fp)['bytes']
+                used = os.stat(manifest_file).st_mtime
+            except (IOError, OSError, ValueError, KeyError):
+                continue
+            entries.append((used, size, directory))
+            total += size
+        entries.sort()
+        for used, size, directory in entries:
+            if total <= self.max_size:
+                break
+            if directory == keep:
+                continue
+            shutil.rmtree(directory, ignore_errors=True)
+            total -= size
+
+
+class CSVColumnCacheEntry(object):
+    def __init__(self, directory, manifest):
+        self.directory = directory
+        self.rows = manifest['rows']
+        self.numeric = manifest['numeric']
+
+    def get_column(self, index):
+        """Returns a numeric column as a float32 array.
+        """
+        if not self.numeric[index]:
+            raise ValueError("Column %d is not numeric" % index)
+        if not self.rows:
+            return numpy.zeros((0,), dtype=numpy.float32)
+        # copy-on-write, so that the columns can be modified without
+        # changing the cache
+        return numpy.memmap(os.path.join(self.directory,
+                                         'num_%d.f32' % index),
+                            dtype=numpy.float32, mode='c',
+                            shape=(self.rows,))
+
+
+_column_cache = None
+
+def get_column_cache():
+    """Returns the columnar cache, or None if it can't be used.
+    """
+    global _column_cache
+    if _column_cache is None and numpy is not None:
+        try:
+            directory = os.path.join(current_dot_vistrails(), 'tabledata')
+        except Exception: # pragma: no cover
+            return None
+        _column_cache = CSVColumnCache(directory)
+    if _column_cache is not None:
+        _column_cache.max_size = configuration.csv_cache_size * 1024 * 1024
+    return _column_cache
+
+
 class CSVTable(TableObject):
     def __init__(self, csv_file, header_present, delimiter,
                  skip_lines=0, dialect=None, use_sniffer=True):
         self._rows = None
+        self._entry = None
 
         self.header_present = header_present
         self.delimiter = delimiter
@@ -91,7 +276,10 @@ class CSVTable(TableObject):
         if (index, numeric) in self.column_cache:
             return self.column_cache[(index, numeric)]
 
-        if numeric and numpy is not None:
+        entry = self._get_entry() if numeric else None
+        if entry is not None:
+            result = entry.get_column(index)
+        elif numeric and numpy is not None:
             result = numpy.loadtxt(
                     self.filename,
                     dtype=numpy.float32,
@@ -99,32 +287,65 @@ class CSVTable(TableObject):
                     skiprows=self.skip_lines,
                     usecols=[index])
         else:
-            with open(self.filename, 'rb') as fp:
-                for i in xrange(self.skip_lines):
-                    line = fp.readline()
-                    if not line:
-                        raise InternalModuleError("skip_lines greater than "
-                                                  "the number of lines in the "
-                                                  "file")
-                if self.dialect is not None:
-                    reader = csv.reader(fp, dialect=self.dialect)
-                else:
-                    reader = csv.reader(fp, delimiter=self.delimiter)
-
-                result = [row[index] for row in reader]
+            result = [row[index] for row in self._iter_rows()]
             if numeric:
                 result = [float(e) for e in result]
 
         self.column_cache[(index, numeric)] = result
         return result
 
+    def _get_entry(self):
+        """Gets the numeric columns from the columnar cache.
+
+        Returns None if the cache can't be used.
+        """
+        if self._entry is None:
+            cache = get_column_cache()
+            if cache is None:
+                return None
+            options = (self.delimiter, self.skip_lines,
+                       dialect_key(self.dialect))
+            self._entry = cache.lookup(self.filename, options)
+            if self._entry is None:
+                self._entry = cache.store(self.filename, options,
+                                          self.columns, self._iter_rows())
+        return self._entry
+
+    def _iter_rows(self):
+        """Iterates over the rows of the file.
+
+        Empty lines are skipped, and missing fields are read as empty strings.
+        """
+        with open(self.filename, 'rb') as fp:
+            for i in xrange(self.skip_lines):
+                line = fp.readline()
+                if not line:
+                    raise InternalModuleError("skip_lines greater than "
+                                              "the number of lines in the "
+                                              "file")
+            if self.dialect is not None:
+                reader = csv.reader(fp, dialect=self.dialect)
+            else:
+                reader = csv.reader(fp, delimiter=self.delimiter)
+
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) < self.columns:
+                    row.extend([''] * (self.columns - len(row)))
+                yield row
+
     @property
     def rows(self):
         if self._rows is not None:
             return self._rows
-        with open(self.filename, 'rb') as fp:
-            self._rows = count_lines(fp)
-        self._rows -= self.skip_lines
+        entry = self._get_entry()
+        if entry is not None:
+            self._rows = entry.rows
+        else:
+            with open(self.filename, 'rb') as fp:
+                self._rows = count_lines(fp)
+            self._rows -= self.skip_lines
         return self._rows
 
 
@@ -278,6 +499,123 @@ class CSVTestCase(unittest.TestCase):
                          ['col moutarde', '4', 'not a number', '7'])
 
 
+    def test_csv_cache(self):
+        """Reads columns through the columnar cache.
+        """
+        import os
+        import shutil
+        import tempfile
+        if get_column_cache() is None: # pragma: no cover
+            self.skipTest("numpy is not available")
+
+        directory = tempfile.mkdtemp(prefix='vt_tabledata_')
+        try:
+            filename = os.path.join(directory, 'test.csv')
+            shutil.copyfile(self._test_dir + '/test.csv', filename)
+            table = CSVTable(filename, True, None)
+            self.assertEqual(table.rows, 3)
+            self.assertEqual(list(table.get_column(1, True)),
+                             [2.0, 3.0, 14.5])
+            self.assertEqual(table.get_column(2),
+                             ['4', 'not a number', '7'])
+            self.assertRaises(ValueError, table.get_column, 2, True)
+
+            # a new table reads the cache instead of the file
+            table = CSVTable(filename, True, None)
+            def iter_rows():
+                self.fail("file was parsed again")
+            table._iter_rows = iter_rows
+            column = table.get_column(0, True)
+            self.assertEqual(list(column), [-1.0, 2.0, 6.0])
+            column[0] = 42.0
+            self.assertEqual(list(CSVTable(filename, True, None)
+                                  .get_column(0, True)),
+                             [-1.0, 2.0, 6.0])
+
+            # changing the file invalidates the cache
+            with open(filename, 'wb') as fp:
+                fp.write("a;b\n1;2\n")
+            stat = os.stat(filename)
+            os.utime(filename, (stat.st_atime, stat.st_mtime + 10))
+            table = CSVTable(filename, True, None)
+            self.assertEqual(table.rows, 1)
+            self.assertEqual(table.get_column(1), ['2'])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_csv_cache_chunks(self):
+        """Builds a cache entry over several chunks of rows.
+        """
+        import os
+        import shutil
+        import tempfile
+        if get_column_cache() is None: # pragma: no cover
+            self.skipTest("numpy is not available")
+
+        directory = tempfile.mkdtemp(prefix='vt_tabledata_')
+        try:
+            cache = CSVColumnCache(os.path.join(directory, 'cache'))
+            cache.CHUNK_ROWS = 3
+            filename = os.path.join(directory, 'test.csv')
+            with open(filename, 'wb') as fp:
+                for i in xrange(10):
+                    fp.write('%d,%s\n' % (i, 'x' if i == 7 else i * 0.5))
+            entry = cache.store(filename, None, 2,
+                                CSVTable(filename, False, ',')._iter_rows())
+            self.assertEqual(entry.rows, 10)
+            self.assertEqual(entry.numeric, [True, False])
+            self.assertEqual(list(entry.get_column(0)), range(10))
+            self.assertEqual(
+                    sorted(os.listdir(entry.directory)),
+                    [CSVColumnCache.MANIFEST, 'num_0.f32'])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_csv_cache_eviction(self):
+        """Keeps the cache under its maximum size.
+        """
+        import os
+        import shutil
+        import tempfile
+        import time
+        if get_column_cache() is None: # pragma: no cover
+            self.skipTest("numpy is not available")
+
+        directory = tempfile.mkdtemp(prefix='vt_tabledata_')
+        try:
+            # each file has 2 numeric columns of 5 rows: 40 bytes
+            cache = CSVColumnCache(os.path.join(directory, 'cache'), 100)
+            filenames = []
+            for i in xrange(3):
+                filename = os.path.join(directory, 'test%d.csv' % i)
+                with open(filename, 'wb') as fp:
+                    fp.write(''.join('%d,%d\n' % (i, j) for j in xrange(5)))
+                filenames.append(filename)
+            entries = []
+            for filename in filenames:
+                table = CSVTable(filename, False, ',')
+                entries.append(cache.store(filename, 'key', 2,
+                                           table._iter_rows()))
+                time.sleep(0.01)
+            self.assertFalse(os.path.exists(entries[0].directory))
+            self.assertTrue(os.path.exists(entries[1].directory))
+            self.assertTrue(os.path.exists(entries[2].directory))
+            self.assertIsNone(cache.lookup(filenames[0], 'key'))
+            self.assertIsNotNone(cache.lookup(filenames[1], 'key'))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_dialect_key(self):
+        """Sniffed dialects are part of the cache key.
+        """
+        class Semicolon(csv.excel):
+            delimiter = ';'
+        self.assertEqual(dialect_key('excel'), 'excel')
+        self.assertIsNone(dialect_key(None))
+        self.assertNotEqual(dialect_key(csv.excel), dialect_key(Semicolon))
+        self.assertEqual(dialect_key(csv.excel), dialect_key(csv.excel()))
+
+
 class TestCountlines(unittest.TestCase):
     def test_countlines(self):
         # Simple